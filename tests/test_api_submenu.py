@@ -933,11 +933,8 @@ def test_make_api_request_success(monkeypatch, submenu):
     def mock_get(*args, **kwargs):
         return MockResponse()
     
-    # Mock all HTTP methods that might be used
-    monkeypatch.setattr("httpx.get", mock_get)
-    monkeypatch.setattr("httpx.post", mock_get)
-    monkeypatch.setattr("httpx.put", mock_get)
-    monkeypatch.setattr("httpx.delete", mock_get)
+    # Mock the pooled client used for every HTTP method
+    monkeypatch.setattr("httpx.Client.request", mock_get)
     monkeypatch.setattr(submenu, "_get_api_headers", lambda: {"Authorization": "Bearer token"})
     monkeypatch.setattr("builtins.input", lambda _: "")
     
@@ -966,11 +963,8 @@ def test_make_silent_api_request_success(monkeypatch, submenu):
     def mock_get(*args, **kwargs):
         return MockResponse()
     
-    # Mock all HTTP methods that might be used
-    monkeypatch.setattr("httpx.get", mock_get)
-    monkeypatch.setattr("httpx.post", mock_get)
-    monkeypatch.setattr("httpx.put", mock_get)
-    monkeypatch.setattr("httpx.delete", mock_get)
+    # Mock the pooled client used for every HTTP method
+    monkeypatch.setattr("httpx.Client.request", mock_get)
     monkeypatch.setattr(submenu, "_get_api_headers", lambda: {"Authorization": "Bearer token"})
     
     submenu.api_reader_ip = "192.168.1.1"
@@ -981,3 +975,73 @@ def test_make_silent_api_request_success(monkeypatch, submenu):
     assert success is True
     assert data == {"success": True}
     assert status_code == 200
+
+# Test pooled HTTP client reuse across requests
+def test_http_client_is_reused_and_closed(monkeypatch, submenu):
+    import httpx
+
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, str(request.url), request.headers.get("Authorization")))
+        return httpx.Response(200, json={"ok": True})
+
+    real_client = httpx.Client
+    monkeypatch.setattr("httpx.Client", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+    submenu.api_reader_ip = "192.168.1.1"
+    submenu.api_protocol = "https"
+    submenu.api_jwt_token = "first.jwt.token"
+
+    assert submenu._make_silent_api_request("/cloud/status")[0] is True
+    client = submenu._http_client
+    submenu.api_jwt_token = "second.jwt.token"
+    assert submenu._make_silent_api_request("/cloud/config", "PUT", data={"a": 1})[0] is True
+    assert submenu._http_client is client
+    assert calls == [
+        ("GET", "https://192.168.1.1/cloud/status", "Bearer first.jwt.token"),
+        ("PUT", "https://192.168.1.1/cloud/config", "Bearer second.jwt.token")
+    ]
+
+    submenu.api_reader_ip = "192.168.1.2"
+    submenu._make_silent_api_request("/cloud/status")
+    assert client.is_closed and submenu._http_client is not client
+
+    submenu.close_http_client()
+    assert submenu._http_client is None
+
+# Test concurrent snapshot bundle
+def test_snapshot_fetches_all_endpoints_concurrently(monkeypatch, submenu, tmp_path):
+    import asyncio
+    import json
+    import httpx
+    from zebra_cli.reader_session import READER_STATE_OPERATIONS
+
+    in_flight, peak = [0], [0]
+
+    async def handler(request):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.05)
+        in_flight[0] -= 1
+        if request.url.path == "/cloud/logs":
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json={"path": request.url.path})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr("httpx.AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+    monkeypatch.setattr("builtins.input", lambda _: "")
+    monkeypatch.chdir(tmp_path)
+    submenu.api_reader_ip = "192.168.1.1"
+    submenu.api_protocol = "https"
+    submenu.api_jwt_token = "valid.jwt.token"
+    submenu.api_reader_model = "FXR90"
+
+    submenu.handle_api_snapshot()
+
+    assert peak[0] == len(READER_STATE_OPERATIONS)
+    [bundle_path] = (tmp_path / "api-responses" / "192.168.1.1_FXR90" / "snapshot").glob("snapshot-FXR90-*.json")
+    bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
+    assert list(bundle["endpoints"]) == list(READER_STATE_OPERATIONS)
+    assert bundle["endpoints"]["config"]["data"] == {"path": "/cloud/config"}
+    assert bundle["endpoints"]["logs"]["success"] is False and bundle["endpoints"]["logs"]["status_code"] == 500
+    assert bundle["elapsed_ms"] < 50 * len(READER_STATE_OPERATIONS) / 2
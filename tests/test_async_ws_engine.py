@@ -0,0 +1,114 @@
+"""
+Automated tests for zebra_cli.async_ws_engine and the ingestion benchmark
+Run with: pytest tests/test_async_ws_engine.py
+"""
+import json
+import time
+import queue
+import threading
+import zebra_cli.async_ws_engine as async_ws_engine
+from zebra_cli.async_ws_engine import (
+    OPCODE_CONTINUATION, OPCODE_PING, OPCODE_TEXT, AsyncWebSocketListener, decode_frames, decode_messages,
+    encode_frame
+)
+from zebra_cli.ws_benchmark import StandInReaderServer, run_benchmark
+
+def test_frames_are_decoded_in_batches_across_reads():
+    big = b"x" * 70000
+    stream = (encode_frame(OPCODE_TEXT, b'{"a": 1}') + encode_frame(OPCODE_PING, b"hi", mask=False)
+              + encode_frame(OPCODE_TEXT, big, mask=False))
+    buffer = bytearray(stream[:-10])
+
+    frames = decode_frames(buffer)
+    assert frames == [(True, OPCODE_TEXT, b'{"a": 1}'), (True, OPCODE_PING, b"hi")]
+    buffer += stream[-10:]
+    assert decode_frames(buffer) == [(True, OPCODE_TEXT, big)] and not buffer
+
+def test_concatenated_and_invalid_payloads_decode_like_the_threaded_listener():
+    messages = decode_messages([b'{"a": 1}', b'{"b": 2}\n{"c": 3}', b'{"d": 4} oops'])
+    assert messages[:4] == [{"a": 1}, {"b": 2}, {"c": 3}, {"d": 4}]
+    assert messages[4]["raw_message"] == "oops" and "error" in messages[4]
+
+def test_fragmented_message_is_reassembled():
+    first = bytearray(encode_frame(OPCODE_TEXT, b'{"data": '))
+    first[0] &= 0x7F  # Not final
+    frames = decode_frames(first + encode_frame(OPCODE_CONTINUATION, b'{"idHex": "E1"}}'))
+    assert [fin for fin, _, _ in frames] == [False, True]
+    assert json.loads(b"".join(payload for _, _, payload in frames)) == {"data": {"idHex": "E1"}}
+
+def test_full_consumer_queue_pauses_the_connection():
+    server = StandInReaderServer(messages=5000)
+    uri = server.start()
+    data_queue = queue.Queue()
+    listener = AsyncWebSocketListener(uri, data_queue, threading.Event(), reconnect=False, high_water=100)
+    try:
+        listener.start()
+        time.sleep(0.5)
+        assert listener.is_connected() and data_queue.qsize() < 5000  # Stopped reading, reader data left in TCP
+        received = []
+        deadline = time.monotonic() + 10
+        while len(received) < 5000 and time.monotonic() < deadline:
+            try:
+                received.append(data_queue.get(timeout=0.2))
+            except queue.Empty:
+                pass
+        assert len(received) == 5000 and listener.paused_seconds > 0
+        assert [m["data"]["idHex"] for m in received[:2]] == [f"E280{0:020X}", f"E280{1:020X}"]
+    finally:
+        listener.close()
+        server.stop()
+    assert not listener.is_alive()
+
+def test_recording_connection_does_not_pause_on_a_full_queue():
+    server = StandInReaderServer(messages=5000)
+    uri = server.start()
+    data_queue = queue.Queue(maxsize=50)  # Nobody drains it
+    listener = AsyncWebSocketListener(uri, data_queue, threading.Event(), reconnect=False, high_water=100)
+    recorded = []
+    listener.record_message = recorded.append
+    listener.ws_recorder_active = True
+    try:
+        listener.start()
+        deadline = time.monotonic() + 10
+        while len(recorded) < 5000 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(recorded) == 5000 and listener.paused_seconds == 0
+        assert data_queue.qsize() == 50 and listener.dropped == 4950
+    finally:
+        listener.ws_recorder_active = False
+        listener.close()
+        server.stop()
+
+def test_silent_reader_is_detected_by_ping_timeout(monkeypatch):
+    monkeypatch.setattr(async_ws_engine, "PING_INTERVAL", 0.5)
+    monkeypatch.setattr(async_ws_engine, "PING_TIMEOUT", 0.3)
+    server = StandInReaderServer(messages=20, close=False)  # Sends its events, then never answers again
+    data_queue = queue.Queue()
+    listener = AsyncWebSocketListener(server.start(), data_queue, threading.Event(), reconnect=False)
+    try:
+        listener.start()
+        started = time.monotonic()
+        listener.join(timeout=5)
+        assert not listener.is_alive() and data_queue.qsize() == 20
+        assert time.monotonic() - started < 3
+    finally:
+        listener.close()
+        server.stop()
+
+def test_stop_event_ends_the_reconnect_backoff(monkeypatch):
+    monkeypatch.setattr(async_ws_engine, "reconnect_delay", lambda attempt: 20.0)
+    stop_event = threading.Event()
+    listener = AsyncWebSocketListener("ws://127.0.0.1:1/ws", queue.Queue(), stop_event)
+    listener.start()
+    time.sleep(0.5)  # Connection refused, now in the 20 s backoff
+    assert listener.is_alive() and listener.ws is None
+    stop_event.set()  # What AppContext.stop_websocket does while disconnected
+    started = time.monotonic()
+    listener.join(timeout=5)
+    assert not listener.is_alive() and time.monotonic() - started < 1
+
+def test_both_engines_deliver_every_message():
+    results = run_benchmark(readers=3, messages=200, timeout=30)
+    assert [r['engine'] for r in results] == ['thread', 'async']
+    assert all(r['received'] == r['messages'] == 600 for r in results)
+    assert all(r['messages_per_s'] > 0 for r in results)
@@ -0,0 +1,51 @@
+"""
+Automated tests for zebra_cli.atr7000_locationing
+Run with: pytest tests/test_atr7000_locationing.py
+"""
+import random
+from datetime import datetime, timedelta
+import pytest
+from zebra_cli.atr7000_locationing import PositionPoint, PositionTracker, PointDataStore
+
+def _point(epc, x, y, t):
+    return PositionPoint(epc=epc, x=x, y=y, z=3.0, timestamp=t)
+
+def test_tracker_first_update_returns_measurement():
+    tracker = PositionTracker()
+    state = tracker.update(_point("E1", 1.0, 2.0, datetime(2025, 1, 1)))
+    assert state.x == 1.0 and state.y == 2.0
+    assert state.vx == 0.0 and state.vy == 0.0
+    assert state.updates == 1
+
+def test_tracker_estimates_constant_velocity():
+    tracker = PositionTracker(measurement_std=0.3)
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    for i in range(200):
+        t = start + timedelta(milliseconds=100 * i)
+        true_x = 0.5 * i * 0.1
+        tracker.update(_point("E1", true_x + rng.gauss(0, 0.3), -1.0 + rng.gauss(0, 0.3), t))
+    state = tracker.get_state("E1")
+    assert state.vx == pytest.approx(0.5, abs=0.15)
+    assert state.vy == pytest.approx(0.0, abs=0.15)
+    assert state.y == pytest.approx(-1.0, abs=0.3)
+
+def test_tracker_restarts_after_gap():
+    tracker = PositionTracker(max_gap_seconds=2.0)
+    start = datetime(2025, 1, 1)
+    tracker.update(_point("E1", 0.0, 0.0, start))
+    tracker.update(_point("E1", 0.1, 0.0, start + timedelta(seconds=1)))
+    state = tracker.update(_point("E1", 5.0, 5.0, start + timedelta(seconds=10)))
+    assert (state.x, state.y, state.updates) == (5.0, 5.0, 1)
+
+def test_point_store_keeps_track_history_and_clears():
+    store = PointDataStore()
+    start = datetime(2025, 1, 1)
+    for i in range(5):
+        store.add_position_point(_point("E1", float(i), 0.0, start + timedelta(seconds=i)))
+    timestamps, xs, ys = store.get_track_history("E1")
+    assert len(timestamps) == len(xs) == len(ys) == 5
+    assert store.get_track_state("E1").vx > 0
+    store.clear()
+    assert store.get_track_history("E1") == ([], [], [])
+    assert store.get_track_state("E1") is None
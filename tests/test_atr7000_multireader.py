@@ -0,0 +1,94 @@
+"""
+Automated tests for zebra_cli.atr7000_multireader
+Run with: pytest tests/test_atr7000_multireader.py
+"""
+import time
+import pytest
+from datetime import datetime, timedelta
+from zebra_cli.atr7000_locationing import PointDataStore
+from zebra_cli.atr7000_zones import ZONE_EXIT, Zone, ZoneEventEngine, ZoneMap
+from zebra_cli.atr7000_multireader import (
+    MultiReaderLocator, ObservationFuser, ReaderObservation, ReaderPose,
+    compute_observation, load_reader_poses, save_reader_poses
+)
+
+T0 = datetime(2025, 9, 11, 10, 17, 2)
+
+def _message(epc, azimuth, elevation, t=T0):
+    return {
+        'type': 'RAW_DIRECTIONALITY',
+        'timestamp': t.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + '+0000',
+        'data': {'idHex': epc, 'azimuth': azimuth, 'elevation': elevation}
+    }
+
+def test_pose_translates_and_rotates():
+    pose = ReaderPose("r2", x=10.0, y=5.0, height=13.0, rotation=90.0)
+    # 45° elevation from 10m above the tag projects 10m on the floor; azimuth 0 + 90° points along +X
+    observation = compute_observation(pose, pose.create_calculator(3.0), _message("E1", 0.0, 45.0))
+    assert observation.x == pytest.approx(20.0)
+    assert observation.y == pytest.approx(5.0)
+    assert observation.timestamp == T0
+
+def test_fuser_weights_observations_by_elevation():
+    fuser = ObservationFuser(window_seconds=0.25)
+    assert fuser.add(ReaderObservation("r1", "E1", 0.0, 0.0, 3.0, T0)) is None
+    assert fuser.add(ReaderObservation("r2", "E1", 4.0, 0.0, 1.0, T0 + timedelta(milliseconds=100))) is None
+    fused = fuser.add(ReaderObservation("r1", "E1", 9.0, 9.0, 1.0, T0 + timedelta(seconds=1)))
+    assert fused.x == pytest.approx(1.0)
+    assert fused.timestamp == T0 + timedelta(milliseconds=100)
+    remaining = fuser.flush()
+    assert [(p.x, p.y) for p in remaining] == [(9.0, 9.0)]
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_locator_fuses_readers_into_point_store(use_processes):
+    poses = [ReaderPose("r1", x=0.0, y=0.0), ReaderPose("r2", x=10.0, y=0.0, rotation=180.0)]
+    store = PointDataStore()
+    locator = MultiReaderLocator(poses, store, use_processes=use_processes)
+    locator.start()
+    locator.submit("r1", _message("E1", 90.0, 0.0))
+    locator.submit("r2", _message("E1", 0.0, 0.0))
+    locator.stop()
+    timestamps, xs, ys = store.get_xy_history("E1")
+    assert len(xs) == 1
+    assert xs[0] == pytest.approx(5.0)
+    assert locator.observation_counts == {"r1": 1, "r2": 1}
+
+def test_reader_poses_roundtrip(tmp_path):
+    file_path = str(tmp_path / "atr_readers.json")
+    poses = [ReaderPose("r1", 1.0, 2.0, 12.0, 30.0, "ws://10.0.0.1/ws")]
+    save_reader_poses(poses, file_path)
+    assert load_reader_poses(file_path) == poses
+
+def test_locator_uses_host_arrival_time_for_skewed_reader_clocks():
+    poses = [ReaderPose("r1"), ReaderPose("r2", x=10.0, rotation=180.0)]
+    store = PointDataStore()
+    locator = MultiReaderLocator(poses, store, use_processes=False)
+    locator.start()
+    arrival = datetime.now()
+    # r2's clock is one hour behind: the two observations still fall in the same fusion window
+    locator.submit("r1", _message("E1", 90.0, 0.0, arrival), received_at=arrival)
+    locator.submit("r2", _message("E1", 0.0, 0.0, arrival - timedelta(hours=1)),
+                   received_at=arrival + timedelta(milliseconds=50))
+    locator.stop()
+    timestamps, xs, _ = store.get_xy_history("E1")
+    assert len(xs) == 1 and xs[0] == pytest.approx(5.0)
+    assert timestamps[0] == arrival + timedelta(milliseconds=50)
+
+def test_locator_tick_expires_zone_tags_without_traffic():
+    zone_map = ZoneMap()
+    zone_map.add_zone(Zone("hall", [(-50, -50), (50, -50), (50, 50), (-50, 50)]))
+    engine = ZoneEventEngine(zone_map, stale_seconds=0.2)
+    events = []
+    locator = MultiReaderLocator([ReaderPose("r1")], PointDataStore(), use_processes=False,
+                                 on_point=lambda p: events.extend(engine.process_position(p.epc, p.x, p.y, p.timestamp)),
+                                 on_tick=lambda: events.extend(engine.expire_stale_tags()), tick_seconds=0.05)
+    locator.start()
+    try:
+        locator.submit("r1", _message("E1", 90.0, 45.0))
+        deadline = time.monotonic() + 5
+        # The tag is seen once: only the periodic tick can make it leave the zone
+        while time.monotonic() < deadline and not any(e.event == ZONE_EXIT for e in events):
+            time.sleep(0.05)
+    finally:
+        locator.stop()
+    assert [(e.event, e.epc, e.zone) for e in events if e.event == ZONE_EXIT] == [(ZONE_EXIT, "E1", "hall")]
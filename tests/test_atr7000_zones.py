@@ -0,0 +1,92 @@
+"""
+Automated tests for zebra_cli.atr7000_zones
+Run with: pytest tests/test_atr7000_zones.py
+"""
+import sys
+import threading
+from datetime import datetime, timedelta
+from zebra_cli.atr7000_zones import Zone, ZoneMap, ZoneEventEngine, read_zone_events
+
+T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+def _engine():
+    zone_map = ZoneMap()
+    zone_map.add_zone(Zone.rectangle("dock", 0, 0, 2, 2, dwell_seconds=5))
+    zone_map.add_zone(Zone("triangle", [(-3, -3), (-1, -3), (-2, -1)]))
+    return ZoneEventEngine(zone_map)
+
+def test_polygon_contains():
+    zone = Zone("triangle", [(-3, -3), (-1, -3), (-2, -1)])
+    assert zone.contains(-2, -2.5)
+    assert not zone.contains(-1.1, -1.2)
+
+def test_enter_dwell_exit_and_membership():
+    engine = _engine()
+    events = engine.process_position("E1", 1, 1, T0)
+    assert [(e.event, e.zone) for e in events] == [("ENTER", "dock")]
+    assert engine.tags_in_zone("dock") == ["E1"]
+    assert engine.process_position("E1", 1.5, 1, T0 + timedelta(seconds=2)) == []
+    events = engine.process_position("E1", 1.5, 1, T0 + timedelta(seconds=6))
+    assert [e.event for e in events] == ["DWELL"]
+    # DWELL is emitted only once per visit
+    assert engine.process_position("E1", 1.5, 1, T0 + timedelta(seconds=7)) == []
+    events = engine.process_position("E1", -2, -2.5, T0 + timedelta(seconds=8))
+    assert [(e.event, e.zone) for e in events] == [("EXIT", "dock"), ("ENTER", "triangle")]
+    assert events[0].dwell_seconds == 8
+    assert engine.tags_in_zone("dock") == []
+
+def test_expire_stale_tags():
+    engine = _engine()
+    engine.process_position("E1", 1, 1, T0)
+    events = engine.expire_stale_tags(T0 + timedelta(seconds=60))
+    assert [(e.event, e.zone) for e in events] == [("EXIT", "dock")]
+    assert engine.get_occupancy() == {}
+
+def test_record_and_replay(tmp_path):
+    engine = _engine()
+    file_path = str(tmp_path / "zone_events.csv")
+    engine.start_recording(file_path)
+    engine.process_position("E1", 1, 1, T0)
+    engine.process_position("E2", 0.5, 0.5, T0 + timedelta(seconds=1))
+    engine.process_position("E1", 5, 5, T0 + timedelta(seconds=2))
+    engine.stop_recording()
+    assert [e.event for e in read_zone_events(file_path)] == ["ENTER", "ENTER", "EXIT"]
+
+    replayed = _engine()
+    replayed.replay(file_path)
+    assert replayed.tags_in_zone("dock") == ["E2"]
+
+def test_zone_map_save_load(tmp_path):
+    zone_map = _engine().zone_map
+    file_path = str(tmp_path / "zones.json")
+    zone_map.save(file_path)
+    loaded = ZoneMap.load(file_path)
+    assert set(loaded.zones) == {"dock", "triangle"}
+    assert loaded.zones_at(1, 1) == {"dock"}
+
+def test_zone_changes_while_positions_are_processed():
+    zone_map = ZoneMap()
+    zone_map.add_grid(grid_size=5)
+    errors = []
+    stop = threading.Event()
+
+    def lookups():
+        try:
+            while not stop.is_set():
+                zone_map.zones_at(0.2, 0.2)
+        except Exception as e:  # KeyError on a zone removed mid-lookup
+            errors.append(e)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Interleave the threads as often as possible
+    thread = threading.Thread(target=lookups)
+    thread.start()
+    try:
+        for _ in range(2000):
+            zone_map.remove_zone("cell_2_2")
+            zone_map.add_zone(Zone.rectangle("cell_2_2", -0.5, -0.5, 0.5, 0.5))
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    assert errors == [] and zone_map.zones_at(0.2, 0.2) == {"cell_2_2"}
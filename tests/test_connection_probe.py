@@ -0,0 +1,65 @@
+"""
+Automated tests for zebra_cli.connection_probe and the per-reader endpoint persistence
+Run with: pytest tests/test_connection_probe.py
+"""
+import time
+import zebra_cli.context as context_module
+from zebra_cli.connection_probe import race
+
+READER = "192.168.1.1"
+
+def test_race_first_success_wins_and_losers_are_cancelled_or_discarded():
+    started, discarded = [], []
+
+    def probe(candidate):
+        started.append(candidate)
+        if candidate == "slow":
+            time.sleep(0.3)
+            return "slow-connection"
+        if candidate == "refused":
+            raise ConnectionRefusedError("refused")
+        return f"{candidate}-connection"
+
+    winner = race(["slow", "refused", "fast", "unstarted"], probe, stagger=0.05, discard=discarded.append)
+
+    assert winner == ("fast", "fast-connection")
+    assert "unstarted" not in started
+    deadline = time.monotonic() + 2
+    while not discarded and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert discarded == ["slow-connection"]
+
+def test_race_returns_none_when_every_candidate_fails():
+    start = time.monotonic()
+    assert race(["https", "http"], lambda candidate: None, stagger=0.05) == (None, None)
+    assert time.monotonic() - start < 1
+
+def test_winning_endpoint_is_persisted_per_reader(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    probes, status_calls = [], []
+
+    def mock_probe(ip, debug=False):
+        probes.append(ip)
+        return "http"
+
+    def mock_get_status(self):
+        status_calls.append(self.base_url)
+        return {"status": "ok"}
+
+    monkeypatch.setattr(context_module, "probe_protocol", mock_probe)
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "get_status", mock_get_status)
+
+    context = context_module.AppContext()
+    context.connect(READER, "valid.jwt.token")
+    assert probes == [READER] and status_calls == [f"http://{READER}"]
+    assert context.ws_uri == f"ws://{READER}/ws"
+
+    context.config_manager.save_reader_endpoint(READER, ws_uri=f"ws://{READER}:80/ws")
+    context.disconnect()  # Clears config.json but keeps the reader endpoints
+
+    context = context_module.AppContext()
+    context.connect(READER, "valid.jwt.token")
+    assert probes == [READER]  # Saved protocol: connected in one attempt without probing
+    assert status_calls == [f"http://{READER}", f"http://{READER}"]
+    assert context.ws_uri == f"ws://{READER}:80/ws"
+    assert context.ws_fallback_uris == [f"ws://{READER}/ws", f"wss://{READER}/ws"]
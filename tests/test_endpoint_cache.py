@@ -0,0 +1,76 @@
+"""
+Automated tests for zebra_cli.endpoint_cache
+Run with: pytest tests/test_endpoint_cache.py
+"""
+import zebra_cli.endpoint_cache as endpoint_cache
+from zebra_cli.endpoint_cache import ENDPOINT_TTLS, EndpointCache
+
+READER = "192.168.1.1"
+
+def test_entries_persist_and_expire_per_endpoint(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr(endpoint_cache.time, "time", lambda: now[0])
+    cache_file = tmp_path / "endpoint_cache.json"
+
+    EndpointCache(cache_file=cache_file).put(READER, "/cloud/version", {"model": "FXR90"})
+    EndpointCache(cache_file=cache_file).put(READER, "/cloud/certificates", [{"name": "server"}])
+    EndpointCache(cache_file=cache_file).put(READER, "/cloud/status", {"uptime": 1})  # Not cacheable
+
+    cache = EndpointCache(cache_file=cache_file)
+    assert cache.get(READER, "/cloud/version") == {"model": "FXR90"}
+    assert cache.get("192.168.1.2", "/cloud/version") is None
+    assert cache.get(READER, "/cloud/status") is None
+
+    now[0] += ENDPOINT_TTLS["/cloud/certificates"] + 1
+    assert cache.get(READER, "/cloud/certificates") is None
+    assert cache.get(READER, "/cloud/version") == {"model": "FXR90"}
+
+    assert EndpointCache(cache_file=cache_file, enabled=False).get(READER, "/cloud/version") is None
+
+def test_writes_invalidate_affected_entries(tmp_path):
+    cache = EndpointCache(cache_file=tmp_path / "endpoint_cache.json")
+    for endpoint in ("/cloud/version", "/cloud/region", "/cloud/certificates", "/cloud/readerCapabilities"):
+        cache.put(READER, endpoint, {"endpoint": endpoint})
+
+    cache.invalidate_for_write(READER, "/cloud/certificates/server")
+    assert cache.get(READER, "/cloud/certificates") is None
+    cache.invalidate_for_write(READER, "/cloud/region")
+    assert cache.get(READER, "/cloud/region") is None
+    assert cache.get(READER, "/cloud/version") == {"endpoint": "/cloud/version"}
+
+    cache.invalidate_for_write(READER, "/cloud/reboot")
+    assert cache.get(READER, "/cloud/version") is None
+    assert cache.get(READER, "/cloud/readerCapabilities") is None
+
+def test_api_submenu_serves_and_invalidates_from_cache(monkeypatch, tmp_path):
+    from zebra_cli.api_submenu import ApiSubmenu
+    from zebra_cli.context import AppContext
+
+    context = AppContext()
+    context.endpoint_cache = EndpointCache(cache_file=tmp_path / "endpoint_cache.json")
+    submenu = ApiSubmenu(app_context=context)
+    submenu.api_reader_ip = READER
+    submenu.api_protocol = "https"
+    submenu.api_jwt_token = "valid.jwt.token"
+
+    requests = []
+
+    class MockResponse:
+        status_code = 200
+        text = '{"model": "FXR90"}'
+
+        def json(self):
+            return {"model": "FXR90"}
+
+    def mock_request(self, method, url, **kwargs):
+        requests.append((method, url))
+        return MockResponse()
+
+    monkeypatch.setattr("httpx.Client.request", mock_request)
+    assert submenu._make_silent_api_request("/cloud/version")[1] == {"model": "FXR90"}
+    assert submenu._make_silent_api_request("/cloud/version")[1] == {"model": "FXR90"}
+    assert requests == [("GET", "/cloud/version")]
+
+    submenu._make_silent_api_request("/cloud/reboot", "PUT", data={})
+    submenu._make_silent_api_request("/cloud/version")
+    assert requests == [("GET", "/cloud/version"), ("PUT", "/cloud/reboot"), ("GET", "/cloud/version")]
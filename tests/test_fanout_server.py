@@ -0,0 +1,111 @@
+"""
+Automated tests for zebra_cli.fanout_server
+Run with: pytest tests/test_fanout_server.py
+"""
+import json
+import time
+import socket
+import threading
+import pytest
+import websocket
+from zebra_cli.fanout_server import BroadcastQueue, ClientFilter, FanoutServer, parse_address
+
+def tag_message(epc, rssi=-50, antenna=1, reader_id=None):
+    message = {"type": "SIMPLE", "data": {"idHex": epc, "peakRssi": rssi, "antenna": antenna}}
+    if reader_id:
+        message["reader_id"] = reader_id
+    return message
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+def read_lines(sock, count, timeout=5):
+    sock.settimeout(timeout)
+    data = b""
+    while data.count(b"\n") < count:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return [json.loads(line) for line in data.splitlines()]
+
+def test_filters_and_addresses():
+    assert parse_address("8765") == ("127.0.0.1", 8765) and parse_address("0.0.0.0:9000") == ("0.0.0.0", 9000)
+    client_filter = ClientFilter("?epc=e280*,3000*&antenna=1,2&min_rssi=-60&gaps=0")
+    event = {"epc": "E2801234", "reader_id": None, "antenna": 2, "rssi": -55.0}
+    assert client_filter.matches(event)
+    assert not client_filter.matches({**event, "epc": "AAAA"})
+    assert not client_filter.matches({**event, "rssi": -70.0}) and not client_filter.matches({**event, "rssi": None})
+    assert not client_filter.matches({"type": "CONNECTION_GAP"}) and ClientFilter("").matches({"type": "CONNECTION_GAP"})
+    assert str(client_filter) == "epc=E280*,3000*&antenna=1,2&min_rssi=-60&gaps=0"
+    with pytest.raises(ValueError):
+        ClientFilter("rssi=-60")
+
+def test_websocket_and_tcp_clients_receive_their_filtered_stream():
+    server = FanoutServer(port=0)
+    host, port = parse_address(server.start())
+    data_queue = BroadcastQueue(server)
+    ws = websocket.create_connection(f"ws://{host}:{port}/?reader=dock-a", timeout=5)
+    tcp = socket.create_connection((host, port))
+    tcp.sendall(b"epc=E2*\n")
+    try:
+        assert wait_for(lambda: server.status()["clients"] == 2)
+        for message in [tag_message("E1", reader_id="dock-a"), tag_message("E2", reader_id="dock-b"),
+                        {"type": "heartbeat"}, tag_message("E3", reader_id="dock-a")]:
+            data_queue.put_nowait(message)
+
+        assert [json.loads(ws.recv())["epc"] for _ in range(2)] == ["E1", "E3"]
+        lines = read_lines(tcp, 1)
+        assert [(line["epc"], line["reader_id"], line["rssi"]) for line in lines] == [("E2", "dock-b", -50.0)]
+        assert data_queue.qsize() == 4  # The local consumers still get every message
+        assert server.status()["published"] == 3
+    finally:
+        ws.close()
+        tcp.close()
+        server.stop()
+
+def test_full_local_queue_still_publishes_every_message():
+    server = FanoutServer(port=0)
+    host, port = parse_address(server.start())
+    data_queue = BroadcastQueue(server, maxsize=2)  # Nobody drains it
+    tcp = socket.create_connection((host, port))
+    tcp.sendall(b"\n")
+    try:
+        assert wait_for(lambda: server.status()["clients"] == 1)
+        for i in range(5):
+            data_queue.put_nowait(tag_message(f"E{i}"))
+        data_queue.put(tag_message("E5"))  # Blocking put does not block either
+        assert [event["epc"] for event in read_lines(tcp, 6)] == [f"E{i}" for i in range(6)]
+        assert data_queue.qsize() == 2 and data_queue.dropped == 4
+    finally:
+        tcp.close()
+        server.stop()
+
+def test_slow_consumer_is_disconnected_without_stalling_the_others():
+    events = 100000
+    server = FanoutServer(port=0, buffer_size=200)
+    host, port = parse_address(server.start())
+    slow = socket.socket()
+    slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    slow.connect((host, port))
+    slow.sendall(b"\n")  # Never reads
+    fast = socket.create_connection((host, port))
+    fast.sendall(b"\n")
+    received = []
+    reader = threading.Thread(target=lambda: received.extend(read_lines(fast, events, timeout=20)))
+    try:
+        assert wait_for(lambda: server.status()["clients"] == 2)
+        reader.start()
+        for i in range(events):
+            server.publish(tag_message(f"E{i:08d}"))
+        reader.join(timeout=30)
+
+        assert len(received) == events and received[-1]["epc"] == f"E{events - 1:08d}"
+        assert server.slow_disconnects == 1 and server.status()["clients"] == 1
+    finally:
+        slow.close()
+        fast.close()
+        server.stop()
@@ -0,0 +1,125 @@
+"""
+Automated tests for zebra_cli.fleet_config
+Run with: pytest tests/test_fleet_config.py
+"""
+import json
+import httpx
+import pytest
+import zebra_cli.fleet_config as fleet_config
+from zebra_cli.reader_session import ReaderSession
+
+MODE = {"type": "INVENTORY", "antennas": [1, 2], "transmitPower": 30}
+
+def reader_handler(readers, requests):
+    """Mock readers keyed by host: {"mode": {...}, "config": {...}}; PUTs update them"""
+    def handler(request):
+        reader = readers[request.url.host]
+        section = request.url.path.rsplit("/", 1)[-1]
+        requests.append((request.url.host, request.method, section))
+        if reader.get("fail_put") and request.method == "PUT":
+            return httpx.Response(500, json={"message": "busy"})
+        if request.method == "PUT":
+            reader[section] = json.loads(request.content)
+            return httpx.Response(200)
+        return httpx.Response(200, json=reader[section])
+    return handler
+
+@pytest.fixture
+def fleet(monkeypatch):
+    readers, requests = {}, []
+    transport = httpx.MockTransport(reader_handler(readers, requests))
+
+    def open_session(target, token, timeout, debug):
+        session = ReaderSession(f"https://{target['ip']}", token)
+        session.client.set_async_httpx_client(httpx.AsyncClient(base_url=session.base_url, transport=transport))
+        return session
+
+    monkeypatch.setattr(fleet_config, "_reader_token", lambda target, store, force, debug: "valid.jwt.token")
+    monkeypatch.setattr(fleet_config, "_open_session", open_session)
+    return readers, requests
+
+def targets(*ips):
+    return [{"ip": ip, "username": "admin", "password": "change", "protocol": "https"} for ip in ips]
+
+def test_diff_ignores_fields_the_reader_adds():
+    current = {"type": "INVENTORY", "antennas": [1, 2], "transmitPower": 30, "query": {"tagPopulation": 30}}
+    assert fleet_config.diff_json(MODE, current) == []
+    assert fleet_config.diff_json({"antennas": [1], "filter": {"match": "prefix"}}, current) == ["antennas", "filter"]
+    assert fleet_config.diff_json({"query": {"tagPopulation": 100}}, current) == ["query.tagPopulation"]
+
+def test_load_desired_accepts_bare_operating_mode(tmp_path):
+    path = tmp_path / "mode.json"
+    path.write_text(json.dumps(MODE))
+    assert fleet_config.load_desired(str(path)) == {"mode": MODE}
+    path.write_text(json.dumps({"mode": MODE, "config": {"x": 1}}))
+    assert list(fleet_config.load_desired(str(path))) == ["config", "mode"]
+    path.write_text(json.dumps({"network": {}}))
+    with pytest.raises(ValueError, match="network"):
+        fleet_config.load_desired(str(path))
+
+def test_only_differing_readers_and_sections_are_put(fleet, tmp_path):
+    readers, requests = fleet
+    config = {"GPIO-LED": {"GPODefaults": {"1": "LOW"}}}
+    readers["10.0.0.1"] = {"mode": dict(MODE), "config": dict(config, **{"READER-GATEWAY": {"batching": []}})}
+    readers["10.0.0.2"] = {"mode": dict(MODE, transmitPower=20), "config": config}
+    readers["10.0.0.3"] = {"mode": {"type": "SIMPLE"}, "config": {}, "fail_put": True}
+    report = tmp_path / "report.json"
+
+    summary = fleet_config.run_fleet_config(targets("10.0.0.1", "10.0.0.2", "10.0.0.3"),
+                                            {"config": config, "mode": MODE}, workers=2,
+                                            report_path=str(report), log=lambda line: None)
+
+    assert (summary["unchanged"], summary["changed"], summary["failed"]) == (1, 1, 1)
+    puts = [r for r in requests if r[1] == "PUT"]
+    assert puts == [("10.0.0.2", "PUT", "mode"), ("10.0.0.3", "PUT", "config")]  # No mode after a failed config
+    assert readers["10.0.0.2"]["mode"] == MODE
+    result = summary["results"][1]
+    assert result["sections"]["config"]["status"] == "unchanged"
+    assert result["sections"]["mode"]["differences"] == ["transmitPower"]
+    assert result["sections"]["mode"]["put_ms"] is not None
+    assert summary["sections"]["mode"]["changed"] == 1 and "p95_ms" in summary["sections"]["mode"]["get"]
+    assert json.loads(report.read_text())["results"][2]["status"] == "failed"
+
+def test_config_put_keeps_reader_settings_the_desired_file_does_not_mention(fleet, tmp_path):
+    readers, requests = fleet
+    readers["10.0.0.1"] = {
+        "mode": dict(MODE),
+        "config": {"GPIO-LED": {"GPODefaults": {"1": "LOW", "2": "HIGH"}}, "READER-GATEWAY": {"batching": []}}
+    }
+    desired = {"config": {"GPIO-LED": {"GPODefaults": {"1": "HIGH"}}}, "mode": MODE}
+
+    summary = fleet_config.run_fleet_config(targets("10.0.0.1"), desired, report_path=str(tmp_path / "report.json"),
+                                            log=lambda line: None)
+
+    assert summary["changed"] == 1
+    assert readers["10.0.0.1"]["config"] == {"GPIO-LED": {"GPODefaults": {"1": "HIGH", "2": "HIGH"}},
+                                             "READER-GATEWAY": {"batching": []}}
+    assert summary["results"][0]["sections"]["mode"]["status"] == "unchanged"
+
+def test_mode_of_another_type_is_put_as_desired(fleet, tmp_path):
+    readers, requests = fleet
+    simple = {"type": "SIMPLE", "reportFilter": {"duration": 0, "type": "RADIO_WIDE"},
+              "tagMetaData": ["ANTENNA", "RSSI", "SEEN_COUNT"]}
+    readers["10.0.0.1"] = {"mode": {"type": "DIRECTIONALITY", "reportFilter": {"duration": 0, "type": "RADIO_WIDE"},
+                                    "tagMetaData": ["ANTENNA", "RSSI", "SEEN_COUNT"], "filter": {"match": "prefix"},
+                                    "modeSpecificSettings": {"interval": 1}}}
+    readers["10.0.0.2"] = {"mode": dict(simple, filter={"match": "prefix"})}  # Only an extra key differs
+
+    summary = fleet_config.run_fleet_config(targets("10.0.0.1", "10.0.0.2"), {"mode": simple},
+                                            report_path=str(tmp_path / "report.json"), log=lambda line: None)
+
+    assert summary["changed"] == 2
+    assert summary["results"][0]["sections"]["mode"]["differences"] == ["type", "-filter", "-modeSpecificSettings"]
+    assert summary["results"][1]["sections"]["mode"]["differences"] == ["-filter"]
+    assert readers["10.0.0.1"]["mode"] == simple and readers["10.0.0.2"]["mode"] == simple
+
+def test_dry_run_reports_differences_without_put(fleet, tmp_path):
+    readers, requests = fleet
+    readers["10.0.0.1"] = {"mode": {"type": "SIMPLE"}}
+
+    summary = fleet_config.run_fleet_config(targets("10.0.0.1"), {"mode": MODE}, dry_run=True,
+                                            report_path=str(tmp_path / "report.json"), log=lambda line: None)
+
+    assert summary["would_change"] == 1
+    assert summary["results"][0]["sections"]["mode"]["differences"] == ["type", "antennas", "transmitPower"]
+    assert all(method == "GET" for _, method, _ in requests)
@@ -0,0 +1,39 @@
+"""
+Automated tests for the CLI startup import budget
+Run with: pytest tests/test_import_time.py
+"""
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Generous budget for slow CI machines; a warm start is ~0.15s, the eager imports took ~1.1s
+IMPORT_BUDGET_MS = float(os.environ.get('ZEBRA_CLI_IMPORT_BUDGET_MS', '600'))
+DEFERRED_MODULES = [
+    'matplotlib', 'numpy', 'scipy', 'requests', 'plotext',
+    'zebra_cli.api_submenu', 'zebra_cli.atr_submenu', 'zebra_cli.atr7000_locationing',
+    'zebra_cli.plotter', 'zebra_cli.report_renderer', 'zebra_cli.report_html', 'zebra_cli.iotc_client',
+    'zebra_cli.reader_session'
+]
+
+def _import_times(module):
+    """Runs `python -X importtime -c 'import module'` and returns {module: cumulative microseconds}"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_interactive_cli_defers_heavy_imports():
+    _import_times('zebra_cli.interactive_cli')  # Warm the bytecode cache
+    times = _import_times('zebra_cli.interactive_cli')
+    assert 'zebra_cli.interactive_cli' in times
+    assert [m for m in DEFERRED_MODULES if m in times] == []
+    assert times['zebra_cli.interactive_cli'] / 1000 < IMPORT_BUDGET_MS
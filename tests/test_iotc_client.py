@@ -0,0 +1,67 @@
+"""
+Automated tests for zebra_cli.iotc_client.ZebraIoTCClient
+Run with: pytest tests/test_iotc_client.py
+"""
+import json
+import threading
+from zebra_cli.iotc_client import ProvisioningState, ZebraIoTCClient
+
+NAMESPACES = 'xmlns:g1="urn:epcglobal:rm:xsd:1" xmlns:g3="urn:motorfid:rm:xsd:1"'
+ENDPOINTS = [{"type": "WEBSOCKET", "name": "WS"}, {"type": "MQTT", "name": "broker"}]
+MAPPING = {"data": [{"type": "MQTT", "name": "broker"}]}
+
+def xml_reply(content):
+    return f'<g1:reply {NAMESPACES}><g1:resultCode>0</g1:resultCode>{content}</g1:reply>'
+
+class MockResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+def make_client(monkeypatch):
+    client = ZebraIoTCClient(ip_address="192.168.1.1")
+    posts = []
+    lock = threading.Lock()
+
+    def mock_post(url, data=None, headers=None, timeout=None):
+        with lock:
+            posts.append(data)
+        if "isEnrolledToCloud" in data:
+            return MockResponse(xml_reply("<g3:isEnrolled>true</g3:isEnrolled>"))
+        if "isConnectedToCloud" in data:
+            return MockResponse(xml_reply("<g3:isConnected>false</g3:isConnected>"))
+        if "manageCloudEndpoints" in data:
+            return MockResponse(xml_reply(f"<g3:data>{json.dumps(ENDPOINTS)}</g3:data>"))
+        if "cloudEndpointsMapping" in data:
+            return MockResponse(xml_reply(f"<g3:data>{json.dumps(MAPPING)}</g3:data>"))
+        return MockResponse(xml_reply(""))
+
+    monkeypatch.setattr(client.session, "post", mock_post)
+    return client, posts
+
+def test_provisioning_state_is_one_concurrent_snapshot(monkeypatch):
+    client, posts = make_client(monkeypatch)
+
+    state = client.get_provisioning_state("session")
+
+    assert len(posts) == 4
+    assert state.enrolled is True and state.connected is False and state.errors == {}
+    assert state.has_endpoint("WEBSOCKET", "WS") is True
+    assert state.has_endpoint("MQTT", "other") is False
+    assert state.is_mapped("MQTT", "broker") is True
+    assert state.is_mapped("WEBSOCKET", "WS") is False
+    assert ProvisioningState().has_endpoint("WEBSOCKET", "WS") is None
+
+def test_endpoint_views_are_cached_until_changed(monkeypatch):
+    client, posts = make_client(monkeypatch)
+    client.get_provisioning_state("session")
+
+    assert client.get_all_endpoints("session") == ENDPOINTS
+    assert client.get_endpoint_mapping("session") == MAPPING
+    assert len(posts) == 4
+
+    client.add_wsep("session")
+    client.get_all_endpoints("session")
+    assert len(posts) == 6  # ADD plus a fresh VIEW
+    client.close()
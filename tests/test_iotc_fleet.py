@@ -0,0 +1,176 @@
+"""
+Automated tests for zebra_cli.iotc_fleet
+Run with: pytest tests/test_iotc_fleet.py
+"""
+import json
+import time
+import threading
+import socketserver
+import pytest
+import zebra_cli.iotc_fleet as fleet
+from zebra_cli.iotc_client import ProvisioningState, ZebraIoTCClient, build_fxr90_endpoint_config
+from zebra_cli.iotc_setup import PHASES, XmlIotcSetup
+
+class FakeIoTCClient:
+    """Reader with the WS endpoint already created but not mapped; the first login can be made to fail"""
+    fail_logins = 0
+    calls = []
+
+    def __init__(self, protocol="https", debug=False, ip_address=None):
+        self.ip = ip_address
+
+    def xml_login(self, username, password):
+        if FakeIoTCClient.fail_logins:
+            FakeIoTCClient.fail_logins -= 1
+            return None
+        return "session"
+
+    def get_provisioning_state(self, session_id):
+        return ProvisioningState(enrolled=True, connected=True,
+                                 endpoints=[{"type": "WEBSOCKET", "name": "WS"}], mapping={"data": []})
+
+    def map_wsep(self, session_id):
+        self.calls.append(("map", self.ip))
+        return True
+
+    def disconnect_iotc(self, session_id):
+        self.calls.append(("disconnect", self.ip))
+
+    def is_iotc_connected(self, session_id, verbose=True):
+        return False
+
+    def connect_iotc(self, session_id):
+        self.calls.append(("connect", self.ip))
+        return True
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    FakeIoTCClient.fail_logins = 0
+    FakeIoTCClient.calls = []
+    monkeypatch.setattr(fleet, "ZebraIoTCClient", FakeIoTCClient)
+    return FakeIoTCClient
+
+def test_inventory_applies_defaults_and_rejects_invalid_entries(tmp_path):
+    inventory = tmp_path / "fleet.json"
+    inventory.write_text(json.dumps({
+        "defaults": {"password": "secret", "model": "FX9600"},
+        "readers": [
+            {"ip": "10.0.0.1"},
+            {"ip": "10.0.0.2", "setup": "mqtt", "host_name": "broker", "endpoint_name": "plant"}
+        ]
+    }))
+    targets = fleet.load_inventory(str(inventory))
+    assert [t["password"] for t in targets] == ["secret", "secret"]
+    assert targets[0]["setup"] == "ws" and targets[0]["username"] == "admin"
+    assert targets[1]["reader_name"] == "reader-10-0-0-2"
+
+    inventory.write_text(json.dumps([{"ip": "10.0.0.1", "setup": "mqtt"}]))
+    with pytest.raises(ValueError, match="host_name"):
+        fleet.load_inventory(str(inventory))
+    inventory.write_text(json.dumps([{"ip": "10.0.0.1"}, {"ip": "10.0.0.1"}]))
+    with pytest.raises(ValueError, match="twice"):
+        fleet.load_inventory(str(inventory))
+    for malformed in (["10.0.0.1"], {"readers": {"ip": "10.0.0.1"}}, {"defaults": [], "readers": []}):
+        inventory.write_text(json.dumps(malformed))
+        with pytest.raises(ValueError, match="expected"):
+            fleet.load_inventory(str(inventory))
+
+def test_reader_skips_done_phases_and_retries_failed_attempts(fake_client):
+    fake_client.fail_logins = 1
+    target = dict(fleet.INVENTORY_DEFAULTS, ip="10.0.0.1", model="FX9600")
+
+    result = fleet.provision_reader(target, timeout=30, retries=1, retry_delay=0)
+
+    assert result["status"] == "provisioned" and result["attempts"] == 2 and result["error"] is None
+    statuses = {p["phase"]: p["status"] for p in result["phases"]}
+    assert statuses == {"detect": "skipped", "login": "completed", "state": "completed", "endpoint": "skipped",
+                        "mapping": "completed", "enrollment": "skipped", "activation": "completed"}
+    assert fake_client.calls == [("map", "10.0.0.1"), ("disconnect", "10.0.0.1"), ("connect", "10.0.0.1")]
+
+    fake_client.fail_logins = 2
+    result = fleet.provision_reader(target, timeout=30, retries=1, retry_delay=0)
+    assert result["status"] == "failed" and result["attempts"] == 2
+    assert result["error"] == "login: XML login failed"
+
+class StuckConnectedClient(FakeIoTCClient):
+    """Reader that never reports itself disconnected from IOTC"""
+    connect_error = None
+
+    def is_iotc_connected(self, session_id, verbose=True):
+        return True
+
+    def connect_iotc(self, session_id):
+        self.calls.append(("connect", self.ip))
+        self.last_error = self.connect_error
+        return self.connect_error is None
+
+def test_activation_connects_a_reader_still_connected_after_the_checks(fake_client):
+    client = StuckConnectedClient(ip_address="10.0.0.1")
+    setup = XmlIotcSetup(client, 'ws', always_activate=False, sleep=lambda seconds: None)
+    statuses = {name: setup.phase(name, "admin", "change")[0] for name in PHASES}
+    assert statuses["mapping"] == "completed" and statuses["activation"] == "completed"
+    assert client.calls[-1] == ("connect", "10.0.0.1")  # Connected anyway, like the interactive setup
+
+    # Only "already connected" back: the new mapping was never activated
+    StuckConnectedClient.connect_error = "result code 65535: already connected to cloud"
+    try:
+        setup = XmlIotcSetup(StuckConnectedClient(ip_address="10.0.0.1"), 'ws', sleep=lambda seconds: None)
+        for name in PHASES[:-1]:
+            setup.phase(name, "admin", "change")
+        status, detail = setup.activation()
+        assert status == "failed" and "mapping not activated" in detail
+        setup.changed = []
+        assert setup.activation()[0] == "skipped"
+    finally:
+        StuckConnectedClient.connect_error = None
+
+def test_fleet_run_writes_report_with_phase_timings(fake_client, tmp_path):
+    targets = [dict(fleet.INVENTORY_DEFAULTS, ip=f"10.0.0.{i}", model="ATR7000") for i in range(1, 6)]
+    report = tmp_path / "fleet_report.json"
+    lines = []
+
+    summary = fleet.run_fleet_provisioning(targets, workers=3, timeout=30, retries=0,
+                                           report_path=str(report), log=lines.append)
+
+    assert summary["provisioned"] == 5 and summary["failed"] == 0 and summary["workers"] == 3
+    assert [r["ip"] for r in summary["results"]] == [t["ip"] for t in targets]
+    assert summary["phases"]["mapping"]["completed"] == 5
+    assert summary["phases"]["endpoint"]["skipped"] == 5
+    assert set(summary["phases"]["activation"]) >= {"avg_seconds", "max_seconds", "total_seconds"}
+    assert json.loads(report.read_text())["provisioned"] == 5
+    assert len(lines) == 7  # Start line, one line per reader, report path
+
+def test_reader_deadline_bounds_requests_inside_a_phase():
+    class SilentReader(socketserver.BaseRequestHandler):
+        def handle(self):
+            time.sleep(3)  # Accepts the connection, never answers in time
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SilentReader)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = ZebraIoTCClient(protocol="http", ip_address=f"127.0.0.1:{server.server_address[1]}")
+        run = fleet._ReaderRun(timeout=0.5)
+        client.deadline = run.deadline
+        start = time.monotonic()
+        with pytest.raises(fleet.PhaseFailed, match="reader timeout"):
+            run.phase("login", lambda: (fleet.STATUS_COMPLETED, "") if client.xml_login("admin", "change")
+                      else (fleet.STATUS_FAILED, "XML login failed"))
+        assert time.monotonic() - start < 2  # Not the 60 s read timeout of the XML interface
+        assert run.phases[0]["detail"] == "reader timeout"
+        with pytest.raises(TimeoutError):
+            run.timeout(30)
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_fxr90_endpoint_config_is_idempotent():
+    current = {"data": {"event": {"connections": [{"type": "mqtt", "name": "old"}]}}}
+    desired = build_fxr90_endpoint_config(current, "broker", "dock-1", "plant")
+    assert desired != current
+    assert current == {"data": {"event": {"connections": [{"type": "mqtt", "name": "old"}]}}}
+    assert build_fxr90_endpoint_config(desired, "broker", "dock-1", "plant") == desired
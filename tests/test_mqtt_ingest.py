@@ -0,0 +1,83 @@
+"""
+Automated tests for zebra_cli.mqtt_ingest (against the local stand-in broker)
+Run with: pytest tests/test_mqtt_ingest.py
+"""
+import time
+import queue
+import threading
+import pytest
+from zebra_cli.mqtt_ingest import PAHO_AVAILABLE, data_topics, decode_payload, reader_from_topic
+from zebra_cli.multi_reader_session import MultiReaderSession
+from zebra_cli.ws_benchmark import StandInMqttBroker, mqtt_topic_matches, run_benchmark
+
+needs_paho = pytest.mark.skipif(not PAHO_AVAILABLE, reason="paho-mqtt not installed")
+
+def test_topics_and_payloads():
+    assert data_topics() == ["tevents/+"]
+    assert data_topics(["dock-a", "dock-b"], management_events=True) == [
+        "tevents/dock-a", "tevents/dock-b", "mevents/dock-a", "mevents/dock-b"]
+    assert reader_from_topic("tevents/dock-a") == "dock-a"
+    assert decode_payload(b'[{"a": 1}, {"b": 2}]') == [{"a": 1}, {"b": 2}]  # Batched report
+    assert decode_payload(b'{"a": 1}{"b": 2}') == [{"a": 1}, {"b": 2}]
+    assert decode_payload(b'oops')[0]["raw_message"] == "oops"
+    assert mqtt_topic_matches("tevents/+", "tevents/dock-a") and mqtt_topic_matches("#", "mevents/x")
+    assert not mqtt_topic_matches("tevents/+", "mevents/dock-a")
+
+def collect(get, count, timeout=10):
+    messages, deadline = [], time.monotonic() + timeout
+    while len(messages) < count and time.monotonic() < deadline:
+        message = get()
+        if message:
+            messages.append(message)
+    return messages
+
+@needs_paho
+def test_one_connection_receives_every_named_reader():
+    from zebra_cli.mqtt_ingest import MqttListener
+
+    broker = StandInMqttBroker()
+    uri = broker.start()
+    data_queue = queue.Queue()
+    listener = MqttListener(uri, data_queue, threading.Event(), reader_names=["dock-a", "dock-b"], reconnect=False)
+    try:
+        listener.start()
+        assert listener.wait_subscribed(5) and listener.is_connected()
+        broker.publish_events(["dock-a", "dock-b", "other"], 5)
+
+        def get():
+            try:
+                return data_queue.get(timeout=0.1)
+            except queue.Empty:
+                return None
+        messages = collect(get, 10)
+    finally:
+        listener.close()
+        broker.stop()
+
+    assert sorted(m["reader_id"] for m in messages) == ["dock-a"] * 5 + ["dock-b"] * 5
+    assert data_queue.empty() and listener.readers_seen == {"dock-a", "dock-b"}
+    assert not listener.is_alive()
+
+@needs_paho
+def test_multi_reader_session_over_mqtt_keys_stats_by_reader_name():
+    broker = StandInMqttBroker()
+    uri = broker.start()
+    session = MultiReaderSession([])
+    try:
+        session.start_mqtt(uri)
+        assert session._shared_listener.wait_subscribed(5)
+        broker.publish_events(["dock-a", "dock-b"], 3)
+        messages = collect(lambda: session.get(timeout=0.1), 6)
+        stats = {s["reader_id"]: s for s in session.reader_stats()}
+    finally:
+        session.stop()
+        broker.stop()
+
+    assert len(messages) == 6
+    assert (stats["dock-a"]["tag_events"], stats["dock-b"]["tag_events"]) == (3, 3)
+    assert stats["dock-a"]["connected"] is True and stats["dock-a"]["reconnects"] == 0
+
+@needs_paho
+def test_mqtt_path_in_benchmark():
+    result, = run_benchmark(readers=4, messages=100, engines=["mqtt"], timeout=30)
+    assert result["received"] == result["messages"] == 400 and result["engine"] == "mqtt"
@@ -0,0 +1,74 @@
+"""
+Automated tests for zebra_cli.multi_reader_session
+Run with: pytest tests/test_multi_reader_session.py
+"""
+import time
+import threading
+from datetime import datetime, timezone
+from zebra_cli.config import ConfigManager
+from zebra_cli.multi_reader_session import (
+    LiveReader, MultiReaderSession, parse_reader_timestamp, resolve_live_readers
+)
+
+def tag_event(epc, seconds_ago=0.0):
+    timestamp = datetime.fromtimestamp(time.time() - seconds_ago, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')
+    return {"type": "SIMPLE", "timestamp": timestamp[:-3] + "+0000", "data": {"idHex": epc, "peakRssi": -50}}
+
+class FakeListener(threading.Thread):
+    """Delivers the messages scripted for its URI, like a WebSocketListener would"""
+    scripts = {}
+
+    def __init__(self, uri, data_queue, stop_event, fallback_uris=None, debug=False):
+        super().__init__(daemon=True)
+        self.uri, self.data_queue = uri, data_queue
+
+    def run(self):
+        for message in self.scripts.get(self.uri, []):
+            self.data_queue.put(message)
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+def test_reader_timestamps_parse_with_offsets():
+    assert parse_reader_timestamp("2025-09-12T10:15:30.500+0000") == 1757672130.5
+    assert parse_reader_timestamp("2025-09-12T10:15:30.500Z") == 1757672130.5
+    assert parse_reader_timestamp("2025-09-12T10:15:30.500") == 1757672130.5
+    assert parse_reader_timestamp("N/A") is None and parse_reader_timestamp(None) is None
+
+def test_streams_are_merged_stamped_and_counted():
+    FakeListener.scripts = {
+        "ws://a/ws": [tag_event("E1", 0.2), tag_event("E2", 0.2), {"type": "heartbeat"}],
+        "ws://b/ws": [tag_event("E1", 1.0)]
+    }
+    session = MultiReaderSession([LiveReader("dock-a", "10.0.0.1", "ws://a/ws"),
+                                  LiveReader("dock-b", "10.0.0.2", "ws://b/ws")])
+    assert session.start(listener_factory=FakeListener) == 2
+
+    messages = []
+    deadline = time.monotonic() + 3
+    while len(messages) < 4 and time.monotonic() < deadline:
+        message = session.get(timeout=0.1)
+        if message:
+            messages.append(message)
+    session.stop()
+
+    assert sorted(m["reader_id"] for m in messages) == ["dock-a", "dock-a", "dock-a", "dock-b"]
+    stats = {s["reader_id"]: s for s in session.reader_stats()}
+    assert (stats["dock-a"]["messages"], stats["dock-a"]["tag_events"]) == (3, 2)
+    assert 150 < stats["dock-a"]["lag_ms"] < 2000
+    assert stats["dock-b"]["max_lag_ms"] > 900
+    assert "dock-a" in session.stats_line()
+
+def test_saved_websocket_uri_is_tried_first(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config_manager = ConfigManager()
+    config_manager.save_reader_endpoint("10.0.0.1", protocol="http", ws_uri="ws://10.0.0.1:80/ws")
+
+    readers = resolve_live_readers(["10.0.0.1", "10.0.0.2"], config_manager)
+
+    assert readers[0].ws_uri == "ws://10.0.0.1:80/ws" and readers[0].fallback_uris[0] == "ws://10.0.0.1/ws"
+    assert readers[1].ws_uri == "wss://10.0.0.2/ws"
+    assert [r.reader_id for r in readers] == ["R1-10.0.0.1", "R2-10.0.0.2"]
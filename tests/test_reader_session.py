@@ -0,0 +1,52 @@
+"""
+Automated tests for zebra_cli.reader_session
+Run with: pytest tests/test_reader_session.py
+"""
+import asyncio
+import httpx
+from zebra_cli.reader_session import READER_STATE_OPERATIONS, ReaderSession
+from zebra_cli.rest_client.io_t_connector_local_rest_ap_is_client.models import GetGpoStatusResponse200, OperatingMode
+
+def _run_session(handler, names, token="first.jwt.token"):
+    async def run():
+        async with ReaderSession("https://192.168.1.1/", token) as session:
+            session.client.set_async_httpx_client(httpx.AsyncClient(
+                base_url=session.base_url, headers={"Authorization": f"Bearer {token}"},
+                transport=httpx.MockTransport(handler)))
+            results = await session.fetch(names)
+            session.set_token("second.jwt.token")
+            results["status"] = await session.call(READER_STATE_OPERATIONS["status"])
+            return results
+    return asyncio.run(run())
+
+def test_fetch_parses_typed_models_and_keeps_raw_json():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.path, request.headers["Authorization"]))
+        if request.url.path == "/cloud/mode":
+            return httpx.Response(200, json={"type": "INVENTORY", "antennas": [1, 2]})
+        if request.url.path == "/cloud/gpo":
+            return httpx.Response(200, json={"1": "HIGH", "2": "LOW"})
+        if request.url.path == "/cloud/config":
+            return httpx.Response(200, json={"unexpected": True})
+        return httpx.Response(500, text="Internal error")
+
+    results = _run_session(handler, ["mode", "gpo", "config"])
+
+    assert isinstance(results["mode"].parsed, OperatingMode) and results["mode"].parsed.antennas == [1, 2]
+    assert isinstance(results["gpo"].parsed, GetGpoStatusResponse200) and results["gpo"].parsed.pin_1 == "HIGH"
+    assert results["config"].success and results["config"].data == {"unexpected": True}
+    assert results["status"].status_code == 500 and results["status"].data == {"message": "Internal error"}
+    assert results["status"].to_dict()["success"] is False
+    assert sorted(seen)[:3] == [("/cloud/config", "Bearer first.jwt.token"), ("/cloud/gpo", "Bearer first.jwt.token"),
+                                ("/cloud/mode", "Bearer first.jwt.token")]
+    assert seen[-1] == ("/cloud/status", "Bearer second.jwt.token")
+
+def test_request_errors_are_reported_per_call():
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    results = _run_session(handler, ["version"])
+    assert results["version"].status_code == 0
+    assert "connection refused" in results["version"].data["error"]
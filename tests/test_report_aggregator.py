@@ -0,0 +1,60 @@
+"""
+Automated tests for zebra_cli.report_aggregator
+Run with: pytest tests/test_report_aggregator.py
+"""
+import csv
+import json
+from datetime import datetime, timedelta
+from zebra_cli.report_aggregator import ReportAggregator
+
+T0 = datetime(2025, 9, 11, 10, 17, 2)
+
+def _write_messages(path, messages):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Timestamp', 'Message_Type', 'Raw_JSON'])
+        for i, message in enumerate(messages):
+            t = T0 + timedelta(milliseconds=100 * i)
+            writer.writerow([t.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], message['type'], json.dumps(message)])
+
+def test_standard_reader_rssi_and_antenna_stats(tmp_path):
+    path = str(tmp_path / "messages_read_20250911_101702.csv")
+    messages = [{'type': 'SIMPLE', 'data': {'idHex': 'E1', 'peakRssi': -50 - i % 2, 'antenna': 1 + i % 2, 'channel': 915.25}}
+                for i in range(12)]
+    messages.append({'type': 'SIMPLE', 'data': {'idHex': 'OTHER', 'peakRssi': -40, 'antenna': 1}})
+    _write_messages(path, messages)
+    result = ReportAggregator({'E1': {}}).aggregate(path)
+    assert result.is_atr_reader is False
+    assert result.point_store is None
+    assert len(result.epc_rssi_data['E1']['rssi_values']) == 12
+    assert result.epc_rssi_data['E1']['timestamps'][0] == T0
+    assert result.epc_antenna_counts == {'E1': {1: 6, 2: 6}}
+    stats = result.epc_antenna_rssi_stats['E1'][2]
+    assert (stats['min'], stats['max'], stats['count']) == (-51, -51, 6)
+
+def test_atr_reader_positions_in_same_pass(tmp_path):
+    path = str(tmp_path / "messages_read_20250911_101702.csv")
+    messages = []
+    for i in range(15):
+        t = T0 + timedelta(milliseconds=100 * i)
+        messages.append({'type': 'RAW_DIRECTIONALITY', 'timestamp': t.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + '+0000',
+                         'data': {'idHex': 'E1', 'azimuth': 90.0, 'elevation': 45.0, 'rssi': -55, 'antenna': 1}})
+    _write_messages(path, messages)
+    result = ReportAggregator({'E1': {}}).aggregate(path)
+    assert result.is_atr_reader is True
+    assert result.epc_antenna_counts == {}
+    assert result.messages_with_position_data == 15
+    timestamps, xs, ys = result.point_store.get_xy_history('E1')
+    assert len(xs) == 15
+    assert timestamps[0] == T0
+    assert round(xs[0], 6) == 12.0
+
+def test_connection_gap_rows_count_as_downtime(tmp_path):
+    path = str(tmp_path / "messages_read_20250911_101702.csv")
+    gap = {'type': 'CONNECTION_GAP', 'uri': 'wss://10.0.0.1/ws', 'reason': 'connection lost',
+           'start': '2025-09-11T10:17:02.300', 'end': '2025-09-11T10:17:14.800', 'duration_s': 12.5}
+    messages = [{'type': 'SIMPLE', 'data': {'idHex': 'E1', 'peakRssi': -50, 'antenna': 1}} for _ in range(3)]
+    _write_messages(path, messages[:2] + [gap, dict(gap, duration_s=1.5)] + messages[2:])
+    result = ReportAggregator({'E1': {}}).aggregate(path)
+    assert result.messages_processed == 3
+    assert len(result.connection_gaps) == 2 and result.downtime_seconds == 14.0
@@ -0,0 +1,52 @@
+"""
+Automated tests for zebra_cli.report_batch
+Run with: pytest tests/test_report_batch.py
+"""
+import os
+from datetime import datetime
+import zebra_cli.report_batch as report_batch
+from zebra_cli.report_batch import parse_range_bound, run_batch_reports, select_recordings
+
+def _touch(path, mtime=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("EPC,Reads,Avg_RSSI,Min_RSSI,Max_RSSI,First_Seen,Last_Seen,Rate_Per_Minute\n")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def test_select_recordings_by_glob_and_date_range(tmp_path):
+    for name in ["tags_read_20250910_080000.csv", "tags_read_20250911_101702.csv",
+                 "tags_read_20250912_235959.csv", "notes.txt"]:
+        _touch(str(tmp_path / name))
+    assert select_recordings(str(tmp_path), "tags_read_202509*.csv") == [
+        "tags_read_20250910_080000.csv", "tags_read_20250911_101702.csv", "tags_read_20250912_235959.csv"]
+    assert select_recordings(str(tmp_path), since=parse_range_bound("2025-09-11"),
+                             until=parse_range_bound("2025-09-12", end=True)) == [
+        "tags_read_20250911_101702.csv", "tags_read_20250912_235959.csv"]
+    assert parse_range_bound("20250911_101702") == datetime(2025, 9, 11, 10, 17, 2)
+
+def test_batch_skips_up_to_date_reports(tmp_path, monkeypatch):
+    tag_reads_dir, messages_dir, reports_dir = (str(tmp_path / d) for d in ("tag_reads", "messages", "reports"))
+    for directory in (tag_reads_dir, messages_dir, reports_dir):
+        os.makedirs(directory)
+    _touch(os.path.join(tag_reads_dir, "tags_read_20250911_101702.csv"), mtime=1000)
+    _touch(os.path.join(tag_reads_dir, "tags_read_20250912_101702.csv"), mtime=1000)
+    _touch(os.path.join(reports_dir, "report_20250911_101702.pdf"), mtime=2000)
+
+    generated = []
+    def fake_generate(tags_path, messages_path, pdf_path, **kwargs):
+        generated.append(os.path.basename(pdf_path))
+        if "20250912" in pdf_path and len(generated) > 1:
+            raise ValueError("broken recording")
+        return {'tags': 3, 'reader': 'Standard RFID', 'cache_hit': False}
+    monkeypatch.setattr(report_batch, "generate_report", fake_generate)
+
+    lines = []
+    summary = run_batch_reports(tag_reads_dir, messages_dir, reports_dir, workers=1, log=lines.append)
+    assert generated == ["report_20250912_101702.pdf"]
+    assert (summary['selected'], summary['generated'], summary['skipped'], summary['failed']) == (2, 1, 1, 0)
+    assert [r['status'] for r in summary['reports']] == ['skipped', 'generated']
+    assert summary['reports'][1]['tags'] == 3
+
+    summary = run_batch_reports(tag_reads_dir, messages_dir, reports_dir, workers=1, force=True, log=lines.append)
+    assert summary['failed'] == 1
+    assert summary['reports'][1]['error'] == "broken recording"
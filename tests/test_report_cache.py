@@ -0,0 +1,78 @@
+"""
+Automated tests for zebra_cli.report_cache
+Run with: pytest tests/test_report_cache.py
+"""
+import os
+import csv
+import json
+from datetime import datetime, timedelta
+import zebra_cli.report_cache as report_cache
+from zebra_cli.report_cache import ReportCache, load_report_aggregates
+
+T0 = datetime(2025, 9, 11, 10, 17, 2)
+
+def _write_recording(tmp_path, atr):
+    tags_path = str(tmp_path / "tags_read_20250911_101702.csv")
+    messages_path = str(tmp_path / "messages_read_20250911_101702.csv")
+    with open(tags_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['EPC', 'Reads', 'Avg_RSSI', 'Min_RSSI', 'Max_RSSI', 'First_Seen', 'Last_Seen', 'Rate_Per_Minute'])
+        writer.writerow(['E1', 15, -50.5, -51, -50, '2025-09-11 10:17:02.000', '2025-09-11 10:17:03.400', 600.0])
+    with open(messages_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Timestamp', 'Message_Type', 'Raw_JSON'])
+        for i in range(15):
+            t = T0 + timedelta(milliseconds=100 * i)
+            if atr:
+                message = {'type': 'RAW_DIRECTIONALITY', 'timestamp': t.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + '+0000',
+                           'data': {'idHex': 'E1', 'azimuth': 90.0, 'elevation': 45.0, 'rssi': -55}}
+            else:
+                message = {'type': 'SIMPLE', 'data': {'idHex': 'E1', 'peakRssi': -50 - i % 2, 'antenna': 1 + i % 2}}
+            writer.writerow([t.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], message['type'], json.dumps(message)])
+    return tags_path, messages_path
+
+def test_cache_hit_skips_parsing_and_roundtrips(tmp_path, monkeypatch):
+    tags_path, messages_path = _write_recording(tmp_path, atr=False)
+    cache = ReportCache(str(tmp_path / "cache"))
+    tag_data, parsed, hit = load_report_aggregates(tags_path, messages_path, cache)
+    assert hit is False
+
+    def fail(*args, **kwargs):
+        raise AssertionError("recording parsed on a cache hit")
+    monkeypatch.setattr(report_cache, "read_tag_reads", fail)
+    monkeypatch.setattr(report_cache, "hash_file", fail)
+    cached_tag_data, cached, hit = load_report_aggregates(tags_path, messages_path, cache)
+    assert hit is True
+    assert cached_tag_data == tag_data
+    assert cached.epc_rssi_data == parsed.epc_rssi_data
+    assert cached.epc_antenna_counts == {'E1': {1: 8, 2: 7}}
+    assert cached.epc_antenna_rssi_stats == parsed.epc_antenna_rssi_stats
+
+def test_atr_positions_roundtrip_and_content_change_misses(tmp_path):
+    tags_path, messages_path = _write_recording(tmp_path, atr=True)
+    cache = ReportCache(str(tmp_path / "cache"))
+    _, parsed, _ = load_report_aggregates(tags_path, messages_path, cache)
+    _, cached, hit = load_report_aggregates(tags_path, messages_path, cache)
+    assert hit is True
+    assert cached.is_atr_reader is True
+    assert cached.epc_position_data == parsed.epc_position_data
+    assert len(cached.epc_position_data['E1']['x']) == 15
+
+    with open(messages_path, 'a', encoding='utf-8') as f:
+        f.write('2025-09-11 10:17:05.000,SIMPLE,"{}"\n')
+    _, _, hit = load_report_aggregates(tags_path, messages_path, cache)
+    assert hit is False
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    tags_path, messages_path = _write_recording(tmp_path, atr=False)
+    cache = ReportCache(str(tmp_path / "cache"))
+    _, aggregates, _ = load_report_aggregates(tags_path, messages_path, cache)
+    entry_size = os.path.getsize(next((tmp_path / "cache").glob("*.npz")))
+    cache.max_bytes = 2 * entry_size
+    for i, key in enumerate(["a", "b"]):
+        cache.put(key, {}, aggregates)
+        os.utime(cache._entry_path(key), (1000 + i, 1000 + i))
+    cache.put("c", {}, aggregates)
+    remaining = sorted(p.stem for p in (tmp_path / "cache").glob("*.npz"))
+    assert len(remaining) == 2
+    assert "a" not in remaining and "c" in remaining
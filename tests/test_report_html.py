@@ -0,0 +1,61 @@
+"""
+Automated tests for zebra_cli.report_html
+Run with: pytest tests/test_report_html.py
+"""
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+import numpy as np
+from zebra_cli.report_aggregator import ReportAggregates
+from zebra_cli.report_html import HtmlReportWriter, decimate_series
+from zebra_cli.report_summary import build_epc_jobs, plan_report
+
+T0 = datetime(2025, 9, 11, 10, 17, 2)
+
+def test_decimation_bounds_points_and_keeps_peaks():
+    x = np.arange(10000, dtype=float)
+    y = np.sin(x / 50)
+    y[4321] = 25.0
+    dx, dy = decimate_series(x, y, max_points=200)
+    assert len(dx) <= 200
+    assert 25.0 in dy
+    assert np.all(np.diff(dx) > 0)
+
+def test_report_streams_epc_sections_and_summary(tmp_path):
+    tag_data, rssi_data, position_data = {}, {}, {}
+    for i in range(3):
+        epc = f"E2{i:06d}"
+        tag_data[epc] = {'reads': 2000 + i, 'avg_rssi': -50.0, 'min_rssi': -60.0, 'max_rssi': -40.0,
+                         'first_seen': '2025-09-11 10:17:02.000', 'last_seen': '2025-09-11 10:50:21.000',
+                         'rate_per_minute': 60.0}
+        times = [T0 + timedelta(seconds=s) for s in range(2000)]
+        rssi_data[epc] = {'timestamps': times, 'rssi_values': [-50.0 + s % 7 for s in range(2000)]}
+        position_data[epc] = {'timestamps': times, 'x': [s / 1000 for s in range(2000)], 'y': [0.5] * 2000,
+                               'track_timestamps': times, 'track_x': [s / 1000 for s in range(2000)],
+                               'track_y': [0.5] * 2000}
+    aggregates = ReportAggregates(is_atr_reader=True, epc_rssi_data=rssi_data, epc_position_data=position_data)
+    detail, summary = plan_report(tag_data, aggregates, summary_mode=True, top_n=2)
+    jobs = build_epc_jobs(detail, rssi_data, True, {}, {}, position_data)
+    html_path = tmp_path / "report.html"
+    progress = []
+    written = HtmlReportWriter(max_points=100).render_report(
+        str(html_path), "tags.csv", "messages.csv", tag_data, jobs, summary=summary,
+        progress=lambda done, total: progress.append(done))
+    content = html_path.read_text(encoding='utf-8')
+    assert written == 2 and progress == [1, 2]
+    assert "Fleet Summary: 3 tags" in content
+    assert content.index("E2000002") < content.index("Tag Analysis: E2000001")
+    assert "Tag Analysis: E2000000" not in content
+    svgs = re.findall(r'<svg.*?</svg>', content, re.S)
+    assert len(svgs) == 3 + 2 * 4  # summary histograms + (RSSI, X, Y, floor) per EPC
+    for svg in svgs:
+        ET.fromstring(svg)
+    assert "10:17:02" in content
+    assert not list(tmp_path.glob("*.part"))
+
+def test_benchmark_html_report_is_faster_than_pdf(tmp_path):
+    from zebra_cli.report_benchmark import run_benchmark
+    results = {r['format']: r for r in run_benchmark(tags=6, reads_per_tag=200, directory=str(tmp_path))}
+    assert results['pdf']['detail_pages'] == results['html']['detail_pages'] == 6
+    assert results['pdf']['bytes'] > 0 and results['html']['bytes'] > 0
+    assert results['html']['seconds'] * 3 < results['pdf']['seconds']
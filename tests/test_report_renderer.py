@@ -0,0 +1,69 @@
+"""
+Automated tests for zebra_cli.report_renderer
+Run with: pytest tests/test_report_renderer.py
+"""
+from datetime import datetime, timedelta
+import matplotlib
+import pytest
+import zebra_cli.report_renderer as report_renderer
+from zebra_cli.report_renderer import ReportPageRenderer, build_epc_jobs
+
+# Render headless, whatever backend other modules selected at import
+matplotlib.use('Agg', force=True)
+
+def _dataset(count):
+    tag_data, rssi_data, antenna_counts = {}, {}, {}
+    for i in range(count):
+        epc = f"E2000000000000000000{i:04d}"
+        tag_data[epc] = {
+            'reads': 12, 'avg_rssi': -50.0, 'min_rssi': -60.0, 'max_rssi': -40.0,
+            'first_seen': '2025-01-01 12:00:00.000', 'last_seen': '2025-01-01 12:00:11.000',
+            'rate_per_minute': 60.0
+        }
+        rssi_data[epc] = {
+            'timestamps': [datetime(2025, 1, 1, 12) + timedelta(seconds=s) for s in range(12)],
+            'rssi_values': [-50.0 + (s % 3) for s in range(12)]
+        }
+        antenna_counts[epc] = {1: 12}
+    return tag_data, rssi_data, antenna_counts
+
+def test_build_epc_jobs_slices_data_per_epc():
+    tag_data, rssi_data, antenna_counts = _dataset(3)
+    jobs = build_epc_jobs(tag_data, rssi_data, False, antenna_counts, {})
+    assert [job['epc'] for job in jobs] == list(tag_data)
+    assert list(jobs[1]['rssi_data']) == [jobs[1]['epc']]
+    assert jobs[1]['antenna_rssi_stats'] == {}
+    assert jobs[1]['position_data'] is None
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_report_keeps_epc_order(tmp_path, monkeypatch, workers):
+    pypdf = pytest.importorskip("pypdf")
+    monkeypatch.setattr(report_renderer, "PARALLEL_MIN_EPCS", 2)
+    tag_data, rssi_data, antenna_counts = _dataset(4)
+    jobs = build_epc_jobs(tag_data, rssi_data, False, antenna_counts, {})
+    pdf_path = str(tmp_path / "report.pdf")
+    progress = []
+    parallel = ReportPageRenderer().render_report(pdf_path, "tags.csv", "messages.csv", tag_data, jobs,
+                                                  workers=workers, progress=lambda d, t: progress.append((d, t)))
+    assert parallel is (workers > 1)
+    assert progress[-1] == (4, 4)
+    pages = pypdf.PdfReader(pdf_path).pages
+    assert len(pages) == 5
+    for page, epc in zip(pages[1:], tag_data):
+        assert epc[-4:] in page.extract_text()
+
+def test_summary_pages_follow_title_page(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    from zebra_cli.report_aggregator import ReportAggregates
+    from zebra_cli.report_summary import plan_report
+    tag_data, rssi_data, antenna_counts = _dataset(30)
+    aggregates = ReportAggregates(epc_rssi_data=rssi_data, epc_antenna_counts=antenna_counts)
+    detail, summary = plan_report(tag_data, aggregates, summary_mode=True, top_n=2)
+    jobs = build_epc_jobs(detail, rssi_data, False, antenna_counts, {})
+    pdf_path = str(tmp_path / "report.pdf")
+    ReportPageRenderer().render_report(pdf_path, "tags.csv", "messages.csv", tag_data, jobs,
+                                       workers=1, progress=None, summary=summary)
+    pages = pypdf.PdfReader(pdf_path).pages
+    assert len(pages) == 1 + 3 + 2
+    assert "Fleet Summary: 30 tags" in pages[1].extract_text()
+    assert "Population Percentiles" in pages[3].extract_text()
@@ -0,0 +1,42 @@
+"""
+Automated tests for zebra_cli.report_summary
+Run with: pytest tests/test_report_summary.py
+"""
+import numpy as np
+from zebra_cli.report_aggregator import ReportAggregates
+from zebra_cli.report_summary import build_fleet_summary, percentile_table, plan_report, select_detail_epcs
+
+def _tag_data(count):
+    return {
+        f"E2{i:06d}": {'reads': i + 1, 'avg_rssi': -70.0 + i % 30, 'min_rssi': -75.0, 'max_rssi': -40.0,
+                       'first_seen': '', 'last_seen': '', 'rate_per_minute': float(i)}
+        for i in range(count)
+    }
+
+def test_summary_matrices_and_percentiles():
+    tag_data = _tag_data(4)
+    aggregates = ReportAggregates(
+        epc_antenna_counts={'E2000000': {1: 3}, 'E2000001': {1: 1, 2: 5}},
+        epc_antenna_rssi_stats={'E2000001': {2: {'min': -60.0, 'max': -50.0, 'sum': -275.0, 'count': 5}}}
+    )
+    summary = build_fleet_summary(tag_data, aggregates)
+    assert summary.antenna_ids == [1, 2]
+    assert summary.antenna_reads.tolist() == [[3, 0], [1, 5], [0, 0], [0, 0]]
+    assert summary.antenna_avg_rssi[1, 1] == -55.0
+    assert np.isnan(summary.antenna_avg_rssi[0, 0])
+    rows = percentile_table(summary)
+    assert rows[0][0] == 'Reads per tag' and rows[0][3] == '2' and rows[0][-1] == '4'
+    assert rows[-1][0] == 'Antenna 2 avg RSSI (dBm)' and rows[-1][-1] == '1'
+
+def test_detail_pages_limited_to_top_n_and_filter():
+    tag_data = _tag_data(500)
+    summary = build_fleet_summary(tag_data, ReportAggregates())
+    assert select_detail_epcs(summary, top_n=3) == ['E2000499', 'E2000498', 'E2000497']
+    assert select_detail_epcs(summary, top_n=None, epc_filter='E200000*,E2000499') == [
+        'E2000499', 'E2000009', 'E2000008', 'E2000007', 'E2000006',
+        'E2000005', 'E2000004', 'E2000003', 'E2000002', 'E2000001', 'E2000000']
+
+    detail, summary = plan_report(tag_data, ReportAggregates(), top_n=5)
+    assert summary is not None and list(detail) == ['E2000499', 'E2000498', 'E2000497', 'E2000496', 'E2000495']
+    detail, summary = plan_report(_tag_data(10), ReportAggregates())
+    assert summary is None and len(detail) == 10
@@ -0,0 +1,109 @@
+"""
+Automated tests for zebra_cli.stream_daemon
+Run with: pytest tests/test_stream_daemon.py
+"""
+import os
+import sys
+import json
+import queue
+import socket
+import threading
+import subprocess
+from zebra_cli.stream_daemon import NdjsonWriter, WindowAggregator, normalize_event, stream
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def tag_message(epc, rssi=-50, antenna=1, reader_id=None):
+    message = {"type": "SIMPLE", "timestamp": "2025-09-12T10:15:30.500+0000",
+               "data": {"idHex": epc, "peakRssi": rssi, "antenna": antenna}}
+    if reader_id:
+        message["reader_id"] = reader_id
+    return message
+
+def test_reader_messages_are_normalized():
+    event = normalize_event(tag_message("E1", rssi="-41", reader_id="dock-a"), 100.0)
+    assert event == {"ts": 100.0, "reader_ts": "2025-09-12T10:15:30.500+0000", "reader_id": "dock-a",
+                     "epc": "E1", "rssi": -41.0, "antenna": 1, "reads": 1}
+    assert normalize_event({"epc": "E2", "RSSI": "N/A", "reads": 3}, 1.0)["reads"] == 3
+    assert normalize_event({"epc": "E2", "RSSI": "N/A"}, 1.0)["rssi"] is None
+    assert normalize_event({"type": "heartbeat"}, 1.0) is None and normalize_event("raw", 1.0) is None
+
+def test_windows_aggregate_per_reader_and_epc():
+    aggregator = WindowAggregator(5)
+    for ts, epc, rssi, antenna in [(10.1, "E1", -40, 1), (12.0, "E1", -60, 2), (14.9, "E2", None, 1)]:
+        assert aggregator.add({"ts": ts, "reader_id": None, "epc": epc, "rssi": rssi, "antenna": antenna, "reads": 1}) == []
+    assert aggregator.due(14.99) == []
+
+    rows = aggregator.add({"ts": 15.0, "reader_id": None, "epc": "E1", "rssi": -50, "antenna": 1, "reads": 1})
+    e1, e2 = sorted(rows, key=lambda r: r["epc"])
+    assert (e1["window_start"], e1["window_end"], e1["reads"], e1["rssi_avg"]) == (10.0, 15.0, 2, -50.0)
+    assert (e1["rssi_min"], e1["rssi_max"], e1["antennas"]) == (-60, -40, [1, 2])
+    assert e2["rssi_avg"] is None and e2["reads"] == 1
+    assert [r["reads"] for r in aggregator.due(20.0)] == [1]
+
+def test_stream_writes_events_and_gaps_then_drains_on_stop(tmp_path):
+    data_queue, stop_event = queue.Queue(), threading.Event()
+    for message in [tag_message("E1"), {"type": "heartbeat"}, tag_message("E2"),
+                    {"type": "CONNECTION_GAP", "uri": "ws://r/ws", "duration_s": 2.0}]:
+        data_queue.put(message)
+    stop_event.set()  # Stop already requested: the queued messages are still written
+    output = tmp_path / "events.ndjson"
+    writer = NdjsonWriter(str(output), flush_interval=60)
+
+    counts = stream(data_queue, writer, stop_event)
+    writer.close()
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line.get("epc", line.get("type")) for line in lines] == ["E1", "E2", "CONNECTION_GAP"]
+    assert counts == {"messages": 4, "tag_events": 2, "gaps": 1, "lines": 3}
+
+def test_unix_socket_output_with_window_aggregates(tmp_path):
+    path = str(tmp_path / "tags.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    data_queue, stop_event = queue.Queue(), threading.Event()
+    writer = NdjsonWriter("unix:" + path, flush_interval=0)
+    connection, _ = server.accept()
+    for _ in range(100):
+        data_queue.put(tag_message("E1", reader_id="dock-a"))
+    data_queue.put(tag_message("E2", reader_id="dock-b"))
+
+    timer = threading.Timer(0.5, stop_event.set)
+    timer.start()
+    stream(data_queue, writer, stop_event, window=3600)
+    writer.close()
+    received = b""
+    while chunk := connection.recv(65536):
+        received += chunk
+    connection.close()
+    server.close()
+
+    rows = {row["reader_id"]: row for row in map(json.loads, received.decode().splitlines())}
+    assert (rows["dock-a"]["epc"], rows["dock-a"]["reads"]) == ("E1", 100)
+    assert rows["dock-b"]["reads"] == 1
+
+def test_closed_output_stops_the_stream(tmp_path):
+    path = str(tmp_path / "closed.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    writer = NdjsonWriter("unix:" + path, flush_interval=0, buffer_size=1024)
+    connection, _ = server.accept()
+    connection.close()  # The consumer goes away
+    server.close()
+    data_queue = queue.Queue()
+    for i in range(1000):
+        data_queue.put(tag_message(f"E{i}"))
+
+    stream(data_queue, writer, threading.Event())  # Returns although stop_event is never set
+    writer.close()
+    assert writer.broken
+
+def test_daemon_imports_no_gui_modules():
+    result = subprocess.run(
+        [sys.executable, '-c', 'import sys, zebra_cli.stream_daemon, zebra_cli.context; '
+                               'print([m for m in ("tkinter", "matplotlib") if m in sys.modules])'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,141 @@
+"""
+Automated tests for zebra_cli.token_store and token reuse in AppContext
+Run with: pytest tests/test_token_store.py
+"""
+import json
+import time
+import base64
+import httpx
+import zebra_cli.context as context_module
+from zebra_cli.endpoint_cache import EndpointCache
+from zebra_cli.token_store import REFRESH_MARGIN, TokenStore, decode_jwt_exp
+
+READER = "192.168.1.1"
+
+def make_jwt(exp, subject="admin"):
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+    return f"{encode({'alg': 'HS256'})}.{encode({'sub': subject, 'exp': exp})}.signature"
+
+def test_tokens_expire_by_claim_and_are_bound_to_the_user(tmp_path):
+    token = make_jwt(time.time() + 3600)
+    assert abs(decode_jwt_exp(token) - (time.time() + 3600)) < 5
+    assert decode_jwt_exp("not-a-jwt") is None
+
+    TokenStore(token_file=tmp_path / "tokens.json").put(READER, token, "admin", "/cloud/localRestLogin")
+    store = TokenStore(token_file=tmp_path / "tokens.json")
+    assert store.get(READER, "admin") == token
+    assert store.get(READER, "operator") is None
+    assert store.get_login_method(READER) == "/cloud/localRestLogin"
+    assert store.get(READER, "admin", "change") is None  # Stored without a password hash
+
+    store.put(READER, token, "admin", password="change")
+    assert store.get(READER, "admin", "change") == token
+    assert store.get(READER, "admin", "wrong") is None
+    assert "change" not in (tmp_path / "tokens.json").read_text()
+
+    store.put(READER, make_jwt(time.time() + REFRESH_MARGIN - 10), "admin")
+    assert store.get(READER, "admin") is None  # Expires too soon to be handed out
+    store.put(READER, token, "admin")
+    store.invalidate(READER)
+    assert store.get(READER) is None
+    assert store.get_login_method(READER) == "/cloud/localRestLogin"
+
+def test_login_tries_remembered_method_first_on_one_connection():
+    paths = []
+    token = make_jwt(time.time() + 3600)
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path == "/login":
+            return httpx.Response(200, json={"message": token})
+        return httpx.Response(404)
+
+    client = context_module.ZebraRFIDClient(f"https://{READER}", "dummy-token")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert client.get_bearer_token("admin", "change") == token
+    assert paths == ["/cloud/localRestLogin", "/auth/login", "/login"] and client.login_method == "/login"
+
+    paths.clear()
+    assert client.get_bearer_token("admin", "change", preferred_method="/login") == token
+    assert paths == ["/login"]
+
+def test_reconnect_reuses_stored_token_and_refresh_updates_clients(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    logins = []
+    tokens = [make_jwt(time.time() + 3600), make_jwt(time.time() + 7200)]
+
+    def mock_get_bearer_token(self, username, password, preferred_method=None):
+        logins.append(preferred_method)
+        self.login_method = "/cloud/localRestLogin"
+        return tokens[len(logins) - 1]
+
+    monkeypatch.setattr(context_module, "probe_protocol", lambda ip, debug=False: "https")
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "get_bearer_token", mock_get_bearer_token)
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "get_version", lambda self: {"model": "FXR90"})
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "token_rejected", lambda self: False)
+
+    def new_context():
+        context = context_module.AppContext()
+        context.token_store = TokenStore(token_file=tmp_path / "tokens.json")
+        context.endpoint_cache = EndpointCache(cache_file=tmp_path / "endpoint_cache.json")
+        return context
+
+    context = new_context()
+    assert context.login_and_connect(READER, "admin", "change")
+    assert logins == [None] and context.token == tokens[0]
+    assert context._token_refresh_timer is not None
+    context.disconnect()
+    assert context._token_refresh_timer is None
+
+    context = new_context()
+    assert context.login_and_connect(READER, "admin", "change")
+    assert logins == [None]  # Stored token reused, no login round trips
+    assert context.token == tokens[0]
+
+    context._refresh_token()
+    assert logins == [None, "/cloud/localRestLogin"]
+    assert context.token == tokens[1]
+    assert context.rest_client.headers["Authorization"] == f"Bearer {tokens[1]}"
+    assert context.config_manager.load_config()["token"] == tokens[1]
+    context.disconnect()
+
+def test_rejected_stored_token_is_dropped_and_login_repeated(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    revoked, fresh = make_jwt(time.time() + 3600), make_jwt(time.time() + 3600, subject="admin2")
+    status_tokens, logins = [], []
+
+    def handler(request):
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        status_tokens.append(token)
+        return httpx.Response(401 if token == revoked else 200, json={})
+
+    real_init = context_module.ZebraRFIDClient.__init__
+    def mock_init(self, *args, **kwargs):
+        real_init(self, *args, **kwargs)
+        self.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def mock_get_bearer_token(self, username, password, preferred_method=None):
+        logins.append(password)
+        self.login_method = "/cloud/localRestLogin"
+        return fresh if password == "change" else None
+
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "__init__", mock_init)
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "get_bearer_token", mock_get_bearer_token)
+    monkeypatch.setattr(context_module, "probe_protocol", lambda ip, debug=False: "https")
+    monkeypatch.setattr(context_module.ZebraRFIDClient, "get_version", lambda self: {"model": "FXR90"})
+
+    context = context_module.AppContext()
+    context.token_store = TokenStore(token_file=tmp_path / "tokens.json")
+    context.endpoint_cache = EndpointCache(cache_file=tmp_path / "endpoint_cache.json")
+    context.token_store.put(READER, revoked, "admin", password="change")
+
+    # A wrong password is not accepted because a stored token exists
+    assert context.obtain_token(READER, "admin", "wrong", "https") is None
+    assert logins == ["wrong"] and status_tokens == []
+
+    assert context.login_and_connect(READER, "admin", "change")
+    assert status_tokens == [revoked]  # Stored token verified once, rejected
+    assert logins == ["wrong", "change"] and context.token == fresh
+    assert context.token_store.get(READER, "admin", "change") == fresh
+    context.disconnect()
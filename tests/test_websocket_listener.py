@@ -0,0 +1,88 @@
+"""
+Automated tests for the reconnection of zebra_cli.websocket_listener
+Run with: pytest tests/test_websocket_listener.py
+"""
+import time
+import queue
+import threading
+import websocket
+import zebra_cli.websocket_listener as websocket_listener
+from zebra_cli.websocket_listener import ConnectionGaps, WebSocketListener, reconnect_delay
+from zebra_cli.ws_benchmark import StandInReaderServer
+
+def test_backoff_is_jittered_and_capped():
+    for attempt, base in [(0, 1.0), (3, 8.0), (10, 30.0)]:
+        delays = [reconnect_delay(attempt) for _ in range(50)]
+        assert all(base / 2 <= delay <= base for delay in delays)
+        assert len(set(delays)) > 1
+
+def test_gaps_are_measured_until_reconnection():
+    gaps = ConnectionGaps()
+    assert gaps.connected() is None  # First connection is not a reconnection
+    gaps.disconnected("ws://a/ws", "closed (1006)")
+    gaps.disconnected("ws://a/ws", "connection lost")  # Same gap
+    time.sleep(0.05)
+    assert gaps.status()['disconnected_since'] is not None and gaps.status()['downtime_s'] >= 0
+    gap = gaps.connected()
+    assert gap['type'] == "CONNECTION_GAP" and gap['reason'] == "closed (1006)" and gap['duration_s'] >= 0.05
+    assert gaps.status() == {'reconnects': 1, 'connection_gaps': 1, 'downtime_s': round(gap['duration_s'], 1),
+                             'disconnected_since': None}
+
+def test_listener_reconnects_to_last_good_uri_on_same_queue(monkeypatch, capsys):
+    monkeypatch.setattr(websocket_listener, "reconnect_delay", lambda attempt: 0.05)
+    server = StandInReaderServer(messages=20)  # Sends its events, then closes the connection
+    uri = server.start()
+    data_queue = queue.Queue()
+    listener = WebSocketListener("ws://127.0.0.1:1/ws", data_queue, threading.Event(), fallback_uris=[uri])
+    try:
+        listener.start()
+        events, gaps = 0, []
+        deadline = time.monotonic() + 15
+        while events < 60 and time.monotonic() < deadline:
+            try:
+                data = data_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            if data.get('type') == "CONNECTION_GAP":
+                gaps.append(data)
+            else:
+                events += 1
+    finally:
+        listener.close()
+        server.stop()
+
+    assert events == 60 and len(gaps) >= 2  # Three sessions of the stand-in server
+    assert gaps[0]['uri'] == uri and gaps[0]['duration_s'] >= 0
+    assert listener._uri_order() == [1, 0]
+    attempts = [line for line in capsys.readouterr().out.splitlines() if "connection attempt" in line]
+    assert sum("127.0.0.1:1/ws" in line for line in attempts) == 1  # Not retried while the last good URI works
+
+def test_silent_reader_is_detected_by_ping_timeout(monkeypatch, capsys):
+    monkeypatch.setattr(websocket_listener, "PING_INTERVAL", 0.5)
+    monkeypatch.setattr(websocket_listener, "PING_TIMEOUT", 0.3)
+    server = StandInReaderServer(messages=20, close=False)  # Sends its events, then never answers again
+    data_queue = queue.Queue()
+    listener = WebSocketListener(server.start(), data_queue, threading.Event(), reconnect=False)
+    try:
+        listener.start()
+        deadline = time.monotonic() + 5
+        while data_queue.qsize() < 20 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert data_queue.qsize() == 20 and listener.is_connected()
+        listener.join(timeout=5)
+        assert not listener.is_alive() and not listener.is_connected()
+        output = capsys.readouterr().out
+        assert "Connection to the reader lost" in output and "Connection failed" not in output
+    finally:
+        listener.close()
+        server.stop()
+
+def test_lost_connection_is_not_reported_as_failed_uri(capsys):
+    listener = WebSocketListener("ws://127.0.0.1:1/ws", queue.Queue(), threading.Event())
+    listener.on_error(None, websocket.WebSocketConnectionClosedException("Connection to remote host was lost."))
+    output = capsys.readouterr().out
+    assert "Connection to the reader lost" in output and "reconnecting" in output
+    assert "Connection failed" not in output and "next URI" not in output
+
+    listener.on_error(None, ConnectionRefusedError("Connection refused"))
+    assert "Connection failed" in capsys.readouterr().out
@@ -1,4 +1,6 @@
 # Standard library imports
+import sys
+import json
 import argparse
 
 # Local imports
@@ -10,6 +12,14 @@ def main() -> None:
     - Standard interactive mode: shows the CLI menu.
     - Batch/one-shot mode: with --table or --rssi, after automatic login executes the sequence directly (login → start scanning → table/plot) without showing the menu between steps.
       The menu is only shown in case of error in one of the steps.
+    - Report mode: with --report, generates PDF reports for the selected recordings without any prompt and prints
+      a JSON summary on stdout (progress goes to stderr).
+    - Fleet provisioning mode: with --iotc-fleet, provisions IoT Connector on every reader of an inventory file
+      and prints a JSON summary on stdout (progress goes to stderr, the full report is written to reports/).
+    - Fleet config mode: with --fleet-config, pushes mode/config/region to every reader of an inventory file,
+      only where they differ, and prints a JSON summary on stdout.
+    - Streaming mode: with --stream, logs in with --ip/-u/-p, starts scanning and writes the tag events (or with
+      --window per-window aggregates) as NDJSON to stdout, a file or a Unix socket until SIGINT/SIGTERM.
     """
     parser = argparse.ArgumentParser(
         description="Entry point for the Zebra RFID CLI. Allows optional automatic login and batch mode."
@@ -32,11 +42,105 @@ def main() -> None:
         action="store_true",
         help="After automatic connection, start scanning and open RSSI graph"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the reader for version, capabilities, regions and certificates (ignore ~/.zebra_cli/endpoint_cache.json)"
+    )
+    parser.add_argument(
+        "--ws-engine",
+        choices=["thread", "async"],
+        default="thread",
+        help="WebSocket ingestion engine: one thread per reader (default) or all readers on one asyncio event loop"
+    )
+    parser.add_argument(
+        "--fanout",
+        type=str,
+        metavar="[HOST:]PORT",
+        help="Re-publish the reader events to local WebSocket/TCP clients on this port (default host: 127.0.0.1)"
+    )
+    parser.add_argument("--fanout-buffer", type=int, help="With --fanout: events a client may fall behind before it is disconnected (default: 10000)")
+    parser.add_argument(
+        "--report",
+        nargs="?",
+        const="tags_read_*.csv",
+        metavar="GLOB",
+        help="Generate PDF reports for record/tag_reads files matching GLOB (default: all) and exit"
+    )
+    parser.add_argument("--since", type=str, help="With --report: only recordings from this date/time (YYYY-MM-DD[ HH:MM:SS])")
+    parser.add_argument("--until", type=str, help="With --report: only recordings up to this date/time (YYYY-MM-DD[ HH:MM:SS])")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="With --report: number of report processes (default: CPU count); "
+             "with --iotc-fleet: readers provisioned in parallel (default: 16); "
+             "with --fleet-config: readers updated concurrently (default: 32)"
+    )
+    parser.add_argument("--force", action="store_true", help="With --report: regenerate reports that are up to date")
+    parser.add_argument("--no-report-cache", action="store_true", help="With --report: do not use the report aggregate cache")
+    parser.add_argument(
+        "--summary",
+        choices=["auto", "on", "off"],
+        default="auto",
+        help="With --report: fleet summary pages + top-N detail pages (auto: above 200 tags or with --epc-filter)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["pdf", "html"],
+        default="pdf",
+        help="With --report: report format (html: self-contained HTML with SVG charts, much faster)"
+    )
+    parser.add_argument("--top", type=int, default=50, help="With --report: detail pages in summary mode (default: 50)")
+    parser.add_argument("--epc-filter", type=str, help="With --report: EPC glob(s), comma separated, for detail pages")
+    parser.add_argument(
+        "--sort-by",
+        choices=["reads", "rssi", "rate"],
+        default="reads",
+        help="With --report: ranking of the top-N detail pages (default: reads)"
+    )
+    parser.add_argument(
+        "--iotc-fleet",
+        type=str,
+        metavar="INVENTORY",
+        help="Provision IoT Connector (WS/MQTT) on every reader of a JSON inventory file and exit"
+    )
+    parser.add_argument("--reader-timeout", type=float, help="With --iotc-fleet: seconds per reader and attempt (default: 900)")
+    parser.add_argument("--retries", type=int, help="With --iotc-fleet: additional attempts for a failed reader (default: 1)")
+    parser.add_argument(
+        "--fleet-config",
+        type=str,
+        metavar="DESIRED",
+        help="Push the mode/config/region sections of a JSON file to every reader of --inventory "
+             "(only readers and sections that differ) and exit"
+    )
+    parser.add_argument("--inventory", type=str, help="With --fleet-config: JSON reader inventory (same format as --iotc-fleet)")
+    parser.add_argument("--dry-run", action="store_true", help="With --fleet-config: report differences without PUT")
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        const="-",
+        metavar="OUTPUT",
+        help="Headless mode: log in (--ip/-u/-p), start scanning and stream tag events as NDJSON to OUTPUT "
+             "(default: stdout; a file path or unix:/path/to/socket) until SIGINT/SIGTERM"
+    )
+    parser.add_argument("--window", type=float, help="With --stream: one line per reader, EPC and window of this many seconds")
+    parser.add_argument("--flush-interval", type=float, default=1.0, help="With --stream: seconds between output flushes (default: 1)")
     args = parser.parse_args()
 
+    if args.iotc_fleet:
+        sys.exit(run_iotc_fleet_mode(args))
+    if args.fleet_config:
+        sys.exit(run_fleet_config_mode(args))
+    if args.stream is not None:
+        sys.exit(run_stream_mode(args))
+
+    if args.report is not None or args.since or args.until:
+        sys.exit(run_report_mode(args))
+
     # Batch/one-shot mode: execute automatic sequence without showing menu, show menu only in case of error
     batch_mode = args.table or args.rssi
-    cli = InteractiveCLI(debug=args.debug)
+    cli = InteractiveCLI(debug=args.debug, use_endpoint_cache=not args.no_cache, ws_engine=args.ws_engine,
+                         fanout_address=args.fanout, fanout_buffer=args.fanout_buffer)
     def fallback_to_menu():
         print("\n➡️  Switching to interactive menu...")
         cli.run()
@@ -120,5 +224,106 @@ def main() -> None:
     # If not batch, or if batch but login not requested, show menu
     cli.run()
 
+def run_report_mode(args) -> int:
+    """Runs the non-interactive batch report generation. Returns the process exit code."""
+    from zebra_cli.report_batch import default_directories, parse_range_bound, run_batch_reports
+
+    try:
+        since = parse_range_bound(args.since) if args.since else None
+        until = parse_range_bound(args.until, end=True) if args.until else None
+    except ValueError as e:
+        print(f"❌ Invalid date range: {e}", file=sys.stderr)
+        return 2
+
+    tag_reads_dir, messages_dir, reports_dir = default_directories()
+    summary = run_batch_reports(
+        tag_reads_dir, messages_dir, reports_dir,
+        pattern=args.report or "tags_read_*.csv",
+        since=since,
+        until=until,
+        workers=args.workers,
+        force=args.force,
+        use_cache=not args.no_report_cache,
+        report_options={
+            "summary_mode": {"auto": None, "on": True, "off": False}[args.summary],
+            "top_n": args.top,
+            "epc_filter": args.epc_filter,
+            "sort_by": args.sort_by
+        },
+        report_format=args.format,
+        debug=args.debug
+    )
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+def run_iotc_fleet_mode(args) -> int:
+    """Runs the non-interactive fleet IoT Connector provisioning. Returns the process exit code."""
+    from zebra_cli.iotc_fleet import (DEFAULT_READER_TIMEOUT, DEFAULT_RETRIES, DEFAULT_WORKERS, load_inventory,
+                                      run_fleet_provisioning)
+
+    try:
+        targets = load_inventory(args.iotc_fleet)
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        print(f"❌ Invalid inventory: {e}", file=sys.stderr)
+        return 2
+
+    summary = run_fleet_provisioning(
+        targets,
+        workers=args.workers or DEFAULT_WORKERS,
+        timeout=args.reader_timeout or DEFAULT_READER_TIMEOUT,
+        retries=DEFAULT_RETRIES if args.retries is None else args.retries,
+        debug=args.debug
+    )
+    summary.pop("results")  # Per-reader details are in the report file
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+def run_fleet_config_mode(args) -> int:
+    """Runs the non-interactive fleet configuration push. Returns the process exit code."""
+    from zebra_cli.fleet_config import DEFAULT_WORKERS, load_desired, run_fleet_config
+    from zebra_cli.iotc_fleet import load_inventory
+
+    if not args.inventory:
+        print("❌ --fleet-config requires --inventory", file=sys.stderr)
+        return 2
+    try:
+        targets = load_inventory(args.inventory)
+        desired = load_desired(args.fleet_config)
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        print(f"❌ Invalid fleet configuration: {e}", file=sys.stderr)
+        return 2
+
+    summary = run_fleet_config(
+        targets, desired,
+        workers=args.workers or DEFAULT_WORKERS,
+        dry_run=args.dry_run,
+        debug=args.debug
+    )
+    summary.pop("results")  # Per-reader details are in the report file
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+def run_stream_mode(args) -> int:
+    """Runs the headless NDJSON streaming daemon. Returns the process exit code."""
+    from zebra_cli.stream_daemon import run_stream_daemon
+
+    if not (args.ip and args.username and args.password):
+        print("❌ --stream requires --ip, -u and -p", file=sys.stderr)
+        return 2
+    if args.window is not None and args.window <= 0:
+        print("❌ --window must be positive", file=sys.stderr)
+        return 2
+
+    return run_stream_daemon(
+        args.ip, args.username, args.password,
+        output=args.stream,
+        window=args.window,
+        flush_interval=args.flush_interval,
+        ws_engine=args.ws_engine,
+        fanout_address=args.fanout,
+        fanout_buffer=args.fanout_buffer,
+        debug=args.debug
+    )
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
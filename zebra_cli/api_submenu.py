@@ -5,6 +5,7 @@ Persistent Interactive CLI for API Submenu
 import os
 import time
 import json
+import asyncio
 import base64
 import getpass
 from pathlib import Path
@@ -16,11 +17,21 @@ import httpx
 # Local imports
 from typing import Optional
 from zebra_cli.context import AppContext
+from zebra_cli.endpoint_cache import EndpointCache
+from zebra_cli.token_store import token_expires_soon
+
+# Pooled HTTP client settings (one keep-alive client per reader)
+HTTP_TIMEOUT = 10.0
+HTTP_MAX_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY = 30.0  # Seconds an idle connection to the reader is kept open
 
 class ApiSubmenu:
   
     def __init__(self, app_context: Optional[AppContext] = None) -> None:
         self.app_context = app_context
+        # Keep-alive HTTP client of the current reader (created on first request)
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_base_url: Optional[str] = None
         # API credentials storage
         if app_context:
             self.api_reader_ip = app_context.ip_address
@@ -133,8 +144,12 @@ class ApiSubmenu:
         
         return login_success  # Return the success status
     
-    def _auto_login(self) -> bool:
-        """Silently attempts to obtain JWT token automatically"""
+    def _auto_login(self, force_login: bool = False) -> bool:
+        """
+        Silently attempts to obtain JWT token automatically.
+        The token of the main connection (or the stored one of this reader) is reused while it is
+        valid; a login only happens if it is missing, about to expire or force_login is set.
+        """
         print("🔐 Attempting automatic login...")
         
         try:
@@ -149,12 +164,15 @@ class ApiSubmenu:
                 
                 try:
 
-                    token = self.api_jwt_token
+                    token = None if force_login else self.api_jwt_token
+                    if (not token or token_expires_soon(token)) and self.app_context and \
+                            self.api_reader_ip and self.api_username and self.api_password:
+                        token = self.app_context.obtain_token(self.api_reader_ip, self.api_username,
+                                                              self.api_password, protocol, force=force_login)
 
                     if token:
                         # Store token and timestamp
-                        self.api_jwt_token = token
-                        self.api_token_timestamp = time.time()
+                        self._store_api_token(token)
                         if self.app_context and self.app_context.debug:
                             if protocol in ['http', 'https']:
                                 print(f"   ✅ Token obtained via {protocol.upper()}")
@@ -190,8 +208,14 @@ class ApiSubmenu:
             }
             
             protocol = self.api_protocol
-            
-            
+
+            cached_version = self.endpoint_cache.get(self.api_reader_ip, "/cloud/version") if self.endpoint_cache else None
+            if isinstance(cached_version, dict) and 'model' in cached_version:
+                self.api_reader_model = str(cached_version['model']).strip()
+                if self.app_context and self.app_context.debug:
+                    print(f"   ✅ Reader model: {self.api_reader_model} (cached)")
+                return
+
             try:
                 if self.app_context and self.app_context.debug:
                     if protocol in ['http', 'https']:
@@ -199,12 +223,7 @@ class ApiSubmenu:
                     else:
                         print(f"   🔍 Trying UNKNOWN protocol for version endpoint...")
                 
-                response = httpx.get(
-                    f"{protocol}://{self.api_reader_ip}/cloud/version",
-                    headers=headers,
-                    verify=False,
-                    timeout=10.0
-                )
+                response = self._get_http_client().get("/cloud/version", headers=headers)
 
                 if self.app_context and self.app_context.debug:
                     print(f"   📡 Version response status: {response.status_code}")
@@ -217,6 +236,7 @@ class ApiSubmenu:
                     if isinstance(response_data, dict) and 'model' in response_data:
                         model = str(response_data['model']).strip()
                         self.api_reader_model = model
+                        self._update_endpoint_cache("/cloud/version", "GET", None, True, response_data)
                         if self.app_context and self.app_context.debug:
                             print(f"   ✅ Reader model: {model}")
                         return
@@ -235,6 +255,18 @@ class ApiSubmenu:
             self.api_reader_model = "UNKNOWN"
             print(f"   ⚠️  Model detection error: {e}")
         
+    def _store_api_token(self, token: str, login_method: Optional[str] = None) -> None:
+        """Stores a new JWT token and shares it with the main connection and the token store"""
+        self.api_jwt_token = token
+        self.api_token_timestamp = time.time()
+        if not self.app_context or not self.api_reader_ip:
+            return
+        if self.app_context.token_store.get(self.api_reader_ip) != token:
+            self.app_context.token_store.put(self.api_reader_ip, token, self.api_username, login_method,
+                                                self.api_password)
+        if self.app_context.ip_address == self.api_reader_ip and self.app_context.token != token:
+            self.app_context.set_token(token)
+
     def _reset_api_credentials(self) -> None:
         """Resets all API session credentials and data"""
         self.api_reader_ip = None
@@ -243,6 +275,7 @@ class ApiSubmenu:
         self.api_jwt_token = None
         self.api_token_timestamp = None
         self.api_reader_model = None
+        self.close_http_client()
         print("✅ API session reset - credentials cleared")
     
     def _show_api_submenu(self) -> None:
@@ -324,6 +357,7 @@ class ApiSubmenu:
             'st': self.handle_api_set_timezone, 'settimezone': self.handle_api_set_timezone,
             'sl': self.handle_api_set_logs, 'setlogs': self.handle_api_set_logs,
             'rb': self.handle_api_reboot, 'reboot': self.handle_api_reboot,
+            'ss': self.handle_api_snapshot, 'snapshot': self.handle_api_snapshot,
             # Utilities
             'c': self.clear_screen,
             'h': self.show_help, 'help': self.show_help,
@@ -374,6 +408,7 @@ class ApiSubmenu:
                     print(two_col_row("ge / getCerts    🔒 Get certificates", "[-y] [-n](default)"))
                     print(two_col_row("gw / getLogs     📄 Get logs configuration", "[-y] [-n](default)"))
                     print(two_col_row("gy / getSyslog   📋 Get system log", "[-y] [-n](default)"))
+                    print(two_col_row("ss / snapshot    📸 Get all endpoints at once", "(always saved)"))
                     
                     print(separator_row())
                     # PUT ENDPOINTS - File-based section
@@ -513,7 +548,7 @@ class ApiSubmenu:
                             ]
                             
                             # Define commands that don't accept any arguments
-                            no_arg_commands = ['rb', 'reboot']
+                            no_arg_commands = ['rb', 'reboot', 'ss', 'snapshot']
                             
                             if cmd in put_commands_with_path:
                                 # Parse PUT command arguments for -p/--path flag
@@ -622,8 +657,74 @@ class ApiSubmenu:
             "Content-Type": "application/json"
         }
 
+    def _get_http_client(self) -> httpx.Client:
+        """
+        Returns the keep-alive HTTP client of the current reader, creating it on first use.
+
+        All handlers share its connection pool, so only the first request pays the TCP/TLS handshake.
+        The client is recreated when the reader address or protocol changes; the Bearer token
+        is updated in place after a login.
+        """
+        base_url = f"{self.api_protocol}://{self.api_reader_ip}"
+        if self._http_client is not None and (self._http_client.is_closed or self._http_client_base_url != base_url):
+            self.close_http_client()
+
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                base_url=base_url,
+                headers={"Accept": "application/json"},
+                verify=False,
+                timeout=HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+                )
+            )
+            self._http_client_base_url = base_url
+            if self.app_context and self.app_context.debug:
+                print(f"[DEBUG] Opened pooled HTTP client for {base_url}")
+
+        # Adopt a token refreshed in the background by the main connection
+        if self.app_context and self.app_context.token and self.app_context.ip_address == self.api_reader_ip:
+            self.api_jwt_token = self.app_context.token
+        if self.api_jwt_token:
+            self._http_client.headers["Authorization"] = f"Bearer {self.api_jwt_token}"
+        else:
+            self._http_client.headers.pop("Authorization", None)
+        return self._http_client
+
+    def close_http_client(self) -> None:
+        """Closes the pooled HTTP client and its keep-alive connections to the reader"""
+        if self._http_client is None:
+            return
+        try:
+            self._http_client.close()
+        except Exception:
+            pass
+        self._http_client = None
+        self._http_client_base_url = None
+
+    @property
+    def endpoint_cache(self) -> Optional[EndpointCache]:
+        """Read-mostly endpoint cache of the application context (None if unavailable)"""
+        return getattr(self.app_context, 'endpoint_cache', None)
+
+    def _update_endpoint_cache(self, endpoint: str, method: str, params: Optional[dict], success: bool, response_data) -> None:
+        """Stores fresh read-mostly GET responses and invalidates the entries that a successful write can change"""
+        cache = self.endpoint_cache
+        if cache is None or not success:
+            return
+        if method.upper() == "GET":
+            if params is None:
+                cache.put(self.api_reader_ip, endpoint, response_data)
+        else:
+            cache.invalidate_for_write(self.api_reader_ip, endpoint)
+
     def _handle_auth_error(self) -> bool:
         """Handle authorization errors and display user guidance. Returns True if error occurred."""
+        if self.app_context and self.api_reader_ip:
+            self.app_context.token_store.invalidate(self.api_reader_ip)  # Do not reuse a rejected token
         print("\n🚨 AUTHORIZATION ERROR")
         print("=" * 25)
         print("❌ Request unauthorized - JWT token may be expired or invalid")
@@ -650,30 +751,27 @@ class ApiSubmenu:
         # Silent token check - no user interaction
         if not hasattr(self, 'api_jwt_token') or not self.api_jwt_token:
             return False, {"error": "No JWT token available"}, 0
+
+        # Read-mostly endpoints (version, capabilities, ...) are served from the endpoint cache
+        if self.endpoint_cache and method.upper() == "GET" and params is None:
+            cached = self.endpoint_cache.get(self.api_reader_ip, endpoint)
+            if cached is not None:
+                return True, cached, 200
         
         try:
-
-            protocol = self.api_protocol
-
             headers = {
                 "Authorization": f"Bearer {self.api_jwt_token}",
                 "Accept": "application/json",
                 "Content-Type": "application/json"
             }
 
-            url = f"{protocol}://{self.api_reader_ip}{endpoint}"
-            
-            # Make the request based on method
-            if method.upper() == "GET":
-                response = httpx.get(url, headers=headers, params=params, verify=False, timeout=10.0)
-            elif method.upper() == "POST":
-                response = httpx.post(url, headers=headers, json=data, params=params, verify=False, timeout=10.0)
-            elif method.upper() == "PUT":
-                response = httpx.put(url, headers=headers, json=data, params=params, verify=False, timeout=10.0)
-            elif method.upper() == "DELETE":
-                response = httpx.delete(url, headers=headers, params=params, verify=False, timeout=10.0)
-            else:
+            # Make the request on the pooled keep-alive connection
+            if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
                 return False, {"error": f"Unsupported method: {method}"}, 0
+            response = self._get_http_client().request(
+                method.upper(), endpoint, headers=headers, params=params,
+                json=data if method.upper() in ("POST", "PUT") else None
+            )
             
             # Try to parse JSON response
             try:
@@ -683,6 +781,7 @@ class ApiSubmenu:
             
             # Check if the request was successful (2xx status codes)
             success = 200 <= response.status_code < 300
+            self._update_endpoint_cache(endpoint, method, params, success, response_data)
             return success, response_data, response.status_code
             
         except Exception as e:
@@ -705,24 +804,15 @@ class ApiSubmenu:
             return False, {"error": "No JWT token available"}, 0
         
         try:
-
-            protocol = self.api_protocol
-
             headers = self._get_api_headers()
 
-            url = f"{protocol}://{self.api_reader_ip}{endpoint}"
-            
-            # Make the request based on method
-            if method.upper() == "GET":
-                response = httpx.get(url, headers=headers, params=params, verify=False, timeout=10.0)
-            elif method.upper() == "POST":
-                response = httpx.post(url, headers=headers, json=data, params=params, verify=False, timeout=10.0)
-            elif method.upper() == "PUT":
-                response = httpx.put(url, headers=headers, json=data, params=params, verify=False, timeout=10.0)
-            elif method.upper() == "DELETE":
-                response = httpx.delete(url, headers=headers, params=params, verify=False, timeout=10.0)
-            else:
+            # Make the request on the pooled keep-alive connection
+            if method.upper() not in ("GET", "POST", "PUT", "DELETE"):
                 return False, {"error": f"Unsupported method: {method}"}, 0
+            response = self._get_http_client().request(
+                method.upper(), endpoint, headers=headers, params=params,
+                json=data if method.upper() in ("POST", "PUT") else None
+            )
             
             # Try to parse JSON response
             try:
@@ -732,6 +822,7 @@ class ApiSubmenu:
             
             # Check if the request was successful (2xx status codes)
             success = 200 <= response.status_code < 300
+            self._update_endpoint_cache(endpoint, method, params, success, response_data)
             return success, response_data, response.status_code
         
         except Exception as e:
@@ -1206,7 +1297,7 @@ class ApiSubmenu:
             print("🔄 Refreshing JWT token with new password...")
             
             # Auto-refresh token with new credentials
-            login_success = self._auto_login()
+            login_success = self._auto_login(force_login=True)
             
             if login_success:
                 print("✅ JWT token refreshed successfully!")
@@ -1256,14 +1347,12 @@ class ApiSubmenu:
             basic_auth_header = f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('utf-8')}"
             
             # Make GET request with Basic Auth
-            response = httpx.get(
-                f"{protocol}://{self.api_reader_ip}/cloud/localRestLogin",
+            response = self._get_http_client().get(
+                "/cloud/localRestLogin",
                 headers={
                     "Authorization": basic_auth_header,
                     "Accept": "application/json"
-                },
-                verify=False,
-                timeout=10.0
+                }
             )
             
             if response.status_code == 200:
@@ -1286,9 +1375,7 @@ class ApiSubmenu:
                     
                     if token and isinstance(token, str) and token.count('.') == 2:
                         print("✅ JWT token extracted successfully!")
-                        self.api_jwt_token = token
-                        import time
-                        self.api_token_timestamp = time.time()
+                        self._store_api_token(token, login_method="/cloud/localRestLogin")
                     else:
                         print("⚠️  No valid JWT token found in response")
                         print(f"📄 Raw response: {data}")
@@ -1655,6 +1742,84 @@ class ApiSubmenu:
 
     # PUT HANDLERS
 
+    async def _fetch_snapshot(self) -> dict:
+        """
+        Fetches every reader state endpoint concurrently through a ReaderSession
+        (generated REST client on one pooled async connection).
+
+        Returns:
+            dict: bundle key -> {endpoint, success, status_code, elapsed_ms, data}
+        """
+        from zebra_cli.reader_session import ReaderSession
+
+        async with ReaderSession(
+            f"{self.api_protocol}://{self.api_reader_ip}", self.api_jwt_token, timeout=HTTP_TIMEOUT,
+            debug=bool(self.app_context and self.app_context.debug)
+        ) as session:
+            results = await session.fetch()
+        return {name: result.to_dict() for name, result in results.items()}
+
+    def take_snapshot(self) -> dict:
+        """Captures the reader state from all snapshot endpoints and returns the bundle (without saving it)"""
+        start = time.perf_counter()
+        endpoints = asyncio.run(self._fetch_snapshot())
+        return {
+            "reader_ip": self.api_reader_ip,
+            "reader_model": getattr(self, 'api_reader_model', None) or "UNKNOWN",
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            "endpoints": endpoints
+        }
+
+    def handle_api_snapshot(self) -> None:
+        """Fetches all GET endpoints concurrently and saves them as one timestamped JSON bundle"""
+        print("\n📸 READER SNAPSHOT")
+        print("-" * 20)
+        print(f"📍 Target: {self.api_reader_ip}")
+        print("🌐 Endpoints: status, version, network, region, mode, config, gpi, gpo, capabilities,")
+        print("              timezone, cableloss, certificates, logs (concurrent)")
+        print(f"🔑 Authentication: Bearer Token")
+
+        if not self._check_jwt_token():
+            return
+
+        try:
+            bundle = self.take_snapshot()
+        except Exception as e:
+            print(f"❌ Snapshot failed: {e}")
+            input("\n⏸️  Press ENTER to continue...")
+            return
+
+        endpoints = bundle["endpoints"]
+        if any(result["status_code"] in [401, 403] for result in endpoints.values()):
+            self._handle_auth_error()
+            return
+
+        print()
+        for name, result in endpoints.items():
+            icon = "✅" if result["success"] else "❌"
+            status = result["status_code"] or "ERR"
+            print(f"   {icon} {name:<13} {result['endpoint']:<32} {status:>4}  {result['elapsed_ms']:>8.1f} ms")
+        slowest = max(result["elapsed_ms"] for result in endpoints.values())
+        succeeded = sum(1 for result in endpoints.values() if result["success"])
+        print(f"\n⏱️  Total: {bundle['elapsed_ms']:.1f} ms (slowest endpoint: {slowest:.1f} ms)")
+        print(f"📊 {succeeded}/{len(endpoints)} endpoints succeeded")
+
+        try:
+            reader_model = self._get_reader_model()
+            bundle["reader_model"] = reader_model
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            response_dir = os.path.join(os.getcwd(), "api-responses", f"{self.api_reader_ip}_{reader_model}", "snapshot")
+            os.makedirs(response_dir, exist_ok=True)
+            file_path = os.path.join(response_dir, f"snapshot-{reader_model}-{timestamp}.json")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(bundle, f, indent=2, ensure_ascii=False)
+            print(f"💾 Snapshot saved: {file_path}")
+        except Exception as e:
+            print(f"❌ Error saving snapshot: {e}")
+
+        input("\n⏸️  Press ENTER to continue...")
+
     def handle_api_set_config(self, file_path_args: Optional[list] = None) -> None:
         """Handles PUT /cloud/config API endpoint with JSON file selection"""
         if file_path_args:
@@ -1932,6 +2097,7 @@ class ApiSubmenu:
         print("\nUSAGE:")
         print("  • Enter a command shortcut (e.g. 'gs', 'setnetwork') or full command name.")
         print("  • For GET commands, add '-y' to save the response as a JSON file.")
+        print("  • Use 'ss' or 'snapshot' to fetch all GET endpoints concurrently into one JSON bundle.")
         print("  • For PUT commands, provide a file path with '-p <file>' or '--path <file>'.")
         print("  • Use 'b' or 'back' to return to the main menu.")
         print("  • Use 'c' or 'clear' to clear the screen.")
@@ -0,0 +1,453 @@
+"""
+Asyncio WebSocket ingestion engine: many reader sockets on one event loop
+
+Alternative to the thread-per-reader WebSocketListener, selected at startup with `--ws-engine async`.
+All connections of the process share one event loop running in one background thread. Each connection
+reads its socket in large chunks and decodes all complete frames of a chunk as one batch. While its
+consumer queue is above a high-water mark a connection stops reading, so TCP flow control slows down
+that reader only. A recording connection never pauses: the CSV recording gets every message and the
+messages above the high-water mark are not queued (counted in `dropped`). The engine speaks RFC 6455 directly over asyncio streams (no extra dependency).
+
+AsyncWebSocketListener has the interface of WebSocketListener, so the same consumers (AppContext
+queue, tag table, CSV recording, multi-reader session) work with both engines.
+"""
+import os
+import ssl
+import json
+import time
+import queue
+import base64
+import struct
+import asyncio
+import hashlib
+import threading
+import concurrent.futures
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
+
+from zebra_cli.websocket_listener import (
+    CsvRecorder, ConnectionGaps, PING_INTERVAL, PING_TIMEOUT, RECONNECT_STABLE_AFTER, URI_RETRY_DELAY,
+    WebSocketListener, reconnect_delay
+)
+
+WS_ENGINES = ('thread', 'async')
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+READ_CHUNK = 256 * 1024  # Bytes read per socket read; every complete frame in it is decoded as one batch
+HANDSHAKE_TIMEOUT = 5.0
+DEFAULT_HIGH_WATER = 50000  # Queued messages above which a connection stops reading its socket (None: never)
+BACKPRESSURE_POLL = 0.01
+STOP_POLL = 0.1  # Seconds between stop_event checks while waiting to reconnect
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+class WebSocketProtocolError(Exception):
+    """Invalid handshake or frame"""
+    pass
+
+def listener_class(engine: str = 'thread'):
+    """Returns the listener class of a WebSocket engine ('thread' or 'async')"""
+    return AsyncWebSocketListener if engine == 'async' else WebSocketListener
+
+def _apply_mask(payload: bytes, key: bytes) -> bytes:
+    """XORs payload with the 4-byte masking key (as one big integer, fast for large payloads)"""
+    if not payload:
+        return b''
+    length = len(payload)
+    repeated = (key * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, 'big') ^ int.from_bytes(repeated, 'big')).to_bytes(length, 'big')
+
+def encode_frame(opcode: int, payload: bytes = b'', mask: bool = True) -> bytes:
+    """Encodes one final frame (clients must mask, servers must not)"""
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 65536:
+        header.append(mask_bit | 126)
+        header += struct.pack('!H', length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack('!Q', length)
+    if not mask:
+        return bytes(header) + payload
+    key = os.urandom(4)
+    return bytes(header) + key + _apply_mask(payload, key)
+
+def decode_frames(buffer: bytearray) -> List[Tuple[bool, int, bytes]]:
+    """
+    Removes every complete frame from buffer (an incomplete last frame stays for the next read).
+
+    Returns:
+        list: (fin, opcode, payload) per frame
+    """
+    frames = []
+    offset = 0
+    size = len(buffer)
+    while size - offset >= 2:
+        first, second = buffer[offset], buffer[offset + 1]
+        length = second & 0x7F
+        position = offset + 2
+        if length == 126:
+            if size - position < 2:
+                break
+            length = struct.unpack_from('!H', buffer, position)[0]
+            position += 2
+        elif length == 127:
+            if size - position < 8:
+                break
+            length = struct.unpack_from('!Q', buffer, position)[0]
+            position += 8
+        if length > MAX_FRAME_SIZE:
+            raise WebSocketProtocolError(f"Frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+        key = None
+        if second & 0x80:
+            if size - position < 4:
+                break
+            key = bytes(buffer[position:position + 4])
+            position += 4
+        if size - position < length:
+            break
+        payload = bytes(buffer[position:position + length])
+        frames.append((bool(first & 0x80), first & 0x0F, _apply_mask(payload, key) if key else payload))
+        offset = position + length
+    del buffer[:offset]
+    return frames
+
+_json_decoder = json.JSONDecoder()
+
+def decode_messages(payloads: List[bytes]) -> list:
+    """
+    Decodes a batch of message payloads. A payload with several concatenated JSON objects yields one
+    message per object; undecodable text yields {"raw_message", "error"} as with the threaded listener.
+    """
+    messages = []
+    for payload in payloads:
+        text = payload.decode('utf-8', errors='ignore')
+        try:
+            messages.append(json.loads(text))
+            continue
+        except json.JSONDecodeError:
+            pass
+        index, length = 0, len(text)
+        while index < length:
+            while index < length and text[index].isspace():
+                index += 1
+            if index >= length:
+                break
+            try:
+                data, index = _json_decoder.raw_decode(text, index)
+                messages.append(data)
+            except json.JSONDecodeError as e:
+                messages.append({"raw_message": text[index:], "error": str(e)})
+                break
+    return messages
+
+def websocket_accept(key: str) -> str:
+    """Sec-WebSocket-Accept value for a Sec-WebSocket-Key"""
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+
+class AsyncIngestEngine:
+    """One event loop in one background thread, shared by all AsyncWebSocketListener connections"""
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the engine loop, starting its thread on first use"""
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="AsyncIngestEngine", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        """Runs a coroutine on the engine loop"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop())
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine() -> AsyncIngestEngine:
+    """Returns the process-wide ingestion engine"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AsyncIngestEngine()
+        return _engine
+
+class AsyncWebSocketListener(CsvRecorder):
+    """
+    One reader connection on the shared asyncio engine, with the interface of WebSocketListener
+    (start, is_alive, is_connected, join, close, ws.close, the CSV recording methods and the same
+    reconnection with backoff and gap accounting).
+    """
+
+    def __init__(self, uri: str, data_queue: queue.Queue, stop_event: threading.Event,
+                 fallback_uris: Optional[list] = None, debug: bool = False,
+                 reconnect: bool = True, high_water: Optional[int] = DEFAULT_HIGH_WATER,
+                 engine: Optional[AsyncIngestEngine] = None):
+        self.uri = uri
+        self.fallback_uris = fallback_uris or []
+        self.all_uris = [uri] + self.fallback_uris
+        self.current_uri_index = 0
+        self.data_queue = data_queue
+        self.stop_event = stop_event
+        self.debug = debug
+        self.high_water = high_water
+        self.engine = engine or get_engine()
+        self._future = None
+        self._task = None
+        self._is_connected = False
+        self._last_data_time = None
+        # Ingestion counters
+        self.messages = 0
+        self.frames = 0
+        self.batches = 0
+        self.paused_seconds = 0.0  # Time spent not reading because the consumer queue was full
+        self.dropped = 0  # Messages recorded but not queued because the consumer queue was full
+        self.reconnect = reconnect
+        self.gaps = ConnectionGaps()
+        self._good_uri_index = None
+        self._connection_open_time = None
+        self._init_recording()
+
+    @property
+    def ws(self):
+        """Open connection handle (AppContext calls ws.close() to stop the listener)"""
+        return self if self._is_connected else None
+
+    def start(self):
+        """Schedules the connection on the engine loop"""
+        self._future = self.engine.submit(self._run())
+
+    def is_alive(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    def join(self, timeout: Optional[float] = None):
+        if self._future is None:
+            return
+        try:
+            self._future.result(timeout)
+        except (Exception, concurrent.futures.CancelledError):
+            pass
+
+    def close(self):
+        """Closes the connection and stops the listener."""
+        print("🔌 Terminating WebSocket listener...")
+        gap = self.gaps.close_open_gap()
+        if gap:
+            self.record_message(gap)
+        self._stop_csv_recording()
+        self.stop_event.set()
+        task = self._task
+        if task is not None and not task.done():
+            self.engine.loop().call_soon_threadsafe(task.cancel)
+        if self.is_alive():
+            self.join(timeout=2.0)
+            if self.is_alive():
+                print("⚠️  Listener not terminated within timeout")
+
+    async def _run(self):
+        """Connection rounds like the threaded listener: last good URI first, backoff between rounds"""
+        self._task = asyncio.current_task()
+        if self.debug:
+            print(f"[DEBUG][AsyncWebSocketListener] URIs: {self.all_uris}")
+        attempt = 0
+        try:
+            while not self.stop_event.is_set():
+                connected = False
+                order = list(range(len(self.all_uris)))
+                if self._good_uri_index is not None:
+                    order.remove(self._good_uri_index)
+                    order.insert(0, self._good_uri_index)
+                for position, uri_index in enumerate(order):
+                    if self.stop_event.is_set():
+                        break
+                    current_uri = self.all_uris[uri_index]
+                    self.current_uri_index = uri_index
+                    self._connection_open_time = None
+                    print(f"\n🔗 WebSocket connection attempt ({position + 1}/{len(order)}): {current_uri}")
+                    try:
+                        await self._connect_and_read(current_uri)
+                    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                            WebSocketProtocolError) as e:
+                        print(f"❌ Connection failed: {current_uri}")
+                        print(f"   Error: {e or type(e).__name__}")
+                    if self.stop_event.is_set():
+                        break
+                    if self._connection_open_time:
+                        connected = True
+                        self._good_uri_index = uri_index
+                        if time.time() - self._connection_open_time >= RECONNECT_STABLE_AFTER:
+                            attempt = 0
+                        self.gaps.disconnected(current_uri, "connection lost")
+                        break
+                    if position < len(order) - 1:
+                        print("🔄 Trying next URI...")
+                        await self._wait_stop(URI_RETRY_DELAY)
+
+                if self.stop_event.is_set():
+                    break
+                if not self.reconnect:
+                    if not connected:
+                        print(f"❌ All {len(self.all_uris)} WebSocket URIs attempted without success")
+                    break
+                delay = reconnect_delay(attempt)
+                attempt += 1
+                print(f"🔄 Reconnecting in {delay:.1f}s (attempt {attempt})...")
+                await self._wait_stop(delay)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._is_connected = False
+
+    async def _wait_stop(self, delay: float) -> bool:
+        """Sleeps up to delay seconds, returning early (True) once stop_event is set, like stop_event.wait(delay)"""
+        deadline = time.monotonic() + delay
+        while not self.stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(STOP_POLL, remaining))
+        return True
+
+    async def _handshake(self, reader, writer, host: str, port: int, path: str):
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write((f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+        await writer.drain()
+        lines = (await reader.readuntil(b"\r\n\r\n")).decode('latin-1').split("\r\n")
+        status = lines[0].split()
+        if len(status) < 2 or status[1] != "101":
+            raise WebSocketProtocolError(f"Handshake rejected: {lines[0]}")
+        headers = {name.strip().lower(): value.strip() for name, _, value in (line.partition(':') for line in lines[1:])}
+        if headers.get('sec-websocket-accept') != websocket_accept(key):
+            raise WebSocketProtocolError("Invalid Sec-WebSocket-Accept")
+
+    async def _connect_and_read(self, uri: str):
+        parsed = urlparse(uri)
+        secure = parsed.scheme == 'wss'
+        host = parsed.hostname
+        port = parsed.port or (443 if secure else 80)
+        path = (parsed.path or '/') + (f"?{parsed.query}" if parsed.query else '')
+        ssl_context = None
+        if secure:
+            # Readers use self-signed certificates
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context, limit=READ_CHUNK), HANDSHAKE_TIMEOUT)
+        try:
+            await asyncio.wait_for(self._handshake(reader, writer, host, port, path), HANDSHAKE_TIMEOUT)
+            self._is_connected = True
+            self._connection_open_time = time.time()
+            print(f"✅ WebSocket connected: {uri}")
+            gap = self.gaps.connected()
+            if gap:
+                print(f"🔁 Reconnected after {gap['duration_s']:.1f}s")
+                await self._deliver([gap])
+            await self._read_loop(reader, writer)
+        finally:
+            self._is_connected = False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _read_loop(self, reader, writer):
+        buffer = bytearray()
+        fragments = []
+        ping_sent = False  # Idle for PING_INTERVAL: a ping is out and any data within PING_TIMEOUT answers it
+        while not self.stop_event.is_set():
+            if self._queue_full() and not self.ws_recorder_active:
+                # Backpressure: leave the socket unread until the consumer catches up (or a recording starts)
+                paused_at = time.perf_counter()
+                while self._queue_full() and not self.ws_recorder_active and not self.stop_event.is_set():
+                    await asyncio.sleep(BACKPRESSURE_POLL)
+                self.paused_seconds += time.perf_counter() - paused_at
+            try:
+                chunk = await asyncio.wait_for(reader.read(READ_CHUNK), PING_TIMEOUT if ping_sent else PING_INTERVAL)
+            except asyncio.TimeoutError:
+                if ping_sent:
+                    print(f"💀 No data and no pong from the reader for {PING_INTERVAL + PING_TIMEOUT:.0f}s, "
+                          f"dropping the connection")
+                    return
+                writer.write(encode_frame(OPCODE_PING, b''))
+                await writer.drain()
+                ping_sent = True
+                continue
+            ping_sent = False
+            if not chunk:
+                print("🔌 WebSocket connection closed by the reader")
+                return
+            buffer += chunk
+            payloads = []
+            closed = False
+            for fin, opcode, payload in decode_frames(buffer):
+                self.frames += 1
+                if opcode == OPCODE_PING:
+                    writer.write(encode_frame(OPCODE_PONG, payload))
+                elif opcode == OPCODE_CLOSE:
+                    writer.write(encode_frame(OPCODE_CLOSE, payload[:2]))
+                    closed = True
+                    break
+                elif opcode in (OPCODE_TEXT, OPCODE_BINARY, OPCODE_CONTINUATION):
+                    fragments.append(payload)
+                    if fin:
+                        payloads.append(b''.join(fragments))
+                        fragments = []
+            if payloads:
+                await self._deliver(decode_messages(payloads))
+            if closed:
+                print("🔌 WebSocket connection closed by the reader")
+                return
+
+    def _queue_full(self) -> bool:
+        return (self.high_water is not None and self.data_queue.qsize() >= self.high_water) or self.data_queue.full()
+
+    async def _deliver(self, messages: list):
+        """Records and queues one decoded batch; while recording, a full queue drops instead of waiting"""
+        self.batches += 1
+        for data in messages:
+            recording = self.ws_recorder_active
+            if recording:
+                self.record_message(data)
+                if self._queue_full():
+                    self.dropped += 1
+                    continue
+            while True:
+                try:
+                    self.data_queue.put_nowait(data)
+                    break
+                except queue.Full:
+                    if self.ws_recorder_active or self.stop_event.is_set():
+                        self.dropped += 1
+                        break
+                    await asyncio.sleep(BACKPRESSURE_POLL)
+        self.messages += len(messages)
+        self._last_data_time = time.time()
@@ -3,37 +3,44 @@ Module for managing ATR7000 localization with RAW_DIRECTIONALITY messages
 """
 import math
 import queue
+import importlib.util
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import deque
-import numpy as np
-
- # Import matplotlib with fallback
-try:
-    import matplotlib
-    # Set non-interactive backend to avoid threading conflicts with tkinter
-    matplotlib.use('Qt5Agg')  # Use Qt backend if available, otherwise fallback
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-    from matplotlib.dates import DateFormatter
-    import matplotlib.patches as patches
-    from mpl_toolkits.axes_grid1 import make_axes_locatable
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    try:
-        # Fallback to TkAgg backend if Qt is not available
-        import matplotlib
-        matplotlib.use('TkAgg')
-        import matplotlib.pyplot as plt
-        import matplotlib.animation as animation
-        from matplotlib.dates import DateFormatter
-        import matplotlib.patches as patches
-        from mpl_toolkits.axes_grid1 import make_axes_locatable
-        MATPLOTLIB_AVAILABLE = True
-    except ImportError:
-        MATPLOTLIB_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# matplotlib is imported on first plot (see _load_matplotlib), not at module import
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+_matplotlib_loaded = False
+
+def _load_matplotlib() -> bool:
+    """
+    Imports matplotlib for the interactive plots on first use, with the Qt5Agg backend
+    (TkAgg as fallback). Returns False if no GUI-capable matplotlib is available.
+    """
+    global plt, animation, DateFormatter, patches, make_axes_locatable, MATPLOTLIB_AVAILABLE, _matplotlib_loaded
+    if _matplotlib_loaded or not MATPLOTLIB_AVAILABLE:
+        return MATPLOTLIB_AVAILABLE
+    for backend in ('Qt5Agg', 'TkAgg'):
+        try:
+            import matplotlib
+            # Interactive backend to avoid threading conflicts with tkinter
+            matplotlib.use(backend)
+            import matplotlib.pyplot as plt
+            import matplotlib.animation as animation
+            from matplotlib.dates import DateFormatter
+            import matplotlib.patches as patches
+            from mpl_toolkits.axes_grid1 import make_axes_locatable
+            _matplotlib_loaded = True
+            return True
+        except ImportError:
+            continue
+    MATPLOTLIB_AVAILABLE = False
+    return False
 
 @dataclass
 class RawDirectionalityMessage:
@@ -66,17 +73,216 @@ class PlotDataSerie:
     first_timestamp: Optional[datetime] = None
     last_timestamp: Optional[datetime] = None
 
+@dataclass
+class TrackState:
+    """Smoothed position and velocity of a tag estimated by the PositionTracker"""
+    epc: str
+    x: float  # meters
+    y: float  # meters
+    vx: float = 0.0  # meters/second
+    vy: float = 0.0  # meters/second
+    timestamp: Optional[datetime] = None
+    updates: int = 0
+    # Shared 2x2 covariance for both axes (position, position/velocity, velocity)
+    p_pos: float = 0.0
+    p_cross: float = 0.0
+    p_vel: float = 0.0
+
+    @property
+    def speed(self) -> float:
+        """Returns the estimated speed in meters/second"""
+        return math.hypot(self.vx, self.vy)
+
+class PositionTracker:
+    """
+    Streaming per-EPC constant-velocity Kalman tracker.
+    Each update costs O(1) and only keeps the latest state per tag, so it can run
+    live on every RAW_DIRECTIONALITY message and offline when replaying recordings.
+    """
+
+    def __init__(self, measurement_std: float = 0.5, acceleration_std: float = 0.5,
+                 initial_velocity_std: float = 1.0, max_gap_seconds: float = 5.0):
+        """
+        Args:
+            measurement_std: Expected noise of a calculated position in meters
+            acceleration_std: Expected tag acceleration in meters/second^2 (process noise)
+            initial_velocity_std: Uncertainty of the velocity when a track starts
+            max_gap_seconds: Restart the track if no update arrives within this time
+        """
+        self.measurement_var = measurement_std ** 2
+        self.acceleration_var = acceleration_std ** 2
+        self.initial_velocity_var = initial_velocity_std ** 2
+        self.max_gap_seconds = max_gap_seconds
+        self.tracks: Dict[str, TrackState] = {}
+        self._lock = threading.Lock()
+
+    def update(self, point: PositionPoint) -> TrackState:
+        """Feeds a new position measurement and returns the updated track state"""
+        with self._lock:
+            track = self.tracks.get(point.epc)
+            dt = None
+            if track is not None and track.timestamp is not None:
+                dt = (point.timestamp - track.timestamp).total_seconds()
+
+            if track is None or (dt is not None and dt > self.max_gap_seconds):
+                track = TrackState(
+                    epc=point.epc,
+                    x=point.x,
+                    y=point.y,
+                    timestamp=point.timestamp,
+                    updates=1,
+                    p_pos=self.measurement_var,
+                    p_cross=0.0,
+                    p_vel=self.initial_velocity_var
+                )
+                self.tracks[point.epc] = track
+                return self._copy_state(track)
+
+            # Out-of-order or duplicated timestamps: correct without predicting
+            dt = max(dt or 0.0, 0.0)
+
+            # Predict (constant velocity, white-noise acceleration)
+            q = self.acceleration_var
+            pred_x = track.x + track.vx * dt
+            pred_y = track.y + track.vy * dt
+            p_pos = track.p_pos + 2 * dt * track.p_cross + dt * dt * track.p_vel + q * dt ** 4 / 4
+            p_cross = track.p_cross + dt * track.p_vel + q * dt ** 3 / 2
+            p_vel = track.p_vel + q * dt * dt
+
+            # Correct (same gain for both axes as they share noise model and covariance)
+            innovation_var = p_pos + self.measurement_var
+            k_pos = p_pos / innovation_var
+            k_vel = p_cross / innovation_var
+            res_x = point.x - pred_x
+            res_y = point.y - pred_y
+
+            track.x = pred_x + k_pos * res_x
+            track.y = pred_y + k_pos * res_y
+            track.vx += k_vel * res_x
+            track.vy += k_vel * res_y
+            track.p_pos = (1 - k_pos) * p_pos
+            track.p_cross = (1 - k_pos) * p_cross
+            track.p_vel = p_vel - k_vel * p_cross
+            track.timestamp = max(track.timestamp, point.timestamp)
+            track.updates += 1
+            return self._copy_state(track)
+
+    def _copy_state(self, track: TrackState) -> TrackState:
+        """Returns a snapshot of a track so callers never share mutable state"""
+        return TrackState(
+            epc=track.epc, x=track.x, y=track.y, vx=track.vx, vy=track.vy,
+            timestamp=track.timestamp, updates=track.updates,
+            p_pos=track.p_pos, p_cross=track.p_cross, p_vel=track.p_vel
+        )
+
+    def get_state(self, epc: str) -> Optional[TrackState]:
+        """Returns the latest smoothed state for an EPC, or None if not tracked"""
+        with self._lock:
+            track = self.tracks.get(epc)
+            return self._copy_state(track) if track is not None else None
+
+    def get_all_states(self) -> List[TrackState]:
+        """Returns the latest smoothed state of every tracked EPC"""
+        with self._lock:
+            return [self._copy_state(track) for track in self.tracks.values()]
+
+    def remove(self, epc: str):
+        """Drops the track of an EPC"""
+        with self._lock:
+            self.tracks.pop(epc, None)
+
+    def clear(self):
+        """Drops all tracks"""
+        with self._lock:
+            self.tracks.clear()
+
+def parse_message_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parses a reader message timestamp such as "2025-09-11T10:17:02.227+0000" (timezone dropped)"""
+    if not timestamp_str:
+        return None
+    timestamp_clean = timestamp_str.replace('+0000', '').replace('Z', '')
+    try:
+        return datetime.fromisoformat(timestamp_clean)
+    except ValueError:
+        for fmt in ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S'):
+            try:
+                return datetime.strptime(timestamp_clean, fmt)
+            except ValueError:
+                continue
+    return None
+
+def extract_position_point(data: dict, position_calculator: 'ATR7000PositionCalculator',
+                           timestamp: Optional[datetime] = None) -> Optional[PositionPoint]:
+    """
+    Extracts a position point from a decoded RAW_DIRECTIONALITY/DIRECTIONALITY_RAW message,
+    or from a CUSTOM message carrying azimuth/elevation or x/y. Returns None for other messages.
+    """
+    message_type = data.get('type')
+    msg_data = data.get('data', {})
+    if not isinstance(msg_data, dict):
+        return None
+    timestamp = timestamp or datetime.now()
+
+    if message_type in ('RAW_DIRECTIONALITY', 'DIRECTIONALITY_RAW'):
+        epc = msg_data.get('idHex') or msg_data.get('epc', '') or msg_data.get('EPC', '')
+        azimuth = msg_data.get('azimuth') or msg_data.get('Azimuth') or 0.0
+        elevation = msg_data.get('elevation') or msg_data.get('Elevation') or 0.0
+        if not epc:
+            return None
+        raw_message = RawDirectionalityMessage(
+            epc=epc,
+            azimuth=float(azimuth),
+            elevation=float(elevation),
+            timestamp=timestamp,
+            rssi=msg_data.get('rssi') or msg_data.get('peakRssi') or msg_data.get('RSSI'),
+            antenna=msg_data.get('antenna') or msg_data.get('Antenna')
+        )
+        return position_calculator.calculate_position(raw_message)
+
+    if message_type == 'CUSTOM':
+        epc = msg_data.get('idHex', '')
+        azimuth = msg_data.get('azimuth')
+        elevation = msg_data.get('elevation')
+        if azimuth is not None and elevation is not None:
+            raw_message = RawDirectionalityMessage(
+                epc=epc,
+                azimuth=float(azimuth),
+                elevation=float(elevation),
+                timestamp=timestamp,
+                rssi=msg_data.get('peakRssi') or msg_data.get('rssi'),
+                antenna=msg_data.get('antenna')
+            )
+            return position_calculator.calculate_position(raw_message)
+        if msg_data.get('x') is not None and msg_data.get('y') is not None:
+            # Use coordinates directly if available
+            return PositionPoint(
+                epc=epc,
+                x=float(msg_data['x']),
+                y=float(msg_data['y']),
+                z=0.0,
+                timestamp=timestamp,
+                is_significant=True
+            )
+    return None
+
 class ATR7000PositionCalculator:
     """Position calculator based on RAW_DIRECTIONALITY messages"""
     
-    def __init__(self, reader_height: float = 15.0, tag_height: float = 3.0):
+    def __init__(self, reader_height: float = 15.0, tag_height: float = 3.0,
+                 reader_x: float = 0.0, reader_y: float = 0.0, rotation: float = 0.0):
         """
         Args:
             reader_height: Reader height in meters (default 15.0m)
             tag_height: Tag height in meters (default 3.0m)
+            reader_x: Reader X position in the site frame in meters (default 0.0m, origin)
+            reader_y: Reader Y position in the site frame in meters (default 0.0m, origin)
+            rotation: Reader rotation in degrees, added to the reported azimuth (default 0.0)
         """
         self.reader_height = reader_height
         self.tag_height = tag_height
+        self.reader_x = reader_x
+        self.reader_y = reader_y
+        self.rotation = rotation
         
     def feet_to_meters(self, feet: float) -> float:
         """Converts feet to meters"""
@@ -92,16 +298,16 @@ class ATR7000PositionCalculator:
         azimuth = raw_data.azimuth  # Azimuth in degrees
         elevation = raw_data.elevation  # Elevation in degrees
 
-        # Convert angles to radians
-        azimuth_radians = math.radians(azimuth)
+        # Convert angles to radians (azimuth in the site frame when the reader is rotated)
+        azimuth_radians = math.radians(azimuth + self.rotation)
         elevation_radians = math.radians(elevation)
 
         # Project onto the XY plane the object's distance using tangent
         projection_on_plane = object_height * math.tan(elevation_radians)
 
         # Calculate Cartesian coordinates
-        result_x = projection_on_plane * math.sin(azimuth_radians)
-        result_y = projection_on_plane * math.cos(azimuth_radians)
+        result_x = self.reader_x + projection_on_plane * math.sin(azimuth_radians)
+        result_y = self.reader_y + projection_on_plane * math.cos(azimuth_radians)
         result_z = self.tag_height
 
         return PositionPoint(
@@ -124,6 +330,8 @@ class PointDataStore:
         self.series_dict: Dict[str, PlotDataSerie] = {}
         self.all_points_dict: Dict[str, deque] = {}  # new: save all FIFO points
         self.colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
+        self.tracker = PositionTracker()
+        self.track_history_dict: Dict[str, deque] = {}  # smoothed tracker output, same FIFO limit as all points
         self._lock = threading.Lock()
         
     def add_position_point(self, point: PositionPoint) -> Optional[PositionPoint]:
@@ -133,6 +341,10 @@ class PointDataStore:
             if point.epc not in self.all_points_dict:
                 self.all_points_dict[point.epc] = deque(maxlen=self.max_all_points_per_series)
             self.all_points_dict[point.epc].append(point)
+            # Feed the streaming tracker (O(1) per point)
+            if point.epc not in self.track_history_dict:
+                self.track_history_dict[point.epc] = deque(maxlen=self.max_all_points_per_series)
+            self.track_history_dict[point.epc].append(self.tracker.update(point))
             # Create or get the series for this EPC
             if point.epc not in self.series_dict:
                 if len(self.series_dict) >= self.max_series_count:
@@ -227,6 +439,8 @@ class PointDataStore:
         oldest_epc = min(self.series_dict.keys(), 
                         key=lambda epc: self.series_dict[epc].first_timestamp or datetime.now())
         del self.series_dict[oldest_epc]
+        self.track_history_dict.pop(oldest_epc, None)
+        self.tracker.remove(oldest_epc)
     
     def get_all_series(self) -> List[PlotDataSerie]:
         """Returns all series"""
@@ -261,12 +475,28 @@ class PointDataStore:
             y_coords = [p.y for p in points]
             return timestamps, x_coords, y_coords
     
-    def generate_heatmap_matrix(self, grid_size: int = 13, meter_per_cell: float = 1.0) -> np.ndarray:
+    def get_track_state(self, epc: str) -> Optional[TrackState]:
+        """Returns the latest smoothed position and velocity for an EPC"""
+        return self.tracker.get_state(epc)
+
+    def get_track_history(self, epc: str) -> Tuple[List[datetime], List[float], List[float]]:
+        """Returns the history of tracker-smoothed X and Y coordinates for an EPC"""
+        with self._lock:
+            if epc not in self.track_history_dict:
+                return [], [], []
+            states = list(self.track_history_dict[epc])
+            timestamps = [s.timestamp for s in states]
+            x_coords = [s.x for s in states]
+            y_coords = [s.y for s in states]
+            return timestamps, x_coords, y_coords
+
+    def generate_heatmap_matrix(self, grid_size: int = 13, meter_per_cell: float = 1.0) -> 'np.ndarray':
         """
         Generates a heatmap matrix with the number of detected positions per area, using ALL points (FIFO)
         grid_size: grid size (default 13x13)
         meter_per_cell: meters per cell (default 1 meter)
         """
+        import numpy as np
         matrix = np.zeros((grid_size, grid_size), dtype=int)
         center = grid_size // 2
         
@@ -282,10 +512,12 @@ class PointDataStore:
         return matrix
     
     def clear(self):
-        """Clears all data (both significant points and all FIFO points)"""
+        """Clears all data (significant points, all FIFO points and tracker state)"""
         with self._lock:
             self.series_dict.clear()
             self.all_points_dict.clear()
+            self.track_history_dict.clear()
+            self.tracker.clear()
 
 class ATR7000LocationPlotter:
     """Plotter for ATR7000 localization visualizations"""
@@ -297,7 +529,7 @@ class ATR7000LocationPlotter:
     
     def plot_realtime_positions(self, data_queue: queue.Queue, stop_event: threading.Event):
         """Displays real-time positions"""
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             if self.debug:
                 print("[DEBUG][ATR7000LocationPlotter] Matplotlib not available for GUI plotting")
             print("❌ Matplotlib not available for GUI plotting")
@@ -341,8 +573,14 @@ class ATR7000LocationPlotter:
                                                label=f'{series.epc}', edgecolors='white', linewidth=0.5)
                             plots.append(scatter)
                             if len(x_coords) > 0:
-                                star = ax.scatter(x_coords[-1], y_coords[-1], color=series.color, 
+                                # Current position from the streaming tracker, last significant point as fallback
+                                state = self.point_store.get_track_state(series.epc)
+                                star_x, star_y = (state.x, state.y) if state else (x_coords[-1], y_coords[-1])
+                                star = ax.scatter(star_x, star_y, color=series.color,
                                                s=120, marker='*', edgecolors='black', linewidth=1)
+                                if state and state.speed > 0.05:
+                                    ax.arrow(star_x, star_y, state.vx, state.vy, color=series.color,
+                                             width=0.02, head_width=0.15, length_includes_head=True, alpha=0.8)
                     if all_series:
                         ax.legend(loc='upper right', fontsize=8)
                     if self.debug:
@@ -385,7 +623,7 @@ class ATR7000LocationPlotter:
     
     def plot_xy_variations(self, epc: str):
         """Shows X and Y variations over time for a specific tag, using ALL read points (FIFO), with high-precision X axis (milliseconds)"""
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             print("❌ Matplotlib not available for GUI plotting")
             return
         # Use all read points (FIFO)
@@ -417,13 +655,13 @@ class ATR7000LocationPlotter:
     
     def plot_heatmap(self, grid_size: int = 13, meter_per_cell: float = 1.0):
         """Displays the heatmap of detected positions"""
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             print("❌ Matplotlib not available for GUI plotting")
             return
         
         matrix = self.point_store.generate_heatmap_matrix(grid_size, meter_per_cell)
         
-        if np.sum(matrix) == 0:
+        if matrix.sum() == 0:
             print("❌ No data available for the heatmap")
             return
         
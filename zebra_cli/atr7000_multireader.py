@@ -0,0 +1,343 @@
+"""
+Module for multi-reader ATR7000 localization: per-reader poses, parallel ingest and time-windowed fusion
+"""
+import json
+import math
+import time
+import queue
+import threading
+import multiprocessing
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from zebra_cli.atr7000_locationing import (
+    ATR7000PositionCalculator, PointDataStore, PositionPoint, RawDirectionalityMessage
+)
+
+DEFAULT_READERS_FILE = Path.home() / ".zebra_cli" / "atr_readers.json"
+
+@dataclass
+class ReaderPose:
+    """Position and orientation of an ATR7000 reader in the site frame"""
+    reader_id: str
+    x: float = 0.0  # meters
+    y: float = 0.0  # meters
+    height: float = 15.0  # meters
+    rotation: float = 0.0  # degrees added to the reported azimuth
+    ws_uri: Optional[str] = None  # WebSocket URI of the reader's IoT Connector endpoint
+
+    def create_calculator(self, tag_height: float) -> ATR7000PositionCalculator:
+        return ATR7000PositionCalculator(reader_height=self.height, tag_height=tag_height,
+                                         reader_x=self.x, reader_y=self.y, rotation=self.rotation)
+
+@dataclass
+class ReaderObservation:
+    """Position of a tag seen by a single reader, in the site frame"""
+    reader_id: str
+    epc: str
+    x: float
+    y: float
+    weight: float
+    timestamp: datetime
+    azimuth: float = 0.0
+    elevation: float = 0.0
+
+def load_reader_poses(file_path: str = str(DEFAULT_READERS_FILE)) -> List[ReaderPose]:
+    """Loads reader poses from JSON ({"readers": [{"reader_id", "x", "y", "height", "rotation", "ws_uri"}]})"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [ReaderPose(**item) for item in data.get('readers', [])]
+
+def save_reader_poses(poses: List[ReaderPose], file_path: str = str(DEFAULT_READERS_FILE)):
+    """Saves reader poses as JSON"""
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({'readers': [asdict(p) for p in poses]}, f, indent=2)
+
+def parse_directionality_message(message) -> Optional[RawDirectionalityMessage]:
+    """Extracts a RawDirectionalityMessage from a RAW_DIRECTIONALITY message (dict or JSON string)"""
+    data = json.loads(message) if isinstance(message, (str, bytes)) else message
+    if not isinstance(data, dict) or data.get('type') not in ('RAW_DIRECTIONALITY', 'DIRECTIONALITY_RAW'):
+        return None
+    msg_data = data.get('data', {})
+    epc = msg_data.get('idHex') or msg_data.get('epc', '') or msg_data.get('EPC', '')
+    # 0.0 is a valid angle, so do not chain with 'or'
+    azimuth = msg_data.get('azimuth', msg_data.get('Azimuth'))
+    elevation = msg_data.get('elevation', msg_data.get('Elevation'))
+    if not epc or azimuth is None or elevation is None:
+        return None
+
+    timestamp = None
+    timestamp_str = data.get('timestamp', '')
+    if timestamp_str:
+        timestamp_clean = timestamp_str.replace('+0000', '').replace('Z', '')
+        for fmt in ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S'):
+            try:
+                timestamp = datetime.strptime(timestamp_clean, fmt)
+                break
+            except ValueError:
+                continue
+
+    return RawDirectionalityMessage(
+        epc=epc,
+        azimuth=float(azimuth),
+        elevation=float(elevation),
+        timestamp=timestamp or datetime.now(),
+        rssi=msg_data.get('rssi') or msg_data.get('peakRssi') or msg_data.get('RSSI'),
+        antenna=msg_data.get('antenna') or msg_data.get('Antenna')
+    )
+
+def observation_weight(elevation: float, object_height: float) -> float:
+    """
+    Inverse-variance weight of a single-reader position.
+    The ground error of a fixed angular error grows with height * sec^2(elevation),
+    so tags seen close to the reader nadir weigh more than tags seen at grazing angles.
+    """
+    cos_el = math.cos(math.radians(min(abs(elevation), 85.0)))
+    return (cos_el ** 4) / max(object_height, 0.1) ** 2
+
+def compute_observation(pose: ReaderPose, calculator: ATR7000PositionCalculator, message,
+                        received_at: Optional[datetime] = None) -> Optional[ReaderObservation]:
+    """
+    Parses a message of a reader and returns its observation in the site frame.
+    received_at (host arrival time) replaces the reader's timestamp, so that readers with skewed clocks are
+    fused and expired on the host clock.
+    """
+    raw_message = parse_directionality_message(message)
+    if raw_message is None:
+        return None
+    if received_at is not None:
+        raw_message.timestamp = received_at
+    position = calculator.calculate_position(raw_message)
+    return ReaderObservation(
+        reader_id=pose.reader_id,
+        epc=position.epc,
+        x=position.x,
+        y=position.y,
+        weight=observation_weight(raw_message.elevation, calculator.reader_height - calculator.tag_height),
+        timestamp=position.timestamp,
+        azimuth=raw_message.azimuth,
+        elevation=raw_message.elevation
+    )
+
+def _reader_worker(pose: ReaderPose, tag_height: float, in_queue, out_queue):
+    """Worker loop for one reader: decodes messages and projects them in the site frame"""
+    calculator = pose.create_calculator(tag_height)
+    while True:
+        item = in_queue.get()
+        if item is None:
+            break
+        received_at, message = item
+        try:
+            observation = compute_observation(pose, calculator, message, received_at)
+        except Exception:
+            observation = None
+        if observation is not None:
+            out_queue.put(observation)
+    out_queue.put(None)
+
+class ObservationFuser:
+    """Fuses concurrent observations of the same EPC from several readers over a time window"""
+
+    def __init__(self, tag_height: float = 3.0, window_seconds: float = 0.25):
+        self.tag_height = tag_height
+        self.window_seconds = window_seconds
+        self._pending: Dict[str, List[ReaderObservation]] = {}
+        self._opened_at: Dict[str, float] = {}  # local arrival time of each window (monotonic)
+
+    def add(self, observation: ReaderObservation) -> Optional[PositionPoint]:
+        """Adds an observation; returns the fused point of the previous window when it closes"""
+        pending = self._pending.get(observation.epc)
+        if pending and (observation.timestamp - pending[0].timestamp).total_seconds() > self.window_seconds:
+            fused = self._fuse(pending)
+            self._pending[observation.epc] = [observation]
+            self._opened_at[observation.epc] = time.monotonic()
+            return fused
+        if not pending:
+            self._opened_at[observation.epc] = time.monotonic()
+        self._pending.setdefault(observation.epc, []).append(observation)
+        return None
+
+    def flush(self, idle_only: bool = False) -> List[PositionPoint]:
+        """Fuses the pending windows (only those open locally for more than window_seconds if idle_only)"""
+        fused = []
+        now = time.monotonic()
+        for epc in list(self._pending):
+            if idle_only and now - self._opened_at.get(epc, now) <= self.window_seconds:
+                continue
+            fused.append(self._fuse(self._pending.pop(epc)))
+            self._opened_at.pop(epc, None)
+        return fused
+
+    def _fuse(self, observations: List[ReaderObservation]) -> PositionPoint:
+        """Weighted average of the observations, keeping only the latest one per reader"""
+        latest: Dict[str, ReaderObservation] = {}
+        for observation in observations:
+            latest[observation.reader_id] = observation
+        total_weight = sum(o.weight for o in latest.values()) or 1.0
+        x = sum(o.x * o.weight for o in latest.values()) / total_weight
+        y = sum(o.y * o.weight for o in latest.values()) / total_weight
+        best = max(latest.values(), key=lambda o: o.weight)
+        return PositionPoint(
+            epc=best.epc,
+            x=x,
+            y=y,
+            z=self.tag_height,
+            timestamp=max(o.timestamp for o in observations),
+            azimuth=best.azimuth,
+            elevation=best.elevation
+        )
+
+class MultiReaderLocator:
+    """
+    Runs one worker per reader and fuses their observations into a PointDataStore.
+    Workers are processes by default so the per-reader decoding scales across cores.
+    """
+
+    def __init__(self, poses: List[ReaderPose], point_store: PointDataStore, tag_height: float = 3.0,
+                 window_seconds: float = 0.25, use_processes: bool = True,
+                 on_point: Optional[Callable[[PositionPoint], None]] = None,
+                 on_tick: Optional[Callable[[], None]] = None, tick_seconds: float = 1.0, debug: bool = False):
+        """
+        Args:
+            poses: Reader poses (one worker per reader)
+            point_store: Store receiving the fused positions
+            tag_height: Tag height in meters
+            window_seconds: Observations of the same EPC within this window are fused
+            use_processes: Run workers as processes (True) or threads (False)
+            on_point: Optional callback called after each fused point is stored
+            on_tick: Optional callback called every tick_seconds by the fusion thread, traffic or not
+        """
+        self.on_point = on_point
+        self.on_tick = on_tick
+        self.tick_seconds = tick_seconds
+        self.poses = {pose.reader_id: pose for pose in poses}
+        self.point_store = point_store
+        self.tag_height = tag_height
+        self.fuser = ObservationFuser(tag_height, window_seconds)
+        self.use_processes = use_processes
+        self.debug = debug
+        self.fused_count = 0
+        self.observation_counts: Dict[str, int] = {reader_id: 0 for reader_id in self.poses}
+        self._in_queues = {}
+        self._workers = []
+        self._out_queue = None
+        self._collector = None
+        self._listeners = []
+        self._pumps = []
+        self._listener_stop_event = threading.Event()
+        self._running = False
+
+    def start(self):
+        """Starts the reader workers and the fusion thread"""
+        if self._running:
+            return
+        self._listener_stop_event.clear()
+        if self.use_processes:
+            ctx = multiprocessing.get_context()
+            self._out_queue = ctx.Queue()
+            make_queue, make_worker = ctx.Queue, ctx.Process
+        else:
+            self._out_queue = queue.Queue()
+            make_queue, make_worker = queue.Queue, threading.Thread
+        for reader_id, pose in self.poses.items():
+            self._in_queues[reader_id] = make_queue()
+            worker = make_worker(target=_reader_worker,
+                                 args=(pose, self.tag_height, self._in_queues[reader_id], self._out_queue),
+                                 daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+        self._running = True
+        if self.debug:
+            mode = "processes" if self.use_processes else "threads"
+            print(f"[DEBUG][MultiReaderLocator] Started {len(self._workers)} reader workers ({mode})")
+
+    def submit(self, reader_id: str, message, received_at: Optional[datetime] = None) -> bool:
+        """Queues a message received from a reader, stamped with its host arrival time (default: now)"""
+        in_queue = self._in_queues.get(reader_id)
+        if in_queue is None:
+            return False
+        in_queue.put((received_at or datetime.now(), message))
+        return True
+
+    def attach_websockets(self) -> int:
+        """Starts one WebSocket listener per reader with a ws_uri and forwards its messages"""
+        from zebra_cli.websocket_listener import WebSocketListener
+        attached = 0
+        for reader_id, pose in self.poses.items():
+            if not pose.ws_uri:
+                continue
+            data_queue = queue.Queue()
+            listener = WebSocketListener(pose.ws_uri, data_queue, threading.Event(), debug=self.debug)
+            listener.start()
+            pump = threading.Thread(target=self._pump, args=(reader_id, data_queue), daemon=True)
+            pump.start()
+            self._pumps.append(pump)
+            self._listeners.append(listener)
+            attached += 1
+        return attached
+
+    def _pump(self, reader_id: str, data_queue: queue.Queue):
+        while not self._listener_stop_event.is_set():
+            try:
+                self.submit(reader_id, data_queue.get(timeout=0.5))
+            except queue.Empty:
+                continue
+
+    def _collect(self):
+        """Fusion loop: turns reader observations into fused points"""
+        finished = 0
+        last_flush = last_tick = time.monotonic()
+        while finished < len(self._workers):
+            if self.on_tick and time.monotonic() - last_tick >= self.tick_seconds:
+                self.on_tick()
+                last_tick = time.monotonic()
+            if time.monotonic() - last_flush > self.fuser.window_seconds:
+                self._store(self.fuser.flush(idle_only=True))
+                last_flush = time.monotonic()
+            try:
+                observation = self._out_queue.get(timeout=self.fuser.window_seconds)
+            except queue.Empty:
+                continue
+            if observation is None:
+                finished += 1
+                continue
+            self.observation_counts[observation.reader_id] = self.observation_counts.get(observation.reader_id, 0) + 1
+            fused = self.fuser.add(observation)
+            if fused is not None:
+                self._store([fused])
+        self._store(self.fuser.flush())
+
+    def _store(self, points: List[PositionPoint]):
+        for point in points:
+            self.point_store.add_position_point(point)
+            self.fused_count += 1
+            if self.on_point:
+                self.on_point(point)
+
+    def stop(self):
+        """Stops listeners and workers, fusing the pending observations"""
+        if not self._running:
+            return
+        self._listener_stop_event.set()
+        for listener in self._listeners:
+            listener.close()
+        for pump in self._pumps:
+            pump.join(timeout=2)
+        for in_queue in self._in_queues.values():
+            in_queue.put(None)
+        if self._collector:
+            self._collector.join(timeout=10)
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers.clear()
+        self._in_queues.clear()
+        self._listeners.clear()
+        self._pumps.clear()
+        self._running = False
+        if self.debug:
+            print(f"[DEBUG][MultiReaderLocator] Stopped, {self.fused_count} fused positions")
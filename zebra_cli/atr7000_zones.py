@@ -0,0 +1,354 @@
+"""
+Module for ATR7000 zone monitoring: enter/exit/dwell events over calculated tag positions
+"""
+import os
+import csv
+import json
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from zebra_cli.atr7000_locationing import PositionPoint
+
+ZONE_ENTER = 'ENTER'
+ZONE_EXIT = 'EXIT'
+ZONE_DWELL = 'DWELL'
+
+ZONE_EVENTS_CSV_HEADER = ['Timestamp', 'Event', 'EPC', 'Zone', 'X', 'Y', 'Dwell_Seconds']
+
+@dataclass
+class Zone:
+    """Polygonal zone in the ATR7000PositionCalculator coordinate frame (meters)"""
+    name: str
+    vertices: List[Tuple[float, float]]
+    dwell_seconds: float = 10.0  # DWELL event after this time inside the zone
+
+    def __post_init__(self):
+        if len(self.vertices) < 3:
+            raise ValueError(f"Zone '{self.name}' needs at least 3 vertices")
+        self.vertices = [(float(x), float(y)) for x, y in self.vertices]
+        xs = [v[0] for v in self.vertices]
+        ys = [v[1] for v in self.vertices]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    @classmethod
+    def rectangle(cls, name: str, x_min: float, y_min: float, x_max: float, y_max: float,
+                  dwell_seconds: float = 10.0) -> 'Zone':
+        """Creates a rectangular zone"""
+        return cls(name, [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)], dwell_seconds)
+
+    def contains(self, x: float, y: float) -> bool:
+        """Returns True if the point is inside the polygon (ray casting, edges included)"""
+        x_min, y_min, x_max, y_max = self.bbox
+        if x < x_min or x > x_max or y < y_min or y > y_max:
+            return False
+        inside = False
+        count = len(self.vertices)
+        for i in range(count):
+            x1, y1 = self.vertices[i]
+            x2, y2 = self.vertices[(i + 1) % count]
+            if (y1 > y) != (y2 > y):
+                x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                if x == x_cross:
+                    return True
+                if x < x_cross:
+                    inside = not inside
+        return inside
+
+    def to_dict(self) -> dict:
+        return {'name': self.name, 'vertices': [list(v) for v in self.vertices], 'dwell_seconds': self.dwell_seconds}
+
+@dataclass
+class ZoneEvent:
+    """Zone event for a tag"""
+    event: str  # ENTER, EXIT or DWELL
+    epc: str
+    zone: str
+    timestamp: datetime
+    x: float = 0.0
+    y: float = 0.0
+    dwell_seconds: float = 0.0
+
+class ZoneMap:
+    """
+    Set of zones with a uniform grid spatial index.
+
+    Copy-on-write: changes build new `zones` and index dicts under a lock and swap them in, so zones_at can
+    run in the listener thread while zones are added or removed from the menu.
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        """
+        Args:
+            cell_size: Side of the spatial index cells in meters
+        """
+        self.cell_size = cell_size
+        self.zones: Dict[str, Zone] = {}
+        self._index: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _build_index(self, zones: Dict[str, Zone]) -> Dict[Tuple[int, int], Tuple[str, ...]]:
+        """Indexes every zone in every cell its bounding box touches"""
+        index: Dict[Tuple[int, int], List[str]] = {}
+        for zone in zones.values():
+            x_min, y_min, x_max, y_max = zone.bbox
+            cx_min, cy_min = self._cell(x_min, y_min)
+            cx_max, cy_max = self._cell(x_max, y_max)
+            for cx in range(cx_min, cx_max + 1):
+                for cy in range(cy_min, cy_max + 1):
+                    index.setdefault((cx, cy), []).append(zone.name)
+        return {cell: tuple(names) for cell, names in index.items()}
+
+    def _replace(self, zones: Dict[str, Zone]):
+        index = self._build_index(zones)
+        self._index = index
+        self.zones = zones
+
+    def add_zones(self, zones: List[Zone]):
+        """Adds (or replaces) several zones with one index rebuild"""
+        with self._lock:
+            updated = dict(self.zones)
+            for zone in zones:
+                updated[zone.name] = zone
+            self._replace(updated)
+
+    def add_zone(self, zone: Zone):
+        """Adds (or replaces) a zone"""
+        self.add_zones([zone])
+
+    def remove_zone(self, name: str):
+        """Removes a zone from the map and the index"""
+        with self._lock:
+            if name not in self.zones:
+                return
+            updated = dict(self.zones)
+            del updated[name]
+            self._replace(updated)
+
+    def add_grid(self, grid_size: int = 13, meter_per_cell: float = 1.0, dwell_seconds: float = 10.0):
+        """Adds one square zone per cell of the same grid used by the heatmap (named 'cell_<col>_<row>')"""
+        center = grid_size // 2
+        half = meter_per_cell / 2
+        zones = []
+        for col in range(grid_size):
+            for row in range(grid_size):
+                x_center = (col - center) * meter_per_cell
+                y_center = (row - center) * meter_per_cell
+                zones.append(Zone.rectangle(f"cell_{col}_{row}", x_center - half, y_center - half,
+                                            x_center + half, y_center + half, dwell_seconds))
+        self.add_zones(zones)
+
+    def zones_at(self, x: float, y: float) -> Set[str]:
+        """Returns the names of the zones containing the point, checking only candidates from the index"""
+        zones = self.zones  # Snapshot: a concurrent change swaps in new dicts
+        candidates = self._index.get(self._cell(x, y), ())
+        return {name for name in candidates if name in zones and zones[name].contains(x, y)}
+
+    def clear(self):
+        with self._lock:
+            self._replace({})
+
+    def save(self, file_path: str):
+        """Saves the zone map as JSON"""
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'cell_size': self.cell_size, 'zones': [z.to_dict() for z in self.zones.values()]}, f, indent=2)
+
+    @classmethod
+    def load(cls, file_path: str) -> 'ZoneMap':
+        """Loads a zone map from JSON ({"cell_size": 1.0, "zones": [{"name", "vertices", "dwell_seconds"}]})"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        zone_map = cls(cell_size=float(data.get('cell_size', 1.0)))
+        for item in data.get('zones', []):
+            zone_map.add_zone(Zone(item['name'], item['vertices'], float(item.get('dwell_seconds', 10.0))))
+        return zone_map
+
+class ZoneEventEngine:
+    """Emits enter/exit/dwell events incrementally as positions arrive"""
+
+    def __init__(self, zone_map: ZoneMap, stale_seconds: float = 10.0, max_events: int = 1000, debug: bool = False):
+        """
+        Args:
+            zone_map: Zones to monitor
+            stale_seconds: Tags not seen for this time leave their zones (see expire_stale_tags)
+            max_events: Number of recent events kept in memory
+        """
+        self.zone_map = zone_map
+        self.stale_seconds = stale_seconds
+        self.debug = debug
+        self.recent_events: deque = deque(maxlen=max_events)
+        self._tag_zones: Dict[str, Dict[str, datetime]] = {}  # epc -> zone -> enter time
+        self._dwell_sent: Set[Tuple[str, str]] = set()
+        self._zone_members: Dict[str, Set[str]] = {}  # zone -> epcs
+        self._last_seen: Dict[str, Tuple[datetime, float, float]] = {}
+        self._lock = threading.Lock()
+        self._csv_file = None
+        self._csv_writer = None
+        self.recording_file: Optional[str] = None
+
+    def process_point(self, point: PositionPoint) -> List[ZoneEvent]:
+        """Processes a position point and returns the generated events"""
+        return self.process_position(point.epc, point.x, point.y, point.timestamp)
+
+    def process_position(self, epc: str, x: float, y: float, timestamp: datetime) -> List[ZoneEvent]:
+        """Processes a tag position and returns the generated events"""
+        with self._lock:
+            self._last_seen[epc] = (timestamp, x, y)
+            current = self._tag_zones.setdefault(epc, {})
+            new_zones = self.zone_map.zones_at(x, y)
+            events = []
+
+            for zone_name in [z for z in current if z not in new_zones]:
+                events.append(self._exit(epc, zone_name, timestamp, x, y))
+
+            for zone_name in new_zones:
+                if zone_name not in current:
+                    current[zone_name] = timestamp
+                    self._zone_members.setdefault(zone_name, set()).add(epc)
+                    events.append(ZoneEvent(ZONE_ENTER, epc, zone_name, timestamp, x, y))
+                elif (epc, zone_name) not in self._dwell_sent:
+                    dwell = (timestamp - current[zone_name]).total_seconds()
+                    zone = self.zone_map.zones.get(zone_name)
+                    if zone and dwell >= zone.dwell_seconds:
+                        self._dwell_sent.add((epc, zone_name))
+                        events.append(ZoneEvent(ZONE_DWELL, epc, zone_name, timestamp, x, y, dwell))
+
+            self._emit(events)
+            return events
+
+    def expire_stale_tags(self, now: Optional[datetime] = None) -> List[ZoneEvent]:
+        """Generates EXIT events for tags not seen for more than stale_seconds"""
+        now = now or datetime.now()
+        with self._lock:
+            events = []
+            for epc, (last_seen, x, y) in list(self._last_seen.items()):
+                if (now - last_seen).total_seconds() > self.stale_seconds:
+                    for zone_name in list(self._tag_zones.get(epc, {})):
+                        events.append(self._exit(epc, zone_name, last_seen, x, y))
+                    del self._last_seen[epc]
+                    self._tag_zones.pop(epc, None)
+            self._emit(events)
+            return events
+
+    def _exit(self, epc: str, zone_name: str, timestamp: datetime, x: float, y: float) -> ZoneEvent:
+        """Removes a tag from a zone and returns the EXIT event (lock must be held)"""
+        entered = self._tag_zones[epc].pop(zone_name)
+        members = self._zone_members.get(zone_name)
+        if members is not None:
+            members.discard(epc)
+            if not members:
+                del self._zone_members[zone_name]
+        self._dwell_sent.discard((epc, zone_name))
+        return ZoneEvent(ZONE_EXIT, epc, zone_name, timestamp, x, y, (timestamp - entered).total_seconds())
+
+    def _emit(self, events: List[ZoneEvent]):
+        """Stores events in memory and in the recording file if active (lock must be held)"""
+        for event in events:
+            self.recent_events.append(event)
+            if self._csv_writer:
+                self._csv_writer.writerow(_event_to_row(event))
+            if self.debug:
+                print(f"[DEBUG][ZoneEventEngine] {event.event} {event.epc} {event.zone}")
+        if events and self._csv_file:
+            self._csv_file.flush()
+
+    def tags_in_zone(self, zone_name: str) -> List[str]:
+        """Returns the EPCs currently inside a zone (cost proportional to the tags in the zone)"""
+        with self._lock:
+            return list(self._zone_members.get(zone_name, ()))
+
+    def zones_of_tag(self, epc: str) -> List[str]:
+        """Returns the zones a tag is currently inside"""
+        with self._lock:
+            return list(self._tag_zones.get(epc, {}))
+
+    def get_occupancy(self) -> Dict[str, int]:
+        """Returns the number of tags per occupied zone"""
+        with self._lock:
+            return {zone: len(members) for zone, members in self._zone_members.items()}
+
+    def reset(self):
+        """Clears tag membership and recent events (zones are kept)"""
+        with self._lock:
+            self._tag_zones.clear()
+            self._zone_members.clear()
+            self._dwell_sent.clear()
+            self._last_seen.clear()
+            self.recent_events.clear()
+
+    def start_recording(self, file_path: Optional[str] = None) -> Optional[str]:
+        """Starts recording events to CSV (default record/zone_events/zone_events_<timestamp>.csv)"""
+        with self._lock:
+            if self._csv_file:
+                return self.recording_file
+            try:
+                if file_path is None:
+                    events_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'zone_events')
+                    os.makedirs(events_dir, exist_ok=True)
+                    file_path = os.path.join(events_dir, f"zone_events_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+                self._csv_file = open(file_path, 'w', newline='', encoding='utf-8')
+                self._csv_writer = csv.writer(self._csv_file)
+                self._csv_writer.writerow(ZONE_EVENTS_CSV_HEADER)
+                self._csv_file.flush()
+                self.recording_file = file_path
+                print(f"📝 Zone events recording started: {file_path}")
+                return file_path
+            except Exception as e:
+                print(f"❌ Failed to start zone events recording: {e}")
+                self._csv_file = None
+                self._csv_writer = None
+                return None
+
+    def stop_recording(self):
+        """Stops recording events"""
+        with self._lock:
+            if self._csv_file:
+                self._csv_file.close()
+                print(f"💾 Zone events saved: {self.recording_file}")
+            self._csv_file = None
+            self._csv_writer = None
+
+    def is_recording(self) -> bool:
+        return self._csv_file is not None
+
+    def replay(self, file_path: str) -> List[ZoneEvent]:
+        """Replays a recorded event stream, rebuilding zone membership, and returns the events"""
+        events = list(read_zone_events(file_path))
+        with self._lock:
+            for event in events:
+                if event.event == ZONE_ENTER:
+                    self._tag_zones.setdefault(event.epc, {})[event.zone] = event.timestamp
+                    self._zone_members.setdefault(event.zone, set()).add(event.epc)
+                elif event.event == ZONE_EXIT and event.zone in self._tag_zones.get(event.epc, {}):
+                    self._exit(event.epc, event.zone, event.timestamp, event.x, event.y)
+                elif event.event == ZONE_DWELL:
+                    self._dwell_sent.add((event.epc, event.zone))
+                self._last_seen[event.epc] = (event.timestamp, event.x, event.y)
+                self.recent_events.append(event)
+        return events
+
+def _event_to_row(event: ZoneEvent) -> list:
+    return [event.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], event.event, event.epc, event.zone,
+            f"{event.x:.3f}", f"{event.y:.3f}", f"{event.dwell_seconds:.3f}"]
+
+def read_zone_events(file_path: str) -> Iterator[ZoneEvent]:
+    """Reads a recorded zone events CSV"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield ZoneEvent(
+                event=row['Event'],
+                epc=row['EPC'],
+                zone=row['Zone'],
+                timestamp=datetime.strptime(row['Timestamp'], '%Y-%m-%d %H:%M:%S.%f'),
+                x=float(row['X']),
+                y=float(row['Y']),
+                dwell_seconds=float(row['Dwell_Seconds'])
+            )
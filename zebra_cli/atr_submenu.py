@@ -8,6 +8,7 @@ import queue
 import threading
 import json
 from datetime import datetime
+from pathlib import Path
 
 # Third-party imports
 try:
@@ -19,6 +20,11 @@ except ImportError:
 from zebra_cli.atr7000_locationing import (
     ATR7000LocationPlotter, ATR7000PositionCalculator, PointDataStore, PositionPoint, RawDirectionalityMessage
 )
+from zebra_cli.atr7000_zones import Zone, ZoneMap, ZoneEventEngine, ZONE_ENTER, ZONE_EXIT
+from zebra_cli.atr7000_multireader import DEFAULT_READERS_FILE, MultiReaderLocator, load_reader_poses
+
+DEFAULT_ZONES_FILE = Path.home() / ".zebra_cli" / "zones.json"
+ZONE_EXPIRY_INTERVAL = 1.0  # Seconds between zone exit checks of the live listeners (single and multi-reader)
 
 class AtrSubmenu:
     """Handles the ATR7000 localization submenu with text commands and shortcuts"""
@@ -29,6 +35,8 @@ class AtrSubmenu:
         self.point_store = PointDataStore()
         self.location_plotter = ATR7000LocationPlotter(self.point_store, debug=self.cli.debug)
         self.data_queue = None
+        self.zone_map = self._load_zone_map()
+        self.zone_engine = ZoneEventEngine(self.zone_map, debug=self.cli.debug)
         self.command_map = {
             'r': self.handle_atr7000_realtime_plot, 'realtime': self.handle_atr7000_realtime_plot,
             'x': self.handle_atr7000_xy_variations, 'xy': self.handle_atr7000_xy_variations,
@@ -36,6 +44,8 @@ class AtrSubmenu:
             'c': self.handle_atr7000_configuration, 'config': self.handle_atr7000_configuration,
             'cl': self.handle_atr7000_clear_data, 'clear': self.handle_atr7000_clear_data,
             's': self.handle_atr7000_statistics, 'stat': self.handle_atr7000_statistics,
+            'z': self.handle_atr7000_zones, 'zones': self.handle_atr7000_zones,
+            'm': self.handle_atr7000_multireader, 'multi': self.handle_atr7000_multireader,
             'b': None, 'back': None
         }
 
@@ -83,6 +93,8 @@ class AtrSubmenu:
         print(atr_row("c  / config     🔧 Height configuration"))
         print(atr_row("cl / clear      🚮 Clear location data"))
         print(atr_row("s  / stat       📋 Localization statistics"))
+        print(atr_row("z  / zones      🗺️ Zones, dwell and crossing events"))
+        print(atr_row("m  / multi      📡 Multi-reader fused positions"))
         print(atr_row("b  / back       🔙 Back to main menu"))
         print("└" + "─" * (width + 2) + "┘")
 
@@ -148,9 +160,16 @@ class AtrSubmenu:
         if self.cli.debug:
             print("🔍 [DEBUG] ATR7000 listener started, waiting for messages...")
         message_count = 0
+        last_expiry = time.monotonic()
         
         while not location_stop_event.is_set():
             try:
+                # Zone exits of stale tags on a time basis: under steady traffic the queue is never empty
+                now = time.monotonic()
+                if now - last_expiry >= ZONE_EXPIRY_INTERVAL:
+                    last_expiry = now
+                    self._expire_zone_tags()
+
                 # Get message from permanent WebSocket
                 message = self.cli.app_context.get_websocket_data()
                 
@@ -217,6 +236,7 @@ class AtrSubmenu:
                     
                     # Add to point store
                     significant_point = self.point_store.add_position_point(position)
+                    self._update_zones(position)
                     
                     # Concise log: only EPC and Cartesian position
                     if significant_point:
@@ -278,6 +298,7 @@ class AtrSubmenu:
                     
                     # Add to point store
                     significant_point = self.point_store.add_position_point(position)
+                    self._update_zones(position)
                     
                     if significant_point:
                         print(f"📍 {significant_point.epc[:12]}... -> X:{significant_point.x:.2f}m Y:{significant_point.y:.2f}m")
@@ -294,6 +315,7 @@ class AtrSubmenu:
                     )
                     
                     significant_point = self.point_store.add_position_point(position)
+                    self._update_zones(position)
                     if significant_point:
                         print(f"📍 {significant_point.epc[:12]}... -> X:{significant_point.x:.2f}m Y:{significant_point.y:.2f}m")
         
@@ -365,6 +387,51 @@ class AtrSubmenu:
         print("⏹️  Chart stopped")
         input("⏸️  Press ENTER to continue...")
     
+    def handle_atr7000_multireader(self) -> None:
+        """Starts multi-reader localization with the readers configured in atr_readers.json"""
+        print("\n📡 MULTI-READER LOCALIZATION")
+        if not DEFAULT_READERS_FILE.exists():
+            print(f"❌ Reader configuration not found: {DEFAULT_READERS_FILE}")
+            print('💡 Example: {"readers": [{"reader_id": "atr-1", "x": 0, "y": 0, "height": 15, "rotation": 0, "ws_uri": "ws://10.0.0.10/ws"}]}')
+            input("⏸️  Press ENTER to continue...")
+            return
+        try:
+            poses = load_reader_poses(str(DEFAULT_READERS_FILE))
+        except Exception as e:
+            print(f"❌ Invalid reader configuration: {e}")
+            input("⏸️  Press ENTER to continue...")
+            return
+        if not poses:
+            print("❌ No readers configured")
+            input("⏸️  Press ENTER to continue...")
+            return
+
+        for pose in poses:
+            print(f"📍 {pose.reader_id}: X:{pose.x:.2f}m Y:{pose.y:.2f}m H:{pose.height:.2f}m R:{pose.rotation:.1f}° {pose.ws_uri or '(no WebSocket)'}")
+
+        self.cli.ensure_no_background_listeners()
+        locator = MultiReaderLocator(poses, self.point_store, tag_height=self.position_calculator.tag_height,
+                                     on_point=self._update_zones, on_tick=self._expire_zone_tags,
+                                     tick_seconds=ZONE_EXPIRY_INTERVAL, debug=self.cli.debug)
+        stop_event = threading.Event()
+        try:
+            locator.start()
+            attached = locator.attach_websockets()
+            if attached == 0:
+                print("❌ No reader WebSocket could be started")
+                return
+            print(f"✅ Fusing positions from {attached} readers. Close the chart window to stop...")
+            self.location_plotter.plot_realtime_positions(queue.Queue(), stop_event)
+        except Exception as e:
+            print(f"❌ Multi-reader localization error: {e}")
+        finally:
+            stop_event.set()
+            locator.stop()
+            counts = ", ".join(f"{reader_id}: {count}" for reader_id, count in locator.observation_counts.items())
+            print(f"📊 Observations per reader: {counts}")
+            print(f"📍 Fused positions: {locator.fused_count}")
+            input("⏸️  Press ENTER to continue...")
+
     def handle_atr7000_xy_variations(self) -> None:
         """Shows X/Y variations over time for a specific tag"""
         # Get the list of tags with localization data
@@ -446,6 +513,7 @@ class AtrSubmenu:
         
         if confirm == 'y':
             self.point_store.clear()
+            self.zone_engine.reset()
             print("✅ Localization data cleared")
         else:
             print("❌ Operation cancelled")
@@ -487,12 +555,116 @@ class AtrSubmenu:
             print(f"   ⭐ Significant points: {significant_count}")
             print(f"   ⏱️  Tracking duration: {duration}")
 
+            state = self.point_store.get_track_state(epc)
+            if state:
+                print(f"   🎯 Smoothed position: X:{state.x:.2f}m Y:{state.y:.2f}m")
+                print(f"   🚀 Velocity: vX:{state.vx:.2f}m/s vY:{state.vy:.2f}m/s ({state.speed:.2f}m/s)")
+
         print(f"\n📈 TOTALS:")
         print(f"   📊 Total points: {total_points}")
         print(f"   ⭐ Significant points: {total_significant}")
 
         input("⏸️  Press ENTER to continue...")
 
+    def _load_zone_map(self) -> ZoneMap:
+        """Loads the saved zone map, or returns an empty one"""
+        if DEFAULT_ZONES_FILE.exists():
+            try:
+                return ZoneMap.load(str(DEFAULT_ZONES_FILE))
+            except Exception as e:
+                print(f"⚠️  Could not load zones from {DEFAULT_ZONES_FILE}: {e}")
+        return ZoneMap()
+
+    def _update_zones(self, position: PositionPoint) -> None:
+        """Feeds the zone engine with the tracker-smoothed position and logs the events"""
+        if not self.zone_map.zones:
+            return
+        state = self.point_store.get_track_state(position.epc)
+        x, y = (state.x, state.y) if state else (position.x, position.y)
+        for event in self.zone_engine.process_position(position.epc, x, y, position.timestamp):
+            self._print_zone_event(event)
+
+    def _expire_zone_tags(self) -> None:
+        """Closes zone visits of tags that are no longer seen"""
+        if not self.zone_map.zones:
+            return
+        for event in self.zone_engine.expire_stale_tags():
+            self._print_zone_event(event)
+
+    def _print_zone_event(self, event) -> None:
+        icon = {ZONE_ENTER: '➡️', ZONE_EXIT: '⬅️'}.get(event.event, '⏱️')
+        suffix = f" ({event.dwell_seconds:.1f}s)" if event.event != ZONE_ENTER else ""
+        print(f"{icon}  {event.event} {event.epc} zone '{event.zone}'{suffix}")
+
+    def handle_atr7000_zones(self) -> None:
+        """Manages zones and the zone event stream"""
+        while True:
+            print("\n🗺️  ATR7000 ZONES")
+            print(f"📐 Configured zones: {len(self.zone_map.zones)}")
+            print(f"📝 Recording: {'ON - ' + self.zone_engine.recording_file if self.zone_engine.is_recording() else 'OFF'}")
+            print("  1. Show zones and tags inside")
+            print("  2. Add rectangular zone")
+            print("  3. Add heatmap grid zones")
+            print("  4. Remove zone")
+            print("  5. Save zones")
+            print("  6. Start/stop event recording")
+            print("  7. Replay recorded events")
+            print("  8. Show recent events")
+            choice = input("\n🔹 Select option (ENTER to go back): ").strip()
+            if not choice:
+                break
+            try:
+                if choice == '1':
+                    if not self.zone_map.zones:
+                        print("❌ No zones configured")
+                    for name, zone in sorted(self.zone_map.zones.items()):
+                        tags = self.zone_engine.tags_in_zone(name)
+                        x_min, y_min, x_max, y_max = zone.bbox
+                        print(f"📍 {name} [{x_min:.1f},{y_min:.1f} → {x_max:.1f},{y_max:.1f}] dwell {zone.dwell_seconds:.0f}s: {len(tags)} tags")
+                        for epc in tags:
+                            print(f"   🏷️  {epc}")
+                elif choice == '2':
+                    name = input("🔹 Zone name: ").strip()
+                    coords = input("🔹 Corners x_min,y_min,x_max,y_max (m): ").strip()
+                    dwell = input("🔹 Dwell time (s) [10]: ").strip()
+                    x_min, y_min, x_max, y_max = (float(v) for v in coords.split(','))
+                    self.zone_map.add_zone(Zone.rectangle(name, min(x_min, x_max), min(y_min, y_max),
+                                                          max(x_min, x_max), max(y_min, y_max),
+                                                          float(dwell) if dwell else 10.0))
+                    print(f"✅ Zone '{name}' added")
+                elif choice == '3':
+                    self.zone_map.add_grid(13, 1.0)
+                    print("✅ Added 13x13 grid zones of 1m (cell_<col>_<row>)")
+                elif choice == '4':
+                    name = input("🔹 Zone name: ").strip()
+                    self.zone_map.remove_zone(name)
+                    print(f"✅ Zone '{name}' removed")
+                elif choice == '5':
+                    self.zone_map.save(str(DEFAULT_ZONES_FILE))
+                    print(f"💾 Zones saved to {DEFAULT_ZONES_FILE}")
+                elif choice == '6':
+                    if self.zone_engine.is_recording():
+                        self.zone_engine.stop_recording()
+                    else:
+                        self.zone_engine.start_recording()
+                elif choice == '7':
+                    file_path = input("🔹 Zone events CSV path: ").strip()
+                    self.zone_engine.reset()
+                    events = self.zone_engine.replay(file_path)
+                    for event in events:
+                        self._print_zone_event(event)
+                    print(f"✅ Replayed {len(events)} events")
+                elif choice == '8':
+                    for event in list(self.zone_engine.recent_events)[-20:]:
+                        print(f"{event.timestamp.strftime('%H:%M:%S.%f')[:-3]} ", end="")
+                        self._print_zone_event(event)
+                else:
+                    print(f"❌ Invalid option '{choice}'")
+            except ValueError as e:
+                print(f"❌ Invalid value: {e}")
+            except Exception as e:
+                print(f"❌ Zone operation error: {e}")
+
     def clear_screen(self) -> None:
         """Clears the terminal screen"""
         os.system('cls' if os.name == 'nt' else 'clear')
\ No newline at end of file
@@ -7,6 +7,8 @@ class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / ".zebra_cli"
         self.config_file = self.config_dir / "config.json"
+        # Protocol/WebSocket URI that worked per reader IP; kept across disconnects
+        self.reader_endpoints_file = self.config_dir / "reader_endpoints.json"
         self.config_dir.mkdir(exist_ok=True)
     
     def save_config(self, ip_address: str, token: str, protocol: str = "https"):
@@ -39,4 +41,38 @@ class ConfigManager:
     def clear_config(self):
         """Removes saved configuration."""
         if self.config_file.exists():
-            self.config_file.unlink()
\ No newline at end of file
+            self.config_file.unlink()
+
+    def load_reader_endpoint(self, ip_address: str):
+        """Returns the saved {"protocol", "ws_uri"} of a reader, or None."""
+        return self._load_reader_endpoints().get(ip_address)
+
+    def save_reader_endpoint(self, ip_address: str, protocol: str = None, ws_uri: str = None):
+        """Saves the protocol and/or WebSocket URI that worked for a reader."""
+        endpoints = self._load_reader_endpoints()
+        endpoint = endpoints.setdefault(ip_address, {})
+        if protocol:
+            if endpoint.get("protocol") != protocol:
+                endpoint.pop("ws_uri", None)  # URI was probed for the other protocol
+            endpoint["protocol"] = protocol
+        if ws_uri:
+            endpoint["ws_uri"] = ws_uri
+        with open(self.reader_endpoints_file, 'w') as f:
+            json.dump(endpoints, f, indent=2)
+
+    def forget_reader_endpoint(self, ip_address: str):
+        """Removes the saved endpoint of a reader so that the next connect probes again."""
+        endpoints = self._load_reader_endpoints()
+        if endpoints.pop(ip_address, None) is not None:
+            with open(self.reader_endpoints_file, 'w') as f:
+                json.dump(endpoints, f, indent=2)
+
+    def _load_reader_endpoints(self) -> dict:
+        if not self.reader_endpoints_file.exists():
+            return {}
+        try:
+            with open(self.reader_endpoints_file, 'r') as f:
+                endpoints = json.load(f)
+            return endpoints if isinstance(endpoints, dict) else {}
+        except (json.JSONDecodeError, IOError):
+            return {}
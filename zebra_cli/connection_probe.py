@@ -0,0 +1,130 @@
+"""
+Happy-eyeballs style probing of the reader protocol (https/http) and WebSocket URI candidates
+
+Candidates are started a short stagger apart in preference order and run concurrently with short
+connect timeouts. The first one that answers wins; candidates that have not started yet are
+cancelled and connections opened by late losers are closed.
+"""
+import ssl
+import time
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import httpx
+import websocket
+
+PROBE_CONNECT_TIMEOUT = 2.0  # Seconds to establish TCP/TLS with one candidate
+PROBE_READ_TIMEOUT = 5.0  # Seconds to wait for the first response once connected
+PROBE_STAGGER = 0.25  # Head start of each candidate over the next one (RFC 8305 uses 250 ms)
+
+def ws_uri_candidates(ip: str, protocol: str) -> List[str]:
+    """
+    WebSocket URIs of the built-in /ws endpoint for a REST protocol, in preference order.
+    Following Zebra directionality.html pattern: default port first (no explicit port specification)
+    """
+    if protocol == "http":
+        return [
+            f"ws://{ip}/ws",             # Primary: Built-in WebSocket server (HTTP default port)
+            f"ws://{ip}:80/ws",          # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
+            f"wss://{ip}/ws",            # Fallback: Built-in WebSocket server (HTTPS)
+        ]
+    return [
+        f"wss://{ip}/ws",                # Primary: Built-in WebSocket server (HTTPS)
+        f"ws://{ip}/ws",                 # Fallback: Built-in WebSocket server (HTTP default port)
+        f"ws://{ip}:80/ws",              # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
+    ]
+
+def race(candidates: Iterable[Any], probe: Callable[[Any], Any], stagger: float = PROBE_STAGGER,
+         timeout: float = PROBE_CONNECT_TIMEOUT + PROBE_READ_TIMEOUT,
+         discard: Optional[Callable[[Any], None]] = None, debug: bool = False) -> Tuple[Any, Any]:
+    """
+    Runs probe(candidate) for all candidates concurrently, each one starting `stagger` seconds
+    after the previous one, and returns (candidate, result) of the first truthy result.
+
+    Returns (None, None) if every probe fails or nothing answers within `timeout` seconds after the
+    last start. Truthy results of losers are passed to `discard` (e.g. to close a connection).
+    """
+    candidates = list(candidates)
+    cancelled = threading.Event()
+    finished = threading.Condition()
+    state = {"winner": None, "pending": len(candidates), "closed": False}
+
+    def attempt(index, candidate):
+        result = None
+        if not (index and cancelled.wait(index * stagger)):
+            try:
+                result = probe(candidate)
+            except Exception as e:
+                if debug:
+                    print(f"[DEBUG][probe] {candidate} failed: {e}")
+        elif debug:
+            print(f"[DEBUG][probe] {candidate} cancelled before start")
+        with finished:
+            state["pending"] -= 1
+            if result and state["winner"] is None and not state["closed"]:
+                state["winner"] = (candidate, result)
+                cancelled.set()
+            elif result and discard:
+                try:
+                    discard(result)
+                except Exception:
+                    pass
+            finished.notify_all()
+
+    start = time.monotonic()
+    for index, candidate in enumerate(candidates):
+        threading.Thread(target=attempt, args=(index, candidate), daemon=True).start()
+
+    deadline = start + max(len(candidates) - 1, 0) * stagger + timeout
+    with finished:
+        finished.wait_for(lambda: state["winner"] is not None or state["pending"] == 0,
+                          timeout=max(deadline - time.monotonic(), 0))
+        state["closed"] = True
+        cancelled.set()
+        winner = state["winner"]
+
+    if debug:
+        elapsed_ms = (time.monotonic() - start) * 1000
+        print(f"[DEBUG][probe] Winner {winner[0] if winner else None} after {elapsed_ms:.0f} ms")
+    return winner if winner else (None, None)
+
+def _probe_rest(base_url: str, connect_timeout: float) -> bool:
+    """True if the reader answers /cloud/status on base_url (any non-redirect status, auth errors included)"""
+    response = httpx.get(
+        f"{base_url}/cloud/status",
+        verify=False,
+        timeout=httpx.Timeout(PROBE_READ_TIMEOUT, connect=connect_timeout)
+    )
+    return not response.is_redirect
+
+def probe_protocol(ip: str, protocols: Iterable[str] = ("https", "http"),
+                   connect_timeout: float = PROBE_CONNECT_TIMEOUT, debug: bool = False) -> Optional[str]:
+    """Returns the first of protocols on which the reader REST API answers, or None if unreachable"""
+    protocol, _ = race(
+        protocols,
+        lambda protocol: _probe_rest(f"{protocol}://{ip}", connect_timeout),
+        timeout=connect_timeout + PROBE_READ_TIMEOUT,
+        debug=debug
+    )
+    return protocol
+
+def _open_websocket(uri: str, connect_timeout: float):
+    sslopt = {"cert_reqs": ssl.CERT_NONE, "check_hostname": False} if uri.startswith('wss://') else None
+    return websocket.create_connection(uri, timeout=connect_timeout, sslopt=sslopt)
+
+def probe_ws_uri(uris: Iterable[str], connect_timeout: float = PROBE_CONNECT_TIMEOUT,
+                 debug: bool = False) -> Optional[str]:
+    """Returns the first of uris that completes the WebSocket handshake, or None (probe connections are closed)"""
+    uri, ws = race(
+        uris,
+        lambda uri: _open_websocket(uri, connect_timeout),
+        timeout=connect_timeout * 2,  # TCP/TLS connect plus the handshake response
+        discard=lambda ws: ws.close(),
+        debug=debug
+    )
+    if ws is not None:
+        try:
+            ws.close()
+        except Exception:
+            pass
+    return uri
@@ -1,5 +1,8 @@
 import time
 from zebra_cli.config import ConfigManager
+from zebra_cli.connection_probe import probe_protocol, probe_ws_uri, ws_uri_candidates
+from zebra_cli.endpoint_cache import EndpointCache
+from zebra_cli.token_store import REFRESH_MARGIN, TokenStore
 from zebra_cli.websocket_listener import WebSocketListener
 import httpx
 from typing import Optional
@@ -23,6 +26,7 @@ class ZebraRFIDClient:
             verify=False,  # For self-signed certificates
             timeout=10.0
         )
+        self.login_method = None  # Login method that produced the last get_bearer_token() result
     
     def start_scan(self):
         """Starts RFID tag scanning"""
@@ -115,46 +119,68 @@ class ZebraRFIDClient:
             print(f"❌ Error during status request: {e}")
             return None
     
-    def get_bearer_token(self, username: str, password: str) -> Optional[str]:
+    def token_rejected(self) -> bool:
+        """True if the reader rejects the token of this client (401/403 or JWT verification failure on /cloud/status)"""
+        try:
+            response = self.client.get(f"{self.base_url}/cloud/status", headers=self.headers, timeout=15.0)
+        except httpx.HTTPError:
+            return False  # Not an answer about the token: the connection attempt reports it
+        if response.status_code in (401, 403):
+            return True
+        return response.status_code == 500 and 'jwt' in response.text.lower()
+    
+    def get_bearer_token(self, username: str, password: str, preferred_method: Optional[str] = None) -> Optional[str]:
         """
         Attempts to get a Bearer token from the Zebra reader using various methods.
+        All attempts share the keep-alive connection of this client.
         Args:
             username: Username for authentication
             password: Password for authentication
+            preferred_method: Login method that worked before (REST endpoint or "web"), tried first
         Returns:
-            str: Bearer token if successful, None if failed
+            str: Bearer token if successful, None if failed (self.login_method tells which method worked)
         """
+        self.login_method = None
+        if preferred_method == "web":
+            token = self._try_web_login(username, password)
+            if token:
+                self.login_method = "web"
+                return token
         # Method 1: Try standard REST endpoint
-        token = self._try_rest_login(username, password)
+        token = self._try_rest_login(username, password, preferred_method)
         if token:
             return token
         # Method 2: Try web interface
-        token = self._try_web_login(username, password)
-        if token:
-            return token
+        if preferred_method != "web":
+            token = self._try_web_login(username, password)
+            if token:
+                self.login_method = "web"
+                return token
         # If all methods fail, return None
         return None
 
-    def _try_rest_login(self, username: str, password: str) -> Optional[str]:
+    def _try_rest_login(self, username: str, password: str, preferred_endpoint: Optional[str] = None) -> Optional[str]:
         """Attempts login via REST endpoint using Basic Authentication"""
         endpoints = [
                 "/cloud/localRestLogin",  # Main Zebra endpoint
                 "/auth/login", 
                 "/login"
         ]        
+        if preferred_endpoint in endpoints:
+            endpoints.remove(preferred_endpoint)
+            endpoints.insert(0, preferred_endpoint)
         credentials = f"{username}:{password}"
         basic_auth_header = f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('utf-8')}"
         
         for endpoint in endpoints:
             # GET with Basic Auth (main method for Zebra)
             try:
-                response = httpx.get(
+                response = self.client.get(
                     f"{self.base_url}{endpoint}",
                     headers={
                         "Authorization": basic_auth_header,
                         "Accept": "application/json"
                     },
-                    verify=False,
                     timeout=10.0
                 )
                 
@@ -168,6 +194,7 @@ class ZebraRFIDClient:
                                 data.get('message'))
                         
                         if token and isinstance(token, str) and token.count('.') == 2:
+                            self.login_method = endpoint
                             return token
                     except Exception:
                         pass
@@ -179,9 +206,8 @@ class ZebraRFIDClient:
         """Attempts to extract token from web interface"""
         try:
             # Access main page
-            response = httpx.get(
+            response = self.client.get(
                 f"{self.base_url}/",
-                verify=False,
                 timeout=10.0,
                 follow_redirects=True
             )
@@ -226,6 +252,11 @@ class ZebraRFIDClient:
             print(f"❌ Error getting version: {e}")
             return None
 
+    def set_token(self, token: str):
+        """Replaces the Bearer token (e.g. after a background refresh)"""
+        self.token = token
+        self.headers['Authorization'] = f'Bearer {token}'
+
     def close(self):
         """Closes the HTTP client."""
         if hasattr(self, 'client'):
@@ -327,9 +358,16 @@ class ZebraRFIDClient:
 class AppContext:
     """Manages the CLI application state."""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_endpoint_cache: bool = True, ws_engine: str = 'thread',
+                 fanout_address: Optional[str] = None, fanout_buffer: Optional[int] = None):
         self.debug = debug
+        self.ws_engine = ws_engine  # WebSocket ingestion engine: 'thread' (one thread per reader) or 'async'
         self.config_manager = ConfigManager()
+        # Read-mostly endpoint responses (version, capabilities, ...) shared with the API submenu
+        self.endpoint_cache = EndpointCache(enabled=use_endpoint_cache, debug=debug)
+        # JWT tokens per reader, shared with the API submenu and refreshed before they expire
+        self.token_store = TokenStore(debug=debug)
+        self._token_refresh_timer = None
         self.ip_address = None
         self.token = None
         self.username = None  # Store last used username
@@ -348,6 +386,11 @@ class AppContext:
         self.ws_data_queue = None
         self.ws_stop_event = None
 
+        # Local fan-out server re-publishing the events of the reader connection ([HOST:]PORT, --fanout)
+        self.fanout_server = None
+        if fanout_address:
+            self.start_fanout(fanout_address, fanout_buffer)
+
         # Load existing configuration if available
         self._load_existing_config()
 
@@ -362,20 +405,7 @@ class AppContext:
             self.preferred_protocol = config.get("preferred_protocol")  # Load persistent protocol
             # Recreate fallback URIs if we have IP (following Zebra directionality pattern)
             if self.ip_address:
-                if self.protocol == "http":
-                    ws_uris = [
-                        f"ws://{self.ip_address}/ws",        # Primary: Built-in WebSocket server (HTTP default port)
-                        f"ws://{self.ip_address}:80/ws",     # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
-                        f"wss://{self.ip_address}/ws",       # Fallback: Built-in WebSocket server (HTTPS)
-                    ]
-                else:
-                    ws_uris = [
-                        f"wss://{self.ip_address}/ws",       # Primary: Built-in WebSocket server (HTTPS)
-                        f"ws://{self.ip_address}/ws",        # Fallback: Built-in WebSocket server (HTTP default port)
-                        f"ws://{self.ip_address}:80/ws",     # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
-                    ]
-                self.ws_uri = ws_uris[0]
-                self.ws_fallback_uris = ws_uris[1:]
+                self._configure_ws_uris(self.ip_address, self.protocol)
             if self.ip_address and self.token:
                 if self.protocol == "http":
                     self.rest_client = ZebraRFIDClient(
@@ -412,11 +442,11 @@ class AppContext:
             ConnectionError: If reader is unreachable
         """
         
-        # Try HTTPS first (more common for Zebra), then HTTP as fallback
+        # Protocol saved for this reader, otherwise the winner of a concurrent HTTPS/HTTP probe
         connection_successful = False
         used_protocol = None
         
-        for protocol in ["https", "http"]:
+        for protocol in self._protocol_candidates(ip):
             base_url = f"{protocol}://{ip}"
             
             # Create temporary client to test connection
@@ -447,6 +477,7 @@ class AppContext:
         
         if not connection_successful:
             raise ConnectionError("❌ Invalid token or reader unreachable on HTTP/HTTPS")
+        self.config_manager.save_reader_endpoint(ip, protocol=used_protocol)
         
         # Save credentials
         self.ip_address = ip
@@ -455,23 +486,7 @@ class AppContext:
         self.preferred_protocol = used_protocol  # Remember the protocol that worked
         
         # Configure WebSocket URIs based on the protocol that worked
-        # Following Zebra directionality.html pattern: connect to built-in /ws endpoint only
-        # Try default port first (no explicit port specification)
-        if used_protocol == "http":
-            ws_uris = [
-                f"ws://{ip}/ws",             # Primary: Built-in WebSocket server (HTTP default port)
-                f"ws://{ip}:80/ws",          # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
-                f"wss://{ip}/ws",            # Fallback: Built-in WebSocket server (HTTPS)
-            ]
-        else:
-            ws_uris = [
-                f"wss://{ip}/ws",            # Primary: Built-in WebSocket server (HTTPS)
-                f"ws://{ip}/ws",             # Fallback: Built-in WebSocket server (HTTP default port)
-                f"ws://{ip}:80/ws",          # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
-            ]
-        
-        self.ws_uri = ws_uris[0]
-        self.ws_fallback_uris = ws_uris[1:]
+        ws_uris = self._configure_ws_uris(ip, used_protocol)
         
         print(f"🔗 WebSocket configured: {self.ws_uri}")
         if self.debug:
@@ -508,6 +523,7 @@ class AppContext:
         """Removes connection configuration and closes permanent WebSocket."""
         # Close permanent WebSocket if running
         self.stop_websocket()
+        self._cancel_token_refresh()
         
         if self.rest_client:
             self.rest_client.close()
@@ -534,23 +550,17 @@ class AppContext:
         Returns:
             bool: True if login and connection successful, False otherwise
         """
-        # Use preferred protocol if available, otherwise try both
-        protocols_to_try = []
-        if self.preferred_protocol:
-            # Use ONLY the protocol that worked previously
-            protocols_to_try = [self.preferred_protocol]
-        else:
-            # First time: try HTTPS then HTTP
-            protocols_to_try = ["https", "http"]
+        # Protocol saved for this reader, otherwise the winner of a concurrent HTTPS/HTTP probe
+        protocols_to_try = self._protocol_candidates(ip)
+        if not protocols_to_try:
+            print(f"❌ Reader {ip} unreachable on HTTPS/HTTP")
         
         for protocol in protocols_to_try:
             base_url = f"{protocol}://{ip}"
             
             try:
-                # Create temporary client for login
-                client = ZebraRFIDClient(base_url, "dummy-token", debug=self.debug)
-                token = client.get_bearer_token(username, password)
-                client.close()
+                # Stored token of this reader if still valid, otherwise login
+                token = self.obtain_token(ip, username, password, protocol)
                 
                 if token:
                     # Immediately connect after getting token
@@ -560,11 +570,16 @@ class AppContext:
                         self.username = username
                         self.password = password
                         self.preferred_protocol = protocol
+                        self._schedule_token_refresh()
                         
                         # Get device version information to check if it's FXR90
                         try:
                             if self.rest_client:  # Type guard to ensure rest_client exists
-                                version_data = self.rest_client.get_version()
+                                version_data = self.endpoint_cache.get(ip, "/cloud/version")
+                                if version_data is None:
+                                    version_data = self.rest_client.get_version()
+                                    if version_data:
+                                        self.endpoint_cache.put(ip, "/cloud/version", version_data)
                                 
                                 if version_data:
                                     model = version_data.get("model", "").upper()
@@ -619,6 +634,143 @@ class AppContext:
         
         return False
 
+    def obtain_token(self, ip: str, username: str, password: str, protocol: Optional[str] = None,
+                     force: bool = False) -> Optional[str]:
+        """
+        Returns the stored token of the reader if it was obtained with these credentials and the reader
+        still accepts it (one authenticated status request), otherwise logs in (trying the login method
+        that worked last time first) and stores the new token.
+        
+        Args:
+            force: Always log in, ignoring the stored token
+        """
+        base_url = f"{protocol or self.protocol}://{ip}"
+        if not force:
+            token = self.token_store.get(ip, username, password)
+            if token:
+                client = ZebraRFIDClient(base_url, token, debug=self.debug)
+                try:
+                    rejected = client.token_rejected()
+                finally:
+                    client.close()
+                if not rejected:
+                    print("🔑 Reusing stored token (login skipped)")
+                    return token
+                print("🔑 Stored token rejected by the reader, logging in")
+                self.token_store.invalidate(ip)
+        
+        client = ZebraRFIDClient(base_url, "dummy-token", debug=self.debug)
+        try:
+            token = client.get_bearer_token(username, password, self.token_store.get_login_method(ip))
+        finally:
+            client.close()
+        if token:
+            self.token_store.put(ip, token, username, client.login_method, password)
+            if self.debug:
+                print(f"[DEBUG] Token obtained via {client.login_method}")
+        return token
+
+    def set_token(self, token: str):
+        """Uses a new token of the connected reader everywhere (REST clients, saved configuration)"""
+        self.token = token
+        for client in (self.rest_client, self.rest_client_http):
+            if client:
+                client.set_token(token)
+        config = self.config_manager.load_config()
+        if config and config.get("ip_address") == self.ip_address:
+            config["token"] = token
+            self.config_manager.save_config_dict(config)
+
+    def _schedule_token_refresh(self):
+        """Schedules a background login REFRESH_MARGIN seconds before the current token expires."""
+        self._cancel_token_refresh()
+        expires_at = self.token_store.expires_at(self.ip_address) if self.ip_address else None
+        if not expires_at or not self.username or not self.password:
+            return
+        delay = max(expires_at - time.time() - REFRESH_MARGIN, 0)
+        self._token_refresh_timer = threading.Timer(delay, self._refresh_token)
+        self._token_refresh_timer.daemon = True
+        self._token_refresh_timer.start()
+        if self.debug:
+            print(f"[DEBUG] Token refresh scheduled in {delay:.0f}s")
+
+    def _cancel_token_refresh(self):
+        if self._token_refresh_timer:
+            self._token_refresh_timer.cancel()
+            self._token_refresh_timer = None
+
+    def _refresh_token(self):
+        """Background token refresh; retries every 30 s until the old token expires."""
+        ip = self.ip_address
+        if not ip or not self.username or not self.password:
+            return
+        try:
+            token = self.obtain_token(ip, self.username, self.password, self.protocol, force=True)
+        except Exception as e:
+            token = None
+            if self.debug:
+                print(f"[DEBUG] Token refresh failed: {e}")
+        if ip != self.ip_address:
+            return  # Disconnected or switched reader meanwhile
+        if token:
+            self.set_token(token)
+            self._schedule_token_refresh()
+        else:
+            expires_at = self.token_store.expires_at(ip) or 0
+            if expires_at > time.time():
+                self._token_refresh_timer = threading.Timer(30, self._refresh_token)
+                self._token_refresh_timer.daemon = True
+                self._token_refresh_timer.start()
+
+    def _protocol_candidates(self, ip: str) -> list:
+        """
+        Returns the protocols to try for a reader, best first: the one saved for this IP (no probing,
+        so a known reader connects in one attempt), otherwise the winner of a concurrent probe.
+        Returns an empty list if the reader answers on neither protocol.
+        """
+        saved = self.config_manager.load_reader_endpoint(ip) or {}
+        first = saved.get("protocol")
+        if first not in ("https", "http") and self.preferred_protocol and ip == self.ip_address:
+            first = self.preferred_protocol  # Configuration saved before per-reader endpoints
+        if first not in ("https", "http"):
+            print("🔍 Probing HTTPS and HTTP connections...")
+            first = probe_protocol(ip, debug=self.debug)
+            if first is None:
+                return []
+            print(f"✅ Reader answers on {first.upper()}")
+        return [first] + [protocol for protocol in ("https", "http") if protocol != first]
+
+    def _configure_ws_uris(self, ip: str, protocol: str) -> list:
+        """Sets ws_uri and ws_fallback_uris for protocol, starting with the URI saved for this reader."""
+        ws_uris = ws_uri_candidates(ip, protocol)
+        saved_uri = (self.config_manager.load_reader_endpoint(ip) or {}).get("ws_uri")
+        if saved_uri in ws_uris:
+            ws_uris.remove(saved_uri)
+            ws_uris.insert(0, saved_uri)
+        self.ws_uri = ws_uris[0]
+        self.ws_fallback_uris = ws_uris[1:]
+        return ws_uris
+
+    def _probe_ws_uris(self):
+        """Races the WebSocket URIs once per reader and moves the winner first (persisted per reader IP)."""
+        saved = self.config_manager.load_reader_endpoint(self.ip_address) or {}
+        if saved.get("ws_uri") == self.ws_uri:
+            return
+        ws_uris = [self.ws_uri] + self.ws_fallback_uris
+        print("🔍 Probing WebSocket URIs...")
+        winner = probe_ws_uri(ws_uris, debug=self.debug)
+        if winner is None:
+            print("⚠️  No WebSocket URI answered the probe, trying them in order")
+            return
+        ws_uris.remove(winner)
+        self.ws_uri = winner
+        self.ws_fallback_uris = ws_uris
+        self.config_manager.save_reader_endpoint(self.ip_address, ws_uri=winner)
+        config = self.config_manager.load_config()
+        if config and config.get("ip_address") == self.ip_address:
+            config["ws_uri"] = winner
+            self.config_manager.save_config_dict(config)
+
     def get_client(self):
         """
         Returns the authenticated REST client.
@@ -661,18 +813,19 @@ class AppContext:
         return (self.username, self.password)
     
     # Convenience methods for most common operations
-    def start_scan(self):
-        """Starts RFID tag scanning."""
+    def start_scan(self, record: bool = True):
+        """Starts RFID tag scanning (record=False: without the CSV recording of the WebSocket listener)."""
         if not self.rest_client:
             raise ValueError('Connection not established. Please run the "connect" command first.')
         
         # Check if WebSocket Listener is running
-        if self.is_websocket_running():
-            # Start WebSocket recording if listener is initialized
-            self.ws_listener.start_recording()
-        else:
-            print("WebSocketListener not initialized, not starting recording.")
-            print("This reading session will not create CSVs and report files.")
+        if record:
+            if self.is_websocket_running():
+                # Start WebSocket recording if listener is initialized
+                self.ws_listener.start_recording()
+            else:
+                print("WebSocketListener not initialized, not starting recording.")
+                print("This reading session will not create CSVs and report files.")
 
         # If reader FXR90 try HTTPS directly (can't set HTTP mode for FXR90, so no point trying HTTP first)
         if self.is_fxr90:            
@@ -693,8 +846,8 @@ class AppContext:
         if not self.rest_client:
             raise ValueError('Connection not established. Please run the "connect" command first.')
         
-        # Check if WebSocket Listener is running
-        if self.is_websocket_running():
+        # Check if WebSocket Listener is running (or reconnecting: the recording continues across gaps)
+        if self.is_websocket_running() or self.is_websocket_reconnecting():
             if self.ws_listener.ws_recorder_active:
                 # Stop WebSocket recording if listener is initialized and recording active
                 self.ws_listener.stop_recording()
@@ -764,23 +917,8 @@ class AppContext:
         self.protocol = protocol
         
         # Configure WebSocket URIs based on protocol
-        # Following Zebra directionality.html pattern: connect to built-in /ws endpoint only
-        # Try default port first (no explicit port specification)
-        if protocol == "http":
-            ws_uris = [
-                f"ws://{ip}/ws",             # Primary: Built-in WebSocket server (HTTP default port)
-                f"ws://{ip}:80/ws",          # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
-                f"wss://{ip}/ws",            # Fallback: Built-in WebSocket server (HTTPS)
-            ]
-        else:
-            ws_uris = [
-                f"wss://{ip}/ws",            # Primary: Built-in WebSocket server (HTTPS)
-                f"ws://{ip}/ws",             # Fallback: Built-in WebSocket server (HTTP default port)
-                f"ws://{ip}:80/ws",          # Fallback: Built-in WebSocket server (HTTP with explicit port 80)
-            ]
-        
-        self.ws_uri = ws_uris[0]
-        self.ws_fallback_uris = ws_uris[1:]
+        self._configure_ws_uris(ip, protocol)
+        self.config_manager.save_reader_endpoint(ip, protocol=protocol)
         
         # Save configuration to disk
         config_data = {
@@ -824,7 +962,7 @@ class AppContext:
         
         # Initialize WebSocket components
         if self.ws_data_queue is None:
-            self.ws_data_queue = queue.Queue()
+            self.ws_data_queue = self._new_data_queue()
         if self.ws_stop_event is None:
             self.ws_stop_event = threading.Event()
         else:
@@ -832,17 +970,56 @@ class AppContext:
         
         # Start WebSocket listener
         ws_uri = self.get_ws_uri()
+        self._probe_ws_uris()
+        ws_uri = self.ws_uri
         
-        self.ws_listener = WebSocketListener(
+        # Nothing drains ws_data_queue while the menu is idle: like the threaded listener, the async
+        # engine keeps reading (and recording) instead of pausing at its high-water mark
+        listener_options = {'high_water': None} if self.ws_engine == 'async' else {}
+        self.ws_listener = self.websocket_listener_class()(
             ws_uri, 
             self.ws_data_queue, 
             self.ws_stop_event,
             fallback_uris=self.ws_fallback_uris,
-            debug=debug
+            debug=debug,
+            **listener_options
         )
         
         self.ws_listener.start()
     
+    def _new_data_queue(self) -> queue.Queue:
+        """WebSocket data queue; with a fan-out server every message put into it is also re-published"""
+        if self.fanout_server:
+            from zebra_cli.fanout_server import BroadcastQueue
+            return BroadcastQueue(self.fanout_server)
+        return queue.Queue()
+
+    def start_fanout(self, address: str, buffer_size: Optional[int] = None) -> bool:
+        """
+        Starts the local fan-out server (WebSocket and TCP on one port) for the events of the reader connection.
+
+        Returns:
+            bool: True if the server is listening, False otherwise
+        """
+        from zebra_cli.fanout_server import DEFAULT_CLIENT_BUFFER, FanoutServer, parse_address
+
+        try:
+            host, port = parse_address(address)
+            server = FanoutServer(host, port, buffer_size=buffer_size or DEFAULT_CLIENT_BUFFER, debug=self.debug)
+            print(f"📡 Fan-out server listening on {server.start()} (WebSocket and TCP)")
+        except (OSError, ValueError) as e:
+            print(f"❌ Fan-out server not started on {address}: {e}")
+            return False
+        self.fanout_server = server
+        return True
+
+    def websocket_listener_class(self):
+        """Listener class of the selected WebSocket engine"""
+        if self.ws_engine == 'async':
+            from zebra_cli.async_ws_engine import AsyncWebSocketListener
+            return AsyncWebSocketListener
+        return WebSocketListener
+
     def stop_websocket(self):
         """Stops the permanent WebSocket connection."""
         print("🔌 Stopping WebSocket connection...")
@@ -913,7 +1090,8 @@ class AppContext:
             queue.Queue: The WebSocket data queue for reading messages
         """
 
-        wb_running = self.is_websocket_running()
+        # A listener that is reconnecting keeps filling the same queue once the reader is back
+        wb_running = self.is_websocket_running() or self.is_websocket_reconnecting()
 
         if not wb_running:
             if self.debug:
@@ -937,6 +1115,10 @@ class AppContext:
             return self.ws_listener.is_alive() and self.ws_listener.is_connected()
         return False
     
+    def is_websocket_reconnecting(self):
+        """Checks if the permanent WebSocket listener is alive but waiting for its (re)connection."""
+        return bool(self.ws_listener) and self.ws_listener.is_alive() and not self.ws_listener.is_connected()
+
     def get_websocket_status(self):
         """Returns detailed WebSocket status for debugging."""
         # Safely get WebSocket URI without throwing exceptions
@@ -952,8 +1134,17 @@ class AppContext:
             'configured_uri': configured_uri,
             'listener_uri': getattr(self.ws_listener, 'uri', None) if self.ws_listener else None,
             'queue_size': self.ws_data_queue.qsize() if self.ws_data_queue else 0,
-            'debug_mode': self.debug
+            'debug_mode': self.debug,
+            'reconnecting': self.is_websocket_reconnecting(),
+            'reconnects': 0,
+            'connection_gaps': 0,
+            'downtime_s': 0.0,
+            'disconnected_since': None
         }
+        gaps = getattr(self.ws_listener, 'gaps', None)
+        if gaps is not None:
+            status.update(gaps.status())
+        status['fanout'] = self.fanout_server.status() if self.fanout_server else None
         return status
     
     def get_websocket_data(self):
@@ -0,0 +1,137 @@
+"""
+Persistent per-reader cache of read-mostly REST endpoint responses
+
+Version, capabilities, supported regions and certificates almost never change, but fetching them
+from a loaded reader can take seconds. Responses are kept in ~/.zebra_cli/endpoint_cache.json with
+a TTL per endpoint; writes that can change them (set region/config, reboot, OS update, certificate
+changes) invalidate the affected entries.
+"""
+import os
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_CACHE_FILE = Path.home() / ".zebra_cli" / "endpoint_cache.json"
+
+# Cached GET endpoints and their time to live in seconds
+ENDPOINT_TTLS = {
+    "/cloud/version": 24 * 3600,
+    "/cloud/readerCapabilities": 7 * 24 * 3600,
+    "/cloud/supportedRegionList": 7 * 24 * 3600,
+    "/cloud/supportedStandardList": 7 * 24 * 3600,
+    "/cloud/certificates": 3600,
+    "/cloud/region": 3600
+}
+
+# Write endpoints and the cached endpoints they invalidate (None: every entry of the reader)
+WRITE_INVALIDATIONS = {
+    "/cloud/region": ["/cloud/region", "/cloud/supportedStandardList"],
+    "/cloud/config": None,
+    "/cloud/reboot": None,
+    "/cloud/os": None,
+    "/cloud/revertbackOS": None,
+    "/cloud/certificates": ["/cloud/certificates"]
+}
+
+class EndpointCache:
+    """
+    TTL cache of reader responses keyed by reader address and endpoint.
+    A disabled cache (--no-cache) never returns entries and never writes to disk.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, enabled: bool = True, debug: bool = False):
+        self.cache_file = Path(cache_file) if cache_file else DEFAULT_CACHE_FILE
+        self.enabled = enabled
+        self.debug = debug
+        self._lock = threading.Lock()
+        self._entries = None  # Loaded from disk on first use
+
+    @staticmethod
+    def is_cacheable(endpoint: str) -> bool:
+        return endpoint in ENDPOINT_TTLS
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_file.parent, prefix='.tmp_endpoint_cache_')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            if self.debug:
+                print(f"[DEBUG][EndpointCache] Could not save {self.cache_file}: {e}")
+
+    def get(self, reader: str, endpoint: str) -> Optional[Any]:
+        """Returns the cached response of a reader endpoint, or None if missing, expired or disabled"""
+        if not self.enabled or not self.is_cacheable(endpoint) or not reader:
+            return None
+        with self._lock:
+            entry = self._load().get(reader, {}).get(endpoint)
+        if not entry:
+            return None
+        age = time.time() - entry.get('stored_at', 0)
+        if age < 0 or age > ENDPOINT_TTLS[endpoint]:
+            return None
+        if self.debug:
+            print(f"[DEBUG][EndpointCache] Hit {reader}{endpoint} (age {age:.0f}s)")
+        return entry.get('data')
+
+    def put(self, reader: str, endpoint: str, data: Any) -> None:
+        """Stores a successful response of a cacheable endpoint"""
+        if not self.enabled or not self.is_cacheable(endpoint) or not reader:
+            return
+        with self._lock:
+            self._load().setdefault(reader, {})[endpoint] = {'stored_at': time.time(), 'data': data}
+            self._save()
+
+    def invalidate(self, reader: str, endpoint: Optional[str] = None) -> None:
+        """Drops one cached endpoint of a reader, or all of its entries if endpoint is None"""
+        if not self.enabled or not reader:
+            return
+        with self._lock:
+            entries = self._load()
+            if reader not in entries:
+                return
+            if endpoint is None:
+                del entries[reader]
+            elif entries[reader].pop(endpoint, None) is None:
+                return
+            self._save()
+
+    def invalidate_for_write(self, reader: str, endpoint: str) -> None:
+        """Invalidates the entries that a PUT/POST/DELETE on endpoint can change"""
+        base_endpoint = endpoint
+        if endpoint.startswith("/cloud/certificates/"):
+            base_endpoint = "/cloud/certificates"
+        if base_endpoint not in WRITE_INVALIDATIONS:
+            if self.is_cacheable(base_endpoint):
+                self.invalidate(reader, base_endpoint)
+            return
+        targets = WRITE_INVALIDATIONS[base_endpoint]
+        if targets is None:
+            self.invalidate(reader)
+        else:
+            for target in targets:
+                self.invalidate(reader, target)
+        if self.debug:
+            print(f"[DEBUG][EndpointCache] {endpoint} invalidated {targets or 'all entries'} of {reader}")
+
+    def clear(self) -> None:
+        """Removes every cached response"""
+        with self._lock:
+            self._entries = {}
+            if self.cache_file.exists():
+                self.cache_file.unlink()
@@ -0,0 +1,352 @@
+"""
+Local fan-out server: one reader connection, many downstream consumers
+
+The reader's /ws endpoint tolerates only a few simultaneous clients. With `--fanout [HOST:]PORT` the CLI
+re-publishes the normalized events of its single upstream connection (the same objects as `--stream`) to any
+number of local clients, on one port:
+
+- WebSocket: ws://HOST:PORT/?epc=E280*&min_rssi=-60 (one text message per event)
+- Plain TCP: NDJSON lines; the client may send a first line with the same filter (epc=E280*&reader=dock-a)
+
+Filters: `epc` (comma separated globs), `reader`, `antenna` (comma separated), `min_rssi`, `gaps=0` (no
+CONNECTION_GAP events). Every client has a bounded buffer: a client that falls `buffer_size` events behind
+is disconnected, so a slow consumer never stalls the upstream listener or the other clients.
+"""
+import time
+import json
+import queue
+import asyncio
+import fnmatch
+import threading
+import collections
+from typing import Deque, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from zebra_cli.async_ws_engine import (
+    OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG, OPCODE_TEXT, WebSocketProtocolError, decode_frames, encode_frame,
+    websocket_accept
+)
+from zebra_cli.stream_daemon import normalize_event
+from zebra_cli.websocket_listener import GAP_MESSAGE_TYPE
+
+DEFAULT_FANOUT_HOST = '127.0.0.1'
+DEFAULT_CLIENT_BUFFER = 10000  # Events a client may fall behind before it is disconnected
+FIRST_LINE_TIMEOUT = 0.5  # Seconds a TCP client has to send its filter line
+HANDSHAKE_TIMEOUT = 5.0
+READ_CHUNK = 64 * 1024
+DISPATCH_BATCH = 1000  # Messages distributed per loop iteration
+TRANSPORT_HIGH_WATER = 256 * 1024  # Bytes written to a client socket but not yet sent, above which events wait in its buffer
+FILTER_KEYS = ('epc', 'reader', 'antenna', 'min_rssi', 'gaps')
+
+def parse_address(value: str) -> Tuple[str, int]:
+    """'8765' -> ('127.0.0.1', 8765), '0.0.0.0:8765' -> ('0.0.0.0', 8765)"""
+    host, _, port = value.rpartition(':')
+    return host or DEFAULT_FANOUT_HOST, int(port)
+
+class ClientFilter:
+    """Per-client event filter parsed from a query string"""
+
+    def __init__(self, query: str = ''):
+        params = parse_qs(query.strip().lstrip('?'), strict_parsing=False)
+        unknown = set(params) - set(FILTER_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown filter: {', '.join(sorted(unknown))}")
+
+        def values(key):
+            return [v.strip() for value in params.get(key, []) for v in value.split(',') if v.strip()]
+
+        self.epc_patterns = [pattern.upper() for pattern in values('epc')]
+        self.readers = set(values('reader'))
+        self.antennas = set(values('antenna'))
+        self.min_rssi = float(params['min_rssi'][-1]) if 'min_rssi' in params else None
+        self.gaps = params.get('gaps', ['1'])[-1] not in ('0', 'false', 'no')
+
+    def matches(self, event: dict) -> bool:
+        if event.get('type') == GAP_MESSAGE_TYPE:
+            return self.gaps
+        if self.epc_patterns and not any(fnmatch.fnmatchcase(event['epc'].upper(), p) for p in self.epc_patterns):
+            return False
+        if self.readers and event['reader_id'] not in self.readers:
+            return False
+        if self.antennas and str(event['antenna']) not in self.antennas:
+            return False
+        if self.min_rssi is not None and (event['rssi'] is None or event['rssi'] < self.min_rssi):
+            return False
+        return True
+
+    def __str__(self):
+        parts = [f"epc={','.join(self.epc_patterns)}" if self.epc_patterns else '',
+                 f"reader={','.join(sorted(self.readers))}" if self.readers else '',
+                 f"antenna={','.join(sorted(self.antennas))}" if self.antennas else '',
+                 f"min_rssi={self.min_rssi:g}" if self.min_rssi is not None else '',
+                 '' if self.gaps else 'gaps=0']
+        return '&'.join(part for part in parts if part) or 'all'
+
+class FanoutClient:
+    """One downstream connection: filter, bounded buffer of encoded events and counters"""
+
+    def __init__(self, address: str, protocol: str, client_filter: ClientFilter, writer: asyncio.StreamWriter):
+        self.address = address
+        self.protocol = protocol
+        self.filter = client_filter
+        self.writer = writer
+        self.buffer: Deque[bytes] = collections.deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.sent = 0
+        self.connected_at = time.time()
+
+    def status(self) -> dict:
+        return {"address": self.address, "protocol": self.protocol, "filter": str(self.filter),
+                "sent": self.sent, "buffered": len(self.buffer)}
+
+class FanoutServer:
+    """
+    Re-broadcasts published reader messages to the connected clients. publish() may be called from any thread
+    (listener threads, the async engine loop, the MQTT network thread); the server runs its own event loop in
+    one background thread.
+    """
+
+    def __init__(self, host: str = DEFAULT_FANOUT_HOST, port: int = 0, buffer_size: int = DEFAULT_CLIENT_BUFFER,
+                 debug: bool = False):
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.debug = debug
+        self.clients: Set[FanoutClient] = set()
+        self.published = 0
+        self.slow_disconnects = 0
+        self._pending: Deque[Tuple[float, object]] = collections.deque()
+        self._wake_scheduled = False
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    def start(self) -> str:
+        """Starts the server thread; returns 'host:port'. Raises OSError if the port cannot be bound."""
+        ready = threading.Event()
+        errors = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                self._loop.close()
+                return
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="FanoutServer", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return f"{self.host}:{self.port}"
+
+    def stop(self):
+        """Disconnects every client and stops the server thread"""
+        if self._thread and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    def publish(self, message):
+        """Queues a reader message for the clients (thread-safe, returns immediately)"""
+        if not self.clients or self._loop is None:
+            return
+        self._pending.append((time.time(), message))
+        if not self._wake_scheduled:
+            self._wake_scheduled = True
+            try:
+                self._loop.call_soon_threadsafe(self._dispatch)
+            except RuntimeError:
+                pass  # Loop closed: server stopped
+
+    def status(self) -> dict:
+        clients = list(self.clients)
+        return {"address": f"{self.host}:{self.port}", "clients": len(clients), "published": self.published,
+                "slow_disconnects": self.slow_disconnects, "client_status": [c.status() for c in clients]}
+
+    def _dispatch(self):
+        """
+        Normalizes up to DISPATCH_BATCH pending messages once, appends each to the buffer of every matching
+        client, then moves the buffers to the client transports. Reschedules itself while messages are pending,
+        so client I/O runs between batches.
+        """
+        self._wake_scheduled = False
+        touched = set()
+        for _ in range(min(len(self._pending), DISPATCH_BATCH)):
+            received_at, message = self._pending.popleft()
+            if isinstance(message, dict) and message.get('type') == GAP_MESSAGE_TYPE:
+                event = message
+            else:
+                event = normalize_event(message, received_at)
+                if event is None:
+                    continue
+            self.published += 1
+            line = frame = None
+            for client in self.clients:
+                if client.closed or not client.filter.matches(event):
+                    continue
+                if line is None:
+                    line = json.dumps(event, separators=(',', ':')).encode('utf-8')
+                if client.protocol == 'websocket':
+                    if frame is None:
+                        frame = encode_frame(OPCODE_TEXT, line, mask=False)
+                    client.buffer.append(frame)
+                else:
+                    client.buffer.append(line + b'\n')
+                touched.add(client)
+        for client in touched:
+            self._flush(client)
+        if self._pending and not self._wake_scheduled:
+            self._wake_scheduled = True
+            self._loop.call_soon(self._dispatch)
+
+    def _flush(self, client: FanoutClient):
+        """
+        Writes the buffered events of a client in one call unless its transport is above TRANSPORT_HIGH_WATER;
+        a client whose buffer then exceeds buffer_size is disconnected (slow consumer).
+        """
+        if client.closed:
+            return
+        if client.buffer and client.writer.transport.get_write_buffer_size() < TRANSPORT_HIGH_WATER:
+            count = len(client.buffer)
+            client.writer.write(b''.join(client.buffer))
+            client.buffer.clear()
+            client.sent += count
+        if len(client.buffer) > self.buffer_size:
+            self.slow_disconnects += 1
+            self._disconnect(client, f"slow consumer ({len(client.buffer)} events behind)")
+        elif client.buffer:
+            client.ready.set()  # _send waits for the transport to drain
+
+    def _disconnect(self, client: FanoutClient, reason: str):
+        if client.closed:
+            return
+        client.closed = True
+        client.buffer.clear()
+        client.ready.set()
+        self.clients.discard(client)
+        client.writer.transport.abort()
+        print(f"⚠️  Fan-out client {client.address} disconnected: {reason}")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info('peername')
+        address = f"{peer[0]}:{peer[1]}" if isinstance(peer, tuple) else str(peer)
+        try:
+            client = await self._accept(reader, writer, address)
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError) as e:
+            if self.debug:
+                print(f"[DEBUG][FanoutServer] Rejected {address}: {e}")
+            writer.close()
+            return
+        except asyncio.CancelledError:
+            writer.close()
+            return
+        writer.transport.set_write_buffer_limits(high=TRANSPORT_HIGH_WATER)
+        self.clients.add(client)
+        if self.debug:
+            print(f"[DEBUG][FanoutServer] {client.protocol} client {address} connected, filter {client.filter}")
+        receive = asyncio.ensure_future(self._receive(client, reader))
+        try:
+            await self._send(client)
+        except (OSError, asyncio.CancelledError):
+            pass
+        finally:
+            receive.cancel()
+            client.closed = True
+            self.clients.discard(client)
+            writer.close()
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, address: str) -> FanoutClient:
+        """Tells WebSocket from TCP clients by their first line and parses the filter"""
+        try:
+            first_line = await asyncio.wait_for(reader.readline(), FIRST_LINE_TIMEOUT)
+        except asyncio.TimeoutError:
+            return FanoutClient(address, 'tcp', ClientFilter(), writer)
+        if not first_line.startswith(b'GET '):
+            try:
+                return FanoutClient(address, 'tcp', ClientFilter(first_line.decode('utf-8', errors='ignore')), writer)
+            except ValueError as e:
+                writer.write(json.dumps({"error": str(e)}).encode() + b'\n')
+                await writer.drain()
+                raise
+
+        headers = (await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), HANDSHAKE_TIMEOUT)).decode('latin-1')
+        key = next((line.split(':', 1)[1].strip() for line in headers.split("\r\n")
+                    if line.lower().startswith('sec-websocket-key:')), '')
+        target = first_line.decode('latin-1').split(' ')[1] if len(first_line.split(b' ')) > 1 else '/'
+        try:
+            if not key:
+                raise ValueError("Missing Sec-WebSocket-Key")
+            client_filter = ClientFilter(urlparse(target).query)
+        except ValueError as e:
+            writer.write(f"HTTP/1.1 400 Bad Request\r\nContent-Length: {len(str(e))}\r\n\r\n{e}".encode())
+            await writer.drain()
+            raise
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n\r\n").encode())
+        await writer.drain()
+        return FanoutClient(address, 'websocket', client_filter, writer)
+
+    async def _send(self, client: FanoutClient):
+        """Flushes the buffer of a client whose transport was full, once the transport has drained"""
+        while not client.closed:
+            await client.ready.wait()
+            client.ready.clear()
+            await client.writer.drain()
+            self._flush(client)
+
+    async def _receive(self, client: FanoutClient, reader: asyncio.StreamReader):
+        """Reads the client side: EOF closes a TCP client; WebSocket pings are answered, close frames honored"""
+        buffer = bytearray()
+        try:
+            while not client.closed:
+                data = await reader.read(READ_CHUNK)
+                if not data:
+                    break
+                if client.protocol != 'websocket':
+                    continue
+                buffer += data
+                for _, opcode, payload in decode_frames(buffer):
+                    if opcode == OPCODE_PING:
+                        client.writer.write(encode_frame(OPCODE_PONG, payload, mask=False))
+                    elif opcode == OPCODE_CLOSE:
+                        client.writer.write(encode_frame(OPCODE_CLOSE, payload[:2], mask=False))
+                        raise ConnectionResetError("closed by the client")
+        except (OSError, WebSocketProtocolError):
+            pass
+        client.closed = True
+        client.ready.set()
+
+class BroadcastQueue(queue.Queue):
+    """
+    Listener data queue that also publishes every message put into it to a FanoutServer. The message is
+    published first; a full local queue drops its copy (counted in `dropped`) instead of raising Full or
+    blocking, so an undrained local consumer neither loses events for the fan-out clients nor slows down
+    the reader connection that feeds them.
+    """
+
+    def __init__(self, server: FanoutServer, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.server = server
+        self.dropped = 0
+
+    def put(self, item, block=True, timeout=None):
+        self.server.publish(item)
+        try:
+            super().put(item, False)  # put_nowait() of the listeners comes here too
+        except queue.Full:
+            self.dropped += 1
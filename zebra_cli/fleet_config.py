@@ -0,0 +1,281 @@
+"""
+Fleet-wide configuration push with diff-only updates
+
+Pushes a desired operating mode / configuration / region to every reader of an inventory. All readers
+are handled concurrently on one event loop (bounded by a semaphore, one pooled ReaderSession each): the
+current sections are fetched, compared with the desired JSON and only the sections that differ are PUT.
+A PUT replaces the whole section. The operating mode is sent as in the desired file (its keys depend on
+its `type`, so the reader's other keys are differences to remove); for configuration and region the desired
+keys are merged into the fetched document, so settings the desired file does not mention are kept.
+Readers that are already configured are left untouched.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from zebra_cli.reader_session import ReaderSession, READER_STATE_OPERATIONS
+from zebra_cli.token_store import TokenStore
+
+DEFAULT_WORKERS = 32
+DEFAULT_TIMEOUT = 15.0
+
+# Pushable sections: name -> PUT endpoint (the GET is the READER_STATE_OPERATIONS entry of the same name)
+SECTIONS = {
+    "config": "/cloud/config",
+    "region": "/cloud/region",
+    "mode": "/cloud/mode"
+}
+
+# Sections PUT exactly as desired: a key of the reader that the desired section lacks is a difference
+REPLACED_SECTIONS = ("mode",)
+
+STATUS_UNCHANGED = 'unchanged'
+STATUS_CHANGED = 'changed'
+STATUS_WOULD_CHANGE = 'would_change'
+STATUS_FAILED = 'failed'
+
+def load_desired(file_path: str) -> Dict[str, dict]:
+    """
+    Loads the desired sections: {"mode": {...}, "config": {...}, "region": {...}} (any subset).
+    A file of the requests-json/mode/ kind (a bare operating mode with a "type") is taken as {"mode": ...}.
+
+    Raises:
+        ValueError: If the file contains no known section
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "type" in data and not set(data) & set(SECTIONS):
+        data = {"mode": data}
+    if not isinstance(data, dict):
+        raise ValueError("desired configuration must be a JSON object")
+    unknown = set(data) - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"unknown section(s) {', '.join(sorted(unknown))} (valid: {', '.join(SECTIONS)})")
+    if not data:
+        raise ValueError(f"no section to push (valid: {', '.join(SECTIONS)})")
+    # Push in SECTIONS order: configuration and region before the operating mode that depends on them
+    return {name: data[name] for name in SECTIONS if name in data}
+
+def diff_json(desired, current, path: str = "") -> List[str]:
+    """
+    Returns the paths at which desired differs from current. Objects are compared key by key and only
+    on the keys of desired (fields the reader adds are not differences); lists and values compare whole.
+    """
+    if isinstance(desired, dict) and isinstance(current, dict):
+        differences = []
+        for key, value in desired.items():
+            child = f"{path}.{key}" if path else key
+            if key not in current:
+                differences.append(child)
+            else:
+                differences.extend(diff_json(value, current[key], child))
+        return differences
+    return [] if desired == current else [path or "."]
+
+def section_differences(name: str, desired, current) -> List[str]:
+    """
+    Differences of one section: diff_json, plus for REPLACED_SECTIONS the top-level keys of the reader
+    that the desired section does not have (reported as "-key")
+    """
+    differences = diff_json(desired, current)
+    if name in REPLACED_SECTIONS and isinstance(desired, dict) and isinstance(current, dict):
+        differences.extend(f"-{key}" for key in current if key not in desired)
+    return differences
+
+def section_body(name: str, desired, current):
+    """PUT body of one section: the desired section itself for REPLACED_SECTIONS, merged otherwise"""
+    return desired if name in REPLACED_SECTIONS else merge_json(desired, current)
+
+def _reader_token(target: dict, token_store: TokenStore, force: bool, debug: bool) -> Optional[str]:
+    """Returns a valid token for the reader: from the token store, or by logging in (blocking)"""
+    from zebra_cli.context import ZebraRFIDClient
+
+    ip, username = target['ip'], target['username']
+    if force:
+        token_store.invalidate(ip)
+    else:
+        token = token_store.get(ip, username, target['password'])
+        if token:
+            return token
+    client = ZebraRFIDClient(f"{target['protocol']}://{ip}", "dummy-token", debug=debug)
+    try:
+        token = client.get_bearer_token(username, target['password'], token_store.get_login_method(ip))
+    finally:
+        client.close()
+    if token:
+        token_store.put(ip, token, username, client.login_method, target['password'])
+    return token
+
+def _open_session(target: dict, token: str, timeout: float, debug: bool) -> ReaderSession:
+    return ReaderSession(f"{target['protocol']}://{target['ip']}", token, timeout=timeout,
+                         max_connections=len(SECTIONS), debug=debug)
+
+async def _fetch_sections(session: ReaderSession, names: List[str]) -> dict:
+    results = await asyncio.gather(*(session.call(READER_STATE_OPERATIONS[name]) for name in names))
+    return dict(zip(names, results))
+
+def merge_json(desired, current):
+    """
+    Returns current with desired merged in: objects are merged key by key (recursively), lists and values
+    of desired replace those of current. Neither argument is modified.
+    """
+    if isinstance(desired, dict) and isinstance(current, dict):
+        merged = dict(current)
+        for key, value in desired.items():
+            merged[key] = merge_json(value, current[key]) if key in current else value
+        return merged
+    return desired
+
+async def push_reader(target: dict, desired: Dict[str, dict], semaphore: asyncio.Semaphore, token_store: TokenStore,
+                      dry_run: bool = False, timeout: float = DEFAULT_TIMEOUT, debug: bool = False) -> dict:
+    """
+    Fetches the desired sections of one reader concurrently and PUTs the ones that differ, in order
+    (body: section_body()).
+
+    Returns:
+        dict: {'ip', 'status', 'seconds', 'login_ms', 'sections': {name: {'status', 'differences',
+        'get_ms', 'put_ms', 'error'}}, 'error'}
+    """
+    async with semaphore:
+        start = time.perf_counter()
+        result = {'ip': target['ip'], 'status': STATUS_FAILED, 'seconds': 0.0, 'login_ms': 0.0, 'sections': {},
+                  'error': None}
+        names = list(desired)
+        try:
+            token = await asyncio.to_thread(_reader_token, target, token_store, False, debug)
+            result['login_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            if not token:
+                result['error'] = "login failed"
+                return result
+
+            async with _open_session(target, token, timeout, debug) as session:
+                current = await _fetch_sections(session, names)
+                if any(r.status_code == 401 for r in current.values()):
+                    # Stored token revoked (reader rebooted, password changed): log in once more
+                    token = await asyncio.to_thread(_reader_token, target, token_store, True, debug)
+                    if not token:
+                        result['error'] = "login failed"
+                        return result
+                    session.set_token(token)
+                    current = await _fetch_sections(session, names)
+
+                for name in names:
+                    fetched = current[name]
+                    section = {'status': STATUS_FAILED, 'differences': [], 'get_ms': fetched.elapsed_ms,
+                               'put_ms': None, 'error': None}
+                    result['sections'][name] = section
+                    if not fetched.success:
+                        section['error'] = f"GET {fetched.endpoint}: {fetched.status_code or fetched.data.get('error')}"
+                        continue
+                    section['differences'] = section_differences(name, desired[name], fetched.data)
+                    if not section['differences']:
+                        section['status'] = STATUS_UNCHANGED
+                    elif dry_run:
+                        section['status'] = STATUS_WOULD_CHANGE
+                    else:
+                        put = await session.request("PUT", SECTIONS[name], json=section_body(name, desired[name], fetched.data))
+                        section['put_ms'] = put.elapsed_ms
+                        if put.success:
+                            section['status'] = STATUS_CHANGED
+                        else:
+                            section['error'] = f"PUT {SECTIONS[name]}: {put.status_code or ''} {put.data}".strip()
+                            break  # Later sections (the operating mode) may depend on this one
+        except Exception as e:
+            result['error'] = str(e) or type(e).__name__
+
+        statuses = [section['status'] for section in result['sections'].values()]
+        if result['error'] or STATUS_FAILED in statuses or len(statuses) < len(names):
+            result['status'] = STATUS_FAILED
+            result['error'] = result['error'] or next(
+                (s['error'] for s in result['sections'].values() if s['error']), "not all sections processed")
+        elif STATUS_CHANGED in statuses:
+            result['status'] = STATUS_CHANGED
+        elif STATUS_WOULD_CHANGE in statuses:
+            result['status'] = STATUS_WOULD_CHANGE
+        else:
+            result['status'] = STATUS_UNCHANGED
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        return result
+
+async def push_fleet(targets: List[dict], desired: Dict[str, dict], workers: int = DEFAULT_WORKERS,
+                     dry_run: bool = False, timeout: float = DEFAULT_TIMEOUT, token_store: Optional[TokenStore] = None,
+                     debug: bool = False, log=None) -> List[dict]:
+    """Pushes the desired sections to all targets with at most `workers` readers in flight; results in target order"""
+    semaphore = asyncio.Semaphore(max(1, workers))
+    token_store = token_store or TokenStore(debug=debug)
+    log = log or (lambda line: None)
+
+    async def run(target):
+        result = await push_reader(target, desired, semaphore, token_store, dry_run, timeout, debug)
+        if result['status'] == STATUS_FAILED:
+            log(f"❌ {result['ip']}: {result['error']}")
+        else:
+            changed = [name for name, s in result['sections'].items() if s['status'] != STATUS_UNCHANGED]
+            icon = "✏️ " if changed else "✅"
+            log(f"{icon} {result['ip']}: {result['status']} {', '.join(changed)} ({result['seconds'] * 1000:.0f} ms)")
+        return result
+
+    return await asyncio.gather(*(run(target) for target in targets))
+
+def _latency_statistics(values: List[float]) -> dict:
+    if not values:
+        return {}
+    values = sorted(values)
+    return {
+        'avg_ms': round(sum(values) / len(values), 1),
+        'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))], 1),
+        'max_ms': round(values[-1], 1)
+    }
+
+def run_fleet_config(targets: List[dict], desired: Dict[str, dict], workers: int = DEFAULT_WORKERS,
+                     dry_run: bool = False, timeout: float = DEFAULT_TIMEOUT, report_path: Optional[str] = None,
+                     token_store: Optional[TokenStore] = None, debug: bool = False, log=None) -> dict:
+    """
+    Runs the fleet push and writes a JSON report (default: reports/fleet_config_<timestamp>.json).
+
+    Returns:
+        dict: Summary (counts per status, reader and per-section GET/PUT latency statistics, one entry
+        per reader and the report path)
+    """
+    from zebra_cli.report_batch import default_directories
+
+    log = log or (lambda line: print(line, file=sys.stderr))
+    start = time.perf_counter()
+    log(f"⚙️  {'Checking' if dry_run else 'Pushing'} {', '.join(desired)} on {len(targets)} readers "
+        f"({workers} concurrent)")
+    results = asyncio.run(push_fleet(targets, desired, workers, dry_run, timeout, token_store, debug, log))
+
+    counts = {status: 0 for status in (STATUS_CHANGED, STATUS_WOULD_CHANGE, STATUS_UNCHANGED, STATUS_FAILED)}
+    for result in results:
+        counts[result['status']] += 1
+    sections = {}
+    for name in desired:
+        entries = [r['sections'][name] for r in results if name in r['sections']]
+        sections[name] = {
+            'changed': sum(1 for s in entries if s['status'] in (STATUS_CHANGED, STATUS_WOULD_CHANGE)),
+            'get': _latency_statistics([s['get_ms'] for s in entries]),
+            'put': _latency_statistics([s['put_ms'] for s in entries if s['put_ms'] is not None])
+        }
+    summary = {
+        'readers': len(results),
+        'dry_run': dry_run,
+        **counts,
+        'seconds': round(time.perf_counter() - start, 3),
+        'reader_latency': _latency_statistics([r['seconds'] * 1000 for r in results]),
+        'sections': sections,
+        'results': results
+    }
+
+    if report_path is None:
+        reports_dir = default_directories()[2]
+        report_path = os.path.join(reports_dir, f"fleet_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(summary, generated_at=datetime.now().isoformat(), desired=desired), f, indent=2)
+    summary['report'] = report_path
+    log(f"📄 Fleet config report: {report_path}")
+    return summary
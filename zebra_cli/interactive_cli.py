@@ -5,46 +5,38 @@ import os
 import sys
 import time
 import json
-import csv
 import traceback
+import importlib.util
 from typing import Optional
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import getpass
-import requests
-import urllib3
 import queue
 import threading
-import numpy as np
 
 from zebra_cli.context import AppContext
-from zebra_cli.plotter import Plotter, EnhancedPlotter
-from zebra_cli.tag_table_window import TagTableWindow
-from zebra_cli.api_submenu import ApiSubmenu
-from zebra_cli.atr_submenu import PositionPoint, PointDataStore, ATR7000PositionCalculator, RawDirectionalityMessage
-
-# Optional dependencies with graceful fallbacks
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.backends.backend_pdf import PdfPages
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-
-# Import of converted IOTC functions
-try:
-    from zebra_cli.iotc_client import ZebraIoTCClient as IOTCClient
-    IOTC_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ IOTC modules not available: {e}")
-    IOTC_AVAILABLE = False
+
+# Heavy and optional dependencies (matplotlib, numpy, requests, plotters, submenus, report backends)
+# are imported by the commands that use them, so that starting the CLI stays fast
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+
+# Converted IOTC functions, imported by _load_iotc_client on first use
+IOTCClient = None
+
+def _load_iotc_client():
+    """Imports the IOTC client on first use. Returns the client class, or None if the IOTC modules are not available."""
+    global IOTCClient
+    if IOTCClient is None:
+        try:
+            from zebra_cli.iotc_client import ZebraIoTCClient as IOTCClient
+        except ImportError as e:
+            print(f"⚠️ IOTC modules not available: {e}")
+    return IOTCClient
 
 class InteractiveCLI:
     """Persistent interactive CLI for Zebra RFID"""
 
-    def __init__(self, debug: bool = False, pre_commands: Optional[list[str]] = None):
+    def __init__(self, debug: bool = False, pre_commands: Optional[list[str]] = None, use_endpoint_cache: bool = True,
+                 ws_engine: str = 'thread', fanout_address: Optional[str] = None, fanout_buffer: Optional[int] = None):
         # Step 1: Set code page to UTF-8 on Windows for Unicode support
         if os.name == 'nt':
             try:
@@ -54,7 +46,8 @@ class InteractiveCLI:
             except Exception as e:
                 if debug:
                     print(f"[DEBUG] Failed to set code page: {e}")
-        self.app_context = AppContext(debug=debug)
+        self.app_context = AppContext(debug=debug, use_endpoint_cache=use_endpoint_cache, ws_engine=ws_engine,
+                                      fanout_address=fanout_address, fanout_buffer=fanout_buffer)
         self.running = True
         self.listener = None
         self.data_queue = None
@@ -63,8 +56,34 @@ class InteractiveCLI:
         self.debug = debug
         self._pre_commands = pre_commands or []
         self.login_attempts = 0  # Track login attempts
-        # API submenu instance
-        self.api_submenu = ApiSubmenu(self.app_context)
+        # API submenu, PDF report page renderer and aggregate cache (created on first use)
+        self._api_submenu = None
+        self._report_renderer = None
+        self._report_cache = None
+
+    @property
+    def api_submenu(self):
+        """API submenu instance"""
+        if self._api_submenu is None:
+            from zebra_cli.api_submenu import ApiSubmenu
+            self._api_submenu = ApiSubmenu(self.app_context)
+        return self._api_submenu
+
+    @property
+    def report_renderer(self):
+        """PDF report page renderer"""
+        if self._report_renderer is None:
+            from zebra_cli.report_renderer import ReportPageRenderer
+            self._report_renderer = ReportPageRenderer(debug=self.debug)
+        return self._report_renderer
+
+    @property
+    def report_cache(self):
+        """Report aggregate cache"""
+        if self._report_cache is None:
+            from zebra_cli.report_cache import ReportCache
+            self._report_cache = ReportCache(debug=self.debug)
+        return self._report_cache
         
     def _supports_unicode(self) -> bool:
         """Detects if the terminal likely supports Unicode borders and wide characters."""
@@ -170,6 +189,7 @@ class InteractiveCLI:
         print(row("MONITORING:"))
         print(row("w  / websocket     🔌    Simple WebSocket connection"))
         print(row("m  / monitoring    📋    Tag table"))
+        print(row("mr / multi         📡    Multi-reader tag table"))
         print(row("p  / plot          📊    RSSI plot "))
         print(row("a  / atr           📍    ATR7000 - Localization (submenu)"))
         print(row("ex  / export       📤    Export collected data to pdf"))
@@ -299,6 +319,14 @@ class InteractiveCLI:
             print(f"   Configured URI: {ws_status['configured_uri']}")
             print(f"   Listener URI: {ws_status['listener_uri']}")
             print(f"   Queue Size: {ws_status['queue_size']} messages")
+            if ws_status['reconnecting']:
+                print(f"   Reconnecting: 🔄 disconnected since {ws_status['disconnected_since'] or 'start'}")
+            print(f"   Reconnects: {ws_status['reconnects']} "
+                  f"({ws_status['connection_gaps']} gaps, {ws_status['downtime_s']:.1f}s downtime)")
+            if ws_status['fanout']:
+                fanout = ws_status['fanout']
+                print(f"   Fan-out: {fanout['address']}, {fanout['clients']} clients, "
+                      f"{fanout['published']} events, {fanout['slow_disconnects']} slow consumers disconnected")
             print(f"   Debug Mode: {'✅ On' if ws_status['debug_mode'] else '❌ Off'}")
             
             # Reading status
@@ -336,6 +364,8 @@ class InteractiveCLI:
     def handle_disconnect(self):
         """Handles disconnection"""
         self.ensure_no_background_listeners()
+        if self._api_submenu is not None:
+            self._api_submenu.close_http_client()
         if self.app_context.is_connected():
             self.app_context.disconnect()
             print("✅ Disconnection completed")
@@ -427,6 +457,7 @@ class InteractiveCLI:
 
     def handle_unified_monitoring(self):
         """Starts unified monitoring: events in terminal + tag table window"""
+        from zebra_cli.tag_table_window import TagTableWindow
         if not self.app_context.is_connected():
             print("❌ Connection required. Use command 'l' first.")
             input("\n⏸️  Press ENTER to continue...")
@@ -508,6 +539,120 @@ class InteractiveCLI:
 
         input("\n⏸️  Press ENTER to continue...")
 
+    def handle_multi_reader_monitoring(self):
+        """Monitors several readers in one process: merged event stream, combined tag table and recording"""
+        from zebra_cli.multi_reader_session import (
+            DEFAULT_LIVE_READERS_FILE, MultiReaderSession, load_live_readers, resolve_live_readers, save_live_readers
+        )
+
+        self.ensure_no_background_listeners()
+
+        print("\n📡 MULTI-READER TAG MONITORING")
+        print("-" * 40)
+        broker_uri = input("📨 MQTT broker (mqtt://host:1883, ENTER = reader WebSockets): ").strip()
+        if broker_uri:
+            self._multi_reader_mqtt_monitoring(broker_uri)
+            return
+        print(f"📁 Readers file: {DEFAULT_LIVE_READERS_FILE}")
+        ips = input("🌐 Reader IPs (comma separated, ENTER = readers file): ").strip()
+        try:
+            if ips:
+                readers = resolve_live_readers([ip.strip() for ip in ips.split(',') if ip.strip()],
+                                               self.app_context.config_manager)
+                save_live_readers(readers)
+            else:
+                readers = load_live_readers()
+        except Exception as e:
+            print(f"❌ Cannot load readers: {e}")
+            input("\n⏸️  Press ENTER to continue...")
+            return
+        if not readers:
+            print("❌ No readers configured")
+            input("\n⏸️  Press ENTER to continue...")
+            return
+
+        session = MultiReaderSession(readers, debug=self.debug, fanout=self.app_context.fanout_server)
+        username, password = self.app_context.get_stored_credentials()
+        control_scans = False
+        if username and password:
+            control_scans = input("🟢 Start scanning on all readers? (y/N): ").strip().lower() == 'y'
+        record = input("📝 Record a combined CSV? (y/N): ").strip().lower() == 'y'
+
+        print(f"\n🔗 Connecting {len(readers)} readers...")
+        session.start(listener_factory=self.app_context.websocket_listener_class())
+        if record:
+            session.start_recording()
+        if control_scans:
+            for reader_id, started in session.control_scans(True, username, password).items():
+                print(f"{'✅' if started else '❌'} Scan start {reader_id}")
+        self._run_multi_reader_session(session)
+        if control_scans:
+            session.control_scans(False, username, password)
+        session.stop()
+        input("\n⏸️  Press ENTER to continue...")
+
+    def _multi_reader_mqtt_monitoring(self, broker_uri: str):
+        """Multi-reader monitoring of the readers publishing to an MQTT broker (one broker connection)"""
+        from zebra_cli.mqtt_ingest import PAHO_AVAILABLE
+        from zebra_cli.multi_reader_session import MultiReaderSession
+
+        if not PAHO_AVAILABLE:
+            print("❌ MQTT ingestion requires paho-mqtt: pip install paho-mqtt")
+            input("\n⏸️  Press ENTER to continue...")
+            return
+        names = input("🏷️  Reader names (MQTT client IDs, comma separated, ENTER = all on the broker): ").strip()
+        reader_names = [name.strip() for name in names.split(',') if name.strip()] or None
+        username = input("👤 Broker username (ENTER = none): ").strip() or None
+        password = getpass.getpass("🔑 Broker password: ") if username else None
+        record = input("📝 Record a combined CSV? (y/N): ").strip().lower() == 'y'
+        print("💡 Scanning is controlled on the readers (IoTC / 's'); readers appear when they publish")
+
+        session = MultiReaderSession([], debug=self.debug, fanout=self.app_context.fanout_server)
+        try:
+            session.start_mqtt(broker_uri, reader_names, username, password)
+        except Exception as e:
+            print(f"❌ Cannot start MQTT ingestion: {e}")
+            input("\n⏸️  Press ENTER to continue...")
+            return
+        if record:
+            session.start_recording()
+        self._run_multi_reader_session(session)
+        session.stop()
+        input("\n⏸️  Press ENTER to continue...")
+
+    def _run_multi_reader_session(self, session):
+        """Shows a started multi-reader session in the combined tag table until closed or Ctrl+C"""
+        from zebra_cli.tag_table_window import TagTableWindow
+
+        self.stop_event = threading.Event()
+        self.tag_table_window = None
+        try:
+            self.tag_table_window = TagTableWindow(session.data_queue, self.stop_event, debug=self.debug,
+                                                   show_reader=True, reader_stats=session.stats_line)
+            self.tag_table_window.run()
+            time.sleep(0.5)
+            if not self.tag_table_window.running:
+                print("⚠️  Tag table window not started correctly")
+        except Exception as e:
+            print(f"⚠️  Tag table window not available ({e}) - terminal statistics only")
+            self.tag_table_window = None
+
+        print("💡 Close the table window or press Ctrl+C to stop")
+        try:
+            while not self.stop_event.is_set():
+                self.stop_event.wait(5.0)
+                for stats in session.reader_stats():
+                    lag = f"{stats['lag_ms']:.0f} ms" if stats['lag_ms'] is not None else "-"
+                    print(f"{'🟢' if stats['connected'] else '🔴'} {stats['reader_id']}: {stats['messages']} msgs, "
+                          f"{stats['tag_events']} tags, {stats['rate']:.1f}/s, lag {lag}, dropped {stats['dropped']}, "
+                          f"reconnects {stats.get('reconnects', 0)} ({stats.get('downtime_s', 0.0):.1f}s down)")
+        except KeyboardInterrupt:
+            print("\n⏹️  Interruption requested")
+
+        self.stop_event.set()
+        if self.tag_table_window and self.tag_table_window.running:
+            self.tag_table_window.on_closing()
+
     def handle_listen_events(self):
         """Starts event listening using the permanent WebSocket"""
         if not self.app_context.is_connected():
@@ -591,6 +736,7 @@ class InteractiveCLI:
 
     def handle_plot_live_gui_enhanced(self):
         """Starts RSSI graph with tag selection in separate window"""
+        from zebra_cli.plotter import EnhancedPlotter
         if not self.app_context.is_connected():
             print("❌ Connection required. Use command 'l' first.")
             input("\n⏸️  Press ENTER to continue...")
@@ -711,6 +857,7 @@ class InteractiveCLI:
 
     def handle_plot_live_gui(self):
         """Starts RSSI graph in separate window using permanent WebSocket"""
+        from zebra_cli.plotter import Plotter
         if not self.app_context.is_connected():
             print("❌ Connection required. Use command 'l' first.")
             input("\n⏸️  Press ENTER to continue...")
@@ -863,6 +1010,7 @@ class InteractiveCLI:
     
     def handle_tag_table(self):
         """Opens a separate window with RFID tag table"""
+        from zebra_cli.tag_table_window import TagTableWindow
         if not self.app_context.is_connected():
             print("❌ Connection required. Use command 'l' first.")
             return
@@ -1070,8 +1218,8 @@ class InteractiveCLI:
             # 5. Close plotters if present
             # If there are open matplotlib windows, close them
             try:
-                if MATPLOTLIB_AVAILABLE:
-                    plt.close('all')
+                if 'matplotlib.pyplot' in sys.modules:
+                    sys.modules['matplotlib.pyplot'].close('all')
             except:
                 pass
             
@@ -1084,7 +1232,9 @@ class InteractiveCLI:
                 except:
                     pass
             
-            # 7. Disconnect from reader
+            # 7. Close pooled REST API connections and disconnect from reader
+            if self._api_submenu is not None:
+                self._api_submenu.close_http_client()
             if self.app_context and self.app_context.is_connected():
                 print("   🔌 Disconnecting from reader...")
                 try:
@@ -1112,6 +1262,7 @@ class InteractiveCLI:
             'w': self.startWebsocket, 'websocket': self.startWebsocket,
             'r': self.handle_api_submenu, 'restapi': self.handle_api_submenu,
             'm': self.handle_unified_monitoring, 'monitoring': self.handle_unified_monitoring,
+            'mr': self.handle_multi_reader_monitoring, 'multi': self.handle_multi_reader_monitoring,
             'p': self.handle_plot_live_gui_enhanced, 'plot': self.handle_plot_live_gui_enhanced,
             'a': self.handle_atr7000_submenu, 'atr': self.handle_atr7000_submenu,
             'ex': self.handle_export_data, 'export': self.handle_export_data,
@@ -1203,6 +1354,7 @@ class InteractiveCLI:
 
     def handle_atr7000_submenu(self):
         """Delegates ATR menu handling to the separate AtrSubmenu class."""
+        from zebra_cli.atr_submenu import AtrSubmenu
         self.ensure_no_background_listeners()
         if not hasattr(self, 'atr_submenu'):
             self.atr_submenu = AtrSubmenu(self)
@@ -1343,7 +1495,7 @@ class InteractiveCLI:
         print("\n🔌 DISCONNECT FROM IOTC")
         print("-" * 40)
         
-        if not IOTC_AVAILABLE:
+        if _load_iotc_client() is None:
             print("❌ IOTC modules not available")
             input("\n⏸️  Press ENTER to continue...")
             return
@@ -1464,8 +1616,12 @@ class InteractiveCLI:
             
             print(f"\n✅ Selected: {selected_file}")
             
-            # Generate PDF report
-            self._generate_pdf_report(selected_file, tag_reads_dir, messages_dir, reports_dir)
+            # Report format: matplotlib PDF or lightweight HTML with SVG charts
+            report_format = input("📝 Report format - [p]df or [h]tml (default: pdf): ").strip().lower()
+            report_format = 'html' if report_format in ('h', 'html') else 'pdf'
+            
+            # Generate report
+            self._generate_pdf_report(selected_file, tag_reads_dir, messages_dir, reports_dir, report_format)
             
         except Exception as e:
             print(f"❌ Export error: {e}")
@@ -1474,11 +1630,14 @@ class InteractiveCLI:
         
         input("\n⏸️  Press ENTER to continue...")
     
-    def _generate_pdf_report(self, csv_filename: str, tag_reads_dir: str, messages_dir: str, reports_dir: str):
-        """Generates PDF report from CSV data with RSSI graphs"""
+    def _generate_pdf_report(self, csv_filename: str, tag_reads_dir: str, messages_dir: str, reports_dir: str,
+                             report_format: str = 'pdf'):
+        """Generates PDF (or HTML, report_format='html') report from CSV data with RSSI graphs"""
+        from zebra_cli.report_cache import load_report_aggregates
+        from zebra_cli.report_summary import build_epc_jobs, plan_report
         try:
             # Check if matplotlib is available for PDF generation
-            if not MATPLOTLIB_AVAILABLE:
+            if report_format == 'pdf' and not MATPLOTLIB_AVAILABLE:
                 print("❌ Missing required library: matplotlib")
                 print("💡 Install required packages: pip install matplotlib")
                 return
@@ -1491,1365 +1650,93 @@ class InteractiveCLI:
             messages_filename = f"messages_read_{timestamp_part}.csv"
             messages_path = os.path.join(messages_dir, messages_filename)
             
-            # Generate PDF filename with report_ prefix and timestamp
-            pdf_filename = f"report_{timestamp_part}.pdf"
+            # Generate report filename with report_ prefix and timestamp
+            pdf_filename = f"report_{timestamp_part}.{report_format}"
             pdf_path = os.path.join(reports_dir, pdf_filename)
             
-            print(f"📊 Generating PDF report: {pdf_filename}")
+            print(f"📊 Generating {report_format.upper()} report: {pdf_filename}")
             print(f"🔍 Reading tag data from: {csv_filename}")
             print(f"🔍 Reading message data from: {messages_filename}")
             
-            # Read tag data
-            tag_data = {}
             tags_path = os.path.join(tag_reads_dir, csv_filename)
+            if not os.path.exists(messages_path):
+                print(f"⚠️  Messages file not found: {messages_filename}")
+                print("📊 Will generate report without RSSI graphs and antenna analysis")
             
-            with open(tags_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    epc = row['EPC']
-                    tag_data[epc] = {
-                        'reads': int(row['Reads']),
-                        'avg_rssi': float(row['Avg_RSSI']),
-                        'min_rssi': float(row['Min_RSSI']),
-                        'max_rssi': float(row['Max_RSSI']),
-                        'first_seen': row['First_Seen'],
-                        'last_seen': row['Last_Seen'],
-                        'rate_per_minute': float(row['Rate_Per_Minute'])
-                    }
-            
+            # Single pass over the messages (reader detection, RSSI over time, antenna counts and positions),
+            # skipped entirely when the aggregate cache already holds this recording
+            tag_data, aggregates, cache_hit = load_report_aggregates(
+                tags_path, messages_path, cache=self.report_cache, debug=self.debug
+            )
             print(f"📋 Found {len(tag_data)} unique tags in dataset")
-            
-            # Read messages data to extract RSSI over time and antenna counts for each EPC
-            epc_rssi_data = {}
-            epc_antenna_counts = {}
-            epc_antenna_rssi_stats = {}  # {epc: {antenna_id: {'min': val, 'max': val, 'sum': val, 'count': count}}}
-            
+            if cache_hit:
+                print("⚡ Loaded aggregated message data from the report cache")
             if os.path.exists(messages_path):
-                # Detect if this is an ATR7000 reader
-                is_atr_reader = self._is_messages_csv_from_atr(messages_path)
-                reader_type = "ATR7000" if is_atr_reader else "Standard RFID"
-                print(f"� Detected {reader_type} reader from message data")
-                
-                if is_atr_reader:
-                    print("�📡 Processing message data for RSSI graphs (ATR7000 - antenna analysis skipped)")
-                else:
-                    print("📡 Processing message data for RSSI graphs and antenna analysis...")
-            
-                with open(messages_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        try:
-                            # Parse the raw JSON message
-                            raw_json = row['Raw_JSON']
-                            message_data = json.loads(raw_json)
-                            
-                            # Extract tag data from message
-                            if isinstance(message_data, dict) and 'data' in message_data:
-                                msg_tag_data = message_data['data']
-                                if isinstance(msg_tag_data, dict) and 'idHex' in msg_tag_data:
-                                    epc = msg_tag_data['idHex']
-                                    rssi = msg_tag_data.get('peakRssi', msg_tag_data.get('rssi'))
-                                    antenna = msg_tag_data.get('antenna')
-                                    
-                                    if epc in tag_data:  # Only process if this EPC is in our tag data
-                                        # Process RSSI data for graphs
-                                        if rssi is not None:
-                                            try:
-                                                rssi_value = float(rssi)
-                                                timestamp_str = row['Timestamp']
-                                                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
-                                                
-                                                if epc not in epc_rssi_data:
-                                                    epc_rssi_data[epc] = {'timestamps': [], 'rssi_values': []}
-                                                
-                                                epc_rssi_data[epc]['timestamps'].append(timestamp)
-                                                epc_rssi_data[epc]['rssi_values'].append(rssi_value)
-                                            except (ValueError, TypeError):
-                                                pass  # Skip invalid RSSI values
-                                        
-                                        # Process antenna count and RSSI statistics data (only for non-ATR readers)
-                                        if not is_atr_reader and antenna is not None:
-                                            try:
-                                                antenna_id = int(antenna)
-                                                
-                                                # Initialize antenna counts data structure
-                                                if epc not in epc_antenna_counts:
-                                                    epc_antenna_counts[epc] = {}
-                                                if antenna_id not in epc_antenna_counts[epc]:
-                                                    epc_antenna_counts[epc][antenna_id] = 0
-                                                
-                                                # Update antenna read count
-                                                epc_antenna_counts[epc][antenna_id] += 1
-                                                
-                                                # Process RSSI statistics if available
-                                                if rssi is not None:
-                                                    try:
-                                                        rssi_value = float(rssi)
-                                                        
-                                                        # Initialize RSSI stats data structure
-                                                        if epc not in epc_antenna_rssi_stats:
-                                                            epc_antenna_rssi_stats[epc] = {}
-                                                        if antenna_id not in epc_antenna_rssi_stats[epc]:
-                                                            epc_antenna_rssi_stats[epc][antenna_id] = {
-                                                                'min': rssi_value,
-                                                                'max': rssi_value,
-                                                                'sum': 0,
-                                                                'count': 0
-                                                            }
-                                                        
-                                                        # Update RSSI statistics
-                                                        stats = epc_antenna_rssi_stats[epc][antenna_id]
-                                                        stats['min'] = min(stats['min'], rssi_value)
-                                                        stats['max'] = max(stats['max'], rssi_value)
-                                                        stats['sum'] += rssi_value
-                                                        stats['count'] += 1
-                                                        
-                                                    except (ValueError, TypeError):
-                                                        pass  # Skip invalid RSSI values
-                                                
-                                            except (ValueError, TypeError):
-                                                pass  # Skip invalid antenna values
-                                                
-                        except (json.JSONDecodeError, KeyError):
-                            continue
+                reader_type = "ATR7000" if aggregates.is_atr_reader else "Standard RFID"
+                print(f"🔍 Detected {reader_type} reader from message data")
+                if aggregates.is_atr_reader:
+                    print(f"📍 ATR7000 position data: {aggregates.messages_with_position_data} messages with positions (antenna analysis skipped)")
+            
+            print(f"📄 Creating {report_format.upper()} report...")
+            
+            # Large populations: fleet summary pages plus detail pages for the top EPCs only
+            detail_tag_data, summary = plan_report(tag_data, aggregates)
+            if summary is not None:
+                print(f"📈 Summary-first report: fleet summary + detail pages for the top {len(detail_tag_data)} tags by reads")
+            
+            # Precompute per-EPC page data, then render (in parallel when possible)
+            jobs = build_epc_jobs(
+                detail_tag_data, aggregates.epc_rssi_data, aggregates.is_atr_reader,
+                aggregates.epc_antenna_counts, aggregates.epc_antenna_rssi_stats, aggregates.epc_position_data
+            )
+            if report_format == 'html':
+                from zebra_cli.report_html import HtmlReportWriter
+                HtmlReportWriter(debug=self.debug).render_report(
+                    pdf_path, csv_filename, messages_filename, tag_data, jobs, summary=summary
+                )
             else:
-                print(f"⚠️  Messages file not found: {messages_filename}")
-                print("📊 Will generate report without RSSI graphs and antenna analysis")
-                is_atr_reader = False  # Default to non-ATR behavior when no messages file
-            
-            # Process ATR7000 position data if this is an ATR reader
-            atr_point_store = None
-            if is_atr_reader and os.path.exists(messages_path):
-                try:
-                    print("📍 Processing ATR7000 position data for XY variation analysis...")
-                    atr_point_store = self.process_atr7000_messages_csv(messages_path)
-                    if atr_point_store:
-                        print(f"✅ ATR7000 position data processed successfully")
-                    else:
-                        print("⚠️  No position data found in ATR7000 messages")
-                except Exception as e:
-                    print(f"⚠️  Error processing ATR7000 position data: {e}")
-                    if self.debug:
-                        traceback.print_exc()
-            
-            # Generate PDF report
-            print("📄 Creating PDF report...")
-            
-            with PdfPages(pdf_path) as pdf:
-                # Title page
-                fig, ax = plt.subplots(figsize=(8.5, 11))
-                ax.axis('off')
-                
-                # Title
-                ax.text(0.5, 0.9, 'RFID Tag Analysis Report', 
-                       ha='center', va='center', fontsize=24, fontweight='bold')
-                
-                # Source files information (left aligned)
-                source_files_text = f'Generated from:\n  • Tag data: {csv_filename}\n  • Message data: {messages_filename}'
-                ax.text(0.1, 0.82, source_files_text, 
-                       ha='left', va='top', fontsize=12)
-                
-                # Generation time (left aligned with vertical spacing)
-                generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                ax.text(0.1, 0.72, f'Report generated: {generation_time}', 
-                       ha='left', va='center', fontsize=12)
-                
-                # Summary statistics
-                total_tags = len(tag_data)
-                total_reads = sum(data['reads'] for data in tag_data.values())
-                avg_rssi_overall = sum(data['avg_rssi'] for data in tag_data.values()) / total_tags if total_tags > 0 else 0
-                
-                summary_text = f"""Summary Statistics:
-• Total Unique Tags: {total_tags}
-• Total Read Events: {total_reads:,}
-• Average RSSI: {avg_rssi_overall:.1f} dBm
-• Data Collection Period: {tag_data[list(tag_data.keys())[0]]['first_seen'] if tag_data else 'N/A'} 
-  to {tag_data[list(tag_data.keys())[0]]['last_seen'] if tag_data else 'N/A'}"""
-                
-                ax.text(0.1, 0.55, summary_text, ha='left', va='center', fontsize=12,
-                       bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray"))
-                
-                pdf.savefig(fig, bbox_inches='tight')
-                plt.close(fig)
-                
-                # Generate page(s) for each EPC
-                for i, (epc, data) in enumerate(tag_data.items(), 1):
-                    print(f"📊 Processing EPC {i}/{len(tag_data)}: {epc[:16]}...")
-                    
-                    # Generate Page 1: Statistics and RSSI graph (same for all readers)
-                    self._generate_stats_and_rssi_page(
-                        epc, data, epc_rssi_data, is_atr_reader, 
-                        epc_antenna_counts, epc_antenna_rssi_stats, pdf
-                    )
-                    
-                    # Generate Page 2: Position graphs (only for ATR readers with position data)
-                    if is_atr_reader and atr_point_store is not None:
-                        print(f"📍 Generating position graphs page for EPC: {epc[:16]}...")
-                        self._generate_position_graphs_page(epc, atr_point_store, pdf)
+                self.report_renderer.render_report(pdf_path, csv_filename, messages_filename, tag_data, jobs, summary=summary)
             
-            print(f"✅ PDF report generated successfully!")
+            print(f"✅ {report_format.upper()} report generated successfully!")
             print(f"📄 Report saved: {pdf_path}")
-            print(f"📊 {len(tag_data)} tags processed with detailed analysis")
+            print(f"📊 {len(tag_data)} tags processed, {len(jobs)} with detailed analysis")
             
         except ImportError as e:
             print(f"❌ Missing required library: {e}")
             print("💡 Install required packages: pip install matplotlib")
         except Exception as e:
-            print(f"❌ Error generating PDF: {e}")
+            print(f"❌ Error generating {report_format.upper()} report: {e}")
             if self.debug:
                 traceback.print_exc()
 
-    def _generate_stats_and_rssi_page(self, epc: str, data: dict, epc_rssi_data: dict, 
-                                     is_atr_reader: bool, epc_antenna_counts: dict, 
-                                     epc_antenna_rssi_stats: dict, pdf):
-        """
-        Generates the first page with tag statistics and RSSI graph (same for all readers).
-        
-        Args:
-            epc: EPC identifier
-            data: Tag statistics data
-            epc_rssi_data: RSSI time series data
-            is_atr_reader: Whether this is an ATR7000 reader
-            epc_antenna_counts: Antenna count data
-            epc_antenna_rssi_stats: Antenna RSSI statistics
-            pdf: PdfPages object to save the figure
-        """
-        try:
-            # Create 3-section layout for better spacing
-            fig = plt.figure(figsize=(8.5, 11))
-            gs = fig.add_gridspec(3, 1, height_ratios=[1, 2, 0.5], hspace=0.3)
-            
-            # EPC Header
-            fig.suptitle(f'Tag Analysis: {epc}', fontsize=16, fontweight='bold', y=0.95)
-            
-            # Statistics section
-            ax1 = fig.add_subplot(gs[0])
-            ax1.axis('off')
-            
-            # Build antenna counts and RSSI statistics text (only for non-ATR readers)
-            antenna_text = ""
-            if not is_atr_reader:
-                if epc in epc_antenna_counts and epc_antenna_counts[epc]:
-                    antenna_counts = epc_antenna_counts[epc]
-                    # Sort antenna IDs for consistent display
-                    sorted_antennas = sorted(antenna_counts.keys())
-                    antenna_lines = []
-                    for ant_id in sorted_antennas:
-                        count = antenna_counts[ant_id]
-                        
-                        # Check if we have RSSI statistics for this antenna
-                        rssi_info = ""
-                        if (epc in epc_antenna_rssi_stats and 
-                            ant_id in epc_antenna_rssi_stats[epc] and
-                            epc_antenna_rssi_stats[epc][ant_id]['count'] > 0):
-                            
-                            stats = epc_antenna_rssi_stats[epc][ant_id]
-                            avg_rssi = stats['sum'] / stats['count']
-                            min_rssi = stats['min']
-                            max_rssi = stats['max']
-                            rssi_info = f" (RSSI: {avg_rssi:.1f} avg, {min_rssi:.1f}/{max_rssi:.1f} min/max)"
-                        
-                        antenna_lines.append(f"  - Antenna {ant_id}: {count:,} reads{rssi_info}")
-                    antenna_text = "\n• Reads by Antenna:\n" + "\n".join(antenna_lines)
-                else:
-                    antenna_text = "\n• Reads by Antenna: No antenna data available"
-            
-            stats_text = f"""
-Tag Statistics:
-• EPC: {epc}
-• Total Reads: {data['reads']:,}
-• Average RSSI: {data['avg_rssi']:.1f} dBm
-• Min/Max RSSI: {data['min_rssi']:.1f} / {data['max_rssi']:.1f} dBm
-• First Seen: {data['first_seen']}
-• Last Seen: {data['last_seen']}
-• Read Rate: {data['rate_per_minute']:.1f} reads/minute{antenna_text}
-            """
-            
-            ax1.text(0.1, 0.8, stats_text, fontsize=11, va='top',
-                    bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue"))
-            
-            # Add a little bit of spacing
-            ax1.text(0.1, 0.1, " ", fontsize=11, va='top')
-            
-            # RSSI over time graph (section 2)
-            if epc in epc_rssi_data and epc_rssi_data[epc]['timestamps']:
-                ax2 = fig.add_subplot(gs[1])
-                
-                timestamps = epc_rssi_data[epc]['timestamps']
-                rssi_values = epc_rssi_data[epc]['rssi_values']
-                
-                # Sort by timestamp
-                sorted_data = sorted(zip(timestamps, rssi_values))
-                timestamps, rssi_values = zip(*sorted_data)
-                
-                ax2.plot(timestamps, rssi_values, 'b-', linewidth=0.5, alpha=0.3)
-                ax2.scatter(timestamps, rssi_values, c='red', s=5, alpha=0.5)
-
-                # Calculate and plot smooth curve
-                # Savitzky-Golay Filter
-                smooth_info = self._calculate_smooth_curve_savgol(list(timestamps), list(rssi_values))
-
-                if smooth_info:
-                    ax2.plot(smooth_info['timestamps'], smooth_info['coordinates'], 
-                            'green', linewidth=2, linestyle='-', label='RSSI Smooth', alpha=1)
-                    # Only show legend when we have labeled smooth curve
-                    ax2.legend(fontsize=9)
-
-                ax2.set_xlabel('Time')
-                ax2.set_ylabel('RSSI (dBm)')
-                ax2.set_title('RSSI Over Time')
-                ax2.grid(True, alpha=0.3)
-                
-                # Format x-axis with adaptive interval based on data time span
-                ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-                
-                # Calculate time span from tag data to choose appropriate locator
-                try:
-                    # Try parsing with microseconds first, then without if it fails
-                    try:
-                        first_seen = datetime.strptime(data['first_seen'], '%Y-%m-%d %H:%M:%S.%f')
-                        last_seen = datetime.strptime(data['last_seen'], '%Y-%m-%d %H:%M:%S.%f')
-                    except ValueError:
-                        # Fallback to format without microseconds
-                        first_seen = datetime.strptime(data['first_seen'], '%Y-%m-%d %H:%M:%S')
-                        last_seen = datetime.strptime(data['last_seen'], '%Y-%m-%d %H:%M:%S')
-                    
-                    time_span_seconds = (last_seen - first_seen).total_seconds()
-                    
-                    # Choose appropriate time axis interval based on data duration (time axis markers)
-                    if time_span_seconds <= 10:  # ≤ 10 seconds: show every second
-                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
-                    elif time_span_seconds <= 30:  # ≤ 30 seconds: show every 5 seconds
-                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=5))
-                    elif time_span_seconds <= 120:  # ≤ 2 minutes: show every 15 seconds
-                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
-                    elif time_span_seconds <= 300:  # ≤ 5 minutes: show every 30 seconds
-                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=30))
-                    elif time_span_seconds <= 900:  # ≤ 15 minutes: show every minute
-                        ax2.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
-                    elif time_span_seconds <= 3600:  # ≤ 1 hour: show every 5 minutes
-                        ax2.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
-                    else:  # > 1 hour: show every 15 minutes
-                        ax2.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
-                        
-                except (ValueError, TypeError) as e:
-                    # Fallback to adaptive approach based on data points if timestamp parsing fails
-                    if len(timestamps) > 10:
-                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=max(1, len(timestamps)//6)))
-                    else:
-                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
-                
-                plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
-                
-                # Add statistics to graph
-                stats_box = f'Avg: {data["avg_rssi"]:.1f}dBm\nMin: {data["min_rssi"]:.1f}dBm\nMax: {data["max_rssi"]:.1f}dBm'
-                ax2.text(0.02, 0.98, stats_box, transform=ax2.transAxes, fontsize=9,
-                        verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-            else:
-                ax2 = fig.add_subplot(gs[1])
-                ax2.text(0.5, 0.5, 'No RSSI time-series data available\nfor this EPC', 
-                        ha='center', va='center', fontsize=12,
-                        bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
-                ax2.set_xlim(0, 1)
-                ax2.set_ylim(0, 1)
-                ax2.axis('off')
-            
-            # Note: Custom GridSpec layout eliminates need for plt.tight_layout()
-            pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
-            
-        except Exception as e:
-            print(f"❌ Error generating stats and RSSI page for EPC {epc}: {e}")
-            if hasattr(self, 'debug') and self.debug:
-                traceback.print_exc()
-
-    def _generate_position_graphs_page(self, epc: str, atr_point_store, pdf):
-        """
-        Generates the second page with X and Y position variation graphs (ATR7000 only).
-        
-        Args:
-            epc: EPC identifier
-            atr_point_store: PointDataStore with position data
-            pdf: PdfPages object to save the figure
-        """
-        try:
-            # Create 2-section layout for position graphs with maximum space
-            fig = plt.figure(figsize=(8.5, 11))
-            gs = fig.add_gridspec(2, 1, height_ratios=[1, 1], hspace=0.4)
-            
-            # Page header
-            fig.suptitle(f'Position Analysis: {epc}', fontsize=16, fontweight='bold', y=0.95)
-            
-            # X Position Graph (section 1)
-            ax_x = fig.add_subplot(gs[0])
-            x_graph_created = self._generate_x_position_graph(atr_point_store, epc, ax_x)
-            
-            if not x_graph_created:
-                # Fallback message if no X graph could be created
-                ax_x.text(0.5, 0.5, 'No X coordinate data available for this EPC', 
-                          ha='center', va='center', fontsize=11,
-                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
-                ax_x.set_xlim(0, 1)
-                ax_x.set_ylim(0, 1)
-                ax_x.axis('off')
-            
-            # Y Position Graph (section 2)
-            ax_y = fig.add_subplot(gs[1])
-            y_graph_created = self._generate_y_position_graph(atr_point_store, epc, ax_y)
-            
-            if not y_graph_created:
-                # Fallback message if no Y graph could be created
-                ax_y.text(0.5, 0.5, 'No Y coordinate data available for this EPC', 
-                          ha='center', va='center', fontsize=11,
-                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
-                ax_y.set_xlim(0, 1)
-                ax_y.set_ylim(0, 1)
-                ax_y.axis('off')
-            
-            # Note: Custom GridSpec layout eliminates need for plt.tight_layout()
-            pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
-            
-        except Exception as e:
-            print(f"❌ Error generating position graphs page for EPC {epc}: {e}")
-            if hasattr(self, 'debug') and self.debug:
-                traceback.print_exc()
-
-    def _generate_x_position_graph(self, point_store, epc: str, ax_x):
-        """
-        Generates X position variation graph for ATR7000 readers with smooth curve.
-        
-        Args:
-            point_store: PointDataStore instance with position data
-            epc: EPC string to get position data for
-            ax_x: matplotlib axes to plot on
-            
-        Returns:
-            bool: True if graph was generated, False if no data
-        """
-        try:
-            # Get XY history for this EPC
-            timestamps, x_coords, y_coords = point_store.get_xy_history(epc, all_points=True)
-            
-            if not timestamps or not x_coords or len(timestamps) == 0:
-                # No position data available
-                ax_x.text(0.5, 0.5, 'No X coordinate data available for this EPC', 
-                          ha='center', va='center', fontsize=11,
-                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
-                ax_x.set_xlim(0, 1)
-                ax_x.set_ylim(0, 1)
-                ax_x.axis('off')
-                return False
-            
-            # Plot X coordinates
-            ax_x.plot(timestamps, x_coords, 'b-', linewidth=0.5, marker='o', markersize=2, label='X Coordinate', alpha=0.3)
-
-            # Calculate and plot trend line - Design choice --> not significant
-            # trend_info = self._calculate_trend_line(timestamps, x_coords)
-            # if trend_info:
-            #     ax_x.plot(trend_info['trend_timestamps'], trend_info['trend_coords'], 
-            #              'navy', linewidth=2, linestyle='--', label='X Trend', alpha=0.9)
-            
-            # Calculate and plot smooth curve
-            # Savitzky-Golay Filter
-            smooth_info = self._calculate_smooth_curve_savgol(timestamps, x_coords)
-            
-            if smooth_info:
-                ax_x.plot(smooth_info['timestamps'], smooth_info['coordinates'], 
-                         'green', linewidth=2, linestyle='-', label='X Smooth', alpha=1)
-            
-            ax_x.set_ylabel('X Coordinate (meters)', fontsize=10)
-            ax_x.set_title('X Position Variations Over Time', fontsize=11, fontweight='bold')
-            ax_x.grid(True, alpha=0.3)
-            ax_x.legend(fontsize=9)
-            
-            # Format x-axis with adaptive interval based on timestamps time span
-            ax_x.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-            
-            # Calculate time span to choose appropriate locator (time axis markers)
-            try:
-                time_span_seconds = (max(timestamps) - min(timestamps)).total_seconds()
-                
-                # Choose appropriate time axis interval based on position data duration
-                if time_span_seconds <= 10:  # ≤ 10 seconds: show every second
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
-                elif time_span_seconds <= 30:  # ≤ 30 seconds: show every 5 seconds
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=5))
-                elif time_span_seconds <= 60:  # ≤ 1 minute: show every 10 seconds
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=10))
-                elif time_span_seconds <= 120:  # ≤ 2 minutes: show every 15 seconds
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
-                elif time_span_seconds <= 300:  # ≤ 5 minutes: show every 30 seconds
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=30))
-                elif time_span_seconds <= 900:  # ≤ 15 minutes: show every minute
-                    ax_x.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
-                elif time_span_seconds <= 3600:  # ≤ 1 hour: show every 5 minutes
-                    ax_x.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
-                else:  # > 1 hour: show every 15 minutes
-                    ax_x.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
-                    
-            except (ValueError, TypeError, AttributeError):
-                # Fallback to data point based approach if timestamp calculation fails
-                if len(timestamps) > 10:
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=max(1, len(timestamps)//8)))
-                else:
-                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
-            
-            ax_x.tick_params(axis='x', labelsize=8)
-            ax_x.tick_params(axis='y', labelsize=9)
-            
-            # Don't show x-axis labels (will be shown only on bottom graph)
-            ax_x.set_xticklabels([])
-            
-            # Set time range
-            if len(timestamps) > 1:
-                time_range = [min(timestamps), max(timestamps)]
-                ax_x.set_xlim(time_range)
-            
-            # Add statistics info box
-            if len(x_coords) > 0:
-                x_range = max(x_coords) - min(x_coords)
-                x_mean = sum(x_coords) / len(x_coords)
-                stats_text = f'Points: {len(x_coords)}\nRange: {x_range:.2f}m\nMean: {x_mean:.2f}m'
-                
-                # Add trend information if available - Design choice --> not significant
-                # if trend_info:
-                #     slope_per_second = trend_info['slope']
-                #     direction = trend_info['direction']
-                    
-                #     # Convert slope to more meaningful units (meters per minute if time span > 60s)
-                #     time_span = trend_info['time_span_seconds']
-                #     if time_span > 60:
-                #         slope_per_minute = slope_per_second * 60
-                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_minute:.3f}m/min'
-                #     else:
-                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_second:.3f}m/s'
-                
-                ax_x.text(0.02, 0.98, stats_text, transform=ax_x.transAxes, fontsize=8,
-                         verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8))
-            
-            return True
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error generating X position graph: {e}")
-            return False
-
-    def _generate_y_position_graph(self, point_store, epc: str, ax_y):
-        """
-        Generates Y position variation graph for ATR7000 readers with smooth curve.
-        
-        Args:
-            point_store: PointDataStore instance with position data
-            epc: EPC string to get position data for
-            ax_y: matplotlib axes to plot on
-            
-        Returns:
-            bool: True if graph was generated, False if no data
-        """
-        try:
-            # Get XY history for this EPC
-            timestamps, x_coords, y_coords = point_store.get_xy_history(epc, all_points=True)
-            
-            if not timestamps or not y_coords or len(timestamps) == 0:
-                # No position data available
-                ax_y.text(0.5, 0.5, 'No Y coordinate data available for this EPC', 
-                          ha='center', va='center', fontsize=11,
-                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
-                ax_y.set_xlim(0, 1)
-                ax_y.set_ylim(0, 1)
-                ax_y.axis('off')
-                return False
-            
-            # Plot Y coordinates
-            ax_y.plot(timestamps, y_coords, 'r-', linewidth=0.5, marker='o', markersize=2, label='Y Coordinate', alpha=0.3)
-            
-            # Calculate and plot trend line - Design choice --> not significant
-            # trend_info = self._calculate_trend_line(timestamps, y_coords)
-            # if trend_info:
-            #     ax_y.plot(trend_info['trend_timestamps'], trend_info['trend_coords'], 
-            #              'darkred', linewidth=2, linestyle='--', label='Y Trend', alpha=0.9)
-            
-            # Calculate and plot smooth curve
-            # Savitzky-Golay Filter
-            smooth_info = self._calculate_smooth_curve_savgol(timestamps, y_coords)
-
-            if smooth_info:
-                ax_y.plot(smooth_info['timestamps'], smooth_info['coordinates'], 
-                         'green', linewidth=2, linestyle='-', label='Y Smooth', alpha=1)
-            
-            ax_y.set_ylabel('Y Coordinate (meters)', fontsize=10)
-            ax_y.set_xlabel('Time', fontsize=10)
-            ax_y.set_title('Y Position Variations Over Time', fontsize=11, fontweight='bold')
-            ax_y.grid(True, alpha=0.3)
-            ax_y.legend(fontsize=9)
-            
-            # Format x-axis with adaptive interval based on timestamps time span
-            ax_y.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-            
-            # Calculate time span to choose appropriate locator (time axis markers)
+    # WEBSOCKET #
+    
+    def _run_iotc_xml_phases(self, setup, username: str, password: str, labels: dict,
+                             steps_completed: list, steps_skipped: list, steps_failed: list) -> bool:
+        """Runs the shared XML setup phases (iotc_setup.PHASES) in order; False at the first failed phase"""
+        from zebra_cli.iotc_setup import PHASES, STATUS_COMPLETED, STATUS_FAILED
+
+        for name in PHASES:
+            label = labels[name]
+            print(f"\n🔍 PHASE {label}")
+            print("-" * 50)
             try:
-                time_span_seconds = (max(timestamps) - min(timestamps)).total_seconds()
-                
-                # Choose appropriate time axis interval based on position data duration
-                if time_span_seconds <= 10:  # ≤ 10 seconds: show every second
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
-                elif time_span_seconds <= 30:  # ≤ 30 seconds: show every 5 seconds
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=5))
-                elif time_span_seconds <= 60:  # ≤ 1 minute: show every 10 seconds
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=10))
-                elif time_span_seconds <= 120:  # ≤ 2 minutes: show every 15 seconds
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
-                elif time_span_seconds <= 300:  # ≤ 5 minutes: show every 30 seconds
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=30))
-                elif time_span_seconds <= 900:  # ≤ 15 minutes: show every minute
-                    ax_y.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
-                elif time_span_seconds <= 3600:  # ≤ 1 hour: show every 5 minutes
-                    ax_y.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
-                else:  # > 1 hour: show every 15 minutes
-                    ax_y.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
-                    
-            except (ValueError, TypeError, AttributeError):
-                # Fallback to data point based approach if timestamp calculation fails
-                if len(timestamps) > 10:
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=max(1, len(timestamps)//8)))
-                else:
-                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
-            
-            plt.setp(ax_y.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
-            ax_y.tick_params(axis='y', labelsize=9)
-            
-            # Set time range
-            if len(timestamps) > 1:
-                time_range = [min(timestamps), max(timestamps)]
-                ax_y.set_xlim(time_range)
-            
-            # Add statistics info box
-            if len(y_coords) > 0:
-                y_range = max(y_coords) - min(y_coords)
-                y_mean = sum(y_coords) / len(y_coords)
-                stats_text = f'Points: {len(y_coords)}\nRange: {y_range:.2f}m\nMean: {y_mean:.2f}m'
-                
-                # Add trend information if available - Design choice --> not significant
-                # if trend_info:
-                #     slope_per_second = trend_info['slope']
-                #     direction = trend_info['direction']
-                    
-                #     # Convert slope to more meaningful units (meters per minute if time span > 60s)
-                #     time_span = trend_info['time_span_seconds']
-                #     if time_span > 60:
-                #         slope_per_minute = slope_per_second * 60
-                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_minute:.3f}m/min'
-                #     else:
-                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_second:.3f}m/s'
-                
-                ax_y.text(0.02, 0.98, stats_text, transform=ax_y.transAxes, fontsize=8,
-                         verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcoral", alpha=0.8))
-            
-            return True
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error generating Y position graph: {e}")
-            return False
-
-    def _is_messages_csv_from_atr(self, csv_file_path: str) -> bool:
-        """
-        Checks if a messages_read CSV file is from an ATR7000 reader or a standard RFID reader.
-        
-        Args:
-            csv_file_path: Full path to the messages_read CSV file
-            
-        Returns:
-            True if the CSV is from an ATR7000 reader, False if from a standard RFID reader
-        """
-        try:           
-            # Validate file exists
-            if not os.path.exists(csv_file_path):
-                if self.debug:
-                    print(f"⚠️  File not found: {csv_file_path}")
-                return False
-            
-            # Check if it's a messages_read CSV file by filename
-            filename = os.path.basename(csv_file_path)
-            if not filename.startswith('messages_read_') or not filename.endswith('.csv'):
-                if self.debug:
-                    print(f"⚠️  Not a messages_read CSV file: {filename}")
+                status, detail = setup.phase(name, username, password)
+            except Exception as e:
+                status, detail = STATUS_FAILED, str(e) or type(e).__name__
+            if status == STATUS_FAILED:
+                print(f"❌ {label} failed: {detail}")
+                steps_failed.append(label)
                 return False
-            
-            atr_indicators = 0
-            standard_rfid_indicators = 0
-            rows_analyzed = 0
-            max_rows_to_analyze = 10  # Analyze first 10 data rows for reliable detection
-            
-            with open(csv_file_path, 'r', encoding='utf-8') as f:
-                csv_reader = csv.DictReader(f)
-                
-                # Check if CSV has expected columns
-                if 'Raw_JSON' not in csv_reader.fieldnames:
-                    if self.debug:
-                        print(f"⚠️  CSV missing Raw_JSON column")
-                    return False
-                
-                for row in csv_reader:
-                    if rows_analyzed >= max_rows_to_analyze:
-                        break
-                    
-                    try:
-                        # Parse the JSON message
-                        raw_json = row.get('Raw_JSON', '')
-                        if not raw_json:
-                            continue
-                            
-                        message_data = json.loads(raw_json)
-                        message_type = message_data.get('type', '')
-                        data_section = message_data.get('data', {})
-                        
-                        # Check for ATR7000 indicators
-                        if message_type in ['DIRECTIONALITY_RAW', 'DIRECTIONALITY']:
-                            atr_indicators += 2  # Strong indicator
-                            
-                        # Check for ATR-specific fields in data section
-                        atr_fields = ['azimuth', 'elevation', 'azimuthConf', 'elevationConf', 'zone', 'zoneName']
-                        for field in atr_fields:
-                            if field in data_section:
-                                atr_indicators += 1
-                        
-                        # Check RSSI field type (ATR uses "rssi", standard uses "peakRssi")
-                        if 'rssi' in data_section and 'peakRssi' not in data_section:
-                            atr_indicators += 1
-                        elif 'peakRssi' in data_section and 'rssi' not in data_section:
-                            standard_rfid_indicators += 1
-                        
-                        # Check for standard RFID indicators
-                        if message_type == 'CUSTOM':
-                            standard_rfid_indicators += 1
-                            
-                        # Check for standard RFID-specific fields
-                        standard_fields = ['CRC', 'PC', 'channel', 'eventNum', 'phase', 'reads']
-                        for field in standard_fields:
-                            if field in data_section:
-                                standard_rfid_indicators += 1
-                        
-                        rows_analyzed += 1
-                        
-                    except (json.JSONDecodeError, KeyError) as e:
-                        if self.debug:
-                            print(f"⚠️  Error parsing JSON in row {rows_analyzed + 1}: {e}")
-                        continue
-            
-            if self.debug:
-                print(f"🔍 Analysis results for {filename}:")
-                print(f"   Rows analyzed: {rows_analyzed}")
-                print(f"   ATR indicators: {atr_indicators}")
-                print(f"   Standard RFID indicators: {standard_rfid_indicators}")
-            
-            # Decision logic: ATR if more ATR indicators than standard RFID indicators
-            is_atr = atr_indicators > standard_rfid_indicators
-            
-            if self.debug:
-                reader_type = "ATR7000" if is_atr else "Standard RFID"
-                print(f"✅ Detected: {reader_type} reader")
-            
-            return is_atr
-            
-        except Exception as e:
-            if self.debug:
-                print(f"❌ Error analyzing CSV file: {e}")
-            return False
-
-    def process_atr7000_message(
-            self,
-            message: str,
-            position_point_record: PointDataStore = None,
-            position_calculator: ATR7000PositionCalculator = ATR7000PositionCalculator()) -> PointDataStore:
-        try:
-            if isinstance(message, dict):
-                data = message
+            if status == STATUS_COMPLETED:
+                steps_completed.append(label)
             else:
-                data = json.loads(message)
+                steps_skipped.append(f"{label} ({detail})")
+        return True
 
-            # Extract timestamp from the JSON message
-            message_timestamp = None
-            timestamp_str = data.get('timestamp', '')
-            if timestamp_str:
-                try:
-                    # Parse ISO 8601 timestamp format: "2025-09-11T10:17:02.227+0000"
-                    # Remove timezone info and parse
-                    timestamp_clean = timestamp_str.replace('+0000', '').replace('Z', '')
-                    message_timestamp = datetime.strptime(timestamp_clean, '%Y-%m-%dT%H:%M:%S.%f')
-                except ValueError:
-                    try:
-                        # Try without microseconds
-                        timestamp_clean = timestamp_str.replace('+0000', '').replace('Z', '')
-                        message_timestamp = datetime.strptime(timestamp_clean, '%Y-%m-%dT%H:%M:%S')
-                    except ValueError:
-                        if hasattr(self, 'debug') and self.debug:
-                            print(f"[DEBUG]⚠️  Could not parse message timestamp: {timestamp_str}")
-                        # Will use datetime.now() as fallback
-
-            # Search for RAW_DIRECTIONALITY or DIRECTIONALITY_RAW messages
-            if data.get('type') in ['RAW_DIRECTIONALITY', 'DIRECTIONALITY_RAW']:
-                # Extract message data
-                msg_data = data.get('data', {})
-                
-                epc = msg_data.get('idHex') or msg_data.get('epc', '') or msg_data.get('EPC', '')
-                azimuth = msg_data.get('azimuth') or msg_data.get('Azimuth')
-                elevation = msg_data.get('elevation') or msg_data.get('Elevation')
-                rssi = msg_data.get('rssi') or msg_data.get('peakRssi') or msg_data.get('RSSI')
-                antenna = msg_data.get('antenna') or msg_data.get('Antenna')
-
-                if azimuth is None:
-                    azimuth = 0.0
-                    if self.debug:
-                        print(f"[DEBUG] Azimuth None set to: 0.0")
-                if elevation is None:
-                    elevation = 0.0
-                    if self.debug:
-                        print(f"[DEBUG] Elevation None set to: 0.0")
-
-                if epc and azimuth is not None and elevation is not None:
-                    # Use extracted timestamp from JSON message or current time as fallback
-                    timestamp_to_use = message_timestamp or datetime.now()
-                    
-                    # Create RAW_DIRECTIONALITY message
-                    raw_message = RawDirectionalityMessage(
-                        epc=epc,
-                        azimuth=float(azimuth),
-                        elevation=float(elevation),
-                        timestamp=timestamp_to_use,
-                        rssi=rssi,
-                        antenna=antenna
-                    )
-                    
-                    # Calculate position
-                    # The position is calculated based on
-                    position = position_calculator.calculate_position(raw_message)
-
-                    # Add to point store
-                    position_point_record.add_position_point(position)
-                else:
-                    print(f"⚠️  Incomplete RAW_DIRECTIONALITY message: {msg_data}")
-
-            # Also handle CUSTOM messages that may contain ATR7000 localization data
-            elif data.get('type') == 'CUSTOM':
-                msg_data = data.get('data', {})
-                epc = msg_data.get('idHex', '')
-                
-                # Look for azimuth/elevation data in CUSTOM messages
-                azimuth = msg_data.get('azimuth')
-                elevation = msg_data.get('elevation')
-                location_x = msg_data.get('x')
-                location_y = msg_data.get('y')
-                
-                # Check if it has localization data
-                if azimuth is not None and elevation is not None:
-                    # Use extracted timestamp from JSON message or current time as fallback
-                    timestamp_to_use = message_timestamp or datetime.now()
-                    
-                    rssi = msg_data.get('peakRssi') or msg_data.get('rssi')
-                    antenna = msg_data.get('antenna')
-                    
-                    # Create RAW_DIRECTIONALITY message
-                    raw_message = RawDirectionalityMessage(
-                        epc=epc,
-                        azimuth=float(azimuth),
-                        elevation=float(elevation),
-                        timestamp=timestamp_to_use,
-                        rssi=rssi,
-                        antenna=antenna
-                    )
-                    
-                    # Calculate position
-                    position = position_calculator.calculate_position(raw_message)
-                    
-                    # Add to point store
-                    position_point_record.add_position_point(position)
-
-                elif location_x is not None and location_y is not None:
-                    # Use extracted timestamp from JSON message or current time as fallback
-                    timestamp_to_use = message_timestamp or datetime.now()
-                    
-                    # Use coordinates directly if available
-                    position = PositionPoint(
-                        epc=epc,
-                        x=float(location_x),
-                        y=float(location_y),
-                        z=0.0,
-                        timestamp=timestamp_to_use,
-                        is_significant=True
-                    )
-
-                    position_point_record.add_position_point(position)
-        
-        except json.JSONDecodeError:
-            # Non-JSON message, silently ignore unless useful
-            print(f"⚠️  Non-JSON message received: {data}")
-        except Exception as e:
-            print(f"⚠️  Error processing ATR7000 message: {e}")
-
-        return position_point_record
-
-    def process_atr7000_messages_csv(self, messages_csv_file_path: str) -> PointDataStore:
-        """
-        Processes all messages in an ATR7000 CSV file and populates a PointDataStore.
-        
-        Args:
-            messages_csv_file_path: Full path to the messages_read CSV file from ATR7000 reader
-            
-        Returns:
-            PointDataStore populated with position points calculated from all messages
-        """
-        try:
-            # Create PointDataStore with specified parameters
-            point_store = PointDataStore(
-                max_series_count=1000,
-                max_points_per_series=10000,
-                max_all_points_per_series=10000000
-            )
-            
-            # Create position calculator
-            # With no parameters given the defaults are --> tag height = 3.0m, reader height = 15.0m
-            position_calculator = ATR7000PositionCalculator()
-            
-            # Validate file exists
-            if not os.path.exists(messages_csv_file_path):
-                print(f"❌ Messages file not found: {messages_csv_file_path}")
-                return point_store
-            
-            # Validate it's a messages CSV file
-            filename = os.path.basename(messages_csv_file_path)
-            if not filename.startswith('messages_read_') or not filename.endswith('.csv'):
-                print(f"❌ Invalid file format. Expected messages_read_*.csv, got: {filename}")
-                return point_store
-            
-            if self.debug:
-                print(f"[DEBUG]📍 Processing ATR7000 messages from: {filename}")
-                print(f"[DEBUG]🔧 PointDataStore limits: {point_store.max_series_count} series, {point_store.max_points_per_series} points/series")
-            
-            messages_processed = 0
-            messages_with_position_data = 0
-            errors_encountered = 0
-            
-            with open(messages_csv_file_path, 'r', encoding='utf-8') as f:
-                csv_reader = csv.DictReader(f)
-                
-                # Validate CSV has expected columns
-                if 'Raw_JSON' not in csv_reader.fieldnames:
-                    print(f"❌ Invalid CSV format. Missing 'Raw_JSON' column")
-                    return point_store
-                
-                if self.debug:
-                    print("[DEBUG]🔄 Processing messages...")
-
-                for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 because row 1 is header
-                    try:
-                        raw_json = row.get('Raw_JSON', '')
-                        if not raw_json:
-                            continue
-                        
-                        # Store initial point count to check if new points were added
-                        initial_point_count = sum(len(points_deque) for points_deque in point_store.all_points_dict.values())
-                        
-                        # Process the message (timestamp will be extracted from JSON message itself)
-                        point_store = self.process_atr7000_message(
-                            message=raw_json,
-                            position_point_record=point_store,
-                            position_calculator=position_calculator
-                        )
-                        
-                        messages_processed += 1
-                        
-                        # Check if new points were added
-                        final_point_count = sum(len(points_deque) for points_deque in point_store.all_points_dict.values())
-                        if final_point_count > initial_point_count:
-                            messages_with_position_data += 1
-                        
-                        # Progress feedback every 50 messages
-                        if messages_processed % 50 == 0 and self.debug:
-                            print(f"[DEBUG]   📊 Processed {messages_processed} messages, {messages_with_position_data} with position data")
-                        
-                    except Exception as e:
-                        errors_encountered += 1
-                        if self.debug:
-                            print(f"[DEBUG]⚠️  Error processing message at row {row_num}: {e}")
-                        
-                        # Don't stop processing for individual message errors
-                        continue
-            
-            # Final summary
-            total_position_points = sum(len(points_deque) for points_deque in point_store.all_points_dict.values())
-            unique_tags = len(point_store.series_dict)
-            
-            if self.debug:
-                print(f"[DEBUG]✅ ATR7000 message processing completed!")
-                print(f"[DEBUG]📊 Summary:")
-                print(f"[DEBUG]   • Total messages processed: {messages_processed}")
-                print(f"[DEBUG]   • Messages with position data: {messages_with_position_data}")
-                print(f"[DEBUG]   • Total position points calculated: {total_position_points}")
-                print(f"[DEBUG]   • Unique tags tracked: {unique_tags}")
-                if errors_encountered > 0:
-                    print(f"[DEBUG]   • Errors encountered: {errors_encountered}")
-
-                if unique_tags > 0:
-                    print(f"[DEBUG]📍 Tag series in PointDataStore:")
-                    for epc, series in point_store.series_dict.items():
-                        point_count = len(point_store.all_points_dict.get(epc, []))
-                        print(f"[DEBUG]   • {epc[:16]}...: {point_count} points")
-            
-            return point_store
-            
-        except Exception as e:
-            print(f"❌ Error processing ATR7000 messages CSV: {e}")
-            if self.debug:                
-                traceback.print_exc()
-            
-            # Return empty PointDataStore on error
-            return PointDataStore(
-                max_series_count=1000,
-                max_points_per_series=10000,
-                max_all_points_per_series=10000000
-            )
-
-    # Not used but kept for eventual future use
-    def _calculate_trend_line(self, timestamps, coordinates):
-        """
-        Calculate linear trend line for position coordinate data.
-        
-        Args:
-            timestamps: List of datetime objects
-            coordinates: List of coordinate values (x or y)
-            
-        Returns:
-            dict: Contains slope, intercept, direction, and trend points, or None if calculation fails
-        """
-        try:            
-            if len(timestamps) < 2 or len(coordinates) < 2:
-                return None
-                
-            # Convert timestamps to numeric seconds since first timestamp
-            first_time = timestamps[0]
-            time_numeric = [(t - first_time).total_seconds() for t in timestamps]
-            
-            # Calculate linear regression (degree=1 for linear trend)
-            coefficients = np.polyfit(time_numeric, coordinates, 1)
-            slope, intercept = coefficients
-            
-            # Calculate trend line endpoints for the time range
-            time_range = [min(time_numeric), max(time_numeric)]
-            trend_coords = [slope * t + intercept for t in time_range]
-            trend_timestamps = [timestamps[0], timestamps[-1]]
-            
-            # Determine trend direction
-            slope_threshold = 0.001  # Threshold for considering trend "stable"
-            if abs(slope) < slope_threshold:
-                direction = "Stable"
-            elif slope > 0:
-                direction = "Increasing"
-            else:
-                direction = "Decreasing"
-            
-            return {
-                'slope': slope,
-                'intercept': intercept,
-                'direction': direction,
-                'trend_timestamps': trend_timestamps,
-                'trend_coords': trend_coords,
-                'time_span_seconds': max(time_numeric)
-            }
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error calculating trend line: {e}")
-            return None
-
-    # SMOOTHING ALGORITHM
-    # We use Savitzky-Golay Filter (savgol), but kept for eventual future use
-    def _calculate_smooth_curve_spline(self, timestamps, coordinates):
-        """
-        Calculate smooth interpolated curve for position coordinate data using cubic splines.
-        
-        Args:
-            timestamps: List of datetime objects
-            coordinates: List of coordinate values (x or y)
-            
-        Returns:
-            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
-        """
-        try:
-            # Import scipy.interpolate for cubic spline
-            try:
-                from scipy.interpolate import make_interp_spline
-            except ImportError:
-                if hasattr(self, 'debug') and self.debug:
-                    print("⚠️  scipy.interpolate not available for cubic spline smoothing")
-                return None
-                    
-            if len(timestamps) < 4 or len(coordinates) < 4:
-                # Need at least 4 points for cubic spline
-                return None
-                
-            # Convert timestamps to numeric seconds since first timestamp
-            first_time = timestamps[0]
-            time_numeric = np.array([(t - first_time).total_seconds() for t in timestamps])
-            coordinates_array = np.array(coordinates)
-            
-            # Create cubic spline interpolator
-            spline = make_interp_spline(time_numeric, coordinates_array, k=3)
-            
-            # Generate more time points for smooth curve visualization (3x density)
-            time_span = max(time_numeric) - min(time_numeric)
-            num_points = max(100, len(timestamps) * 3)  # At least 100 points for smoothness
-            time_smooth = np.linspace(min(time_numeric), max(time_numeric), num_points)
-            
-            # Evaluate spline at smooth time points
-            coords_smooth = spline(time_smooth)
-            
-            # Convert back to datetime objects
-            timestamps_smooth = [first_time + np.timedelta64(int(t * 1000), 'ms') for t in time_smooth]
-            
-            return {
-                'timestamps': timestamps_smooth,
-                'coordinates': coords_smooth.tolist()
-            }
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error calculating smooth curve: {e}")
-            return None
-
-    def _calculate_smooth_curve_savgol(self, timestamps, coordinates):
-        """
-        Calculate smooth curve for position coordinate data using Savitzky-Golay filter.
-        
-        Args:
-            timestamps: List of datetime objects
-            coordinates: List of coordinate values (x or y)
-            
-        Returns:
-            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
-        """
-        try:
-            # Import scipy.signal for Savitzky-Golay filter
-            try:
-                from scipy.signal import savgol_filter
-            except ImportError:
-                if hasattr(self, 'debug') and self.debug:
-                    print("⚠️  scipy.signal not available for Savitzky-Golay smoothing")
-                return None
-                
-            if len(timestamps) < 5 or len(coordinates) < 5:
-                # Need at least 5 points for reasonable Savitzky-Golay filtering
-                return None
-                
-            coordinates_array = np.array(coordinates)
-            
-            # Choose appropriate window length and polynomial order for position data
-            data_length = len(coordinates)
-            
-            # Window length should be odd and much smaller than data length
-            # For position data, we want to preserve features while smoothing noise
-            if data_length >= 15:
-                window_length = 7  # Good balance for most position tracking data
-                polyorder = 3      # Cubic polynomial preserves curvature well
-            elif data_length >= 9:
-                window_length = 5  # Smaller window for limited data
-                polyorder = 2      # Quadratic for simpler curves
-            else:
-                window_length = data_length if data_length % 2 == 1 else data_length - 1
-                polyorder = min(2, window_length - 1)
-            
-            # Ensure window_length is odd and >= polyorder + 1
-            if window_length % 2 == 0:
-                window_length += 1
-            if window_length > data_length:
-                window_length = data_length if data_length % 2 == 1 else data_length - 1
-            if polyorder >= window_length:
-                polyorder = window_length - 1
-                
-            # Apply Savitzky-Golay filter for smoothing
-            # Use 'nearest' mode for boundary handling to avoid edge artifacts
-            coords_smooth = savgol_filter(coordinates_array, 
-                                        window_length=window_length, 
-                                        polyorder=polyorder,
-                                        mode='nearest')
-            
-            return {
-                'timestamps': timestamps.copy(),  # Same timestamps as input
-                'coordinates': coords_smooth.tolist()
-            }
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error calculating Savitzky-Golay smooth curve: {e}")
-            return None
-
-    def _calculate_smooth_curve_gaussian(self, timestamps, coordinates):
-        """
-        Calculate smooth curve for position coordinate data using Gaussian filter.
-        
-        Args:
-            timestamps: List of datetime objects
-            coordinates: List of coordinate values (x or y)
-            
-        Returns:
-            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
-        """
-        try:
-            # Import scipy.ndimage for Gaussian filtering
-            try:
-                from scipy.ndimage import gaussian_filter1d
-            except ImportError:
-                if hasattr(self, 'debug') and self.debug:
-                    print("⚠️  scipy.ndimage not available for Gaussian smoothing")
-                return None
-                
-            if len(timestamps) < 3 or len(coordinates) < 3:
-                # Need at least 3 points for Gaussian filtering
-                return None
-                
-            coordinates_array = np.array(coordinates)
-            
-            # Choose appropriate sigma based on data length
-            # Sigma controls the amount of smoothing - larger values = more smoothing
-            data_length = len(coordinates)
-            
-            if data_length >= 20:
-                sigma = 2.0  # Moderate smoothing for larger datasets
-            elif data_length >= 10:
-                sigma = 1.5  # Lighter smoothing for medium datasets
-            else:
-                sigma = 1.0  # Minimal smoothing for small datasets
-            
-            # Apply Gaussian filter for smoothing
-            # Use 'reflect' mode for boundary handling to avoid edge artifacts
-            coords_smooth = gaussian_filter1d(coordinates_array, 
-                                            sigma=sigma,
-                                            mode='reflect')
-            
-            return {
-                'timestamps': timestamps.copy(),  # Same timestamps as input
-                'coordinates': coords_smooth.tolist()
-            }
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error calculating Gaussian smooth curve: {e}")
-            return None
-
-    def _calculate_smooth_curve_ema(self, timestamps, coordinates):
-        """
-        Calculate smooth curve for position coordinate data using Exponential Moving Average.
-        
-        Args:
-            timestamps: List of datetime objects
-            coordinates: List of coordinate values (x or y)
-            
-        Returns:
-            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
-        """
-        try:
-            if len(timestamps) < 2 or len(coordinates) < 2:
-                # Need at least 2 points for EMA
-                return None
-                
-            coordinates_array = np.array(coordinates)
-            
-            # Choose appropriate alpha (smoothing factor) based on data length
-            # Alpha determines responsiveness: higher alpha = less smoothing, lower alpha = more smoothing
-            data_length = len(coordinates)
-            
-            if data_length >= 20:
-                alpha = 0.3  # More smoothing for larger datasets
-            elif data_length >= 10:
-                alpha = 0.4  # Moderate smoothing for medium datasets
-            else:
-                alpha = 0.5  # Less smoothing for small datasets to preserve detail
-            
-            # Calculate Exponential Moving Average
-            coords_smooth = np.zeros_like(coordinates_array)
-            coords_smooth[0] = coordinates_array[0]  # First value unchanged
-            
-            for i in range(1, len(coordinates_array)):
-                coords_smooth[i] = alpha * coordinates_array[i] + (1 - alpha) * coords_smooth[i - 1]
-            
-            return {
-                'timestamps': timestamps.copy(),  # Same timestamps as input
-                'coordinates': coords_smooth.tolist()
-            }
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error calculating EMA smooth curve: {e}")
-            return None
-
-    def _calculate_smooth_curve_polynomial(self, timestamps, coordinates):
-        """
-        Calculate smooth curve for position coordinate data using Polynomial Regression.
-        
-        Args:
-            timestamps: List of datetime objects
-            coordinates: List of coordinate values (x or y)
-            
-        Returns:
-            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
-        """
-        try:
-            if len(timestamps) < 3 or len(coordinates) < 3:
-                # Need at least 3 points for polynomial fitting
-                return None
-                
-            # Convert timestamps to numeric seconds since first timestamp
-            first_time = timestamps[0]
-            time_numeric = np.array([(t - first_time).total_seconds() for t in timestamps])
-            coordinates_array = np.array(coordinates)
-            
-            # Choose appropriate polynomial degree based on data length
-            data_length = len(coordinates)
-            
-            if data_length >= 20:
-                degree = min(5, data_length - 1)  # Higher order for complex curves, but not too high
-            elif data_length >= 10:
-                degree = min(3, data_length - 1)  # Cubic for moderate complexity
-            elif data_length >= 6:
-                degree = min(2, data_length - 1)  # Quadratic for simple curves
-            else:
-                degree = 1  # Linear for very small datasets
-            
-            # Fit polynomial to the data
-            try:
-                coefficients = np.polyfit(time_numeric, coordinates_array, degree)
-            except np.RankWarning:
-                # Fallback to lower degree if rank warning occurs
-                degree = max(1, degree - 1)
-                coefficients = np.polyfit(time_numeric, coordinates_array, degree)
-            
-            # Generate more time points for smooth curve visualization (2x density)
-            time_span = max(time_numeric) - min(time_numeric)
-            num_points = max(50, len(timestamps) * 2)  # At least 50 points for smoothness
-            time_smooth = np.linspace(min(time_numeric), max(time_numeric), num_points)
-            
-            # Evaluate polynomial at smooth time points
-            coords_smooth = np.polyval(coefficients, time_smooth)
-            
-            # Convert back to datetime objects
-            timestamps_smooth = [first_time + np.timedelta64(int(t * 1000), 'ms') for t in time_smooth]
-            
-            return {
-                'timestamps': timestamps_smooth,
-                'coordinates': coords_smooth.tolist()
-            }
-            
-        except Exception as e:
-            if hasattr(self, 'debug') and self.debug:
-                print(f"⚠️  Error calculating polynomial smooth curve: {e}")
-            return None
-
-    # WEBSOCKET #
-    
     def handle_iotc_setup_ws(self):
         """Handles intelligent IOTC setup - analyzes status and executes only necessary steps"""
-        if not IOTC_AVAILABLE:
+        if _load_iotc_client() is None:
             print("\n❌ IOTC modules not available!")
             input("⏸️  Press ENTER to continue...")
             return
@@ -2889,12 +1776,10 @@ Tag Statistics:
         steps_completed = []
         steps_skipped = []
         steps_failed = []
-        session_id = None
+        client = None
 
         try:
-            # PHASE 0: Preliminary Reader Enrollment Check, IOTC client creation and authentication
-            print("\n🔍 PHASE 0: Preliminary Reader Enrollment Check")
-            print("-" * 50)
+            from zebra_cli.iotc_setup import XmlIotcSetup
 
             # Create IOTC client
             if self.app_context.protocol:
@@ -2910,179 +1795,19 @@ Tag Statistics:
                 username = input("Username: ").strip()
                 password = getpass.getpass("Password: ").strip()
 
-            # Try login to obtain session_id
-            try:
-                session_id = client.xml_login(username, password)
-                if not session_id:
-                    raise Exception("Login returned None") 
-                print(f"✅ Login successful - Session ID: {session_id[:20]}...")
-            except Exception as e:
-                print(f"❌ Login failed: {e}")
-                steps_failed.append("0. Authentication")
+            setup = XmlIotcSetup(client, 'ws', is_atr7000=self.app_context.is_atr7000)
+            labels = {
+                'login': "0. Authentication",
+                'state': "1. Provisioning State Check",
+                'endpoint': "2. WebSocket Endpoint Creation",
+                'mapping': "3. WebSocket Endpoint Mapping",
+                'enrollment': "4. Reader Enrollment",
+                'activation': "5. IOTC Service Activation"
+            }
+            if not self._run_iotc_xml_phases(setup, username, password, labels,
+                                             steps_completed, steps_skipped, steps_failed):
                 return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
 
-            # Now check enrollment
-            print("🔍 Checking current enrollment status...")
-
-            is_enrolled = client.is_reader_enrolled(session_id)
-
-            if is_enrolled:
-                print("✅ Reader already enrolled in IOTC")
-                steps_skipped.append("1. Reader Enrollment (already done)")
-            else:
-                print("⚠️  Reader not enrolled - will enroll later in sequence")
-
-            # PHASE 1: Check if WebSocket Endpoint exists, if not we will create it
-            print("\n🔍 PHASE 1: WebSocket Endpoint Configuration Check")
-            print("-" * 50)
-
-            wsep_exists = client.is_wsep_added(session_id)
-
-            if wsep_exists:
-                print("✅ WebSocket Endpoint already exists")
-                steps_skipped.append("2. WebSocket Endpoint Creation (already exists)")
-            else:
-                print("📝 Creating WebSocket Endpoint...")
-                wsep_added = client.add_wsep(session_id)
-                if wsep_added:
-                    print("✅ WebSocket Endpoint created successfully")
-                    steps_completed.append("2. WebSocket Endpoint Creation")
-                else:
-                    print("❌ Failed to create WebSocket Endpoint")
-                    steps_failed.append("2. WebSocket Endpoint Creation")
-                    return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-
-            # Check if WebSocket endpoint is already mapped
-            wsep_mapped = client.is_wsep_mapped(session_id)
-
-            if wsep_mapped:
-                print("✅ WebSocket Endpoint already mapped to reader")
-                steps_skipped.append("3. WebSocket Endpoint Mapping (already done)")
-            else:
-                print("🔗 Mapping WebSocket Endpoint to reader...")
-                # If not already mapped, Map WebSocket endpoint
-                mapping_result = client.map_wsep(session_id)
-                if mapping_result:
-                    print("✅ WebSocket Endpoint mapped successfully")
-                    steps_completed.append("3. WebSocket Endpoint Mapping")
-                else:
-                    print("❌ Failed to map WebSocket Endpoint")
-                    steps_failed.append("3. WebSocket Endpoint Mapping")
-                    return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-
-            # PHASE 2: Re-check enrollment and enroll if needed using the same client
-            print("\n🔍 PHASE 2: Reader Enrollment Check (if needed)")
-            print("-" * 50)
-
-            if not is_enrolled:
-                print("📝 Enrolling reader in IOTC...")
-                # We need to check if it exists
-                try:
-                    enroll_result = client.enroll_reader(session_id)
-                    if enroll_result:
-                        print("✅ Reader enrolled successfully")
-                        steps_completed.append("4. Reader Enrollment")
-                    else:
-                        print("❌ Failed to enroll reader")
-                        steps_failed.append("4. Reader Enrollment")
-                        return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-                except ImportError:                    
-                    print("❌ Failed to enroll reader. error while enrolling")
-                    steps_failed.append("4. Reader Enrollment")
-                    return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-
-            # PHASE 3: Check if there were errors in endpoint configuration steps and print result
-            print("\n🔍 PHASE 3: IOTC Connection Status Check")
-            print("-" * 50)
-            print("\n🔍 Checking endpoint configuration completion...")
-            
-            if steps_failed:
-                print(f"❌ STEPS FAILED - {len(steps_failed)} endpoint configuration step(s) failed:")
-                for failed_step in steps_failed:
-                    print(f"   • {failed_step}")
-                print("💡 Resolve configuration issues before continuing")
-                return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-            
-            print("✅ Endpoint configuration completed successfully!")
-            print("🎯 All endpoints are ready for IOTC connection")
-
-            # PHASE 4: IOTC Connection
-            print("\n🌐 PHASE 4: IoT Connector Service Activation")
-            print("-" * 50)
-            print("💡 NOW that all endpoints are configured, we can activate the service")
-            
-            # Disconnect from previous IOTC connection to reconnect to the correct one            
-            print("⏳ Disconnecting from IOTC service")
-            result = client.disconnect_iotc(session_id)
-            
-            if result:
-                print("✅ Successfully disconnected from IOTC!")
-                print("🔌 Reader is now disconnected from IoT Connector")
-            else:
-                print("❌ Failed to disconnect from IOTC")
-                print("💡 Check reader configuration and try again")
-            
-            # Verify IOTC disconnection with reader-specific timing
-            max_attempts = 6 if self.app_context.is_atr7000 else 5
-            check_interval = 30 if self.app_context.is_atr7000 else 10
-            reader_type = "ATR7000" if self.app_context.is_atr7000 else "non-ATR7000"
-            
-            print(f"🔍 Verifying {reader_type} disconnection from IOTC...")
-            print(f"⏳ Will check up to {max_attempts} times with {check_interval}s intervals")
-            
-            current_connection_status = None
-            for attempt in range(1, max_attempts + 1):
-                current_connection_status = client.is_iotc_connected(session_id)
-                
-                if not current_connection_status:
-                    print(f"✅ {reader_type} successfully disconnected from IOTC (attempt {attempt}/{max_attempts})")
-                    break
-                
-                print(f"ℹ️  Attempt {attempt}/{max_attempts}: {reader_type} still connected to IOTC")
-                
-                if attempt < max_attempts:  # Don't sleep after the last attempt
-                    print(f"⏳ Waiting {check_interval} seconds before next check...")
-                    time.sleep(check_interval)
-            
-            # Final status assessment
-            if current_connection_status:
-                print(f"⚠️  {reader_type} still connected to IOTC after {max_attempts} attempts. Proceeding anyway.")
-                print("💡 IOTC service may need additional time to complete disconnection")
-            else:
-                print(f"🎯 Disconnection verification completed successfully for {reader_type}")
-
-            if current_connection_status:
-                steps_skipped.append("5. IOTC Service Activation")
-            else:
-                print("🚀 Activating IoT Connector...")
-
-                connect_result = client.connect_iotc(session_id)
-                
-                if connect_result:
-                    print("✅ IoT Connector service activated successfully!")
-                    steps_completed.append("5. IOTC Service Activation")
-                else:
-                    # Check for specific error: already connected
-                    last_error = getattr(client, 'last_error', None)
-                    error_str = str(last_error).lower() if last_error else ''
-                    exc_type, exc_value, _ = sys.exc_info()
-                    exc_str = str(exc_value).lower() if exc_value else ''
-                    
-                    if (
-                        'already connected to cloud' in error_str or
-                        '65535' in error_str or
-                        'already connected to cloud' in exc_str or
-                        '65535' in exc_str or
-                        (last_error and hasattr(last_error, 'code') and str(getattr(last_error, 'code', '')).strip() == '65535')
-                    ):
-                        print("✅ Service already activated")
-                        steps_skipped.append("5. IOTC Service Activation")
-                    else:
-                        print(f"❌ Failure during IoT Connector activation")
-                        print(f"   Error: {last_error if last_error else exc_value}")
-                        steps_failed.append("5. IOTC Service Activation")
-                        return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-
             # Extended stabilization time for IOTC service to reconnect from previous step
             # This might not be needed if reader is fast enough to connect to IOTC but added for safety
             if self.app_context.is_atr7000:
@@ -3231,12 +1956,15 @@ Tag Statistics:
             print(f"❌ Error during WebSocket endpoint setup: {e}")
             steps_failed.append(f"Setup process (Error: {str(e)})")
             self._show_setup_results(steps_completed, steps_skipped, steps_failed)
+        finally:
+            if client:
+                client.close()
 
     # MQTT #
 
     def handle_iotc_setup_mqtt(self, host_name: str, reader_name: str, endpoint_name: str):
         """Handles MQTT-specific IOTC setup with provided parameters"""
-        if not IOTC_AVAILABLE:
+        if _load_iotc_client() is None:
             print("\n❌ IOTC modules not available!")
             input("⏸️  Press ENTER to continue...")
             return
@@ -3276,12 +2004,10 @@ Tag Statistics:
         steps_completed = []
         steps_skipped = []
         steps_failed = []
-        session_id = None
+        client = None
 
         try:
-            # PHASE 0: Preliminary Reader Enrollment Check, IOTC client creation and authentication
-            print("\n🔍 PHASE 0: Preliminary Reader Enrollment Check")
-            print("-" * 50)
+            from zebra_cli.iotc_setup import XmlIotcSetup
 
             # Create IOTC client
             if self.app_context.protocol:
@@ -3297,188 +2023,21 @@ Tag Statistics:
                 username = input("Username: ").strip()
                 password = getpass.getpass("Password: ").strip()
 
-            # Try login to obtain session_id
-            try:
-                session_id = client.xml_login(username, password)
-                if not session_id:
-                    raise Exception("Login returned None") 
-                print(f"✅ Login successful - Session ID: {session_id[:20]}...")
-            except Exception as e:
-                print(f"❌ Login failed: {e}")
-                steps_failed.append("0. Authentication")
+            print(f"💡 MQTT endpoint '{endpoint_name}' on broker {host_name}, reader name {reader_name}")
+            setup = XmlIotcSetup(client, 'mqtt', is_atr7000=self.app_context.is_atr7000, host_name=host_name,
+                                 reader_name=reader_name, endpoint_name=endpoint_name)
+            labels = {
+                'login': "0. Authentication",
+                'state': "1. Provisioning State Check",
+                'endpoint': "2. MQTT Endpoint Creation",
+                'mapping': "3. MQTT Endpoint Mapping",
+                'enrollment': "4. Reader Enrollment",
+                'activation': "5. IOTC Service Activation"
+            }
+            if not self._run_iotc_xml_phases(setup, username, password, labels,
+                                             steps_completed, steps_skipped, steps_failed):
                 return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
 
-            # Now check enrollment
-            print("🔍 Checking current enrollment status...")
-
-            is_enrolled = client.is_reader_enrolled(session_id)
-
-            if is_enrolled:
-                print("✅ Reader already enrolled in IOTC")
-                steps_skipped.append("1. Reader Enrollment")
-            else:
-                print("📋 Reader not yet enrolled")
-                print("💡 Reader will be enrolled to IOTC during setup")
-                steps_completed.append("1. Reader Enrollment Status Check")
-
-            # PHASE 1: Check if MQTT Endpoint with same name exists, if not we will create it
-            print("\n🔗 PHASE 1: MQTT Endpoint Configuration")
-            print("-" * 50)
-            print(f"💡 Setting up MQTT endpoint with broker: {host_name}")
-            print(f"💡 Reader name: {reader_name}")
-            print(f"💡 Endpoint name: {endpoint_name}")
-
-            # Check if MQTT endpoint already exists
-            mqtt_exists = client.is_mqttep_added(session_id, endpoint_name)
-            
-            if mqtt_exists:
-                print(f"✅ MQTT endpoint with name '{endpoint_name}' already exists")
-                steps_skipped.append("2. MQTT Endpoint Creation")
-            else:
-                print(f"📋 MQTT endpoint with name '{endpoint_name}' does not exist")
-                print(f"🚀 Creating MQTT endpoint...")
-                
-                # Create the MQTT endpoint
-                mqtt_created = client.add_mqttep(session_id, reader_name, host_name, endpoint_name)
-                
-                if mqtt_created:
-                    print(f"✅ MQTT endpoint '{endpoint_name}' created successfully!")
-                    steps_completed.append("2. MQTT Endpoint Creation")
-                else:
-                    print(f"❌ Failed to create MQTT endpoint '{endpoint_name}'")
-                    steps_failed.append("2. MQTT Endpoint Creation")
-                    return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-
-            # Check if MQTT endpoint is mapped to data interface
-            mqtt_mapped = client.is_mqttep_mapped(session_id, endpoint_name)
-            
-            if mqtt_mapped:
-                print(f"✅ MQTT endpoint '{endpoint_name}' already mapped to data interface")
-                steps_skipped.append("3. MQTT Endpoint Mapping")
-            else:
-                print(f"📋 MQTT endpoint '{endpoint_name}' not yet mapped")
-                print(f"🚀 Mapping MQTT endpoint to data interface...")
-                
-                # If not already mapped, Map the MQTT endpoint
-                mqtt_map_result = client.map_mqttep(session_id, endpoint_name)
-                
-                if mqtt_map_result:
-                    print(f"✅ MQTT endpoint '{endpoint_name}' mapped successfully!")
-                    steps_completed.append("3. MQTT Endpoint Mapping")
-                else:
-                    print(f"❌ Failed to map MQTT endpoint '{endpoint_name}'")
-                    steps_failed.append("3. MQTT Endpoint Mapping")
-                    return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-
-            # PHASE 2: Re-check enrollment and enroll if needed using the same client
-            print("\n🔍 PHASE 2: Reader Enrollment Check (if needed)")
-            print("-" * 50)
-
-            if not is_enrolled:
-                print("📝 Enrolling reader in IOTC...")
-                # We need to check if it exists
-                try:
-                    enroll_result = client.enroll_reader(session_id)
-                    if enroll_result:
-                        print("✅ Reader enrolled successfully")
-                        steps_completed.append("6. Reader Enrollment")
-                    else:
-                        print("❌ Failed to enroll reader")
-                        steps_failed.append("6. Reader Enrollment")
-                        return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-                except ImportError:                    
-                    print("❌ Failed to enroll reader. error while enrolling")
-                    steps_failed.append("6. Reader Enrollment")
-                    return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-            else:
-                steps_skipped.append("4. Reader Enrollment (already enrolled)")
-
-            # PHASE 3: IOTC Connection
-            print("\n🌐 PHASE 3: IoT Connector Service Activation")
-            print("-" * 50)
-            print("💡 NOW that MQTT endpoint is configured, we can activate the service")
-            
-            # Disconnect from previous IOTC connection to reconnect to the correct one
-            print("⏳ Disconnecting from IOTC service")    
-            result = client.disconnect_iotc(session_id)
-            
-            if result:
-                print("✅ Successfully disconnected from IOTC!")
-                print("🔌 Reader is now disconnected from IoT Connector")
-            else:
-                print("❌ Failed to disconnect from IOTC")
-                print("💡 Check reader configuration and try again")
-  
-            # Verify IOTC disconnection with reader-specific timing
-            max_attempts = 6 if self.app_context.is_atr7000 else 5
-            check_interval = 30 if self.app_context.is_atr7000 else 10
-            reader_type = "ATR7000" if self.app_context.is_atr7000 else "non-ATR7000"
-            
-            print(f"🔍 Verifying {reader_type} disconnection from IOTC...")
-            print(f"⏳ Will check up to {max_attempts} times with {check_interval}s intervals")
-            
-            current_connection_status = None
-            for attempt in range(1, max_attempts + 1):
-                current_connection_status = client.is_iotc_connected(session_id)
-                
-                if not current_connection_status:
-                    print(f"✅ {reader_type} successfully disconnected from IOTC (attempt {attempt}/{max_attempts})")
-                    break
-                
-                print(f"ℹ️  Attempt {attempt}/{max_attempts}: {reader_type} still connected to IOTC")
-                
-                if attempt < max_attempts:  # Don't sleep after the last attempt
-                    print(f"⏳ Waiting {check_interval} seconds before next check...")
-                    time.sleep(check_interval)
-
-            # Final status assessment
-            if current_connection_status:
-                print(f"⚠️  {reader_type} still connected to IOTC after {max_attempts} attempts. Proceeding anyway.")
-                print("💡 IOTC service may need additional time to complete disconnection")
-            else:
-                print(f"🎯 Disconnection verification completed successfully for {reader_type}")
-
-            if current_connection_status:
-                print("✅ IOTC already connected")
-                print("💡 The IoT Connector is already active")
-                steps_skipped.append("5. IOTC Connection Status")
-            else:
-                print("📋 IOTC not yet connected")
-                print("💡 IoT Connector service will be activated after the MQTT setup")
-                steps_completed.append("5. IOTC Connection Status Check")
-
-            if current_connection_status:
-                steps_skipped.append("6. IOTC Service Activation")
-            else:
-                print("🚀 Activating IoT Connector...")
-                
-                connect_result = client.connect_iotc(session_id)
-                
-                if connect_result:
-                    print("✅ IoT Connector service activated successfully!")
-                    steps_completed.append("6. IOTC Service Activation")
-                else:
-                    # Check for specific error: already connected
-                    last_error = getattr(client, 'last_error', None)
-                    error_str = str(last_error).lower() if last_error else ''
-                    exc_type, exc_value, _ = sys.exc_info()
-                    exc_str = str(exc_value).lower() if exc_value else ''
-                    
-                    if (
-                        'already connected to cloud' in error_str or
-                        '65535' in error_str or
-                        'already connected to cloud' in exc_str or
-                        '65535' in exc_str or
-                        (last_error and hasattr(last_error, 'code') and str(getattr(last_error, 'code', '')).strip() == '65535')
-                    ):
-                        print("✅ Service already activated")
-                        steps_skipped.append("6. IOTC Service Activation")
-                    else:
-                        print(f"❌ Failure during IoT Connector activation")
-                        print(f"   Error: {last_error if last_error else exc_value}")
-                        steps_failed.append("6. IOTC Service Activation")
-                        return self._show_setup_results(steps_completed, steps_skipped, steps_failed)
-            
             # Extended stabilization time for IOTC service to reconnect from previous step
             # This might not be needed if reader is fast enough to connect to IOTC but added for safety
             if self.app_context.is_atr7000:
@@ -3514,11 +2073,17 @@ Tag Statistics:
             print(f"❌ Error during MQTT IOTC setup: {e}")
             steps_failed.append(f"MQTT Setup process (Error: {str(e)})")
             self._show_setup_results(steps_completed, steps_skipped, steps_failed)
+        finally:
+            if client:
+                client.close()
 
     # FXR90 IOTC SETUP #
 
     def _execute_iotc_fxr90_setup(self, ip: str, token: Optional[str], host_name: Optional[str] = None, reader_name: Optional[str] = None, endpoint_name: Optional[str] = None):
         """Executes FXR90-specific setup by configuring WebSocket endpoint"""
+        import requests
+        import urllib3
+        from zebra_cli.iotc_client import build_fxr90_endpoint_config
         
         # Suppress SSL warnings for FXR90 self-signed certificates
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -3567,274 +2132,11 @@ Tag Statistics:
 
                 if mqtt_setup:
                     print("➕ Adding MQTT connections...")
-                    
-                    # Create complete MQTT endpoint configuration structure
-
-                    # Data event connection for tag events
-                    data_event_connection = {
-                        "additionalOptions": {
-                            "batching": None,
-                            "retention": {
-                                "maxEventRetentionTimeInMin": 500,
-                                "maxNumEvents": 150000,
-                                "throttle": 100
-                            }
-                        },
-                        "description": "MQTT Endpoint set via CLI",
-                        "name": endpoint_name,
-                        "options": {
-                            "additional": {
-                                "cleanSession": True,
-                                "clientId": reader_name,
-                                "debug": False,
-                                "keepAlive": 60,
-                                "qos": 0,
-                                "reconnectDelay": 1,
-                                "reconnectDelayMax": 5
-                            },
-                            "basicAuthentication": {
-                                "password": "admin",
-                                "username": "admin"
-                            },
-                            "enableSecurity": False,
-                            "endpoint": {
-                                "hostName": host_name,
-                                "port": 1883,
-                                "protocol": "tcp"
-                            },
-                            "publishTopic": [
-                                f"tevents/{reader_name}"
-                            ],
-                            "subscribeTopic": []
-                        },
-                        "type": "mqtt"
-                    }
-                    
-                    # Control command response connection
-                    control_connection = {
-                        "additionalOptions": {
-                            "batching": None,
-                            "retention": {
-                                "maxEventRetentionTimeInMin": 500,
-                                "maxNumEvents": 150000,
-                                "throttle": 100
-                            }
-                        },
-                        "description": "MQTT Endpoint set via CLI",
-                        "name": endpoint_name,
-                        "options": {
-                            "additional": {
-                                "cleanSession": True,
-                                "clientId": reader_name,
-                                "debug": False,
-                                "keepAlive": 60,
-                                "qos": 0,
-                                "reconnectDelay": 1,
-                                "reconnectDelayMax": 5
-                            },
-                            "basicAuthentication": {
-                                "password": "admin",
-                                "username": "admin"
-                            },
-                            "enableSecurity": False,
-                            "endpoint": {
-                                "hostName": host_name,
-                                "port": 1883,
-                                "protocol": "tcp"
-                            },
-                            "publishTopic": [
-                                f"crsp/{reader_name}"
-                            ],
-                            "subscribeTopic": [
-                                f"ccmds/{reader_name}"
-                            ]
-                        },
-                        "type": "mqtt"
-                    }
-                    
-                    # Management connections
-                    mgmt_response_connection = {
-                        "additionalOptions": {
-                            "batching": None,
-                            "retention": {
-                                "maxEventRetentionTimeInMin": 500,
-                                "maxNumEvents": 150000,
-                                "throttle": 100
-                            }
-                        },
-                        "description": "MQTT Endpoint set via CLI",
-                        "name": endpoint_name,
-                        "options": {
-                            "additional": {
-                                "cleanSession": True,
-                                "clientId": reader_name,
-                                "debug": False,
-                                "keepAlive": 60,
-                                "qos": 0,
-                                "reconnectDelay": 1,
-                                "reconnectDelayMax": 5
-                            },
-                            "basicAuthentication": {
-                                "password": "admin",
-                                "username": "admin"
-                            },
-                            "enableSecurity": False,
-                            "endpoint": {
-                                "hostName": host_name,
-                                "port": 1883,
-                                "protocol": "tcp"
-                            },
-                            "publishTopic": [
-                                f"mrsp/{reader_name}"
-                            ],
-                            "subscribeTopic": [
-                                f"mcmds/{reader_name}"
-                            ]
-                        },
-                        "type": "mqtt"
-                    }
-
-                    # Management event connection
-                    mgmt_event_connection = {
-                        "additionalOptions": {
-                            "batching": None,
-                            "retention": {
-                                "maxEventRetentionTimeInMin": 500,
-                                "maxNumEvents": 150000,
-                                "throttle": 100
-                            }
-                        },
-                        "description": "MQTT Endpoint set via CLI",
-                        "name": endpoint_name,
-                        "options": {
-                            "additional": {
-                                "cleanSession": True,
-                                "clientId": reader_name,
-                                "debug": False,
-                                "keepAlive": 60,
-                                "qos": 0,
-                                "reconnectDelay": 1,
-                                "reconnectDelayMax": 5
-                            },
-                            "basicAuthentication": {
-                                "password": "admin",
-                                "username": "admin"
-                            },
-                            "enableSecurity": False,
-                            "endpoint": {
-                                "hostName": host_name,
-                                "port": 1883,
-                                "protocol": "tcp"
-                            },
-                            "publishTopic": [
-                                f"mevents/{reader_name}"
-                            ],
-                            "subscribeTopic": []
-                        },
-                        "type": "mqtt"
-                    }
-
-                    # Ensure all required structures exist and populate them
-                    if "data" not in endpoint_config:
-                        endpoint_config["data"] = {}
-                    if "event" not in endpoint_config["data"]:
-                        endpoint_config["data"]["event"] = {}
-                    if "connections" not in endpoint_config["data"]["event"]:
-                        endpoint_config["data"]["event"]["connections"] = []
-                    if "batching" not in endpoint_config["data"]:
-                        endpoint_config["data"]["batching"] = {}
-                    if "retention" not in endpoint_config["data"]:
-                        endpoint_config["data"]["retention"] = {}
-                    
-                    if "control" not in endpoint_config:
-                        endpoint_config["control"] = {}
-                    if "commandResponse" not in endpoint_config["control"]:
-                        endpoint_config["control"]["commandResponse"] = {}
-                    if "connections" not in endpoint_config["control"]["commandResponse"]:
-                        endpoint_config["control"]["commandResponse"]["connections"] = []
-                    
-                    if "management" not in endpoint_config:
-                        endpoint_config["management"] = {}
-                    if "commandResponse" not in endpoint_config["management"]:
-                        endpoint_config["management"]["commandResponse"] = {}
-                    if "connections" not in endpoint_config["management"]["commandResponse"]:
-                        endpoint_config["management"]["commandResponse"]["connections"] = []
-                    if "event" not in endpoint_config["management"]:
-                        endpoint_config["management"]["event"] = {}
-                    if "connections" not in endpoint_config["management"]["event"]:
-                        endpoint_config["management"]["event"]["connections"] = []
-
-                    # Set all MQTT connections
-                    endpoint_config["data"]["event"]["connections"] = [data_event_connection]
-                    endpoint_config["control"]["commandResponse"]["connections"] = [control_connection]
-                    endpoint_config["management"]["commandResponse"]["connections"] = [mgmt_response_connection]
-                    endpoint_config["management"]["event"]["connections"] = [mgmt_event_connection]
-                    
-                    # Add data-level batching and retention sections
-                    endpoint_config["data"]["batching"] = {
-                        "maxPayloadSizePerReport": 0,
-                        "reportingInterval": 0
-                    }
-                    
-                    endpoint_config["data"]["retention"] = {
-                        "maxEventRetentionTimeInMin": 0,
-                        "maxNumEvents": 0,
-                        "throttle": 1
-                    }
-                    
+                    endpoint_config = build_fxr90_endpoint_config(endpoint_config, host_name, reader_name, endpoint_name)
                     print(f"✅ MQTT connections added:")
                 else:
                     print("➕ Adding WebSocket connection...")
-                    # Add WebSocket connection to data.event.connections
-                    websocket_connection = {
-                        "additionalOptions": {
-                            "batching": {
-                                "maxPayloadSizePerReport": 0,
-                                "reportingInterval": 0
-                            },
-                            "retention": {
-                                "maxEventRetentionTimeInMin": 500,
-                                "maxNumEvents": 150000,
-                                "throttle": 100
-                            }
-                        },
-                        "description": "WebSocket endpoint set via CLI",
-                        "name": "WS",
-                        "type": "WEBSOCKET",
-                        "options": {
-                            "security": {
-                                "verifyPeer": False
-                            }
-                        }
-                    }
-                    
-                    # Ensure the data.event.connections structure exists
-                    if "data" not in endpoint_config:
-                        endpoint_config["data"] = {}
-                    if "event" not in endpoint_config["data"]:
-                        endpoint_config["data"]["event"] = {}
-                    if "connections" not in endpoint_config["data"]["event"]:
-                        endpoint_config["data"]["event"]["connections"] = []
-                    if "batching" not in endpoint_config["data"]:
-                        endpoint_config["data"]["batching"] = {}
-                    if "retention" not in endpoint_config["data"]:
-                        endpoint_config["data"]["retention"] = {}
-
-                    # Add the WebSocket connection
-                    endpoint_config["data"]["event"]["connections"] = [websocket_connection]
-
-                    # Add data-level batching and retention sections
-                    endpoint_config["data"]["batching"] = {
-                        "maxPayloadSizePerReport": 0,
-                        "reportingInterval": 0
-                    }
-                    
-                    endpoint_config["data"]["retention"] = {
-                        "maxEventRetentionTimeInMin": 0,
-                        "maxNumEvents": 0,
-                        "throttle": 1
-                    }
-
+                    endpoint_config = build_fxr90_endpoint_config(endpoint_config)
                     print("✅ WebSocket connection added")
             else:
                 print("❌ No endpoint configuration found")
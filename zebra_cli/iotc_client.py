@@ -1,10 +1,19 @@
 import sys
+import time
 import requests
 import urllib3
 import xml.etree.ElementTree as ET
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
+# Timeouts of the XML control interface: (connect, read) in seconds
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 60
+CLOUD_CONNECT_READ_TIMEOUT = 600  # connect/disconnect to the cloud can take minutes
+POOL_SIZE = 4  # Keep-alive connections of the session (one per concurrent state query)
+
 class IoTCException(Exception):
         """Exception specific to IOTC problems"""
         pass
@@ -13,6 +22,139 @@ class InvalidSessionException(IoTCException):
     """Exception for invalid sessions"""
     pass
 
+# FXR90 readers are configured through the REST set_importCloudConfig command instead of XML
+
+def _fxr90_mqtt_connection(endpoint_name: str, host_name: str, reader_name: str,
+                           publish_topic: str, subscribe_topic: Optional[str] = None) -> Dict[str, Any]:
+    """One MQTT connection of an FXR90 endpointConfig"""
+    return {
+        "additionalOptions": {
+            "batching": None,
+            "retention": {
+                "maxEventRetentionTimeInMin": 500,
+                "maxNumEvents": 150000,
+                "throttle": 100
+            }
+        },
+        "description": "MQTT Endpoint set via CLI",
+        "name": endpoint_name,
+        "options": {
+            "additional": {
+                "cleanSession": True,
+                "clientId": reader_name,
+                "debug": False,
+                "keepAlive": 60,
+                "qos": 0,
+                "reconnectDelay": 1,
+                "reconnectDelayMax": 5
+            },
+            "basicAuthentication": {
+                "password": "admin",
+                "username": "admin"
+            },
+            "enableSecurity": False,
+            "endpoint": {
+                "hostName": host_name,
+                "port": 1883,
+                "protocol": "tcp"
+            },
+            "publishTopic": [
+                f"{publish_topic}/{reader_name}"
+            ],
+            "subscribeTopic": [f"{subscribe_topic}/{reader_name}"] if subscribe_topic else []
+        },
+        "type": "mqtt"
+    }
+
+def build_fxr90_endpoint_config(endpoint_config: Dict[str, Any], host_name: Optional[str] = None,
+                                reader_name: Optional[str] = None, endpoint_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Returns a copy of the READER-GATEWAY endpointConfig of an FXR90 with the CLI connections set:
+    the WebSocket "WS" data connection, or the MQTT data/control/management connections if
+    host_name, reader_name and endpoint_name are given. Equal to the input if already configured.
+    """
+    config = json.loads(json.dumps(endpoint_config))
+    data = config.setdefault("data", {})
+    data.setdefault("event", {})
+
+    if host_name and reader_name and endpoint_name:
+        control = config.setdefault("control", {})
+        management = config.setdefault("management", {})
+        data["event"]["connections"] = [
+            _fxr90_mqtt_connection(endpoint_name, host_name, reader_name, "tevents")
+        ]
+        control.setdefault("commandResponse", {})["connections"] = [
+            _fxr90_mqtt_connection(endpoint_name, host_name, reader_name, "crsp", "ccmds")
+        ]
+        management.setdefault("commandResponse", {})["connections"] = [
+            _fxr90_mqtt_connection(endpoint_name, host_name, reader_name, "mrsp", "mcmds")
+        ]
+        management.setdefault("event", {})["connections"] = [
+            _fxr90_mqtt_connection(endpoint_name, host_name, reader_name, "mevents")
+        ]
+    else:
+        data["event"]["connections"] = [{
+            "additionalOptions": {
+                "batching": {
+                    "maxPayloadSizePerReport": 0,
+                    "reportingInterval": 0
+                },
+                "retention": {
+                    "maxEventRetentionTimeInMin": 500,
+                    "maxNumEvents": 150000,
+                    "throttle": 100
+                }
+            },
+            "description": "WebSocket endpoint set via CLI",
+            "name": "WS",
+            "type": "WEBSOCKET",
+            "options": {
+                "security": {
+                    "verifyPeer": False
+                }
+            }
+        }]
+
+    # Data-level batching and retention sections
+    data["batching"] = {
+        "maxPayloadSizePerReport": 0,
+        "reportingInterval": 0
+    }
+    data["retention"] = {
+        "maxEventRetentionTimeInMin": 0,
+        "maxNumEvents": 0,
+        "throttle": 1
+    }
+    return config
+
+@dataclass
+class ProvisioningState:
+    """
+    IoTC provisioning state of a reader from one concurrent query (see get_provisioning_state).
+    A field is None if its query failed; the error message is in errors.
+    """
+    enrolled: Optional[bool] = None
+    connected: Optional[bool] = None
+    endpoints: Optional[Any] = None  # manageCloudEndpoints VIEW: list of endpoint definitions
+    mapping: Optional[Dict[str, Any]] = None  # cloudEndpointsMapping VIEW
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def has_endpoint(self, ep_type: str, name: str) -> Optional[bool]:
+        """True if an endpoint of this type and name exists, None if the endpoints are unknown"""
+        if self.endpoints is None:
+            return None
+        endpoints = self.endpoints if isinstance(self.endpoints, list) else self.endpoints.get("endpoints", [])
+        return any(isinstance(ep, dict) and ep.get('type') == ep_type and ep.get('name') == name for ep in endpoints)
+
+    def is_mapped(self, ep_type: str, name: str) -> Optional[bool]:
+        """True if the endpoint is mapped to the data interface, None if the mapping is unknown"""
+        if self.mapping is None:
+            return None
+        data = self.mapping.get("data") if isinstance(self.mapping, dict) else None
+        if not isinstance(data, list):
+            return False
+        return any(isinstance(ep, dict) and ep.get('type') == ep_type and ep.get('name') == name for ep in data)
+
 class ZebraIoTCClient:
     """Client for Zebra RFID IoT Connector operations (shared for all steps)"""
     
@@ -32,6 +174,69 @@ class ZebraIoTCClient:
             'xmlns:motorm="urn:motorfid:rm:xsd:1">'
         )
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # One keep-alive session for every XML command of this client
+        self.session = requests.Session()
+        self.session.verify = False  # Readers use self-signed certificates
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.ep_mapping = None
+        # Per-session VIEW results, dropped by the commands that change them
+        self._endpoints_cache: Dict[str, Any] = {}
+        self._mapping_cache: Dict[str, Any] = {}
+        # time.monotonic() after which no request is sent and read timeouts are cut to the time left
+        self.deadline: Optional[float] = None
+        self.last_error: Optional[str] = None  # Result code and description of the last failed connect_iotc
+
+    def _timeout(self, read_timeout: float) -> tuple:
+        """(connect, read) timeout of one request, shortened to the time left before the deadline"""
+        if self.deadline is None:
+            return (CONNECT_TIMEOUT, read_timeout)
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout("reader timeout")
+        return (min(CONNECT_TIMEOUT, remaining), min(read_timeout, remaining))
+
+    def close(self):
+        """Closes the keep-alive session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def invalidate_cache(self):
+        """Drops the cached endpoint list and mapping."""
+        self._endpoints_cache.clear()
+        self._mapping_cache.clear()
+
+    def get_provisioning_state(self, session_id: str) -> "ProvisioningState":
+        """
+        Fetches enrollment, endpoints, endpoint mapping and cloud connection status concurrently.
+        The endpoint list and mapping are cached for the session (see get_all_endpoints).
+        Raises InvalidSessionException if the session is not valid.
+        """
+        queries = {
+            "enrolled": lambda: self.is_reader_enrolled(session_id),
+            "endpoints": lambda: self.get_all_endpoints(session_id, use_cache=False),
+            "mapping": lambda: self.get_endpoint_mapping(session_id, use_cache=False),
+            "connected": lambda: self.is_iotc_connected(session_id, verbose=False)
+        }
+        state = ProvisioningState()
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {name: executor.submit(query) for name, query in queries.items()}
+            for name, future in futures.items():
+                try:
+                    setattr(state, name, future.result())
+                except InvalidSessionException:
+                    raise
+                except Exception as e:
+                    state.errors[name] = str(e)
+        if self.debug:
+            print(f"[DEBUG] Provisioning state: {state}")
+        return state
 
     def xml_login(self, username: str, password: str) -> Optional[str]:
         login_command = (
@@ -48,12 +253,11 @@ class ZebraIoTCClient:
             f"</rm:command>"
         )
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=login_command,
                 headers={'Content-Type': 'application/xml'},
-                timeout=60,
-                verify=False
+                timeout=self._timeout(READ_TIMEOUT)
             )
             if response.status_code == 200:
                 root = ET.fromstring(response.text)
@@ -126,12 +330,11 @@ class ZebraIoTCClient:
             f"</rm:command>"
         )
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=enroll_command,
                 headers={'Content-Type': 'application/xml'},
-                timeout=60,
-                verify=False
+                timeout=self._timeout(READ_TIMEOUT)
             )
             if response.status_code == 200:
                 root = ET.fromstring(response.text)
@@ -211,13 +414,13 @@ class ZebraIoTCClient:
         
         try:
             # Replica of the JavaScript fetch call
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=get_cloud_enrollment_status,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=120  # Aggiunto timeout ragionevole
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
@@ -261,10 +464,13 @@ class ZebraIoTCClient:
                 raise
             raise IoTCException(f"Unexpected error: {e}")
 
-    def get_endpoint_mapping(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_endpoint_mapping(self, session_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Gets the current endpoint mapping (needed for mapWSEP and mapMQTTEP).
+        The result is cached per session until a mapping is updated.
         """
+        if use_cache and session_id in self._mapping_cache:
+            return self._mapping_cache[session_id]
         if self.debug:
             print("[DEBUG] Getting current endpoint mapping..")
 
@@ -284,11 +490,11 @@ class ZebraIoTCClient:
         )
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=mapping_cmd,
                 headers={'Content-Type': 'application/xml'},
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
             
             if response.status_code == 200:
@@ -300,6 +506,7 @@ class ZebraIoTCClient:
                     if data_text:
                         ep_mapping = json.loads(data_text)
                         self.ep_mapping = ep_mapping
+                        self._mapping_cache[session_id] = ep_mapping
                         return ep_mapping
             
             return None
@@ -308,10 +515,13 @@ class ZebraIoTCClient:
             print(f"Error getting endpoint mapping: {e}")
             return None
 
-    def get_all_endpoints(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_all_endpoints(self, session_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Retrieves the complete list of available endpoints via manageCloudEndpoints (operation: VIEW).
+        The result is cached per session until an endpoint is added.
         """
+        if use_cache and session_id in self._endpoints_cache:
+            return self._endpoints_cache[session_id]
         if self.debug:
             print("[DEBUG] Getting all available endpoints (manageCloudEndpoints)...")
 
@@ -330,11 +540,11 @@ class ZebraIoTCClient:
         )
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=endpoints_cmd,
                 headers={'Content-Type': 'application/xml'},
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
             if response.status_code == 200:
                 root = self._parse_xml_response(response.text)
@@ -345,6 +555,7 @@ class ZebraIoTCClient:
                         endpoints = json.loads(data_text)
                         if self.debug:
                             print(f"[DEBUG] All endpoints loaded: {endpoints}")
+                        self._endpoints_cache[session_id] = endpoints
                         return endpoints
             if self.debug:
                 print("[DEBUG] Failed to get all endpoints")
@@ -354,9 +565,10 @@ class ZebraIoTCClient:
                 print(f"[DEBUG] Error getting all endpoints: {e}")
             return None
         
-    def is_iotc_connected(self, session_id: str) -> bool:
+    def is_iotc_connected(self, session_id: str, verbose: bool = True) -> bool:
         """
         Check if the reader is connected to IoT Connector using isConnectedToCloud command.
+        verbose=False suppresses the status messages (used by get_provisioning_state).
         """
         if self.debug:
             print("[DEBUG] Checking IoT Connector connection status...")
@@ -380,12 +592,11 @@ class ZebraIoTCClient:
         try:
             if self.debug:
                 print("[DEBUG] Sending isConnectedToCloud command...")
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=is_connected_command,
                 headers={'Content-Type': 'application/xml'},
-                timeout=60,
-                verify=False
+                timeout=self._timeout(READ_TIMEOUT)
             )
             
             if response.status_code == 200:
@@ -404,14 +615,16 @@ class ZebraIoTCClient:
                     for elem in root.iter():
                         if 'isConnected' in elem.tag:
                             status = elem.text.strip() if elem.text else ""
-                            if status != "":
+                            if status != "" and verbose:
                                 print(f"🔗 Connection status found: '{status}'")
 
                             if status.lower() == 'true':
-                                print("✅ Reader is connected to IoT Connector")
+                                if verbose:
+                                    print("✅ Reader is connected to IoT Connector")
                                 return True
                             elif status.lower() == 'false':
-                                print("❌ Reader is not connected to IoT Connector")
+                                if verbose:
+                                    print("❌ Reader is not connected to IoT Connector")
                                 return False
                     if self.debug:
                         print("[DEBUG] ⚠️ No isConnected element found in successful response")
@@ -437,6 +650,7 @@ class ZebraIoTCClient:
         This function initiates a connection to the IoT Connector cloud service.
         """
         print("🔄 Connecting reader to IoT Connector...")
+        self.last_error = None
         
         connect_command = (
             f"{self.cmd_header}"
@@ -450,12 +664,11 @@ class ZebraIoTCClient:
         )
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=connect_command,
                 headers={'Content-Type': 'application/xml'},
-                timeout=600,  # 10 minutes timeout for cloud connection
-                verify=False
+                timeout=self._timeout(CLOUD_CONNECT_READ_TIMEOUT)  # 10 minutes timeout for cloud connection
             )
             
             if response.status_code == 200:
@@ -471,24 +684,29 @@ class ZebraIoTCClient:
                 else:
                     result_code = result_elements[0].text if result_elements else "Unknown"
                     print(f"❌ Reader connection failed with result code: {result_code}")
+                    self.last_error = f"result code {result_code}"
                     
                     # Try to get additional error information
                     error_elements = root.findall('.//g1:description', 
                         namespaces={'g1': 'urn:epcglobal:rm:xsd:1'})
                     if error_elements:
                         print(f"   Error message: {error_elements[0].text}")
+                        self.last_error += f": {error_elements[0].text}"
                     
                     return False
             else:
                 print(f"❌ Connection request failed with status code: {response.status_code}")
+                self.last_error = f"HTTP {response.status_code}"
                 return False
                 
         except requests.exceptions.Timeout:
             print("⏰ Connection request timed out - this may be normal for cloud connections")
             print("ℹ️ Check reader status manually to verify connection")
+            self.last_error = "connect request timed out"
             return False
         except Exception as e:
             print(f"❌ IoT Connector connection error: {e}")
+            self.last_error = str(e)
             return False
   
     def disconnect_iotc(self, session_id: str) -> bool:
@@ -513,12 +731,11 @@ class ZebraIoTCClient:
         )
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=disconnect_command,
                 headers={'Content-Type': 'application/xml'},
-                timeout=600,  # 10 minutes timeout for cloud disconnection
-                verify=False
+                timeout=self._timeout(CLOUD_CONNECT_READ_TIMEOUT)  # 10 minutes timeout for cloud disconnection
             )
             
             if response.status_code == 200:
@@ -560,6 +777,7 @@ class ZebraIoTCClient:
         """
         Adds a WebSocket Endpoint (WSEP) to the reader named "PDWC".
         """
+        self._endpoints_cache.pop(session_id, None)  # Changed by this command
         print("[DEBUG] Adding WS endpoint..")
 
         # Use "ws" instead of "wss" for HTTP compatibility
@@ -606,13 +824,13 @@ class ZebraIoTCClient:
         
         try:
             # Replica of the JavaScript fetch call
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=wsep_config_cmd,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
@@ -675,13 +893,13 @@ class ZebraIoTCClient:
         
         try:
             # Replica of the JavaScript fetch call
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=iswsadded,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
             
             if(self.debug):
@@ -739,6 +957,7 @@ class ZebraIoTCClient:
         """
         Maps the WebSocket Endpoint "PDWC" to the reader's data interface.
         """
+        self._mapping_cache.pop(session_id, None)  # Changed by this command
         if self.debug:
             print("[DEBUG] Mapping WebSocket endpoint to data interface...")
         
@@ -815,13 +1034,13 @@ class ZebraIoTCClient:
                 f"</rm:command>"
             )
 
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=new_ep_map_cmd,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
@@ -869,13 +1088,13 @@ class ZebraIoTCClient:
         
         try:
             # Post XML command
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=wsep_mapping_cmd,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
@@ -942,6 +1161,7 @@ class ZebraIoTCClient:
         """
         Adds a MQTT Endpoint (MQTTEP) to the reader device.
         """
+        self._endpoints_cache.pop(session_id, None)  # Changed by this command
         if self.debug:
             print(f"[DEBUG] Adding MQTT endpoint with client_id='{reader_name}', hostname='{host_name}'..")
 
@@ -1035,13 +1255,13 @@ class ZebraIoTCClient:
 
         try:
             # Post XML command to add MQTT endpoint
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=mqtt_config_cmd,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
@@ -1104,13 +1324,13 @@ class ZebraIoTCClient:
         
         try:
             # Post XML command to view MQTT endpoints
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=is_mqtt_added,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
             
             if self.debug:
@@ -1167,6 +1387,7 @@ class ZebraIoTCClient:
         """
         Maps the MQTT Endpoint to the reader's data interface.
         """
+        self._mapping_cache.pop(session_id, None)  # Changed by this command
         if self.debug:
             print(f"[DEBUG] Mapping MQTT endpoint '{mqtt_name}' to data interface..")
 
@@ -1243,13 +1464,13 @@ class ZebraIoTCClient:
                 f"</rm:command>"
             )
 
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=new_ep_map_cmd,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
@@ -1300,13 +1521,13 @@ class ZebraIoTCClient:
         
         try:
             # Replica of the JavaScript fetch call
-            response = requests.post(
+            response = self.session.post(
                 self.control_url,
                 data=mqtt_mapping_cmd,
                 headers={
                     'Content-Type': 'application/xml'
                 },
-                timeout=60
+                timeout=self._timeout(READ_TIMEOUT)
             )
 
             if self.debug:
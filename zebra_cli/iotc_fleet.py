@@ -0,0 +1,306 @@
+"""
+Non-interactive IoT Connector provisioning of a reader fleet
+
+Runs the idempotent IOTC setup phases of the interactive `iotc` command (XML readers, the shared
+iotc_setup.XmlIotcSetup) and of the FXR90 setup (REST endpointConfig) on every reader of an inventory file, with a bounded thread pool,
+a timeout per reader and retries. Phases that are already done on a reader are skipped, so a fleet
+run can simply be repeated after a partial failure.
+"""
+import os
+import sys
+import json
+import time
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from zebra_cli.iotc_client import ZebraIoTCClient, build_fxr90_endpoint_config
+from zebra_cli.iotc_setup import PHASES, STATUS_COMPLETED, STATUS_FAILED, STATUS_SKIPPED, XmlIotcSetup
+
+DEFAULT_WORKERS = 16
+DEFAULT_READER_TIMEOUT = 900.0  # Seconds per reader and attempt (IOTC activation alone can take minutes)
+DEFAULT_RETRIES = 1
+RETRY_DELAY = 10.0
+REST_TIMEOUT = 30.0
+
+SETUP_TYPES = ('ws', 'mqtt')
+
+
+INVENTORY_DEFAULTS = {
+    'username': 'admin',
+    'password': 'change',
+    'protocol': 'https',
+    'setup': 'ws',
+    'model': None,
+    'host_name': None,
+    'reader_name': None,
+    'endpoint_name': None
+}
+
+class PhaseFailed(Exception):
+    """A provisioning phase failed on a reader"""
+    pass
+
+def load_inventory(file_path: str) -> List[dict]:
+    """
+    Loads a fleet inventory: {"defaults": {...}, "readers": [{"ip": ..., ...}]} (or a plain list of readers).
+
+    Reader keys: ip, username, password, protocol, setup ('ws' or 'mqtt'), model (optional, detected
+    otherwise) and for MQTT host_name, endpoint_name and reader_name (MQTT client id, default from the IP).
+
+    Raises:
+        ValueError: If an entry is invalid or an IP is listed twice
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    defaults = data.get('defaults', {}) if isinstance(data, dict) else {}
+    readers = data.get('readers', []) if isinstance(data, dict) else data
+    if not isinstance(defaults, dict) or not isinstance(readers, list):
+        raise ValueError("expected {\"defaults\": {...}, \"readers\": [...]} or a list of readers")
+
+    targets, seen = [], set()
+    for index, entry in enumerate(readers, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Reader {index}: expected an object, got {type(entry).__name__}")
+        target = dict(INVENTORY_DEFAULTS, **defaults, **entry)
+        ip = target.get('ip')
+        if not ip:
+            raise ValueError(f"Reader {index}: missing 'ip'")
+        if ip in seen:
+            raise ValueError(f"Reader {index}: {ip} is listed twice")
+        if target['setup'] not in SETUP_TYPES:
+            raise ValueError(f"Reader {ip}: setup must be one of {', '.join(SETUP_TYPES)}")
+        if target['setup'] == 'mqtt':
+            if not target['host_name'] or not target['endpoint_name']:
+                raise ValueError(f"Reader {ip}: MQTT setup requires host_name and endpoint_name")
+            target['reader_name'] = target['reader_name'] or f"reader-{ip.replace('.', '-')}"
+        seen.add(ip)
+        targets.append(target)
+    return targets
+
+class _ReaderRun:
+    """Phase bookkeeping of one provisioning attempt on one reader"""
+
+    def __init__(self, timeout: float):
+        self.deadline = time.monotonic() + timeout
+        self.phases = []
+
+    def phase(self, name: str, func: Callable[[], tuple]) -> None:
+        """
+        Runs func() -> (status, detail) as a timed phase; raises PhaseFailed if it fails. The deadline is
+        checked before the phase and bounds every request inside it (see timeout()).
+        """
+        if time.monotonic() > self.deadline:
+            self.phases.append({'phase': name, 'status': STATUS_FAILED, 'seconds': 0.0, 'detail': 'reader timeout'})
+            raise PhaseFailed(f"{name}: reader timeout")
+        start = time.perf_counter()
+        try:
+            status, detail = func()
+        except Exception as e:
+            status, detail = STATUS_FAILED, str(e) or type(e).__name__
+        if status == STATUS_FAILED and time.monotonic() > self.deadline:
+            detail = 'reader timeout'
+        self.phases.append({'phase': name, 'status': status, 'seconds': round(time.perf_counter() - start, 3),
+                            'detail': detail})
+        if status == STATUS_FAILED:
+            raise PhaseFailed(f"{name}: {detail}")
+
+    def timeout(self, limit: float) -> float:
+        """Timeout of one request: limit, shortened to the time left; raises TimeoutError past the deadline"""
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("reader timeout")
+        return min(limit, remaining)
+
+    def sleep(self, seconds: float) -> None:
+        """Sleeps, but raises TimeoutError instead of sleeping past the reader deadline"""
+        if time.monotonic() + seconds > self.deadline:
+            raise TimeoutError("reader timeout")
+        time.sleep(seconds)
+
+def _detect_reader(run: _ReaderRun, target: dict, debug: bool) -> dict:
+    """Phase 'detect': REST login and model detection (the token is needed for FXR90 readers)"""
+    from zebra_cli.context import ZebraRFIDClient
+
+    detected = {'model': (target['model'] or '').upper() or None, 'token': None}
+
+    def detect():
+        if detected['model'] and detected['model'] != 'FXR90':
+            return STATUS_SKIPPED, f"{detected['model']} (inventory)"
+        client = ZebraRFIDClient(f"{target['protocol']}://{target['ip']}", "dummy-token", debug=debug)
+        try:
+            token = client.get_bearer_token(target['username'], target['password'])
+            if not token:
+                return STATUS_FAILED, "REST login failed"
+            detected['token'] = token
+            if detected['model']:
+                return STATUS_COMPLETED, f"{detected['model']} (inventory)"
+            client.set_token(token)
+            version = client.get_version() or {}
+        finally:
+            client.close()
+        detected['model'] = str(version.get('model', 'UNKNOWN')).upper()
+        return STATUS_COMPLETED, detected['model']
+
+    run.phase('detect', detect)
+    return detected
+
+def _provision_xml(run: _ReaderRun, target: dict, model: str, debug: bool) -> None:
+    """Login, state, endpoint, mapping, enrollment and IOTC activation phases of the interactive setup"""
+    client = ZebraIoTCClient(protocol=target['protocol'], debug=debug, ip_address=target['ip'])
+    client.deadline = run.deadline
+    setup = XmlIotcSetup(client, target['setup'], is_atr7000='ATR' in model, host_name=target['host_name'],
+                         reader_name=target['reader_name'], endpoint_name=target['endpoint_name'],
+                         always_activate=False, sleep=run.sleep)
+    try:
+        for name in PHASES:
+            run.phase(name, lambda: setup.phase(name, target['username'], target['password']))
+    finally:
+        client.close()
+
+def _provision_fxr90(run: _ReaderRun, target: dict, token: str) -> None:
+    """endpointConfig phases of an FXR90 (set_importCloudConfig only if the configuration differs)"""
+    ctx = {}
+    with httpx.Client(base_url=f"https://{target['ip']}", verify=False, timeout=REST_TIMEOUT,
+                      headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"}) as http:
+
+        def read_config():
+            response = http.get("/cloud/config", timeout=run.timeout(REST_TIMEOUT))
+            response.raise_for_status()
+            ctx['current'] = response.json().get("READER-GATEWAY", {}).get("endpointConfig", {})
+            if not ctx['current']:
+                return STATUS_FAILED, "no endpointConfig in /cloud/config"
+            connections = ctx['current'].get("data", {}).get("event", {}).get("connections", [])
+            return STATUS_COMPLETED, f"{len(connections)} existing connection(s)"
+
+        def apply_config():
+            if target['setup'] == 'mqtt':
+                desired = build_fxr90_endpoint_config(ctx['current'], target['host_name'], target['reader_name'],
+                                                      target['endpoint_name'])
+            else:
+                desired = build_fxr90_endpoint_config(ctx['current'])
+            if desired == ctx['current']:
+                return STATUS_SKIPPED, "endpoint configuration already set"
+            response = http.post("/cloud", json={
+                "command": "set_importCloudConfig",
+                "command_id": "abdc123",
+                "payload": {"endpointConfig": desired}
+            }, timeout=run.timeout(REST_TIMEOUT))
+            response.raise_for_status()
+            result = response.json().get("response")
+            return (STATUS_COMPLETED, "configuration updated") if result == "success" else (STATUS_FAILED, str(result))
+
+        run.phase('config', read_config)
+        run.phase('apply', apply_config)
+
+def provision_reader(target: dict, timeout: float = DEFAULT_READER_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                     retry_delay: float = RETRY_DELAY, debug: bool = False) -> dict:
+    """
+    Provisions one reader, retrying failed attempts. Every attempt reruns all phases; phases that an
+    earlier attempt completed are skipped by their own checks.
+
+    Returns:
+        dict: {'ip', 'model', 'setup', 'status', 'attempts', 'seconds', 'phases', 'error'}; the phases
+        are those of the last attempt
+    """
+    start = time.perf_counter()
+    result = {'ip': target['ip'], 'model': target['model'], 'setup': target['setup'], 'status': STATUS_FAILED,
+              'attempts': 0, 'seconds': 0.0, 'phases': [], 'error': None}
+    for attempt in range(1, retries + 2):
+        run = _ReaderRun(timeout)
+        result['attempts'] = attempt
+        try:
+            detected = _detect_reader(run, target, debug)
+            result['model'] = detected['model']
+            if detected['model'] == 'FXR90':
+                _provision_fxr90(run, target, detected['token'])
+            else:
+                _provision_xml(run, target, detected['model'] or '', debug)
+            result['status'] = 'provisioned'
+            result['error'] = None
+        except Exception as e:
+            result['error'] = str(e)
+        result['phases'] = run.phases
+        if result['status'] != STATUS_FAILED or attempt > retries:
+            break
+        time.sleep(retry_delay)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+def phase_statistics(results: List[dict]) -> Dict[str, dict]:
+    """Per phase: number of readers, completed/skipped/failed counts and total/average/max seconds"""
+    stats = {}
+    for result in results:
+        for phase in result['phases']:
+            entry = stats.setdefault(phase['phase'], {'readers': 0, STATUS_COMPLETED: 0, STATUS_SKIPPED: 0,
+                                                      STATUS_FAILED: 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            entry['readers'] += 1
+            entry[phase['status']] += 1
+            entry['total_seconds'] += phase['seconds']
+            entry['max_seconds'] = max(entry['max_seconds'], phase['seconds'])
+    for entry in stats.values():
+        entry['total_seconds'] = round(entry['total_seconds'], 3)
+        entry['avg_seconds'] = round(entry['total_seconds'] / entry['readers'], 3)
+    return stats
+
+def run_fleet_provisioning(targets: List[dict], workers: int = DEFAULT_WORKERS,
+                           timeout: float = DEFAULT_READER_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                           report_path: Optional[str] = None, debug: bool = False, log=None) -> dict:
+    """
+    Provisions all targets with a thread pool and writes a consolidated JSON report.
+    The per-reader messages of the IOTC client are suppressed unless debug is set.
+
+    Args:
+        workers: Readers provisioned at the same time
+        timeout: Seconds per reader and attempt
+        retries: Additional attempts for a failed reader
+        report_path: JSON report file (default: reports/iotc_fleet_<timestamp>.json)
+        log: Callable receiving progress lines (default: print to stderr)
+
+    Returns:
+        dict: Summary (counts, timings, per-phase statistics, one entry per reader and the report path)
+    """
+    from zebra_cli.report_batch import default_directories
+
+    log = log or (lambda line: print(line, file=sys.stderr))
+    start = time.perf_counter()
+    workers = max(1, min(workers, len(targets) or 1))
+    log(f"🌐 Provisioning {len(targets)} readers, {workers} workers, {timeout:.0f}s timeout, {retries} retries")
+
+    results = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(sys.stdout if debug else devnull):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(provision_reader, target, timeout, retries, RETRY_DELAY, debug) for target in targets]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if result['status'] == STATUS_FAILED:
+                    log(f"❌ {result['ip']}: {result['error']} ({result['attempts']} attempts)")
+                else:
+                    changed = [p['phase'] for p in result['phases'] if p['status'] == STATUS_COMPLETED]
+                    log(f"✅ {result['ip']} ({result['model']}): {', '.join(changed) or 'nothing to change'} "
+                        f"in {result['seconds']:.1f}s")
+
+    results.sort(key=lambda result: result['ip'])
+    summary = {
+        'readers': len(results),
+        'provisioned': sum(1 for r in results if r['status'] != STATUS_FAILED),
+        'failed': sum(1 for r in results if r['status'] == STATUS_FAILED),
+        'workers': workers,
+        'seconds': round(time.perf_counter() - start, 3),
+        'phases': phase_statistics(results),
+        'results': results
+    }
+
+    if report_path is None:
+        reports_dir = default_directories()[2]
+        report_path = os.path.join(reports_dir, f"iotc_fleet_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(summary, generated_at=datetime.now().isoformat()), f, indent=2)
+    summary['report'] = report_path
+    log(f"📄 Fleet report: {report_path}")
+    return summary
@@ -0,0 +1,169 @@
+"""
+IoT Connector setup phases over the XML control interface
+
+One implementation of the idempotent IOTC setup of XML readers (WebSocket or MQTT data endpoint), used by
+the interactive `iotc` / MQTT setup and by the fleet provisioning. Every phase returns (status, detail)
+and skips what is already done on the reader; the caller decides how phases are reported and retried.
+"""
+import time
+from typing import Callable, Optional, Tuple
+
+STATUS_COMPLETED = 'completed'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+PHASES = ('login', 'state', 'endpoint', 'mapping', 'enrollment', 'activation')
+
+# Disconnect verification before the IOTC connect: (checks, seconds between checks)
+DISCONNECT_CHECKS = 5
+DISCONNECT_CHECK_INTERVAL = 10
+ATR7000_DISCONNECT_CHECKS = 6
+ATR7000_DISCONNECT_CHECK_INTERVAL = 30  # ATR7000 readers take much longer to leave the cloud
+
+def already_connected_error(error: Optional[str]) -> bool:
+    """True if a failed connect_iotc only reported that the reader is already connected to the cloud"""
+    error = (error or '').lower()
+    return 'already connected to cloud' in error or '65535' in error
+
+class XmlIotcSetup:
+    """
+    Setup phases of one XML reader (see PHASES), sharing one ZebraIoTCClient and session.
+
+    Args:
+        client: ZebraIoTCClient of the reader
+        setup: 'ws' (WebSocket endpoint "WS") or 'mqtt' (endpoint_name on broker host_name, client id reader_name)
+        is_atr7000: Use the longer ATR7000 disconnect verification
+        always_activate: Disconnect and reconnect IOTC even if it is connected and no phase changed the reader
+        sleep: Sleep function between disconnect checks (the fleet run passes one bounded by its deadline)
+    """
+
+    def __init__(self, client, setup: str = 'ws', is_atr7000: bool = False, host_name: Optional[str] = None,
+                 reader_name: Optional[str] = None, endpoint_name: Optional[str] = None,
+                 always_activate: bool = True, sleep: Callable[[float], None] = time.sleep):
+        self.client = client
+        self.mqtt = setup == 'mqtt'
+        self.is_atr7000 = is_atr7000
+        self.host_name = host_name
+        self.reader_name = reader_name
+        self.ep_type, self.ep_name = ('MQTT', endpoint_name) if self.mqtt else ('WEBSOCKET', 'WS')
+        self.always_activate = always_activate
+        self.sleep = sleep
+        self.session_id = None
+        self.state = None
+        self.changed = []  # Phases that changed the reader
+
+    def _result(self, name: str, status: str, detail: str) -> Tuple[str, str]:
+        if status == STATUS_COMPLETED and name != 'state':
+            self.changed.append(name)
+        return status, detail
+
+    def login(self, username: str, password: str) -> Tuple[str, str]:
+        self.session_id = self.client.xml_login(username, password)
+        if not self.session_id:
+            return STATUS_FAILED, "XML login failed"
+        print(f"✅ Login successful - Session ID: {self.session_id[:20]}...")
+        return STATUS_COMPLETED, ""
+
+    def read_state(self) -> Tuple[str, str]:
+        """One concurrent snapshot (enrollment, endpoints, mapping, connection) that decides every phase"""
+        print("🔍 Checking current provisioning state...")
+        self.state = self.client.get_provisioning_state(self.session_id)
+        return STATUS_COMPLETED, f"enrolled={self.state.enrolled} connected={self.state.connected}"
+
+    def endpoint(self) -> Tuple[str, str]:
+        exists = self.state.has_endpoint(self.ep_type, self.ep_name)
+        if exists is None:  # Query failed in the snapshot: repeated on its own
+            exists = (self.client.is_mqttep_added(self.session_id, self.ep_name) if self.mqtt
+                      else self.client.is_wsep_added(self.session_id))
+        if exists:
+            print(f"✅ {self.ep_type} endpoint '{self.ep_name}' already exists")
+            return STATUS_SKIPPED, f"{self.ep_name} already exists"
+        print(f"📝 Creating {self.ep_type} endpoint '{self.ep_name}'...")
+        if self.mqtt:
+            added = self.client.add_mqttep(self.session_id, self.reader_name, self.host_name, self.ep_name)
+        else:
+            added = self.client.add_wsep(self.session_id)
+        if not added:
+            return STATUS_FAILED, f"{self.ep_name} creation failed"
+        return self._result('endpoint', STATUS_COMPLETED, f"{self.ep_name} created")
+
+    def mapping(self) -> Tuple[str, str]:
+        mapped = self.state.is_mapped(self.ep_type, self.ep_name)
+        if mapped is None:
+            mapped = (self.client.is_mqttep_mapped(self.session_id, self.ep_name) if self.mqtt
+                      else self.client.is_wsep_mapped(self.session_id))
+        if mapped:
+            print(f"✅ {self.ep_type} endpoint '{self.ep_name}' already mapped")
+            return STATUS_SKIPPED, f"{self.ep_name} already mapped"
+        print(f"🔗 Mapping {self.ep_type} endpoint '{self.ep_name}' to the data interface...")
+        done = (self.client.map_mqttep(self.session_id, self.ep_name) if self.mqtt
+                else self.client.map_wsep(self.session_id))
+        if not done:
+            return STATUS_FAILED, f"{self.ep_name} mapping failed"
+        return self._result('mapping', STATUS_COMPLETED, f"{self.ep_name} mapped")
+
+    def enrollment(self) -> Tuple[str, str]:
+        enrolled = self.state.enrolled
+        if enrolled is None:
+            enrolled = self.client.is_reader_enrolled(self.session_id)
+        if enrolled:
+            print("✅ Reader already enrolled in IOTC")
+            return STATUS_SKIPPED, "already enrolled"
+        print("📝 Enrolling reader in IOTC...")
+        if not self.client.enroll_reader(self.session_id):
+            return STATUS_FAILED, "enrollment failed"
+        return self._result('enrollment', STATUS_COMPLETED, "enrolled")
+
+    def activation(self) -> Tuple[str, str]:
+        """
+        Disconnects IOTC, waits until the reader reports it disconnected and connects again, so the
+        endpoint configuration is applied. A reader still connected after the checks is connected anyway;
+        if it then only reports being already connected, the phase fails when an earlier phase changed it.
+        """
+        if not self.always_activate and self.state.connected and not self.changed:
+            return STATUS_SKIPPED, "already connected, configuration unchanged"
+        client, session_id = self.client, self.session_id
+        print("⏳ Disconnecting from IOTC service")
+        if client.disconnect_iotc(session_id):
+            print("✅ Successfully disconnected from IOTC!")
+        else:
+            print("❌ Failed to disconnect from IOTC")
+
+        if self.is_atr7000:
+            checks, interval, reader_type = ATR7000_DISCONNECT_CHECKS, ATR7000_DISCONNECT_CHECK_INTERVAL, "ATR7000"
+        else:
+            checks, interval, reader_type = DISCONNECT_CHECKS, DISCONNECT_CHECK_INTERVAL, "non-ATR7000"
+        print(f"🔍 Verifying {reader_type} disconnection from IOTC (up to {checks} checks, {interval}s apart)...")
+        still_connected = True
+        for attempt in range(1, checks + 1):
+            still_connected = client.is_iotc_connected(session_id)
+            if not still_connected:
+                print(f"✅ {reader_type} disconnected from IOTC (check {attempt}/{checks})")
+                break
+            print(f"ℹ️  Check {attempt}/{checks}: {reader_type} still connected to IOTC")
+            if attempt < checks:
+                self.sleep(interval)
+        if still_connected:
+            print(f"⚠️  {reader_type} still connected to IOTC after {checks} checks. Proceeding anyway.")
+
+        print("🚀 Activating IoT Connector...")
+        if client.connect_iotc(session_id):
+            print("✅ IoT Connector service activated successfully!")
+            return STATUS_COMPLETED, "connected"
+        error = getattr(client, 'last_error', None)
+        if already_connected_error(error):
+            if still_connected and self.changed:
+                # Never disconnected: the changed endpoint configuration is not active
+                return STATUS_FAILED, (f"still connected after {checks} disconnect checks, "
+                                       f"{', '.join(self.changed)} not activated")
+            print("✅ Service already activated")
+            return STATUS_SKIPPED, "already connected to cloud"
+        return STATUS_FAILED, f"IOTC connect failed{f' ({error})' if error else ''}"
+
+    def phase(self, name: str, username: Optional[str] = None, password: Optional[str] = None) -> Tuple[str, str]:
+        """Runs one phase by name (login needs the credentials)"""
+        if name == 'login':
+            return self.login(username, password)
+        if name == 'state':
+            return self.read_state()
+        return getattr(self, name)()
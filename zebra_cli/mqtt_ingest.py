@@ -0,0 +1,189 @@
+"""
+MQTT ingestion: the IoT Connector data events of many readers through one broker connection
+
+Readers configured with an MQTT endpoint (`iotc` setup, add_mqttep / build_fxr90_endpoint_config) publish
+their tag events on `tevents/<reader name>` (management events on `mevents/<reader name>`). MqttListener
+subscribes to these topics for a list of readers, or for every reader on the broker, on a single
+connection. Each event is stamped with the `reader_id` of its topic and delivered to the same queue and
+CSV recording as a WebSocketListener, so the multi-reader session, tag table and reports consume it
+unchanged.
+
+Requires paho-mqtt (pip install paho-mqtt).
+"""
+import ssl
+import json
+import queue
+import threading
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from zebra_cli.websocket_listener import (
+    CsvRecorder, ConnectionGaps, RECONNECT_INITIAL_DELAY, RECONNECT_MAX_DELAY
+)
+
+# Optional MQTT client
+try:
+    import paho.mqtt.client as mqtt
+    PAHO_AVAILABLE = True
+except ImportError:
+    PAHO_AVAILABLE = False
+
+DEFAULT_MQTT_PORT = 1883
+TAG_EVENTS_TOPIC = "tevents"  # Topic prefixes of the IoT Connector MQTT endpoint (iotc_client.add_mqttep)
+MANAGEMENT_EVENTS_TOPIC = "mevents"
+KEEPALIVE = 60
+
+def data_topics(reader_names: Optional[List[str]] = None, management_events: bool = False) -> List[str]:
+    """Topics to subscribe to: the data topics of the named readers, or of every reader (`+`)"""
+    prefixes = [TAG_EVENTS_TOPIC] + ([MANAGEMENT_EVENTS_TOPIC] if management_events else [])
+    return [f"{prefix}/{name}" for prefix in prefixes for name in (reader_names or ['+'])]
+
+def reader_from_topic(topic: str) -> str:
+    """Reader name of a data topic ("tevents/dock-a" -> "dock-a")"""
+    return topic.split('/', 1)[1] if '/' in topic else topic
+
+def decode_payload(payload: bytes) -> list:
+    """
+    Events of one MQTT payload: a JSON object, a JSON array (batched reports) or concatenated objects.
+    Undecodable text yields {"raw_message", "error"} as with the WebSocket listeners.
+    """
+    text = payload.decode('utf-8', errors='ignore')
+    try:
+        data = json.loads(text)
+        return data if isinstance(data, list) else [data]
+    except json.JSONDecodeError:
+        pass
+    decoder = json.JSONDecoder()
+    events, index = [], 0
+    while index < len(text):
+        while index < len(text) and text[index].isspace():
+            index += 1
+        if index >= len(text):
+            break
+        try:
+            data, index = decoder.raw_decode(text, index)
+            events.append(data)
+        except json.JSONDecodeError as e:
+            events.append({"raw_message": text[index:], "error": str(e)})
+            break
+    return events
+
+class MqttListener(CsvRecorder):
+    """
+    Subscribes to the data topics of many readers on one broker connection and feeds data_queue like a
+    WebSocketListener (start, is_alive, is_connected, join, close, gaps and the CSV recording methods).
+    The paho network thread is the only thread, whatever the number of readers; it reconnects with
+    backoff and the disconnects are recorded as CONNECTION_GAP messages.
+    """
+
+    def __init__(self, broker_uri: str, data_queue: queue.Queue, stop_event: threading.Event,
+                 reader_names: Optional[List[str]] = None, management_events: bool = False,
+                 username: Optional[str] = None, password: Optional[str] = None, debug: bool = False,
+                 reconnect: bool = True):
+        if not PAHO_AVAILABLE:
+            raise ImportError("paho-mqtt is required for MQTT ingestion: pip install paho-mqtt")
+        parsed = urlparse(broker_uri if '://' in broker_uri else f"mqtt://{broker_uri}")
+        self.uri = broker_uri
+        self.host = parsed.hostname
+        self.port = parsed.port or (8883 if parsed.scheme == 'mqtts' else DEFAULT_MQTT_PORT)
+        self.topics = data_topics(reader_names, management_events)
+        self.data_queue = data_queue
+        self.stop_event = stop_event
+        self.debug = debug
+        self.reconnect = reconnect
+        self.gaps = ConnectionGaps()
+        self.messages = 0
+        self.readers_seen = set()
+        self._is_connected = False
+        self._subscribed = threading.Event()
+        self._started = False
+        self._finished = threading.Event()
+
+        self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, clean_session=True)
+        if username:
+            self.client.username_pw_set(username, password)
+        if parsed.scheme == 'mqtts':
+            # Local brokers commonly use self-signed certificates, like the readers
+            self.client.tls_set(cert_reqs=ssl.CERT_NONE)
+            self.client.tls_insecure_set(True)
+        self.client.reconnect_delay_set(int(RECONNECT_INITIAL_DELAY), int(RECONNECT_MAX_DELAY))
+        self.client.on_connect = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+        self.client.on_subscribe = self._on_subscribe
+        self.client.on_message = self._on_message
+        self._init_recording()
+
+    def start(self):
+        """Connects in the background (paho network thread)"""
+        print(f"🔗 Connecting to MQTT broker {self.host}:{self.port} ({', '.join(self.topics)})")
+        self._started = True
+        self.client.connect_async(self.host, self.port, keepalive=KEEPALIVE)
+        self.client.loop_start()
+
+    def wait_subscribed(self, timeout: float = 5.0) -> bool:
+        """Waits until the data topics are subscribed"""
+        return self._subscribed.wait(timeout)
+
+    def is_alive(self) -> bool:
+        return self._started and not self._finished.is_set()
+
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    def join(self, timeout: Optional[float] = None):
+        self._finished.wait(timeout)
+
+    def close(self):
+        """Disconnects from the broker and stops the network thread."""
+        print("🔌 Terminating MQTT listener...")
+        self.stop_event.set()
+        gap = self.gaps.close_open_gap()
+        if gap:
+            self.record_message(gap)
+        self._stop_csv_recording()
+        if self._started:
+            self.client.disconnect()
+            self.client.loop_stop()
+        self._is_connected = False
+        self._finished.set()
+
+    def _on_connect(self, client, userdata, flags, reason_code, properties):
+        if reason_code.is_failure:
+            print(f"❌ MQTT connection refused: {reason_code}")
+            return
+        self._is_connected = True
+        print(f"✅ MQTT broker connected: {self.host}:{self.port}")
+        # Clean session: subscriptions are renewed on every (re)connection
+        client.subscribe([(topic, 0) for topic in self.topics])
+        gap = self.gaps.connected()
+        if gap:
+            print(f"🔁 Reconnected after {gap['duration_s']:.1f}s")
+            self.record_message(gap)
+            self.data_queue.put(gap)
+
+    def _on_subscribe(self, client, userdata, mid, reason_codes, properties):
+        self._subscribed.set()
+
+    def _on_disconnect(self, client, userdata, flags, reason_code, properties):
+        self._is_connected = False
+        self._subscribed.clear()
+        if self.stop_event.is_set():
+            return
+        self.gaps.disconnected(self.uri, f"disconnected ({reason_code})")
+        if self.reconnect:
+            print("🔄 MQTT connection lost - reconnecting")
+        else:
+            print("🔌 MQTT connection lost")
+            client.loop_stop()
+            self._finished.set()
+
+    def _on_message(self, client, userdata, message):
+        reader_id = reader_from_topic(message.topic)
+        self.readers_seen.add(reader_id)
+        for data in decode_payload(message.payload):
+            if isinstance(data, dict):
+                data['reader_id'] = reader_id
+            if self.ws_recorder_active:
+                self.record_message(data)
+            self.data_queue.put(data)
+            self.messages += 1
@@ -0,0 +1,304 @@
+"""
+Multi-reader live session: one WebSocket listener per reader (or one MQTT subscription for all readers)
+merged into a single event stream
+
+Every message is stamped with the `reader_id` of the reader it came from and forwarded to one merged
+queue, which feeds a combined tag table and one combined CSV recording. Per-reader throughput and lag
+(arrival time minus the reader's event timestamp) are tracked while the messages pass through.
+"""
+import json
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from zebra_cli.connection_probe import ws_uri_candidates
+from zebra_cli.websocket_listener import GAP_MESSAGE_TYPE, CsvRecorder, WebSocketListener
+
+DEFAULT_LIVE_READERS_FILE = Path.home() / ".zebra_cli" / "live_readers.json"
+LAG_SMOOTHING = 0.2  # Weight of the newest sample in the smoothed lag
+MERGED_QUEUE_SIZE = 100000  # Bound of the merged queue; if the consumer stalls, new messages are dropped and counted
+
+@dataclass
+class LiveReader:
+    """A reader of a multi-reader session"""
+    reader_id: str
+    ip: str
+    ws_uri: Optional[str] = None  # WebSocket URI of the reader's IoT Connector endpoint (default: saved or probed)
+    fallback_uris: List[str] = field(default_factory=list)
+
+def load_live_readers(file_path: str = str(DEFAULT_LIVE_READERS_FILE)) -> List[LiveReader]:
+    """Loads the readers of a session ({"readers": [{"reader_id", "ip", "ws_uri"}]})"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [LiveReader(**item) for item in data.get('readers', [])]
+
+def save_live_readers(readers: List[LiveReader], file_path: str = str(DEFAULT_LIVE_READERS_FILE)):
+    """Saves the readers of a session as JSON"""
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({'readers': [asdict(r) for r in readers]}, f, indent=2)
+
+def resolve_live_readers(ips: List[str], config_manager=None) -> List[LiveReader]:
+    """
+    Builds the readers of a session from IP addresses. The WebSocket URI saved for a reader by the
+    connection probe is tried first, then the usual candidates of its protocol.
+    """
+    readers = []
+    for index, ip in enumerate(ips, 1):
+        saved = (config_manager.load_reader_endpoint(ip) if config_manager else None) or {}
+        uris = ws_uri_candidates(ip, saved.get('protocol') or 'https')
+        if saved.get('ws_uri'):
+            uris = [saved['ws_uri']] + [uri for uri in uris if uri != saved['ws_uri']]
+        readers.append(LiveReader(reader_id=f"R{index}-{ip}", ip=ip, ws_uri=uris[0], fallback_uris=uris[1:]))
+    return readers
+
+def parse_reader_timestamp(value) -> Optional[float]:
+    """Epoch seconds of a reader event timestamp ("2025-09-12T10:15:30.123+0000", "...Z"); naive = UTC"""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+class ReaderStreamStats:
+    """Throughput and lag counters of one reader stream (updated by its pump thread only)"""
+
+    def __init__(self, reader_id: str):
+        self.reader_id = reader_id
+        self.messages = 0
+        self.tag_events = 0
+        self.dropped = 0
+        self.lag_ms = None  # Smoothed; includes the clock offset between reader and host
+        self.max_lag_ms = None
+        self.last_message_at = None
+        self._rate_mark = (time.monotonic(), 0)
+        self.rate = 0.0  # Messages per second since the previous snapshot
+
+    def record(self, data, received_at: float):
+        self.messages += 1
+        self.last_message_at = received_at
+        if not isinstance(data, dict):
+            return
+        if isinstance(data.get('data'), dict) and 'idHex' in data['data']:
+            self.tag_events += 1
+        event_time = parse_reader_timestamp(data.get('timestamp'))
+        if event_time is not None:
+            lag_ms = (received_at - event_time) * 1000
+            self.lag_ms = lag_ms if self.lag_ms is None else self.lag_ms + LAG_SMOOTHING * (lag_ms - self.lag_ms)
+            self.max_lag_ms = lag_ms if self.max_lag_ms is None else max(self.max_lag_ms, lag_ms)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        mark_time, mark_messages = self._rate_mark
+        if now - mark_time >= 0.5:
+            self.rate = (self.messages - mark_messages) / (now - mark_time)
+            self._rate_mark = (now, self.messages)
+        return {
+            'reader_id': self.reader_id,
+            'messages': self.messages,
+            'tag_events': self.tag_events,
+            'dropped': self.dropped,
+            'rate': round(self.rate, 1),
+            'lag_ms': round(self.lag_ms, 1) if self.lag_ms is not None else None,
+            'max_lag_ms': round(self.max_lag_ms, 1) if self.max_lag_ms is not None else None,
+            'idle_s': round(time.time() - self.last_message_at, 1) if self.last_message_at else None
+        }
+
+class MultiReaderSession:
+    """
+    Runs one WebSocketListener per reader and merges their messages into data_queue.
+    Recording is combined: one messages CSV (each Raw_JSON carries its reader_id) and one tag_reads CSV.
+    """
+
+    def __init__(self, readers: List[LiveReader], debug: bool = False, fanout=None):
+        """
+        fanout: optional FanoutServer that re-publishes the merged stream to its clients (every message, also
+        those a full merged queue drops: counted in data_queue.dropped instead of the per-reader stats)
+        """
+        self.readers = {reader.reader_id: reader for reader in readers}
+        self.debug = debug
+        if fanout:
+            from zebra_cli.fanout_server import BroadcastQueue
+            self.data_queue = BroadcastQueue(fanout, maxsize=MERGED_QUEUE_SIZE)
+        else:
+            self.data_queue = queue.Queue(maxsize=MERGED_QUEUE_SIZE)
+        self.recorder = CsvRecorder(debug=debug)
+        self.stats: Dict[str, ReaderStreamStats] = {reader_id: ReaderStreamStats(reader_id) for reader_id in self.readers}
+        self._listeners: Dict[str, WebSocketListener] = {}
+        self._shared_listener = None  # MQTT: one listener for all readers
+        self._pumps = []
+        self._stop_event = threading.Event()
+        self._record_lock = threading.Lock()
+        self._running = False
+
+    def start(self, listener_factory=WebSocketListener) -> int:
+        """Starts one listener and one pump thread per reader; returns the number of readers"""
+        if self._running:
+            return len(self._listeners)
+        self._stop_event.clear()
+        for reader_id, reader in self.readers.items():
+            reader_queue = queue.Queue()
+            uri = reader.ws_uri or ws_uri_candidates(reader.ip, 'https')[0]
+            listener = listener_factory(uri, reader_queue, threading.Event(), fallback_uris=reader.fallback_uris,
+                                        debug=self.debug)
+            listener.start()
+            pump = threading.Thread(target=self._pump, args=(reader_id, reader_queue), daemon=True)
+            pump.start()
+            self._listeners[reader_id] = listener
+            self._pumps.append(pump)
+        self._running = True
+        if self.debug:
+            print(f"[DEBUG][MultiReaderSession] Started {len(self._listeners)} reader listeners")
+        return len(self._listeners)
+
+    def start_mqtt(self, broker_uri: str, reader_names: Optional[List[str]] = None, username: Optional[str] = None,
+                   password: Optional[str] = None) -> int:
+        """
+        Receives the events of all readers through one MQTT broker connection instead of one WebSocket per
+        reader. The reader_id of an event is the reader name of its topic (tevents/<reader name>); all
+        readers on the broker are received if no names are given. Returns the number of named readers.
+        """
+        from zebra_cli.mqtt_ingest import MqttListener
+
+        if self._running:
+            return len(self.stats)
+        self._stop_event.clear()
+        shared_queue = queue.Queue()
+        self._shared_listener = MqttListener(broker_uri, shared_queue, threading.Event(), reader_names=reader_names,
+                                             username=username, password=password, debug=self.debug)
+        self._shared_listener.start()
+        pump = threading.Thread(target=self._pump, args=(None, shared_queue), daemon=True)
+        pump.start()
+        self._pumps.append(pump)
+        self._running = True
+        return len(reader_names or [])
+
+    def _pump(self, reader_id: Optional[str], reader_queue: queue.Queue):
+        """
+        Stamps the messages of one reader, updates its stats and forwards them to the merged queue.
+        reader_id None: queue of the shared MQTT listener, whose messages already carry their reader_id.
+        """
+        while not self._stop_event.is_set():
+            try:
+                data = reader_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            source = reader_id or 'mqtt'
+            if isinstance(data, dict):
+                source = reader_id or data.get('reader_id') or source
+                data['reader_id'] = source
+            if not (isinstance(data, dict) and data.get('type') == GAP_MESSAGE_TYPE):
+                stats = self.stats.get(source)
+                if stats is None:
+                    stats = self.stats.setdefault(source, ReaderStreamStats(source))
+                stats.record(data, time.time())
+            else:
+                stats = self.stats.get(source) or ReaderStreamStats(source)
+            if self.recorder.ws_recorder_active:
+                with self._record_lock:
+                    self.recorder.record_message(data)
+            try:
+                self.data_queue.put_nowait(data)
+            except queue.Full:
+                stats.dropped += 1
+
+    def get(self, timeout: Optional[float] = None):
+        """Returns the next merged message, or None"""
+        try:
+            return self.data_queue.get(timeout=timeout) if timeout else self.data_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def reader_stats(self) -> List[dict]:
+        """Per-reader throughput and lag snapshot, with the connection state and gaps of each listener"""
+        snapshots = []
+        for reader_id, stats in list(self.stats.items()):
+            snapshot = stats.snapshot()
+            listener = self._listeners.get(reader_id, self._shared_listener)
+            snapshot['connected'] = bool(listener and listener.is_connected())
+            gaps = getattr(listener, 'gaps', None)
+            if gaps is not None:
+                snapshot.update(gaps.status())
+            snapshots.append(snapshot)
+        return snapshots
+
+    def stats_line(self) -> str:
+        """One-line summary of all readers (for the tag table and the terminal)"""
+        parts = []
+        for s in self.reader_stats():
+            icon = "🟢" if s['connected'] else "🔴"
+            lag = f"{s['lag_ms']:.0f}ms" if s['lag_ms'] is not None else "-"
+            parts.append(f"{icon} {s['reader_id']}: {s['rate']:.0f}/s lag {lag}")
+        return "  ".join(parts)
+
+    def start_recording(self):
+        """Starts the combined CSV recording of all readers"""
+        with self._record_lock:
+            self.recorder.start_recording()
+
+    def stop_recording(self):
+        """Stops the combined recording and exports the tag_reads CSV"""
+        with self._record_lock:
+            self.recorder.stop_recording()
+
+    def control_scans(self, start: bool, username: str, password: str, protocol: str = 'https',
+                      token_store=None) -> Dict[str, bool]:
+        """
+        Starts or stops scanning on all readers concurrently (tokens from the token store, or a new login).
+
+        Returns:
+            dict: reader_id -> success
+        """
+        from zebra_cli.context import ZebraRFIDClient
+        from zebra_cli.token_store import TokenStore
+
+        token_store = token_store or TokenStore(debug=self.debug)
+
+        def control(reader: LiveReader) -> bool:
+            client = ZebraRFIDClient(f"{protocol}://{reader.ip}", "dummy-token", debug=self.debug)
+            try:
+                token = token_store.get(reader.ip, username, password)
+                if not token:
+                    token = client.get_bearer_token(username, password, token_store.get_login_method(reader.ip))
+                    if not token:
+                        return False
+                    token_store.put(reader.ip, token, username, client.login_method, password)
+                client.set_token(token)
+                return (client.start_scan() if start else client.stop_scan()) is not None
+            except Exception as e:
+                if self.debug:
+                    print(f"[DEBUG][MultiReaderSession] {'Start' if start else 'Stop'} scan on {reader.ip} failed: {e}")
+                return False
+            finally:
+                client.close()
+
+        readers = list(self.readers.values())
+        with ThreadPoolExecutor(max_workers=max(1, len(readers))) as pool:
+            results = list(pool.map(control, readers))
+        return {reader.reader_id: result for reader, result in zip(readers, results)}
+
+    def stop(self):
+        """Stops the recording, the listeners and the pump threads"""
+        if not self._running:
+            return
+        self.stop_recording()
+        for listener in list(self._listeners.values()) + ([self._shared_listener] if self._shared_listener else []):
+            listener.close()
+        self._stop_event.set()
+        for pump in self._pumps:
+            pump.join(timeout=2)
+        self._listeners.clear()
+        self._shared_listener = None
+        self._pumps.clear()
+        self._running = False
+        if self.debug:
+            print(f"[DEBUG][MultiReaderSession] Stopped, {sum(s.messages for s in self.stats.values())} messages")
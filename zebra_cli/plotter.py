@@ -1,19 +1,28 @@
 # Standard library imports
 import time
 import queue
+import datetime
 import threading
+import importlib.util
 from collections import deque
 
-# Third-party imports
-import plotext as plt
-try:
-    import matplotlib.pyplot as plt_gui
-    import matplotlib.animation as animation
-    from matplotlib.dates import DateFormatter
-    import datetime
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# Third-party imports: plotext and matplotlib are imported by the plots that use them (see _load_matplotlib)
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+_matplotlib_loaded = False
+
+def _load_matplotlib() -> bool:
+    """Imports matplotlib for the GUI plots on first use. Returns False if it is not available."""
+    global plt_gui, animation, DateFormatter, MATPLOTLIB_AVAILABLE, _matplotlib_loaded
+    if _matplotlib_loaded or not MATPLOTLIB_AVAILABLE:
+        return MATPLOTLIB_AVAILABLE
+    try:
+        import matplotlib.pyplot as plt_gui
+        import matplotlib.animation as animation
+        from matplotlib.dates import DateFormatter
+        _matplotlib_loaded = True
+    except ImportError:
+        MATPLOTLIB_AVAILABLE = False
+    return MATPLOTLIB_AVAILABLE
 
 class Plotter:
     """
@@ -30,7 +39,7 @@ class Plotter:
     def plot_live_rssi_gui(self, data_queue: queue.Queue, stop_event: threading.Event) -> None:
         """Displays a real-time RSSI chart in a separate window using matplotlib."""
         
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             print("❌ Matplotlib not available. Install it with: pip install matplotlib")
             print("🔄 Fallback to terminal graph...")
             return self.plot_live_rssi(data_queue, stop_event)
@@ -151,6 +160,7 @@ class Plotter:
 
     def plot_live_rssi(self, data_queue: queue.Queue, stop_event: threading.Event) -> None:
         """Displays a real-time chart of RFID tag RSSI values."""
+        import plotext as plt
         
         plt.title("Real-time RSSI of RFID Tags")
         plt.xlabel("Time (last 100 events)")
@@ -220,7 +230,7 @@ class Plotter:
     def plot_live_rssi_gui_permanent(self, app_context) -> None:
         """Displays a real-time RSSI chart in GUI window using permanent WebSocket."""
         
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             print("❌ Matplotlib not available. Install it with: pip install matplotlib")
             return
             
@@ -327,7 +337,7 @@ class EnhancedPlotter(Plotter):
     def plot_live_rssi_gui(self, data_queue: queue.Queue, stop_event: threading.Event) -> None:
         """Displays RSSI chart filtered for specific tag or all tags"""
         
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             print("❌ Matplotlib not available. Install it with: pip install matplotlib")
             return
             
@@ -487,7 +497,7 @@ class EnhancedPlotter(Plotter):
     def plot_live_rssi_gui_permanent(self, app_context) -> None:
         """Displays RSSI chart filtered for specific tag or all tags using permanent WebSocket"""
         
-        if not MATPLOTLIB_AVAILABLE:
+        if not _load_matplotlib():
             print("❌ Matplotlib not available. Install it with: pip install matplotlib")
             return
             
@@ -600,6 +610,7 @@ class EnhancedPlotter(Plotter):
 
     def plot_live_rssi_permanent(self, app_context) -> None:
         """Displays a real-time chart of RFID tag RSSI values using permanent WebSocket."""
+        import plotext as plt
         
         plt.title("Real-time RFID Tag RSSI")
         plt.xlabel("Time (last 100 events)")
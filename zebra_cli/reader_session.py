@@ -0,0 +1,169 @@
+"""
+Async reader REST session built on the generated IoT Connector local REST client
+(zebra_cli/rest_client/io_t_connector_local_rest_ap_is_client)
+
+One ReaderSession owns one pooled httpx.AsyncClient, so any number of calls can run concurrently
+over the same keep-alive connections. Every call returns the raw JSON together with the typed model
+of the generated client (ReaderStats, OperatingMode, ...) when the response matches the schema.
+"""
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from zebra_cli.rest_client.io_t_connector_local_rest_ap_is_client import AuthenticatedClient
+from zebra_cli.rest_client.io_t_connector_local_rest_ap_is_client.api.control import get_mode
+from zebra_cli.rest_client.io_t_connector_local_rest_ap_is_client.api.management import (
+    get_certificates, get_cloud_cable_loss_compensation, get_cloud_reader_capabilities, get_cloud_time_zone,
+    get_config, get_gpi_status, get_gpo_status, get_logs, get_network, get_region, get_status, get_version
+)
+from zebra_cli.rest_client.io_t_connector_local_rest_ap_is_client.models import GetModeBody
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 16
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Reader state operations (name -> generated API module); all are GET requests without parameters
+READER_STATE_OPERATIONS = {
+    "status": get_status,
+    "version": get_version,
+    "network": get_network,
+    "region": get_region,
+    "mode": get_mode,
+    "config": get_config,
+    "gpi": get_gpi_status,
+    "gpo": get_gpo_status,
+    "capabilities": get_cloud_reader_capabilities,
+    "timezone": get_cloud_time_zone,
+    "cableloss": get_cloud_cable_loss_compensation,
+    "certificates": get_certificates,
+    "logs": get_logs
+}
+
+# GET operations that the OpenAPI spec declares with a (always empty) request body
+EMPTY_BODY_OPERATIONS = {
+    get_mode: GetModeBody
+}
+
+@dataclass
+class ReaderApiResult:
+    """Outcome of one reader API call"""
+    endpoint: str
+    status_code: int  # 0 if the request itself failed
+    data: Any  # Raw JSON body ({"message": text} if not JSON, {"error": ...} on request errors)
+    parsed: Any = None  # Typed model of the generated client, None if the body did not match the schema
+    elapsed_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (without the typed model)"""
+        return {
+            "endpoint": self.endpoint,
+            "success": self.success,
+            "status_code": self.status_code,
+            "elapsed_ms": self.elapsed_ms,
+            "data": self.data
+        }
+
+class ReaderSession:
+    """
+    Async session to one reader. Use as `async with ReaderSession(...) as session:` so that the
+    connection pool is closed on the event loop that used it.
+    """
+
+    def __init__(self, base_url: str, token: str, timeout: float = DEFAULT_TIMEOUT,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS, debug: bool = False) -> None:
+        self.base_url = base_url.rstrip('/')
+        self.debug = debug
+        self.client = AuthenticatedClient(
+            base_url=self.base_url,
+            token=token,
+            verify_ssl=False,  # Readers use self-signed certificates
+            timeout=httpx.Timeout(timeout),
+            headers={"Accept": "application/json"},
+            httpx_args={"limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY
+            )}
+        )
+
+    async def __aenter__(self) -> "ReaderSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections"""
+        await self.client.get_async_httpx_client().aclose()
+
+    def set_token(self, token: str) -> None:
+        """Replaces the Bearer token after a new login (keeps the open connections)"""
+        self.client.token = token
+        self.client.get_async_httpx_client().headers[self.client.auth_header_name] = f"{self.client.prefix} {token}"
+
+    async def call(self, operation, **kwargs) -> ReaderApiResult:
+        """
+        Calls one generated API operation (e.g. api.management.get_status) on the shared pool.
+
+        Unlike the generated asyncio_detailed(), a response that does not match the OpenAPI schema
+        does not raise: the raw JSON is kept and parsed is None.
+        """
+        if operation in EMPTY_BODY_OPERATIONS and "body" not in kwargs:
+            kwargs["body"] = EMPTY_BODY_OPERATIONS[operation]()
+        request = operation._get_kwargs(**kwargs)
+        if request["method"] == "get" and request.get("json") == {}:
+            # Plain GET without a body, as ZebraRFIDClient.get_mode sends it
+            request.pop("json")
+            request.pop("headers", None)
+        result, response = await self._send(request)
+        if response is None:
+            return result
+        try:
+            result.parsed = operation._parse_response(client=self.client, response=response)
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG][ReaderSession] {result.endpoint}: response does not match the schema ({e})")
+        return result
+
+    async def request(self, method: str, endpoint: str, json: Any = None) -> ReaderApiResult:
+        """
+        Sends a raw JSON request on the shared pool, for documents that must reach the reader unchanged
+        (e.g. a whole /cloud/config, which the generated models would reduce to their known fields)
+        """
+        request = {"method": method.lower(), "url": endpoint}
+        if json is not None:
+            request["json"] = json
+        result, _ = await self._send(request)
+        return result
+
+    async def _send(self, request: dict):
+        """Sends one request; returns (result without typed model, response or None on request errors)"""
+        endpoint = request["url"]
+        start = time.perf_counter()
+        try:
+            response = await self.client.get_async_httpx_client().request(**request)
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG][ReaderSession] {request['method'].upper()} {endpoint} failed: {e}")
+            return ReaderApiResult(endpoint, 0, {"error": f"Request error: {e}"},
+                                   elapsed_ms=round((time.perf_counter() - start) * 1000, 1)), None
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        try:
+            data = response.json()
+        except Exception:
+            data = {"message": response.text}
+        return ReaderApiResult(endpoint, response.status_code, data, None, elapsed_ms), response
+
+    async def fetch(self, names: Optional[Iterable[str]] = None) -> Dict[str, ReaderApiResult]:
+        """Fetches the given READER_STATE_OPERATIONS (default: all) concurrently, keyed by name"""
+        names = list(names or READER_STATE_OPERATIONS)
+        results = await asyncio.gather(*(self.call(READER_STATE_OPERATIONS[name]) for name in names))
+        return dict(zip(names, results))
@@ -0,0 +1,245 @@
+"""
+Single-pass aggregation of recorded messages for the PDF report
+"""
+import os
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from zebra_cli.atr7000_locationing import (
+    ATR7000PositionCalculator, PointDataStore, extract_position_point, parse_message_timestamp
+)
+
+# Number of decoded messages used to detect the reader type
+DETECTION_ROWS = 10
+# Message_Type of the listener's disconnect gap rows (websocket_listener.GAP_MESSAGE_TYPE; not imported to keep
+# report workers free of websocket/tkinter)
+GAP_MESSAGE_TYPE = 'CONNECTION_GAP'
+
+ATR_FIELDS = ['azimuth', 'elevation', 'azimuthConf', 'elevationConf', 'zone', 'zoneName']
+STANDARD_RFID_FIELDS = ['CRC', 'PC', 'channel', 'eventNum', 'phase', 'reads']
+
+@dataclass
+class ReportAggregates:
+    """Per-EPC data extracted from a messages_read CSV"""
+    is_atr_reader: bool = False
+    epc_rssi_data: Dict[str, dict] = field(default_factory=dict)  # {epc: {'timestamps': [], 'rssi_values': []}}
+    epc_antenna_counts: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    epc_antenna_rssi_stats: Dict[str, Dict[int, dict]] = field(default_factory=dict)  # {epc: {antenna: {min, max, sum, count}}}
+    point_store: Optional[PointDataStore] = None  # ATR7000 positions (not kept in the aggregate cache)
+    epc_position_data: Dict[str, dict] = field(default_factory=dict)  # {epc: position_data_from_store(...)}
+    messages_processed: int = 0
+    messages_with_position_data: int = 0
+    connection_gaps: List[dict] = field(default_factory=list)  # CONNECTION_GAP rows: {start, end, duration_s, ...}
+    downtime_seconds: float = 0.0  # Total duration of the connection gaps
+
+def read_tag_reads(tags_path: str) -> Dict[str, dict]:
+    """Reads the per-EPC statistics of a tag_reads CSV file"""
+    tag_data = {}
+    with open(tags_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            epc = row['EPC']
+            tag_data[epc] = {
+                'reads': int(row['Reads']),
+                'avg_rssi': float(row['Avg_RSSI']),
+                'min_rssi': float(row['Min_RSSI']),
+                'max_rssi': float(row['Max_RSSI']),
+                'first_seen': row['First_Seen'],
+                'last_seen': row['Last_Seen'],
+                'rate_per_minute': float(row['Rate_Per_Minute'])
+            }
+    return tag_data
+
+def position_data_from_store(point_store: Optional[PointDataStore], epc: str) -> Optional[dict]:
+    """Extracts the picklable position history of an EPC from a PointDataStore"""
+    if point_store is None:
+        return None
+    timestamps, x_coords, y_coords = point_store.get_xy_history(epc, all_points=True)
+    track_timestamps, track_x, track_y = point_store.get_track_history(epc)
+    return {
+        'timestamps': timestamps,
+        'x': x_coords,
+        'y': y_coords,
+        'track_timestamps': track_timestamps,
+        'track_x': track_x,
+        'track_y': track_y
+    }
+
+def score_reader_message(message_data: dict) -> Tuple[int, int]:
+    """Returns (ATR7000 indicators, standard RFID indicators) found in a decoded message"""
+    atr_indicators = 0
+    standard_rfid_indicators = 0
+    message_type = message_data.get('type', '')
+    data_section = message_data.get('data', {})
+    if not isinstance(data_section, dict):
+        data_section = {}
+
+    # Check for ATR7000 indicators
+    if message_type in ['DIRECTIONALITY_RAW', 'DIRECTIONALITY']:
+        atr_indicators += 2  # Strong indicator
+    atr_indicators += sum(1 for f in ATR_FIELDS if f in data_section)
+
+    # Check RSSI field type (ATR uses "rssi", standard uses "peakRssi")
+    if 'rssi' in data_section and 'peakRssi' not in data_section:
+        atr_indicators += 1
+    elif 'peakRssi' in data_section and 'rssi' not in data_section:
+        standard_rfid_indicators += 1
+
+    # Check for standard RFID indicators
+    if message_type == 'CUSTOM':
+        standard_rfid_indicators += 1
+    standard_rfid_indicators += sum(1 for f in STANDARD_RFID_FIELDS if f in data_section)
+    return atr_indicators, standard_rfid_indicators
+
+def parse_row_timestamp(timestamp_str: str) -> datetime:
+    """Parses the Timestamp column of the messages CSV ('%Y-%m-%d %H:%M:%S.%f')"""
+    try:
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
+
+class ReportAggregator:
+    """
+    Streams a messages_read CSV once, decoding each JSON message a single time, and builds
+    reader type detection, RSSI series, antenna statistics and ATR7000 positions together.
+    """
+
+    def __init__(self, tag_data: dict, position_calculator: Optional[ATR7000PositionCalculator] = None,
+                 debug: bool = False):
+        """
+        Args:
+            tag_data: Per-EPC statistics from the tag_reads CSV (RSSI/antenna data only for these EPCs)
+            position_calculator: Calculator for ATR7000 positions (defaults: reader 15.0m, tag 3.0m)
+        """
+        self.tag_data = tag_data
+        self.position_calculator = position_calculator or ATR7000PositionCalculator()
+        self.debug = debug
+
+    def aggregate(self, messages_path: str) -> ReportAggregates:
+        """Aggregates a messages_read CSV file in a single pass"""
+        result = ReportAggregates()
+        if not os.path.exists(messages_path):
+            return result
+
+        atr_score = 0
+        standard_score = 0
+        detection_buffer = []  # Decoded rows waiting for the reader type decision
+        detected = False
+
+        with open(messages_path, 'r', encoding='utf-8') as f:
+            csv_reader = csv.DictReader(f)
+            if 'Raw_JSON' not in (csv_reader.fieldnames or []):
+                print("❌ Invalid CSV format. Missing 'Raw_JSON' column")
+                return result
+
+            for row in csv_reader:
+                raw_json = row.get('Raw_JSON', '')
+                if not raw_json:
+                    continue
+                try:
+                    message_data = json.loads(raw_json)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(message_data, dict):
+                    continue
+                if row.get('Message_Type') == GAP_MESSAGE_TYPE:
+                    # Listener downtime (reader reboot, network loss), not a reader message
+                    result.connection_gaps.append(message_data)
+                    result.downtime_seconds += float(message_data.get('duration_s') or 0)
+                    continue
+
+                if not detected:
+                    atr, standard = score_reader_message(message_data)
+                    atr_score += atr
+                    standard_score += standard
+                    detection_buffer.append((row.get('Timestamp', ''), message_data))
+                    if len(detection_buffer) < DETECTION_ROWS:
+                        continue
+                    detected = True
+                    self._set_reader_type(result, atr_score, standard_score)
+                    for buffered in detection_buffer:
+                        self._process_message(result, *buffered)
+                    detection_buffer = []
+                    continue
+
+                self._process_message(result, row.get('Timestamp', ''), message_data)
+
+        # Short files: decide with the rows available
+        if not detected:
+            self._set_reader_type(result, atr_score, standard_score)
+            for buffered in detection_buffer:
+                self._process_message(result, *buffered)
+
+        if result.point_store is not None:
+            result.epc_position_data = {
+                epc: position_data_from_store(result.point_store, epc) for epc in self.tag_data
+            }
+
+        if self.debug:
+            print(f"[DEBUG]📊 Single-pass aggregation: {result.messages_processed} messages, "
+                  f"{result.messages_with_position_data} with position data")
+        return result
+
+    def _set_reader_type(self, result: ReportAggregates, atr_score: int, standard_score: int):
+        result.is_atr_reader = atr_score > standard_score
+        if result.is_atr_reader:
+            result.point_store = PointDataStore(
+                max_series_count=1000,
+                max_points_per_series=10000,
+                max_all_points_per_series=10000000
+            )
+        if self.debug:
+            print(f"[DEBUG]🔍 ATR indicators: {atr_score}, Standard RFID indicators: {standard_score}")
+
+    def _process_message(self, result: ReportAggregates, row_timestamp: str, message_data: dict):
+        """Updates every aggregate with one decoded message"""
+        result.messages_processed += 1
+        msg_tag_data = message_data.get('data')
+
+        if isinstance(msg_tag_data, dict) and 'idHex' in msg_tag_data:
+            epc = msg_tag_data['idHex']
+            if epc in self.tag_data:
+                rssi = msg_tag_data.get('peakRssi', msg_tag_data.get('rssi'))
+                rssi_value = None
+                if rssi is not None:
+                    try:
+                        rssi_value = float(rssi)
+                        timestamp = parse_row_timestamp(row_timestamp)
+                        series = result.epc_rssi_data.setdefault(epc, {'timestamps': [], 'rssi_values': []})
+                        series['timestamps'].append(timestamp)
+                        series['rssi_values'].append(rssi_value)
+                    except (ValueError, TypeError):
+                        pass  # Skip invalid RSSI values
+
+                # Antenna counts and RSSI statistics (only for non-ATR readers)
+                antenna = msg_tag_data.get('antenna')
+                if not result.is_atr_reader and antenna is not None:
+                    try:
+                        antenna_id = int(antenna)
+                        counts = result.epc_antenna_counts.setdefault(epc, {})
+                        counts[antenna_id] = counts.get(antenna_id, 0) + 1
+                        if rssi_value is not None:
+                            stats = result.epc_antenna_rssi_stats.setdefault(epc, {}).setdefault(
+                                antenna_id, {'min': rssi_value, 'max': rssi_value, 'sum': 0, 'count': 0})
+                            stats['min'] = min(stats['min'], rssi_value)
+                            stats['max'] = max(stats['max'], rssi_value)
+                            stats['sum'] += rssi_value
+                            stats['count'] += 1
+                    except (ValueError, TypeError):
+                        pass  # Skip invalid antenna values
+
+        # ATR7000 positions (timestamp from the JSON message itself)
+        if result.point_store is not None:
+            try:
+                position = extract_position_point(
+                    message_data, self.position_calculator,
+                    parse_message_timestamp(message_data.get('timestamp', ''))
+                )
+            except (ValueError, TypeError):
+                position = None
+            if position is not None:
+                result.point_store.add_position_point(position)
+                result.messages_with_position_data += 1
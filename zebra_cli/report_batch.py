@@ -0,0 +1,243 @@
+"""
+Non-interactive batch generation of PDF reports for many recordings
+"""
+import os
+import io
+import sys
+import time
+import fnmatch
+import traceback
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+TAG_READS_PREFIX = 'tags_read_'
+DEFAULT_PATTERN = 'tags_read_*.csv'
+RECORDING_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+REPORT_FORMATS = ('pdf', 'html')
+
+STATUS_GENERATED = 'generated'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+def default_directories() -> Tuple[str, str, str]:
+    """Returns (tag_reads_dir, messages_dir, reports_dir) under the project root"""
+    project_root = os.path.dirname(os.path.dirname(__file__))
+    return (
+        os.path.join(project_root, 'record', 'tag_reads'),
+        os.path.join(project_root, 'record', 'messages'),
+        os.path.join(project_root, 'reports')
+    )
+
+def recording_timestamp(filename: str) -> Optional[datetime]:
+    """Returns the timestamp encoded in a tags_read_YYYYMMDD_HHMMSS.csv name, or None"""
+    timestamp_part = os.path.basename(filename).replace(TAG_READS_PREFIX, '').replace('.csv', '')
+    try:
+        return datetime.strptime(timestamp_part, RECORDING_TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+def parse_range_bound(value: str, end: bool = False) -> datetime:
+    """
+    Parses a --since/--until value: 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM[:SS]' or 'YYYYMMDD_HHMMSS'.
+    A date-only upper bound includes the whole day.
+    """
+    value = value.strip()
+    try:
+        return datetime.strptime(value, RECORDING_TIMESTAMP_FORMAT)
+    except ValueError:
+        pass
+    bound = datetime.fromisoformat(value)  # Raises ValueError on invalid input
+    if end and len(value) == 10:
+        bound += timedelta(days=1) - timedelta(microseconds=1)
+    return bound
+
+def select_recordings(tag_reads_dir: str, pattern: str = DEFAULT_PATTERN, since: Optional[datetime] = None,
+                      until: Optional[datetime] = None) -> List[str]:
+    """Returns the tag_reads CSV names matching a glob and an optional date range, oldest first"""
+    if not os.path.isdir(tag_reads_dir):
+        return []
+    selected = []
+    for filename in os.listdir(tag_reads_dir):
+        if not filename.endswith('.csv') or not fnmatch.fnmatch(filename, pattern):
+            continue
+        if since or until:
+            timestamp = recording_timestamp(filename)
+            if timestamp is None:
+                continue
+            if (since and timestamp < since) or (until and timestamp > until):
+                continue
+        selected.append(filename)
+    return sorted(selected)
+
+def report_paths(csv_filename: str, messages_dir: str, reports_dir: str,
+                 report_format: str = 'pdf') -> Tuple[str, str]:
+    """Returns (messages_path, report_path) for a tag_reads CSV name"""
+    timestamp_part = csv_filename.replace(TAG_READS_PREFIX, '').replace('.csv', '')
+    return (
+        os.path.join(messages_dir, f"messages_read_{timestamp_part}.csv"),
+        os.path.join(reports_dir, f"report_{timestamp_part}.{report_format}")
+    )
+
+def is_report_up_to_date(tags_path: str, messages_path: str, report_path: str) -> bool:
+    """True if the report exists and is newer than its recording files"""
+    if not os.path.exists(report_path):
+        return False
+    report_mtime = os.path.getmtime(report_path)
+    sources = [tags_path] + ([messages_path] if os.path.exists(messages_path) else [])
+    return all(os.path.getmtime(source) <= report_mtime for source in sources)
+
+def generate_report(tags_path: str, messages_path: str, report_path: str, use_cache: bool = True,
+                    render_workers: Optional[int] = None, report_options: Optional[dict] = None,
+                    report_format: str = 'pdf', debug: bool = False) -> dict:
+    """
+    Aggregates a recording and renders its report.
+
+    Args:
+        report_options: Keyword arguments of report_summary.plan_report (summary_mode, top_n, epc_filter, sort_by)
+        report_format: 'pdf' (matplotlib) or 'html' (self-contained HTML with SVG charts, no matplotlib)
+
+    Returns:
+        dict: tags, reader type, connection gaps and downtime of the recording and whether the aggregates
+        came from the cache
+    """
+    from zebra_cli.report_cache import ReportCache, load_report_aggregates
+    from zebra_cli.report_summary import build_epc_jobs, plan_report
+
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+    tag_data, aggregates, cache_hit = load_report_aggregates(
+        tags_path, messages_path, cache=ReportCache(debug=debug) if use_cache else None, debug=debug
+    )
+    detail_tag_data, summary = plan_report(tag_data, aggregates, **(report_options or {}))
+    jobs = build_epc_jobs(
+        detail_tag_data, aggregates.epc_rssi_data, aggregates.is_atr_reader,
+        aggregates.epc_antenna_counts, aggregates.epc_antenna_rssi_stats, aggregates.epc_position_data
+    )
+    csv_filename, messages_filename = os.path.basename(tags_path), os.path.basename(messages_path)
+    if report_format == 'html':
+        # Writes to a .part file and renames it itself
+        from zebra_cli.report_html import HtmlReportWriter
+        HtmlReportWriter(debug=debug).render_report(
+            report_path, csv_filename, messages_filename, tag_data, jobs, summary=summary
+        )
+    else:
+        from zebra_cli.report_renderer import ReportPageRenderer
+        # Render next to the target and rename, so a failed run never leaves an "up to date" partial report
+        partial_path = f"{report_path}.part"
+        try:
+            ReportPageRenderer(debug=debug).render_report(
+                partial_path, csv_filename, messages_filename, tag_data, jobs,
+                workers=render_workers, progress=None, summary=summary
+            )
+            os.replace(partial_path, report_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+    return {
+        'tags': len(tag_data),
+        'detail_pages': len(jobs),
+        'reader': 'ATR7000' if aggregates.is_atr_reader else 'Standard RFID',
+        'connection_gaps': len(aggregates.connection_gaps),
+        'downtime_s': round(aggregates.downtime_seconds, 1),
+        'cache_hit': cache_hit
+    }
+
+def _init_batch_worker(report_format: str = 'pdf'):
+    """Worker initializer: imports the report modules once per process and selects the headless backend"""
+    import zebra_cli.report_cache  # noqa: F401
+    if report_format == 'pdf':
+        import matplotlib
+        matplotlib.use('Agg', force=True)
+        import zebra_cli.report_renderer  # noqa: F401
+
+def _batch_worker(task: dict) -> dict:
+    """Generates one report (runs in a worker process). Console output is captured unless debugging."""
+    result = {'recording': task['csv_filename'], 'report': task['report_path'], 'status': STATUS_GENERATED}
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sys.stdout if task['debug'] else output):
+            result.update(generate_report(
+                task['tags_path'], task['messages_path'], task['report_path'],
+                use_cache=task['use_cache'], render_workers=1, report_options=task['report_options'],
+                report_format=task['report_format'], debug=task['debug']
+            ))
+    except Exception as e:
+        result['status'] = STATUS_FAILED
+        result['error'] = str(e) or type(e).__name__
+        if task['debug']:
+            traceback.print_exc()
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+def run_batch_reports(tag_reads_dir: str, messages_dir: str, reports_dir: str, pattern: str = DEFAULT_PATTERN,
+                      since: Optional[datetime] = None, until: Optional[datetime] = None,
+                      workers: Optional[int] = None, force: bool = False, use_cache: bool = True,
+                      report_options: Optional[dict] = None, report_format: str = 'pdf',
+                      debug: bool = False, log=None) -> dict:
+    """
+    Generates the reports of every selected recording with a process pool.
+    Recordings whose report is newer than the CSVs are skipped unless force is set.
+
+    Args:
+        workers: Number of report processes (default: CPU count, 1 runs in this process)
+        report_options: Layout options passed to generate_report
+        report_format: 'pdf' or 'html'
+        log: Callable receiving progress lines (default: print to stderr)
+
+    Returns:
+        dict: Machine-readable summary (counts, timings and one entry per recording)
+    """
+    log = log or (lambda line: print(line, file=sys.stderr))
+    start = time.perf_counter()
+    results, tasks = [], []
+
+    for csv_filename in select_recordings(tag_reads_dir, pattern, since, until):
+        tags_path = os.path.join(tag_reads_dir, csv_filename)
+        messages_path, report_path = report_paths(csv_filename, messages_dir, reports_dir, report_format)
+        if not force and is_report_up_to_date(tags_path, messages_path, report_path):
+            results.append({'recording': csv_filename, 'report': report_path, 'status': STATUS_SKIPPED, 'seconds': 0.0})
+            log(f"⏭️  {csv_filename}: report up to date")
+            continue
+        tasks.append({
+            'csv_filename': csv_filename, 'tags_path': tags_path, 'messages_path': messages_path,
+            'report_path': report_path, 'use_cache': use_cache, 'report_options': report_options,
+            'report_format': report_format, 'debug': debug
+        })
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    log(f"📊 {len(tasks)} reports to generate, {len(results)} up to date, {workers} workers")
+
+    def record(result):
+        results.append(result)
+        if result['status'] == STATUS_FAILED:
+            log(f"❌ {result['recording']}: {result['error']}")
+        else:
+            log(f"✅ {result['recording']}: {result.get('tags', 0)} tags in {result['seconds']:.2f}s")
+
+    if workers == 1:
+        if tasks:
+            _init_batch_worker(report_format)
+        for task in tasks:
+            record(_batch_worker(task))
+    elif tasks:
+        # spawn: no forked matplotlib/tkinter/thread state in the workers
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_batch_worker, initargs=(report_format,)) as pool:
+            futures = [pool.submit(_batch_worker, task) for task in tasks]
+            for future in as_completed(futures):
+                record(future.result())
+
+    results.sort(key=lambda result: result['recording'])
+    return {
+        'selected': len(results),
+        'generated': sum(1 for r in results if r['status'] == STATUS_GENERATED),
+        'skipped': sum(1 for r in results if r['status'] == STATUS_SKIPPED),
+        'failed': sum(1 for r in results if r['status'] == STATUS_FAILED),
+        'workers': workers,
+        'seconds': round(time.perf_counter() - start, 3),
+        'reports': results
+    }
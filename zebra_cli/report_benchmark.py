@@ -0,0 +1,93 @@
+"""
+Report backend benchmark: PDF (matplotlib) vs HTML (inline SVG) on the same synthetic recording
+
+Writes a tag_reads/messages recording with N tags, then times report_batch.generate_report for every
+format (aggregation included, no aggregate cache, one render process) and prints the speedup of HTML.
+
+Run with: python -m zebra_cli.report_benchmark --tags 60 --reads 500 [--atr]
+"""
+import os
+import csv
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from typing import List, Sequence, Tuple
+
+from zebra_cli.report_batch import REPORT_FORMATS, generate_report
+
+T0 = datetime(2025, 9, 11, 10, 17, 2)
+TAG_READS_HEADER = ['EPC', 'Reads', 'Avg_RSSI', 'Min_RSSI', 'Max_RSSI', 'First_Seen', 'Last_Seen', 'Rate_Per_Minute']
+
+def write_synthetic_recording(directory: str, tags: int, reads_per_tag: int, atr: bool = False) -> Tuple[str, str]:
+    """Writes tags_read_/messages_read_ CSVs with `reads_per_tag` reads 100 ms apart per tag"""
+    tags_path = os.path.join(directory, "tags_read_20250911_101702.csv")
+    messages_path = os.path.join(directory, "messages_read_20250911_101702.csv")
+    epcs = [f"E280{i:020X}" for i in range(tags)]
+    last = T0 + timedelta(milliseconds=100 * (reads_per_tag - 1))
+    with open(tags_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(TAG_READS_HEADER)
+        for epc in epcs:
+            writer.writerow([epc, reads_per_tag, -55.0, -62, -48, T0.strftime('%Y-%m-%d %H:%M:%S.000'),
+                             last.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], 600.0])
+    with open(messages_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Timestamp', 'Message_Type', 'Raw_JSON'])
+        for r in range(reads_per_tag):
+            t = T0 + timedelta(milliseconds=100 * r)
+            reader_ts = t.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + '+0000'
+            for i, epc in enumerate(epcs):
+                if atr:
+                    message = {'type': 'RAW_DIRECTIONALITY', 'timestamp': reader_ts,
+                               'data': {'idHex': epc, 'azimuth': (i * 37 + r) % 360, 'elevation': 30 + (r % 20),
+                                        'rssi': -48 - (r + i) % 14}}
+                else:
+                    message = {'type': 'SIMPLE', 'timestamp': reader_ts,
+                               'data': {'idHex': epc, 'peakRssi': -48 - (r + i) % 14, 'antenna': 1 + (r + i) % 4}}
+                writer.writerow([t.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], message['type'], json.dumps(message)])
+    return tags_path, messages_path
+
+def run_benchmark(tags: int = 60, reads_per_tag: int = 500, formats: Sequence[str] = REPORT_FORMATS,
+                  atr: bool = False, directory: str = None) -> List[dict]:
+    """Generates the report of one synthetic recording in every format; returns one timing dict per format"""
+    if 'pdf' in formats:
+        import matplotlib
+        matplotlib.use('Agg', force=True)
+    with tempfile.TemporaryDirectory(dir=directory) as work_dir:
+        tags_path, messages_path = write_synthetic_recording(work_dir, tags, reads_per_tag, atr)
+        results = []
+        for report_format in formats:
+            report_path = os.path.join(work_dir, f"report_20250911_101702.{report_format}")
+            start = time.perf_counter()
+            info = generate_report(tags_path, messages_path, report_path, use_cache=False, render_workers=1,
+                                   report_options={'summary_mode': False}, report_format=report_format)
+            results.append({
+                'format': report_format,
+                'seconds': time.perf_counter() - start,
+                'tags': info['tags'],
+                'detail_pages': info['detail_pages'],
+                'bytes': os.path.getsize(report_path)
+            })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the PDF and HTML report backends on a synthetic recording")
+    parser.add_argument("--tags", type=int, default=60, help="Tags in the recording (default: 60)")
+    parser.add_argument("--reads", type=int, default=500, help="Reads per tag (default: 500)")
+    parser.add_argument("--atr", action="store_true", help="ATR7000 recording (position charts)")
+    parser.add_argument("--formats", nargs="+", choices=REPORT_FORMATS, default=list(REPORT_FORMATS))
+    args = parser.parse_args()
+
+    print(f"📊 {args.tags} tags x {args.reads} reads ({'ATR7000' if args.atr else 'Standard RFID'})")
+    results = run_benchmark(args.tags, args.reads, args.formats, args.atr)
+    for result in results:
+        print(f"✅ {result['format']:<5} {result['seconds']:8.2f} s  {result['detail_pages']} EPC sections  "
+              f"{result['bytes'] / 1024:8.0f} KB")
+    timings = {result['format']: result['seconds'] for result in results}
+    if 'pdf' in timings and 'html' in timings:
+        print(f"⚡ HTML is {timings['pdf'] / timings['html']:.1f}x faster than PDF")
+
+if __name__ == "__main__":
+    main()
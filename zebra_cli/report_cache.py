@@ -0,0 +1,280 @@
+"""
+Persistent, content-addressed cache of report aggregates
+
+Entries are keyed by the content hash of the tag_reads and messages CSVs. A small index maps
+(path, size, mtime) to the content hash, so a rerun on an unchanged recording neither re-hashes
+nor re-parses the files.
+"""
+import os
+import io
+import json
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from zebra_cli.atr7000_locationing import ATR7000PositionCalculator
+from zebra_cli.report_aggregator import ReportAggregates, ReportAggregator, read_tag_reads
+
+DEFAULT_CACHE_DIR = Path.home() / ".zebra_cli" / "report_cache"
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+# Bump when the aggregation or the entry layout changes
+CACHE_FORMAT_VERSION = 2
+
+ENTRY_SUFFIX = ".npz"
+INDEX_FILENAME = "index.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def hash_file(path: str) -> str:
+    """Returns the BLAKE2b content hash of a file"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _pack_series(epcs: List[str], series: Dict[str, dict], time_key: str,
+                 value_keys: List[str]) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray]]:
+    """Flattens per-EPC lists into offsets + concatenated arrays"""
+    offsets = np.zeros(len(epcs) + 1, dtype=np.int64)
+    times, values = [], [[] for _ in value_keys]
+    for i, epc in enumerate(epcs):
+        data = series[epc]
+        times.extend(data[time_key])
+        for column, key in zip(values, value_keys):
+            column.extend(data[key])
+        offsets[i + 1] = len(times)
+    return (offsets, np.array(times, dtype='datetime64[us]'),
+            [np.array(column, dtype=np.float64) for column in values])
+
+def _unpack_series(epcs: List[str], offsets: np.ndarray, times: np.ndarray, time_key: str,
+                   columns: Dict[str, np.ndarray]) -> Dict[str, dict]:
+    """Inverse of _pack_series"""
+    all_times = times.astype('datetime64[us]').tolist()
+    all_columns = {key: column.tolist() for key, column in columns.items()}
+    series = {}
+    for i, epc in enumerate(epcs):
+        start, end = int(offsets[i]), int(offsets[i + 1])
+        data = {time_key: all_times[start:end]}
+        for key, column in all_columns.items():
+            data[key] = column[start:end]
+        series[epc] = data
+    return series
+
+def _int_keys(data: Dict[str, dict]) -> Dict[str, dict]:
+    """Restores the integer antenna keys lost in the JSON metadata"""
+    return {epc: {int(antenna): value for antenna, value in per_antenna.items()}
+            for epc, per_antenna in data.items()}
+
+class ReportCache:
+    """
+    Stores the tag data and ReportAggregates of a recording as a compressed NumPy archive:
+    per-EPC RSSI and ATR7000 position series as flat arrays, the rest as JSON metadata.
+    Least recently used entries are evicted once the cache exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+                 debug: bool = False):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.debug = debug
+        self._lock = threading.Lock()
+
+    # --- Keys -----------------------------------------------------------------
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.cache_dir / INDEX_FILENAME, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict):
+        self._atomic_write(self.cache_dir / INDEX_FILENAME, json.dumps(index, indent=2).encode('utf-8'))
+
+    def content_hash(self, path: str) -> str:
+        """Returns the content hash of a file, reusing the indexed hash while path, size and mtime match"""
+        if not os.path.exists(path):
+            return "missing"
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            index = self._load_index()
+            known = index.get(path)
+            if known and known.get('size') == stat.st_size and known.get('mtime_ns') == stat.st_mtime_ns:
+                return known['hash']
+        digest = hash_file(path)
+        with self._lock:
+            index = self._load_index()
+            index[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': digest}
+            self._save_index(index)
+        return digest
+
+    def entry_key(self, tags_path: str, messages_path: str,
+                  position_calculator: Optional[ATR7000PositionCalculator] = None) -> str:
+        """Cache key: content of both recordings plus the position calculator parameters"""
+        calculator = position_calculator or ATR7000PositionCalculator()
+        parts = [
+            str(CACHE_FORMAT_VERSION),
+            self.content_hash(tags_path),
+            self.content_hash(messages_path),
+            repr((calculator.reader_height, calculator.tag_height,
+                  calculator.reader_x, calculator.reader_y, calculator.rotation))
+        ]
+        return hashlib.blake2b('|'.join(parts).encode('utf-8'), digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    # --- Entries --------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Tuple[dict, ReportAggregates]]:
+        """Returns (tag_data, aggregates) for a key, or None on a miss or unreadable entry"""
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+        try:
+            with np.load(entry_path, allow_pickle=False) as archive:
+                meta = json.loads(archive['meta'].tobytes().decode('utf-8'))
+                if meta.get('version') != CACHE_FORMAT_VERSION:
+                    return None
+                aggregates = ReportAggregates(
+                    is_atr_reader=meta['is_atr_reader'],
+                    epc_antenna_counts=_int_keys(meta['antenna_counts']),
+                    epc_antenna_rssi_stats=_int_keys(meta['antenna_rssi_stats']),
+                    messages_processed=meta['messages_processed'],
+                    messages_with_position_data=meta['messages_with_position_data'],
+                    connection_gaps=meta['connection_gaps'],
+                    downtime_seconds=meta['downtime_seconds']
+                )
+                aggregates.epc_rssi_data = _unpack_series(
+                    meta['rssi_epcs'], archive['rssi_offsets'], archive['rssi_times'], 'timestamps',
+                    {'rssi_values': archive['rssi_values']}
+                )
+                positions = _unpack_series(
+                    meta['position_epcs'], archive['pos_offsets'], archive['pos_times'], 'timestamps',
+                    {'x': archive['pos_x'], 'y': archive['pos_y']}
+                )
+                tracks = _unpack_series(
+                    meta['position_epcs'], archive['track_offsets'], archive['track_times'], 'track_timestamps',
+                    {'track_x': archive['track_x'], 'track_y': archive['track_y']}
+                )
+                for epc, position_data in positions.items():
+                    position_data.update(tracks[epc])
+                aggregates.epc_position_data = positions
+            os.utime(entry_path)  # Mark as recently used for eviction
+            return meta['tag_data'], aggregates
+        except (OSError, ValueError, KeyError) as e:
+            if self.debug:
+                print(f"[DEBUG]⚠️  Ignoring unreadable report cache entry {entry_path.name}: {e}")
+            return None
+
+    def put(self, key: str, tag_data: dict, aggregates: ReportAggregates):
+        """Stores the tag data and aggregates of a recording, then evicts down to max_bytes"""
+        rssi_epcs = list(aggregates.epc_rssi_data)
+        position_epcs = list(aggregates.epc_position_data)
+        rssi_offsets, rssi_times, (rssi_values,) = _pack_series(
+            rssi_epcs, aggregates.epc_rssi_data, 'timestamps', ['rssi_values'])
+        pos_offsets, pos_times, (pos_x, pos_y) = _pack_series(
+            position_epcs, aggregates.epc_position_data, 'timestamps', ['x', 'y'])
+        track_offsets, track_times, (track_x, track_y) = _pack_series(
+            position_epcs, aggregates.epc_position_data, 'track_timestamps', ['track_x', 'track_y'])
+        meta = {
+            'version': CACHE_FORMAT_VERSION,
+            'tag_data': tag_data,
+            'is_atr_reader': aggregates.is_atr_reader,
+            'antenna_counts': aggregates.epc_antenna_counts,
+            'antenna_rssi_stats': aggregates.epc_antenna_rssi_stats,
+            'messages_processed': aggregates.messages_processed,
+            'messages_with_position_data': aggregates.messages_with_position_data,
+            'connection_gaps': aggregates.connection_gaps,
+            'downtime_seconds': aggregates.downtime_seconds,
+            'rssi_epcs': rssi_epcs,
+            'position_epcs': position_epcs
+        }
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            meta=np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8),
+            rssi_offsets=rssi_offsets, rssi_times=rssi_times, rssi_values=rssi_values,
+            pos_offsets=pos_offsets, pos_times=pos_times, pos_x=pos_x, pos_y=pos_y,
+            track_offsets=track_offsets, track_times=track_times, track_x=track_x, track_y=track_y
+        )
+        self._atomic_write(self._entry_path(key), buffer.getvalue())
+        self.evict()
+
+    def evict(self) -> int:
+        """Removes least recently used entries until the cache fits in max_bytes. Returns the number removed."""
+        entries = []
+        for entry_path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry_path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        if removed and self.debug:
+            print(f"[DEBUG]🧹 Evicted {removed} report cache entries")
+        return removed
+
+    def clear(self):
+        """Removes every entry and the index"""
+        for entry_path in list(self.cache_dir.glob(f"*{ENTRY_SUFFIX}")) + [self.cache_dir / INDEX_FILENAME]:
+            try:
+                entry_path.unlink()
+            except OSError:
+                pass
+
+    def _atomic_write(self, path: Path, content: bytes):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+def load_report_aggregates(tags_path: str, messages_path: str, cache: Optional[ReportCache] = None,
+                           position_calculator: Optional[ATR7000PositionCalculator] = None,
+                           debug: bool = False) -> Tuple[dict, ReportAggregates, bool]:
+    """
+    Returns (tag_data, aggregates, cache_hit) for a recording, parsing the CSVs only on a cache miss.
+    Pass cache=None to always parse.
+    """
+    key = None
+    if cache is not None:
+        try:
+            key = cache.entry_key(tags_path, messages_path, position_calculator)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached[0], cached[1], True
+        except OSError as e:
+            print(f"⚠️  Report cache unavailable: {e}")
+            key = None
+
+    tag_data = read_tag_reads(tags_path)
+    aggregates = ReportAggregator(tag_data, position_calculator, debug=debug).aggregate(messages_path)
+    if cache is not None and key is not None:
+        try:
+            cache.put(key, tag_data, aggregates)
+        except OSError as e:
+            print(f"⚠️  Could not write report cache: {e}")
+    return tag_data, aggregates, False
@@ -0,0 +1,327 @@
+"""
+Lightweight HTML report backend: a single self-contained HTML file with inline SVG charts
+
+Built from the same per-EPC jobs as the PDF report (report_renderer.build_epc_jobs), without matplotlib.
+Series are decimated to a bounded number of points and the file is written section by section,
+so memory and file size stay flat regardless of the recording length.
+"""
+import os
+import html
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from zebra_cli.report_summary import PERCENTILES, percentile_table
+
+# Points kept per plotted series (min/max per bucket, so peaks survive decimation)
+DEFAULT_MAX_POINTS = 600
+
+CHART_WIDTH = 760
+CHART_HEIGHT = 240
+CHART_MARGIN = (40, 20, 40, 60)  # top, right, bottom, left
+
+SERIES_COLORS = ['#1f77b4', '#d62728', '#2ca02c', '#ff7f0e', '#9467bd']
+
+CSS = """
+body { font-family: -apple-system, Segoe UI, Helvetica, Arial, sans-serif; margin: 24px; color: #222; }
+h1 { margin-bottom: 4px; }
+h2 { border-bottom: 2px solid #ddd; padding-bottom: 4px; margin-top: 36px; }
+.box { background: #f3f3f3; border-radius: 6px; padding: 10px 16px; display: inline-block; }
+.epc { background: #eef5fb; }
+table { border-collapse: collapse; margin: 8px 0; }
+th, td { border: 1px solid #ccc; padding: 3px 8px; text-align: right; font-size: 13px; }
+th:first-child, td:first-child { text-align: left; }
+svg { display: block; margin: 8px 0; }
+svg text { font-size: 11px; fill: #444; }
+.legend { font-size: 12px; }
+.row { display: flex; flex-wrap: wrap; gap: 12px; }
+"""
+
+def to_seconds(timestamps: Sequence[datetime]) -> np.ndarray:
+    """Converts datetimes to float seconds since the epoch (naive datetimes are read as UTC, i.e. kept as wall time)"""
+    return np.array(timestamps, dtype='datetime64[us]').astype(np.int64) / 1e6
+
+def decimate_series(x: np.ndarray, y: np.ndarray, max_points: int = DEFAULT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """Keeps the minimum and maximum of each bucket so that at most max_points points remain, in x order"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) <= max_points:
+        return x, y
+    buckets = max(1, max_points // 2)
+    bounds = np.linspace(0, len(x), buckets + 1).astype(np.int64)
+    keep = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if end <= start:
+            continue
+        segment = y[start:end]
+        keep.extend(sorted({start + int(np.argmin(segment)), start + int(np.argmax(segment))}))
+    keep = np.array(keep, dtype=np.int64)
+    return x[keep], y[keep]
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Centered moving average (edges use the available samples)"""
+    values = np.asarray(values, dtype=np.float64)
+    if window <= 1 or len(values) < window:
+        return values
+    kernel = np.ones(window)
+    sums = np.convolve(values, kernel, mode='same')
+    counts = np.convolve(np.ones(len(values)), kernel, mode='same')
+    return sums / counts
+
+def _ticks(low: float, high: float, count: int = 5) -> np.ndarray:
+    if high <= low:
+        return np.array([low])
+    return np.linspace(low, high, count)
+
+def _format_tick(value: float, time_axis: bool) -> str:
+    if time_axis:
+        return datetime.fromtimestamp(value, timezone.utc).strftime('%H:%M:%S')
+    return f'{value:.1f}' if abs(value) < 1000 else f'{value:,.0f}'
+
+def svg_chart(series: List[dict], title: str, x_label: str = '', y_label: str = '', time_axis: bool = False,
+              equal_aspect: bool = False, width: int = CHART_WIDTH, height: int = CHART_HEIGHT) -> str:
+    """
+    Renders an SVG chart.
+
+    Args:
+        series: Dicts with 'x', 'y', optional 'label', 'color', 'kind' ('line' or 'points') and 'width'
+        time_axis: x values are epoch seconds, labelled as HH:MM:SS
+        equal_aspect: same scale on both axes (floor positions)
+    """
+    top, right, bottom, left = CHART_MARGIN
+    plot_w, plot_h = width - left - right, height - top - bottom
+    valid = [s for s in series if len(s['x'])]
+    parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">',
+             f'<text x="{width / 2}" y="16" text-anchor="middle" style="font-size:13px;font-weight:bold">{html.escape(title)}</text>',
+             f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#999"/>']
+    if not valid:
+        parts.append(f'<text x="{width / 2}" y="{height / 2}" text-anchor="middle">No data available</text></svg>')
+        return ''.join(parts)
+
+    x_low = min(float(np.min(s['x'])) for s in valid)
+    x_high = max(float(np.max(s['x'])) for s in valid)
+    y_low = min(float(np.min(s['y'])) for s in valid)
+    y_high = max(float(np.max(s['y'])) for s in valid)
+    if x_high == x_low:
+        x_low, x_high = x_low - 1, x_high + 1
+    if y_high == y_low:
+        y_low, y_high = y_low - 1, y_high + 1
+    y_pad = (y_high - y_low) * 0.05
+    y_low, y_high = y_low - y_pad, y_high + y_pad
+    if equal_aspect:
+        scale = min(plot_w / (x_high - x_low), plot_h / (y_high - y_low))
+        x_mid, y_mid = (x_low + x_high) / 2, (y_low + y_high) / 2
+        x_low, x_high = x_mid - plot_w / scale / 2, x_mid + plot_w / scale / 2
+        y_low, y_high = y_mid - plot_h / scale / 2, y_mid + plot_h / scale / 2
+
+    def px(values):
+        return left + (np.asarray(values) - x_low) / (x_high - x_low) * plot_w
+
+    def py(values):
+        return top + plot_h - (np.asarray(values) - y_low) / (y_high - y_low) * plot_h
+
+    for tick in _ticks(x_low, x_high):
+        x = float(px(tick))
+        parts.append(f'<line x1="{x:.1f}" y1="{top}" x2="{x:.1f}" y2="{top + plot_h}" stroke="#eee"/>'
+                     f'<text x="{x:.1f}" y="{top + plot_h + 14}" text-anchor="middle">{_format_tick(tick, time_axis)}</text>')
+    for tick in _ticks(y_low, y_high):
+        y = float(py(tick))
+        parts.append(f'<line x1="{left}" y1="{y:.1f}" x2="{left + plot_w}" y2="{y:.1f}" stroke="#eee"/>'
+                     f'<text x="{left - 6}" y="{y + 4:.1f}" text-anchor="end">{_format_tick(tick, False)}</text>')
+    if x_label:
+        parts.append(f'<text x="{left + plot_w / 2}" y="{height - 6}" text-anchor="middle">{html.escape(x_label)}</text>')
+    if y_label:
+        parts.append(f'<text x="14" y="{top + plot_h / 2}" text-anchor="middle" '
+                     f'transform="rotate(-90 14 {top + plot_h / 2})">{html.escape(y_label)}</text>')
+
+    legend_x = left + 8
+    for i, s in enumerate(valid):
+        color = s.get('color', SERIES_COLORS[i % len(SERIES_COLORS)])
+        xs, ys = px(s['x']), py(s['y'])
+        if s.get('kind', 'line') == 'points':
+            # One path of zero-length round-capped segments: far smaller than one <circle> per point
+            path = ''.join(f'M{x:.1f} {y:.1f}h0' for x, y in zip(xs, ys))
+            parts.append(f'<path d="{path}" stroke="{color}" stroke-opacity="0.5" stroke-width="3.2" '
+                         f'stroke-linecap="round"/>')
+        else:
+            points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in zip(xs, ys))
+            parts.append(f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="{s.get("width", 1.2)}"/>')
+        if s.get('label'):
+            parts.append(f'<rect x="{legend_x}" y="{top + 6}" width="10" height="10" fill="{color}"/>'
+                         f'<text class="legend" x="{legend_x + 14}" y="{top + 15}">{html.escape(s["label"])}</text>')
+            legend_x += 24 + 7 * len(s['label'])
+    parts.append('</svg>')
+    return ''.join(parts)
+
+def svg_histogram(values: np.ndarray, title: str, x_label: str, bins: int = 30, color: str = '#1f77b4',
+                  width: int = CHART_WIDTH // 2 - 10, height: int = CHART_HEIGHT) -> str:
+    """Renders a histogram of values as SVG bars"""
+    top, right, bottom, left = CHART_MARGIN
+    plot_w, plot_h = width - left - right, height - top - bottom
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">',
+             f'<text x="{width / 2}" y="16" text-anchor="middle" style="font-size:13px;font-weight:bold">{html.escape(title)}</text>',
+             f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#999"/>']
+    if len(values):
+        counts, edges = np.histogram(values, bins=bins)
+        peak = max(int(counts.max()), 1)
+        bar_w = plot_w / len(counts)
+        for i, count in enumerate(counts):
+            bar_h = count / peak * plot_h
+            parts.append(f'<rect x="{left + i * bar_w:.1f}" y="{top + plot_h - bar_h:.1f}" width="{max(bar_w - 1, 0.5):.1f}" '
+                         f'height="{bar_h:.1f}" fill="{color}"/>')
+        parts.append(f'<text x="{left}" y="{top + plot_h + 14}" text-anchor="middle">{_format_tick(edges[0], False)}</text>'
+                     f'<text x="{left + plot_w}" y="{top + plot_h + 14}" text-anchor="middle">{_format_tick(edges[-1], False)}</text>'
+                     f'<text x="{left - 6}" y="{top + 4}" text-anchor="end">{peak:,}</text>'
+                     f'<text x="{left - 6}" y="{top + plot_h}" text-anchor="end">0</text>')
+    parts.append(f'<text x="{left + plot_w / 2}" y="{height - 6}" text-anchor="middle">{html.escape(x_label)}</text></svg>')
+    return ''.join(parts)
+
+def _html_table(header: List[str], rows: List[List[str]]) -> str:
+    head = ''.join(f'<th>{html.escape(str(h))}</th>' for h in header)
+    body = ''.join('<tr>' + ''.join(f'<td>{html.escape(str(c))}</td>' for c in row) + '</tr>' for row in rows)
+    return f'<table><tr>{head}</tr>{body}</table>'
+
+class HtmlReportWriter:
+    """Writes the RFID tag analysis report as one self-contained HTML file"""
+
+    def __init__(self, debug: bool = False, max_points: int = DEFAULT_MAX_POINTS):
+        self.debug = debug
+        self.max_points = max_points
+
+    def render_report(self, html_path: str, csv_filename: str, messages_filename: str, tag_data: dict,
+                      jobs: List[dict], summary=None,
+                      progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Writes the report: header, optional fleet summary, then one section per EPC job (streamed to disk).
+
+        Args:
+            html_path: Output HTML path
+            csv_filename: Tag reads CSV name
+            messages_filename: Messages CSV name
+            tag_data: Per-EPC statistics from the tag reads CSV (header summary)
+            jobs: Per-EPC jobs from report_renderer.build_epc_jobs
+            summary: Optional FleetSummary (report_summary.py)
+            progress: Callback receiving (written EPCs, total EPCs)
+
+        Returns:
+            int: Number of EPC sections written
+        """
+        partial_path = f"{html_path}.part"
+        try:
+            with open(partial_path, 'w', encoding='utf-8') as f:
+                f.write('<!DOCTYPE html><html><head><meta charset="utf-8">'
+                        f'<title>RFID Tag Analysis Report - {html.escape(csv_filename)}</title>'
+                        f'<style>{CSS}</style></head><body>')
+                f.write(self._header_section(csv_filename, messages_filename, tag_data))
+                if summary is not None:
+                    f.write(self._summary_section(summary, len(jobs)))
+                for i, job in enumerate(jobs, 1):
+                    f.write(self._epc_section(job))
+                    if progress:
+                        progress(i, len(jobs))
+                f.write('</body></html>\n')
+            os.replace(partial_path, html_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        return len(jobs)
+
+    def _header_section(self, csv_filename: str, messages_filename: str, tag_data: dict) -> str:
+        total_tags = len(tag_data)
+        total_reads = sum(data['reads'] for data in tag_data.values())
+        avg_rssi_overall = sum(data['avg_rssi'] for data in tag_data.values()) / total_tags if total_tags > 0 else 0
+        first = next(iter(tag_data.values()), None)
+        return (
+            '<h1>RFID Tag Analysis Report</h1>'
+            f'<p>Generated from: tag data <b>{html.escape(csv_filename)}</b>, '
+            f'message data <b>{html.escape(messages_filename)}</b><br>'
+            f'Report generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>'
+            '<div class="box"><b>Summary Statistics</b><br>'
+            f'Total Unique Tags: {total_tags:,}<br>'
+            f'Total Read Events: {total_reads:,}<br>'
+            f'Average RSSI: {avg_rssi_overall:.1f} dBm<br>'
+            f'Data Collection Period: {html.escape(first["first_seen"]) if first else "N/A"} '
+            f'to {html.escape(first["last_seen"]) if first else "N/A"}</div>'
+        )
+
+    def _summary_section(self, summary, detail_count: int) -> str:
+        parts = [f'<h2>Fleet Summary: {summary.tag_count:,} tags (detail sections for {detail_count:,})</h2><div class="row">',
+                 svg_histogram(np.log10(np.maximum(summary.reads, 1)), 'Reads per Tag', 'log10(reads)'),
+                 svg_histogram(summary.avg_rssi, 'Average RSSI per Tag', 'RSSI (dBm)', color='#2ca02c'),
+                 svg_histogram(summary.rate_per_minute, 'Read Rate per Tag', 'reads/minute', color='#ff7f0e'),
+                 '</div><h3>Population Percentiles</h3>',
+                 _html_table(['Metric'] + [f'P{p}' for p in PERCENTILES] + ['Tags'], percentile_table(summary))]
+        if summary.antenna_reads is not None and summary.antenna_ids:
+            rows = []
+            for i, antenna in enumerate(summary.antenna_ids):
+                column = summary.antenna_reads[:, i]
+                rssi = summary.antenna_avg_rssi[:, i]
+                rssi = rssi[~np.isnan(rssi)]
+                rows.append([f'Antenna {antenna}', f'{int((column > 0).sum()):,}', f'{int(column.sum()):,}',
+                             f'{rssi.mean():.1f}' if len(rssi) else '-'])
+            parts.append('<h3>Per-Antenna Totals</h3>')
+            parts.append(_html_table(['Antenna', 'Tags', 'Reads', 'Mean tag RSSI (dBm)'], rows))
+        return ''.join(parts)
+
+    def _epc_section(self, job: dict) -> str:
+        epc = job['epc']
+        data = job['data']
+        parts = [f'<h2 id="{html.escape(epc)}">Tag Analysis: {html.escape(epc)}</h2>',
+                 '<div class="box epc">'
+                 f'Total Reads: {data["reads"]:,}<br>'
+                 f'Average RSSI: {data["avg_rssi"]:.1f} dBm<br>'
+                 f'Min/Max RSSI: {data["min_rssi"]:.1f} / {data["max_rssi"]:.1f} dBm<br>'
+                 f'First Seen: {html.escape(str(data["first_seen"]))}<br>'
+                 f'Last Seen: {html.escape(str(data["last_seen"]))}<br>'
+                 f'Read Rate: {data["rate_per_minute"]:.1f} reads/minute</div>']
+
+        if not job['is_atr_reader']:
+            counts = job['antenna_counts'].get(epc, {})
+            stats = job['antenna_rssi_stats'].get(epc, {})
+            if counts:
+                rows = []
+                for antenna in sorted(counts):
+                    s = stats.get(antenna)
+                    rows.append([f'Antenna {antenna}', f'{counts[antenna]:,}',
+                                 f'{s["sum"] / s["count"]:.1f}' if s and s['count'] else '-',
+                                 f'{s["min"]:.1f} / {s["max"]:.1f}' if s and s['count'] else '-'])
+                parts.append(_html_table(['Antenna', 'Reads', 'Avg RSSI', 'Min / Max RSSI'], rows))
+
+        rssi = job['rssi_data'].get(epc)
+        if rssi and rssi['timestamps']:
+            times = to_seconds(rssi['timestamps'])
+            values = np.asarray(rssi['rssi_values'], dtype=np.float64)
+            order = np.argsort(times, kind='stable')
+            times, values = times[order], values[order]
+            smooth = moving_average(values, max(5, len(values) // 50))
+            parts.append(svg_chart([
+                dict(zip(('x', 'y'), decimate_series(times, values, self.max_points)), label='RSSI', color='#d62728', kind='points'),
+                dict(zip(('x', 'y'), decimate_series(times, smooth, self.max_points)), label='RSSI Smooth', color='#2ca02c', width=2)
+            ], 'RSSI Over Time', 'Time', 'RSSI (dBm)', time_axis=True))
+        else:
+            parts.append('<p>No RSSI time series available</p>')
+
+        position = job.get('position_data') if job['is_atr_reader'] else None
+        if position and position['timestamps']:
+            times = to_seconds(position['timestamps'])
+            track_times = to_seconds(position['track_timestamps']) if position['track_timestamps'] else np.empty(0)
+            for axis in ('x', 'y'):
+                track = position[f'track_{axis}']
+                parts.append(svg_chart([
+                    dict(zip(('x', 'y'), decimate_series(times, position[axis], self.max_points)),
+                         label=f'{axis.upper()} position', kind='points'),
+                    dict(zip(('x', 'y'), decimate_series(track_times, track, self.max_points)),
+                         label='Tracked', color='#ff7f0e', width=2)
+                ], f'{axis.upper()} Position Over Time', 'Time', f'{axis.upper()} (m)', time_axis=True))
+            step = max(1, len(position['x']) // self.max_points)
+            track_step = max(1, len(position['track_x']) // self.max_points)
+            parts.append(svg_chart([
+                {'x': np.asarray(position['x'][::step]), 'y': np.asarray(position['y'][::step]),
+                 'label': 'Positions', 'kind': 'points'},
+                {'x': np.asarray(position['track_x'][::track_step]), 'y': np.asarray(position['track_y'][::track_step]),
+                 'label': 'Track', 'color': '#ff7f0e', 'width': 1.5}
+            ], 'Floor Trajectory', 'X (m)', 'Y (m)', equal_aspect=True, height=CHART_WIDTH // 2))
+        return ''.join(parts)
@@ -0,0 +1,1093 @@
+"""
+PDF report page rendering for Zebra RFID CLI, with optional parallel rendering in a process pool
+"""
+import os
+import shutil
+import tempfile
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, List, Optional
+
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_pdf import PdfPages
+
+from zebra_cli.report_summary import PERCENTILES, build_epc_jobs, percentile_table  # noqa: F401 (build_epc_jobs re-exported)
+
+# Optional PDF merge support for parallel rendering
+try:
+    from pypdf import PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+# Below this number of EPCs the pool start-up costs more than it saves
+PARALLEL_MIN_EPCS = 20
+
+def _init_render_worker():
+    """Worker initializer: headless backend, no GUI in render processes"""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+def _render_jobs_to_file(jobs: List[dict], output_path: str, debug: bool = False) -> int:
+    """Renders a chunk of EPC jobs into its own PDF file (runs in a worker process)"""
+    renderer = ReportPageRenderer(debug=debug)
+    with PdfPages(output_path) as pdf:
+        for job in jobs:
+            renderer.render_epc_pages(job, pdf)
+    return len(jobs)
+
+def _print_progress(done: int, total: int):
+    print(f"📊 Rendered EPC pages {done}/{total}")
+
+class ReportPageRenderer:
+    """Renders the pages of the RFID tag analysis PDF report"""
+
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+
+    def render_report(self, pdf_path: str, csv_filename: str, messages_filename: str, tag_data: dict,
+                      jobs: List[dict], workers: Optional[int] = None,
+                      progress: Optional[Callable[[int, int], None]] = _print_progress,
+                      summary=None) -> bool:
+        """
+        Renders the full report: title page followed by the pages of each EPC in job order.
+        EPC pages are fanned out to a process pool when several cores, enough EPCs and pypdf are available.
+        
+        Args:
+            pdf_path: Output PDF path
+            csv_filename: Tag reads CSV name (title page)
+            messages_filename: Messages CSV name (title page)
+            tag_data: Per-EPC statistics from the tag reads CSV (title page summary)
+            jobs: Per-EPC jobs from build_epc_jobs
+            workers: Number of render processes (default: CPU count, 1 disables the pool)
+            progress: Callback receiving (rendered EPCs, total EPCs)
+            summary: Optional FleetSummary (report_summary.py); its pages follow the title page
+            
+        Returns:
+            bool: True if the pages were rendered in parallel
+        """
+        workers = workers or os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+        parallel = workers > 1 and len(jobs) >= PARALLEL_MIN_EPCS and PYPDF_AVAILABLE
+        if workers > 1 and len(jobs) >= PARALLEL_MIN_EPCS and not PYPDF_AVAILABLE:
+            print("💡 Install pypdf to render report pages in parallel: pip install pypdf")
+
+        if not parallel:
+            with PdfPages(pdf_path) as pdf:
+                self.render_title_page(pdf, csv_filename, messages_filename, tag_data)
+                if summary is not None:
+                    self.render_summary_pages(pdf, summary, len(jobs))
+                for i, job in enumerate(jobs, 1):
+                    if self.debug:
+                        print(f"[DEBUG]📊 Processing EPC {i}/{len(jobs)}: {job['epc'][:16]}...")
+                    self.render_epc_pages(job, pdf)
+                    if progress:
+                        progress(i, len(jobs))
+            return False
+
+        temp_dir = tempfile.mkdtemp(prefix='zebra_report_')
+        try:
+            title_path = os.path.join(temp_dir, 'title.pdf')
+            with PdfPages(title_path) as pdf:
+                self.render_title_page(pdf, csv_filename, messages_filename, tag_data)
+                if summary is not None:
+                    self.render_summary_pages(pdf, summary, len(jobs))
+
+            # Contiguous chunks (a few per worker for load balancing) keep the merge order deterministic
+            chunk_count = min(len(jobs), workers * 4)
+            chunk_size = -(-len(jobs) // chunk_count)
+            chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+            chunk_paths = [os.path.join(temp_dir, f'chunk_{i:05d}.pdf') for i in range(len(chunks))]
+
+            print(f"⚡ Rendering {len(jobs)} EPCs with {workers} processes...")
+            done = 0
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_render_worker) as executor:
+                futures = [executor.submit(_render_jobs_to_file, chunk, path, self.debug)
+                           for chunk, path in zip(chunks, chunk_paths)]
+                for future in as_completed(futures):
+                    done += future.result()
+                    if progress:
+                        progress(done, len(jobs))
+
+            writer = PdfWriter()
+            for path in [title_path] + chunk_paths:
+                writer.append(path)
+            with open(pdf_path, 'wb') as f:
+                writer.write(f)
+            writer.close()
+            return True
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def render_title_page(self, pdf, csv_filename: str, messages_filename: str, tag_data: dict):
+        """Renders the title page with the summary statistics"""
+        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.axis('off')
+        
+        # Title
+        ax.text(0.5, 0.9, 'RFID Tag Analysis Report', 
+               ha='center', va='center', fontsize=24, fontweight='bold')
+        
+        # Source files information (left aligned)
+        source_files_text = f'Generated from:\n  • Tag data: {csv_filename}\n  • Message data: {messages_filename}'
+        ax.text(0.1, 0.82, source_files_text, 
+               ha='left', va='top', fontsize=12)
+        
+        # Generation time (left aligned with vertical spacing)
+        generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ax.text(0.1, 0.72, f'Report generated: {generation_time}', 
+               ha='left', va='center', fontsize=12)
+        
+        # Summary statistics
+        total_tags = len(tag_data)
+        total_reads = sum(data['reads'] for data in tag_data.values())
+        avg_rssi_overall = sum(data['avg_rssi'] for data in tag_data.values()) / total_tags if total_tags > 0 else 0
+        
+        summary_text = f"""Summary Statistics:
+• Total Unique Tags: {total_tags}
+• Total Read Events: {total_reads:,}
+• Average RSSI: {avg_rssi_overall:.1f} dBm
+• Data Collection Period: {tag_data[list(tag_data.keys())[0]]['first_seen'] if tag_data else 'N/A'} 
+  to {tag_data[list(tag_data.keys())[0]]['last_seen'] if tag_data else 'N/A'}"""
+        
+        ax.text(0.1, 0.55, summary_text, ha='left', va='center', fontsize=12,
+               bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray"))
+        
+        pdf.savefig(fig, bbox_inches='tight')
+        plt.close(fig)
+
+    def render_summary_pages(self, pdf, summary, detail_count: int):
+        """
+        Renders the fleet summary pages: read and RSSI distributions, per-antenna (or floor) heatmaps
+        and the population percentile table.
+        
+        Args:
+            pdf: PdfPages object to save the figures
+            summary: FleetSummary of the recording
+            detail_count: Number of EPCs with detail pages (shown in the page header)
+        """
+        # Page 1: population distributions
+        fig, axes = plt.subplots(2, 2, figsize=(8.5, 11))
+        fig.suptitle(f'Fleet Summary: {summary.tag_count:,} tags '
+                     f'(detail pages for {detail_count:,})', fontsize=16, fontweight='bold')
+        reads = summary.reads[summary.reads > 0]
+        if len(reads):
+            bins = np.logspace(0, np.log10(max(reads.max(), 2)), 40)
+            axes[0, 0].hist(reads, bins=bins, color='steelblue')
+            axes[0, 0].set_xscale('log')
+        axes[0, 0].set_title('Reads per Tag')
+        axes[0, 0].set_xlabel('Reads')
+        axes[0, 0].set_ylabel('Tags')
+        axes[0, 1].hist(summary.avg_rssi, bins=40, color='seagreen')
+        axes[0, 1].set_title('Average RSSI per Tag')
+        axes[0, 1].set_xlabel('RSSI (dBm)')
+        axes[0, 1].set_ylabel('Tags')
+        axes[1, 0].hist(summary.rate_per_minute, bins=40, color='darkorange')
+        axes[1, 0].set_title('Read Rate per Tag')
+        axes[1, 0].set_xlabel('Reads/minute')
+        axes[1, 0].set_ylabel('Tags')
+        if summary.tag_count:
+            axes[1, 1].hist2d(summary.avg_rssi, np.log10(np.maximum(summary.reads, 1)), bins=40, cmap='viridis', cmin=1)
+        axes[1, 1].set_title('Reads vs Average RSSI')
+        axes[1, 1].set_xlabel('RSSI (dBm)')
+        axes[1, 1].set_ylabel('log10(reads)')
+        for ax in axes.flat:
+            ax.grid(True, alpha=0.3)
+        fig.tight_layout(rect=[0, 0, 1, 0.95])
+        pdf.savefig(fig)
+        plt.close(fig)
+
+        # Page 2: per-antenna heatmaps (standard readers) or floor occupancy (ATR7000)
+        if summary.antenna_reads is not None and summary.antenna_ids:
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8.5, 11))
+            fig.suptitle('Per-Antenna Analysis', fontsize=16, fontweight='bold')
+            labels = [str(a) for a in summary.antenna_ids]
+
+            rssi_edges = np.linspace(np.nanmin(summary.min_rssi), np.nanmax(summary.max_rssi) + 1e-6, 31)
+            rssi_matrix = np.zeros((len(summary.antenna_ids), len(rssi_edges) - 1))
+            for i in range(len(summary.antenna_ids)):
+                values = summary.antenna_avg_rssi[:, i]
+                valid = ~np.isnan(values)
+                rssi_matrix[i], _ = np.histogram(values[valid], bins=rssi_edges)
+            image = ax1.imshow(rssi_matrix, aspect='auto', cmap='viridis', origin='lower',
+                               extent=[rssi_edges[0], rssi_edges[-1], -0.5, len(labels) - 0.5])
+            ax1.set_yticks(range(len(labels)), labels)
+            ax1.set_xlabel('Average RSSI (dBm)')
+            ax1.set_ylabel('Antenna')
+            ax1.set_title('Tags per Antenna and Average RSSI')
+            fig.colorbar(image, ax=ax1, label='Tags')
+
+            max_reads = max(int(summary.antenna_reads.max()), 2)
+            read_edges = np.unique(np.logspace(0, np.log10(max_reads + 1), 31).astype(np.int64))
+            read_matrix = np.zeros((len(summary.antenna_ids), len(read_edges) - 1))
+            for i in range(len(summary.antenna_ids)):
+                column = summary.antenna_reads[:, i]
+                read_matrix[i], _ = np.histogram(column[column > 0], bins=read_edges)
+            image = ax2.imshow(read_matrix, aspect='auto', cmap='magma', origin='lower')
+            ax2.set_yticks(range(len(labels)), labels)
+            tick_positions = np.linspace(0, len(read_edges) - 2, min(8, len(read_edges) - 1)).astype(int)
+            ax2.set_xticks(tick_positions, [f'{read_edges[t]:,}' for t in tick_positions])
+            ax2.set_xlabel('Reads per tag (log bins)')
+            ax2.set_ylabel('Antenna')
+            ax2.set_title('Tags per Antenna and Read Count')
+            fig.colorbar(image, ax=ax2, label='Tags')
+            fig.tight_layout(rect=[0, 0, 1, 0.95])
+            pdf.savefig(fig)
+            plt.close(fig)
+        elif summary.position_histogram is not None:
+            fig, ax = plt.subplots(figsize=(8.5, 11))
+            fig.suptitle('ATR7000 Floor Occupancy', fontsize=16, fontweight='bold')
+            image = ax.imshow(summary.position_histogram, origin='lower', cmap='hot',
+                              extent=summary.position_extent)
+            ax.set_xlabel('X (m)')
+            ax.set_ylabel('Y (m)')
+            ax.set_title('Position reads per cell (all tags)')
+            fig.colorbar(image, ax=ax, label='Reads', shrink=0.6)
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+
+        # Page 3: percentile table
+        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.axis('off')
+        ax.set_title('Population Percentiles', fontsize=16, fontweight='bold')
+        header = ['Metric'] + [f'P{p}' for p in PERCENTILES] + ['Tags']
+        table = ax.table(cellText=percentile_table(summary), colLabels=header, loc='upper center',
+                         colWidths=[0.34] + [0.1] * len(PERCENTILES) + [0.12])
+        table.auto_set_font_size(False)
+        table.set_fontsize(9)
+        table.scale(1, 1.5)
+        pdf.savefig(fig, bbox_inches='tight')
+        plt.close(fig)
+
+    def render_epc_pages(self, job: dict, pdf):
+        """Renders the pages of one EPC job"""
+        epc = job['epc']
+        # Page 1: Statistics and RSSI graph (same for all readers)
+        self._generate_stats_and_rssi_page(
+            epc, job['data'], job['rssi_data'], job['is_atr_reader'],
+            job['antenna_counts'], job['antenna_rssi_stats'], pdf
+        )
+        # Page 2: Position graphs (only for ATR readers with position data)
+        if job['is_atr_reader'] and job.get('position_data') is not None:
+            self._generate_position_graphs_page(epc, job['position_data'], pdf)
+
+    def _generate_stats_and_rssi_page(self, epc: str, data: dict, epc_rssi_data: dict, 
+                                     is_atr_reader: bool, epc_antenna_counts: dict, 
+                                     epc_antenna_rssi_stats: dict, pdf):
+        """
+        Generates the first page with tag statistics and RSSI graph (same for all readers).
+        
+        Args:
+            epc: EPC identifier
+            data: Tag statistics data
+            epc_rssi_data: RSSI time series data
+            is_atr_reader: Whether this is an ATR7000 reader
+            epc_antenna_counts: Antenna count data
+            epc_antenna_rssi_stats: Antenna RSSI statistics
+            pdf: PdfPages object to save the figure
+        """
+        try:
+            # Create 3-section layout for better spacing
+            fig = plt.figure(figsize=(8.5, 11))
+            gs = fig.add_gridspec(3, 1, height_ratios=[1, 2, 0.5], hspace=0.3)
+            
+            # EPC Header
+            fig.suptitle(f'Tag Analysis: {epc}', fontsize=16, fontweight='bold', y=0.95)
+            
+            # Statistics section
+            ax1 = fig.add_subplot(gs[0])
+            ax1.axis('off')
+            
+            # Build antenna counts and RSSI statistics text (only for non-ATR readers)
+            antenna_text = ""
+            if not is_atr_reader:
+                if epc in epc_antenna_counts and epc_antenna_counts[epc]:
+                    antenna_counts = epc_antenna_counts[epc]
+                    # Sort antenna IDs for consistent display
+                    sorted_antennas = sorted(antenna_counts.keys())
+                    antenna_lines = []
+                    for ant_id in sorted_antennas:
+                        count = antenna_counts[ant_id]
+                        
+                        # Check if we have RSSI statistics for this antenna
+                        rssi_info = ""
+                        if (epc in epc_antenna_rssi_stats and 
+                            ant_id in epc_antenna_rssi_stats[epc] and
+                            epc_antenna_rssi_stats[epc][ant_id]['count'] > 0):
+                            
+                            stats = epc_antenna_rssi_stats[epc][ant_id]
+                            avg_rssi = stats['sum'] / stats['count']
+                            min_rssi = stats['min']
+                            max_rssi = stats['max']
+                            rssi_info = f" (RSSI: {avg_rssi:.1f} avg, {min_rssi:.1f}/{max_rssi:.1f} min/max)"
+                        
+                        antenna_lines.append(f"  - Antenna {ant_id}: {count:,} reads{rssi_info}")
+                    antenna_text = "\n• Reads by Antenna:\n" + "\n".join(antenna_lines)
+                else:
+                    antenna_text = "\n• Reads by Antenna: No antenna data available"
+            
+            stats_text = f"""
+Tag Statistics:
+• EPC: {epc}
+• Total Reads: {data['reads']:,}
+• Average RSSI: {data['avg_rssi']:.1f} dBm
+• Min/Max RSSI: {data['min_rssi']:.1f} / {data['max_rssi']:.1f} dBm
+• First Seen: {data['first_seen']}
+• Last Seen: {data['last_seen']}
+• Read Rate: {data['rate_per_minute']:.1f} reads/minute{antenna_text}
+            """
+            
+            ax1.text(0.1, 0.8, stats_text, fontsize=11, va='top',
+                    bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue"))
+            
+            # Add a little bit of spacing
+            ax1.text(0.1, 0.1, " ", fontsize=11, va='top')
+            
+            # RSSI over time graph (section 2)
+            if epc in epc_rssi_data and epc_rssi_data[epc]['timestamps']:
+                ax2 = fig.add_subplot(gs[1])
+                
+                timestamps = epc_rssi_data[epc]['timestamps']
+                rssi_values = epc_rssi_data[epc]['rssi_values']
+                
+                # Sort by timestamp
+                sorted_data = sorted(zip(timestamps, rssi_values))
+                timestamps, rssi_values = zip(*sorted_data)
+                
+                ax2.plot(timestamps, rssi_values, 'b-', linewidth=0.5, alpha=0.3)
+                ax2.scatter(timestamps, rssi_values, c='red', s=5, alpha=0.5)
+
+                # Calculate and plot smooth curve
+                # Savitzky-Golay Filter
+                smooth_info = self._calculate_smooth_curve_savgol(list(timestamps), list(rssi_values))
+
+                if smooth_info:
+                    ax2.plot(smooth_info['timestamps'], smooth_info['coordinates'], 
+                            'green', linewidth=2, linestyle='-', label='RSSI Smooth', alpha=1)
+                    # Only show legend when we have labeled smooth curve
+                    ax2.legend(fontsize=9)
+
+                ax2.set_xlabel('Time')
+                ax2.set_ylabel('RSSI (dBm)')
+                ax2.set_title('RSSI Over Time')
+                ax2.grid(True, alpha=0.3)
+                
+                # Format x-axis with adaptive interval based on data time span
+                ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+                
+                # Calculate time span from tag data to choose appropriate locator
+                try:
+                    # Try parsing with microseconds first, then without if it fails
+                    try:
+                        first_seen = datetime.strptime(data['first_seen'], '%Y-%m-%d %H:%M:%S.%f')
+                        last_seen = datetime.strptime(data['last_seen'], '%Y-%m-%d %H:%M:%S.%f')
+                    except ValueError:
+                        # Fallback to format without microseconds
+                        first_seen = datetime.strptime(data['first_seen'], '%Y-%m-%d %H:%M:%S')
+                        last_seen = datetime.strptime(data['last_seen'], '%Y-%m-%d %H:%M:%S')
+                    
+                    time_span_seconds = (last_seen - first_seen).total_seconds()
+                    
+                    # Choose appropriate time axis interval based on data duration (time axis markers)
+                    if time_span_seconds <= 10:  # ≤ 10 seconds: show every second
+                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
+                    elif time_span_seconds <= 30:  # ≤ 30 seconds: show every 5 seconds
+                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=5))
+                    elif time_span_seconds <= 120:  # ≤ 2 minutes: show every 15 seconds
+                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
+                    elif time_span_seconds <= 300:  # ≤ 5 minutes: show every 30 seconds
+                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=30))
+                    elif time_span_seconds <= 900:  # ≤ 15 minutes: show every minute
+                        ax2.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
+                    elif time_span_seconds <= 3600:  # ≤ 1 hour: show every 5 minutes
+                        ax2.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
+                    else:  # > 1 hour: show every 15 minutes
+                        ax2.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
+                        
+                except (ValueError, TypeError) as e:
+                    # Fallback to adaptive approach based on data points if timestamp parsing fails
+                    if len(timestamps) > 10:
+                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=max(1, len(timestamps)//6)))
+                    else:
+                        ax2.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
+                
+                plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
+                
+                # Add statistics to graph
+                stats_box = f'Avg: {data["avg_rssi"]:.1f}dBm\nMin: {data["min_rssi"]:.1f}dBm\nMax: {data["max_rssi"]:.1f}dBm'
+                ax2.text(0.02, 0.98, stats_box, transform=ax2.transAxes, fontsize=9,
+                        verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+            else:
+                ax2 = fig.add_subplot(gs[1])
+                ax2.text(0.5, 0.5, 'No RSSI time-series data available\nfor this EPC', 
+                        ha='center', va='center', fontsize=12,
+                        bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
+                ax2.set_xlim(0, 1)
+                ax2.set_ylim(0, 1)
+                ax2.axis('off')
+            
+            # Note: Custom GridSpec layout eliminates need for plt.tight_layout()
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+            
+        except Exception as e:
+            print(f"❌ Error generating stats and RSSI page for EPC {epc}: {e}")
+            if hasattr(self, 'debug') and self.debug:
+                traceback.print_exc()
+
+    def _generate_position_graphs_page(self, epc: str, position_data: dict, pdf):
+        """
+        Generates the second page with X and Y position variation graphs (ATR7000 only).
+        
+        Args:
+            epc: EPC identifier
+            position_data: Position history of the EPC (see report_aggregator.position_data_from_store)
+            pdf: PdfPages object to save the figure
+        """
+        try:
+            # Create 2-section layout for position graphs with maximum space
+            fig = plt.figure(figsize=(8.5, 11))
+            gs = fig.add_gridspec(2, 1, height_ratios=[1, 1], hspace=0.4)
+            
+            # Page header
+            fig.suptitle(f'Position Analysis: {epc}', fontsize=16, fontweight='bold', y=0.95)
+            
+            # X Position Graph (section 1)
+            ax_x = fig.add_subplot(gs[0])
+            x_graph_created = self._generate_x_position_graph(position_data, ax_x)
+            
+            if not x_graph_created:
+                # Fallback message if no X graph could be created
+                ax_x.text(0.5, 0.5, 'No X coordinate data available for this EPC', 
+                          ha='center', va='center', fontsize=11,
+                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
+                ax_x.set_xlim(0, 1)
+                ax_x.set_ylim(0, 1)
+                ax_x.axis('off')
+            
+            # Y Position Graph (section 2)
+            ax_y = fig.add_subplot(gs[1])
+            y_graph_created = self._generate_y_position_graph(position_data, ax_y)
+            
+            if not y_graph_created:
+                # Fallback message if no Y graph could be created
+                ax_y.text(0.5, 0.5, 'No Y coordinate data available for this EPC', 
+                          ha='center', va='center', fontsize=11,
+                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
+                ax_y.set_xlim(0, 1)
+                ax_y.set_ylim(0, 1)
+                ax_y.axis('off')
+            
+            # Note: Custom GridSpec layout eliminates need for plt.tight_layout()
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+            
+        except Exception as e:
+            print(f"❌ Error generating position graphs page for EPC {epc}: {e}")
+            if hasattr(self, 'debug') and self.debug:
+                traceback.print_exc()
+
+    def _generate_x_position_graph(self, position_data: dict, ax_x):
+        """
+        Generates X position variation graph for ATR7000 readers with smooth curve.
+        
+        Args:
+            position_data: Position history of the EPC (see report_aggregator.position_data_from_store)
+            ax_x: matplotlib axes to plot on
+            
+        Returns:
+            bool: True if graph was generated, False if no data
+        """
+        try:
+            # Get X history for this EPC
+            timestamps = position_data.get('timestamps', [])
+            x_coords = position_data.get('x', [])
+            
+            if not timestamps or not x_coords or len(timestamps) == 0:
+                # No position data available
+                ax_x.text(0.5, 0.5, 'No X coordinate data available for this EPC', 
+                          ha='center', va='center', fontsize=11,
+                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
+                ax_x.set_xlim(0, 1)
+                ax_x.set_ylim(0, 1)
+                ax_x.axis('off')
+                return False
+            
+            # Plot X coordinates
+            ax_x.plot(timestamps, x_coords, 'b-', linewidth=0.5, marker='o', markersize=2, label='X Coordinate', alpha=0.3)
+
+            # Calculate and plot trend line - Design choice --> not significant
+            # trend_info = self._calculate_trend_line(timestamps, x_coords)
+            # if trend_info:
+            #     ax_x.plot(trend_info['trend_timestamps'], trend_info['trend_coords'], 
+            #              'navy', linewidth=2, linestyle='--', label='X Trend', alpha=0.9)
+            
+            # Smooth curve from the streaming tracker fed while loading the messages,
+            # Savitzky-Golay Filter as fallback
+            smooth_info = self._get_tracked_curve(position_data, 'x')
+            if not smooth_info:
+                smooth_info = self._calculate_smooth_curve_savgol(timestamps, x_coords)
+            
+            if smooth_info:
+                ax_x.plot(smooth_info['timestamps'], smooth_info['coordinates'], 
+                         'green', linewidth=2, linestyle='-', label='X Smooth', alpha=1)
+            
+            ax_x.set_ylabel('X Coordinate (meters)', fontsize=10)
+            ax_x.set_title('X Position Variations Over Time', fontsize=11, fontweight='bold')
+            ax_x.grid(True, alpha=0.3)
+            ax_x.legend(fontsize=9)
+            
+            # Format x-axis with adaptive interval based on timestamps time span
+            ax_x.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+            
+            # Calculate time span to choose appropriate locator (time axis markers)
+            try:
+                time_span_seconds = (max(timestamps) - min(timestamps)).total_seconds()
+                
+                # Choose appropriate time axis interval based on position data duration
+                if time_span_seconds <= 10:  # ≤ 10 seconds: show every second
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
+                elif time_span_seconds <= 30:  # ≤ 30 seconds: show every 5 seconds
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=5))
+                elif time_span_seconds <= 60:  # ≤ 1 minute: show every 10 seconds
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=10))
+                elif time_span_seconds <= 120:  # ≤ 2 minutes: show every 15 seconds
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
+                elif time_span_seconds <= 300:  # ≤ 5 minutes: show every 30 seconds
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=30))
+                elif time_span_seconds <= 900:  # ≤ 15 minutes: show every minute
+                    ax_x.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
+                elif time_span_seconds <= 3600:  # ≤ 1 hour: show every 5 minutes
+                    ax_x.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
+                else:  # > 1 hour: show every 15 minutes
+                    ax_x.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
+                    
+            except (ValueError, TypeError, AttributeError):
+                # Fallback to data point based approach if timestamp calculation fails
+                if len(timestamps) > 10:
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=max(1, len(timestamps)//8)))
+                else:
+                    ax_x.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
+            
+            ax_x.tick_params(axis='x', labelsize=8)
+            ax_x.tick_params(axis='y', labelsize=9)
+            
+            # Don't show x-axis labels (will be shown only on bottom graph)
+            ax_x.set_xticklabels([])
+            
+            # Set time range
+            if len(timestamps) > 1:
+                time_range = [min(timestamps), max(timestamps)]
+                ax_x.set_xlim(time_range)
+            
+            # Add statistics info box
+            if len(x_coords) > 0:
+                x_range = max(x_coords) - min(x_coords)
+                x_mean = sum(x_coords) / len(x_coords)
+                stats_text = f'Points: {len(x_coords)}\nRange: {x_range:.2f}m\nMean: {x_mean:.2f}m'
+                
+                # Add trend information if available - Design choice --> not significant
+                # if trend_info:
+                #     slope_per_second = trend_info['slope']
+                #     direction = trend_info['direction']
+                    
+                #     # Convert slope to more meaningful units (meters per minute if time span > 60s)
+                #     time_span = trend_info['time_span_seconds']
+                #     if time_span > 60:
+                #         slope_per_minute = slope_per_second * 60
+                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_minute:.3f}m/min'
+                #     else:
+                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_second:.3f}m/s'
+                
+                ax_x.text(0.02, 0.98, stats_text, transform=ax_x.transAxes, fontsize=8,
+                         verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8))
+            
+            return True
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error generating X position graph: {e}")
+            return False
+
+    def _generate_y_position_graph(self, position_data: dict, ax_y):
+        """
+        Generates Y position variation graph for ATR7000 readers with smooth curve.
+        
+        Args:
+            position_data: Position history of the EPC (see report_aggregator.position_data_from_store)
+            ax_y: matplotlib axes to plot on
+            
+        Returns:
+            bool: True if graph was generated, False if no data
+        """
+        try:
+            # Get Y history for this EPC
+            timestamps = position_data.get('timestamps', [])
+            y_coords = position_data.get('y', [])
+            
+            if not timestamps or not y_coords or len(timestamps) == 0:
+                # No position data available
+                ax_y.text(0.5, 0.5, 'No Y coordinate data available for this EPC', 
+                          ha='center', va='center', fontsize=11,
+                          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightyellow"))
+                ax_y.set_xlim(0, 1)
+                ax_y.set_ylim(0, 1)
+                ax_y.axis('off')
+                return False
+            
+            # Plot Y coordinates
+            ax_y.plot(timestamps, y_coords, 'r-', linewidth=0.5, marker='o', markersize=2, label='Y Coordinate', alpha=0.3)
+            
+            # Calculate and plot trend line - Design choice --> not significant
+            # trend_info = self._calculate_trend_line(timestamps, y_coords)
+            # if trend_info:
+            #     ax_y.plot(trend_info['trend_timestamps'], trend_info['trend_coords'], 
+            #              'darkred', linewidth=2, linestyle='--', label='Y Trend', alpha=0.9)
+            
+            # Smooth curve from the streaming tracker fed while loading the messages,
+            # Savitzky-Golay Filter as fallback
+            smooth_info = self._get_tracked_curve(position_data, 'y')
+            if not smooth_info:
+                smooth_info = self._calculate_smooth_curve_savgol(timestamps, y_coords)
+
+            if smooth_info:
+                ax_y.plot(smooth_info['timestamps'], smooth_info['coordinates'], 
+                         'green', linewidth=2, linestyle='-', label='Y Smooth', alpha=1)
+            
+            ax_y.set_ylabel('Y Coordinate (meters)', fontsize=10)
+            ax_y.set_xlabel('Time', fontsize=10)
+            ax_y.set_title('Y Position Variations Over Time', fontsize=11, fontweight='bold')
+            ax_y.grid(True, alpha=0.3)
+            ax_y.legend(fontsize=9)
+            
+            # Format x-axis with adaptive interval based on timestamps time span
+            ax_y.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+            
+            # Calculate time span to choose appropriate locator (time axis markers)
+            try:
+                time_span_seconds = (max(timestamps) - min(timestamps)).total_seconds()
+                
+                # Choose appropriate time axis interval based on position data duration
+                if time_span_seconds <= 10:  # ≤ 10 seconds: show every second
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
+                elif time_span_seconds <= 30:  # ≤ 30 seconds: show every 5 seconds
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=5))
+                elif time_span_seconds <= 60:  # ≤ 1 minute: show every 10 seconds
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=10))
+                elif time_span_seconds <= 120:  # ≤ 2 minutes: show every 15 seconds
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=15))
+                elif time_span_seconds <= 300:  # ≤ 5 minutes: show every 30 seconds
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=30))
+                elif time_span_seconds <= 900:  # ≤ 15 minutes: show every minute
+                    ax_y.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
+                elif time_span_seconds <= 3600:  # ≤ 1 hour: show every 5 minutes
+                    ax_y.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
+                else:  # > 1 hour: show every 15 minutes
+                    ax_y.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
+                    
+            except (ValueError, TypeError, AttributeError):
+                # Fallback to data point based approach if timestamp calculation fails
+                if len(timestamps) > 10:
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=max(1, len(timestamps)//8)))
+                else:
+                    ax_y.xaxis.set_major_locator(mdates.SecondLocator(interval=1))
+            
+            plt.setp(ax_y.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
+            ax_y.tick_params(axis='y', labelsize=9)
+            
+            # Set time range
+            if len(timestamps) > 1:
+                time_range = [min(timestamps), max(timestamps)]
+                ax_y.set_xlim(time_range)
+            
+            # Add statistics info box
+            if len(y_coords) > 0:
+                y_range = max(y_coords) - min(y_coords)
+                y_mean = sum(y_coords) / len(y_coords)
+                stats_text = f'Points: {len(y_coords)}\nRange: {y_range:.2f}m\nMean: {y_mean:.2f}m'
+                
+                # Add trend information if available - Design choice --> not significant
+                # if trend_info:
+                #     slope_per_second = trend_info['slope']
+                #     direction = trend_info['direction']
+                    
+                #     # Convert slope to more meaningful units (meters per minute if time span > 60s)
+                #     time_span = trend_info['time_span_seconds']
+                #     if time_span > 60:
+                #         slope_per_minute = slope_per_second * 60
+                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_minute:.3f}m/min'
+                #     else:
+                #         stats_text += f'\nTrend: {direction}\nSlope: {slope_per_second:.3f}m/s'
+                
+                ax_y.text(0.02, 0.98, stats_text, transform=ax_y.transAxes, fontsize=8,
+                         verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcoral", alpha=0.8))
+            
+            return True
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error generating Y position graph: {e}")
+            return False
+
+    # Not used but kept for eventual future use
+    def _calculate_trend_line(self, timestamps, coordinates):
+        """
+        Calculate linear trend line for position coordinate data.
+        
+        Args:
+            timestamps: List of datetime objects
+            coordinates: List of coordinate values (x or y)
+            
+        Returns:
+            dict: Contains slope, intercept, direction, and trend points, or None if calculation fails
+        """
+        try:            
+            if len(timestamps) < 2 or len(coordinates) < 2:
+                return None
+                
+            # Convert timestamps to numeric seconds since first timestamp
+            first_time = timestamps[0]
+            time_numeric = [(t - first_time).total_seconds() for t in timestamps]
+            
+            # Calculate linear regression (degree=1 for linear trend)
+            coefficients = np.polyfit(time_numeric, coordinates, 1)
+            slope, intercept = coefficients
+            
+            # Calculate trend line endpoints for the time range
+            time_range = [min(time_numeric), max(time_numeric)]
+            trend_coords = [slope * t + intercept for t in time_range]
+            trend_timestamps = [timestamps[0], timestamps[-1]]
+            
+            # Determine trend direction
+            slope_threshold = 0.001  # Threshold for considering trend "stable"
+            if abs(slope) < slope_threshold:
+                direction = "Stable"
+            elif slope > 0:
+                direction = "Increasing"
+            else:
+                direction = "Decreasing"
+            
+            return {
+                'slope': slope,
+                'intercept': intercept,
+                'direction': direction,
+                'trend_timestamps': trend_timestamps,
+                'trend_coords': trend_coords,
+                'time_span_seconds': max(time_numeric)
+            }
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error calculating trend line: {e}")
+            return None
+
+    # SMOOTHING ALGORITHM
+    def _get_tracked_curve(self, position_data: dict, axis: str):
+        """
+        Get the smooth curve computed incrementally by the PointDataStore position tracker.
+        
+        Args:
+            position_data: Position history of the EPC (see report_aggregator.position_data_from_store)
+            axis: 'x' or 'y'
+            
+        Returns:
+            dict: Contains smooth curve timestamps and coordinates, or None if no tracker data
+        """
+        try:
+            timestamps = position_data.get('track_timestamps', [])
+            if len(timestamps) < 2:
+                return None
+            return {
+                'timestamps': timestamps,
+                'coordinates': position_data.get(f'track_{axis}', [])
+            }
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error reading tracked curve: {e}")
+            return None
+
+    # We use Savitzky-Golay Filter (savgol), but kept for eventual future use
+    def _calculate_smooth_curve_spline(self, timestamps, coordinates):
+        """
+        Calculate smooth interpolated curve for position coordinate data using cubic splines.
+        
+        Args:
+            timestamps: List of datetime objects
+            coordinates: List of coordinate values (x or y)
+            
+        Returns:
+            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
+        """
+        try:
+            # Import scipy.interpolate for cubic spline
+            try:
+                from scipy.interpolate import make_interp_spline
+            except ImportError:
+                if hasattr(self, 'debug') and self.debug:
+                    print("⚠️  scipy.interpolate not available for cubic spline smoothing")
+                return None
+                    
+            if len(timestamps) < 4 or len(coordinates) < 4:
+                # Need at least 4 points for cubic spline
+                return None
+                
+            # Convert timestamps to numeric seconds since first timestamp
+            first_time = timestamps[0]
+            time_numeric = np.array([(t - first_time).total_seconds() for t in timestamps])
+            coordinates_array = np.array(coordinates)
+            
+            # Create cubic spline interpolator
+            spline = make_interp_spline(time_numeric, coordinates_array, k=3)
+            
+            # Generate more time points for smooth curve visualization (3x density)
+            time_span = max(time_numeric) - min(time_numeric)
+            num_points = max(100, len(timestamps) * 3)  # At least 100 points for smoothness
+            time_smooth = np.linspace(min(time_numeric), max(time_numeric), num_points)
+            
+            # Evaluate spline at smooth time points
+            coords_smooth = spline(time_smooth)
+            
+            # Convert back to datetime objects
+            timestamps_smooth = [first_time + np.timedelta64(int(t * 1000), 'ms') for t in time_smooth]
+            
+            return {
+                'timestamps': timestamps_smooth,
+                'coordinates': coords_smooth.tolist()
+            }
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error calculating smooth curve: {e}")
+            return None
+
+    def _calculate_smooth_curve_savgol(self, timestamps, coordinates):
+        """
+        Calculate smooth curve for position coordinate data using Savitzky-Golay filter.
+        
+        Args:
+            timestamps: List of datetime objects
+            coordinates: List of coordinate values (x or y)
+            
+        Returns:
+            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
+        """
+        try:
+            # Import scipy.signal for Savitzky-Golay filter
+            try:
+                from scipy.signal import savgol_filter
+            except ImportError:
+                if hasattr(self, 'debug') and self.debug:
+                    print("⚠️  scipy.signal not available for Savitzky-Golay smoothing")
+                return None
+                
+            if len(timestamps) < 5 or len(coordinates) < 5:
+                # Need at least 5 points for reasonable Savitzky-Golay filtering
+                return None
+                
+            coordinates_array = np.array(coordinates)
+            
+            # Choose appropriate window length and polynomial order for position data
+            data_length = len(coordinates)
+            
+            # Window length should be odd and much smaller than data length
+            # For position data, we want to preserve features while smoothing noise
+            if data_length >= 15:
+                window_length = 7  # Good balance for most position tracking data
+                polyorder = 3      # Cubic polynomial preserves curvature well
+            elif data_length >= 9:
+                window_length = 5  # Smaller window for limited data
+                polyorder = 2      # Quadratic for simpler curves
+            else:
+                window_length = data_length if data_length % 2 == 1 else data_length - 1
+                polyorder = min(2, window_length - 1)
+            
+            # Ensure window_length is odd and >= polyorder + 1
+            if window_length % 2 == 0:
+                window_length += 1
+            if window_length > data_length:
+                window_length = data_length if data_length % 2 == 1 else data_length - 1
+            if polyorder >= window_length:
+                polyorder = window_length - 1
+                
+            # Apply Savitzky-Golay filter for smoothing
+            # Use 'nearest' mode for boundary handling to avoid edge artifacts
+            coords_smooth = savgol_filter(coordinates_array, 
+                                        window_length=window_length, 
+                                        polyorder=polyorder,
+                                        mode='nearest')
+            
+            return {
+                'timestamps': timestamps.copy(),  # Same timestamps as input
+                'coordinates': coords_smooth.tolist()
+            }
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error calculating Savitzky-Golay smooth curve: {e}")
+            return None
+
+    def _calculate_smooth_curve_gaussian(self, timestamps, coordinates):
+        """
+        Calculate smooth curve for position coordinate data using Gaussian filter.
+        
+        Args:
+            timestamps: List of datetime objects
+            coordinates: List of coordinate values (x or y)
+            
+        Returns:
+            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
+        """
+        try:
+            # Import scipy.ndimage for Gaussian filtering
+            try:
+                from scipy.ndimage import gaussian_filter1d
+            except ImportError:
+                if hasattr(self, 'debug') and self.debug:
+                    print("⚠️  scipy.ndimage not available for Gaussian smoothing")
+                return None
+                
+            if len(timestamps) < 3 or len(coordinates) < 3:
+                # Need at least 3 points for Gaussian filtering
+                return None
+                
+            coordinates_array = np.array(coordinates)
+            
+            # Choose appropriate sigma based on data length
+            # Sigma controls the amount of smoothing - larger values = more smoothing
+            data_length = len(coordinates)
+            
+            if data_length >= 20:
+                sigma = 2.0  # Moderate smoothing for larger datasets
+            elif data_length >= 10:
+                sigma = 1.5  # Lighter smoothing for medium datasets
+            else:
+                sigma = 1.0  # Minimal smoothing for small datasets
+            
+            # Apply Gaussian filter for smoothing
+            # Use 'reflect' mode for boundary handling to avoid edge artifacts
+            coords_smooth = gaussian_filter1d(coordinates_array, 
+                                            sigma=sigma,
+                                            mode='reflect')
+            
+            return {
+                'timestamps': timestamps.copy(),  # Same timestamps as input
+                'coordinates': coords_smooth.tolist()
+            }
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error calculating Gaussian smooth curve: {e}")
+            return None
+
+    def _calculate_smooth_curve_ema(self, timestamps, coordinates):
+        """
+        Calculate smooth curve for position coordinate data using Exponential Moving Average.
+        
+        Args:
+            timestamps: List of datetime objects
+            coordinates: List of coordinate values (x or y)
+            
+        Returns:
+            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
+        """
+        try:
+            if len(timestamps) < 2 or len(coordinates) < 2:
+                # Need at least 2 points for EMA
+                return None
+                
+            coordinates_array = np.array(coordinates)
+            
+            # Choose appropriate alpha (smoothing factor) based on data length
+            # Alpha determines responsiveness: higher alpha = less smoothing, lower alpha = more smoothing
+            data_length = len(coordinates)
+            
+            if data_length >= 20:
+                alpha = 0.3  # More smoothing for larger datasets
+            elif data_length >= 10:
+                alpha = 0.4  # Moderate smoothing for medium datasets
+            else:
+                alpha = 0.5  # Less smoothing for small datasets to preserve detail
+            
+            # Calculate Exponential Moving Average
+            coords_smooth = np.zeros_like(coordinates_array)
+            coords_smooth[0] = coordinates_array[0]  # First value unchanged
+            
+            for i in range(1, len(coordinates_array)):
+                coords_smooth[i] = alpha * coordinates_array[i] + (1 - alpha) * coords_smooth[i - 1]
+            
+            return {
+                'timestamps': timestamps.copy(),  # Same timestamps as input
+                'coordinates': coords_smooth.tolist()
+            }
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error calculating EMA smooth curve: {e}")
+            return None
+
+    def _calculate_smooth_curve_polynomial(self, timestamps, coordinates):
+        """
+        Calculate smooth curve for position coordinate data using Polynomial Regression.
+        
+        Args:
+            timestamps: List of datetime objects
+            coordinates: List of coordinate values (x or y)
+            
+        Returns:
+            dict: Contains smooth curve timestamps and coordinates, or None if calculation fails
+        """
+        try:
+            if len(timestamps) < 3 or len(coordinates) < 3:
+                # Need at least 3 points for polynomial fitting
+                return None
+                
+            # Convert timestamps to numeric seconds since first timestamp
+            first_time = timestamps[0]
+            time_numeric = np.array([(t - first_time).total_seconds() for t in timestamps])
+            coordinates_array = np.array(coordinates)
+            
+            # Choose appropriate polynomial degree based on data length
+            data_length = len(coordinates)
+            
+            if data_length >= 20:
+                degree = min(5, data_length - 1)  # Higher order for complex curves, but not too high
+            elif data_length >= 10:
+                degree = min(3, data_length - 1)  # Cubic for moderate complexity
+            elif data_length >= 6:
+                degree = min(2, data_length - 1)  # Quadratic for simple curves
+            else:
+                degree = 1  # Linear for very small datasets
+            
+            # Fit polynomial to the data
+            try:
+                coefficients = np.polyfit(time_numeric, coordinates_array, degree)
+            except np.RankWarning:
+                # Fallback to lower degree if rank warning occurs
+                degree = max(1, degree - 1)
+                coefficients = np.polyfit(time_numeric, coordinates_array, degree)
+            
+            # Generate more time points for smooth curve visualization (2x density)
+            time_span = max(time_numeric) - min(time_numeric)
+            num_points = max(50, len(timestamps) * 2)  # At least 50 points for smoothness
+            time_smooth = np.linspace(min(time_numeric), max(time_numeric), num_points)
+            
+            # Evaluate polynomial at smooth time points
+            coords_smooth = np.polyval(coefficients, time_smooth)
+            
+            # Convert back to datetime objects
+            timestamps_smooth = [first_time + np.timedelta64(int(t * 1000), 'ms') for t in time_smooth]
+            
+            return {
+                'timestamps': timestamps_smooth,
+                'coordinates': coords_smooth.tolist()
+            }
+            
+        except Exception as e:
+            if hasattr(self, 'debug') and self.debug:
+                print(f"⚠️  Error calculating polynomial smooth curve: {e}")
+            return None
@@ -0,0 +1,178 @@
+"""
+Fleet-level summary and page planning of a recording for the PDF and HTML reports
+
+All statistics are computed with NumPy over the whole tag population, so the cost of the summary
+pages does not grow with the number of per-EPC detail pages.
+"""
+import fnmatch
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:  # Keeps the renderer free of the ATR7000 modules (and their GUI backend) at import
+    from zebra_cli.report_aggregator import ReportAggregates
+
+# Above this number of tags the report switches to summary-first mode automatically
+SUMMARY_AUTO_MIN_EPCS = 200
+# Per-EPC detail pages in summary-first mode
+DEFAULT_TOP_N = 50
+
+PERCENTILES = [5, 25, 50, 75, 95]
+POSITION_GRID_METERS = 13
+POSITION_CELL_METERS = 0.5
+
+SORT_KEYS = {
+    'reads': 'reads',
+    'rssi': 'avg_rssi',
+    'rate': 'rate_per_minute'
+}
+
+@dataclass
+class FleetSummary:
+    """Per-EPC columns and population-wide matrices of one recording"""
+    epcs: np.ndarray
+    reads: np.ndarray
+    avg_rssi: np.ndarray
+    min_rssi: np.ndarray
+    max_rssi: np.ndarray
+    rate_per_minute: np.ndarray
+    is_atr_reader: bool = False
+    antenna_ids: List[int] = field(default_factory=list)
+    antenna_reads: Optional[np.ndarray] = None  # (EPCs x antennas) read counts
+    antenna_avg_rssi: Optional[np.ndarray] = None  # (EPCs x antennas) average RSSI, NaN when not read
+    position_histogram: Optional[np.ndarray] = None  # ATR7000 floor occupancy (y bins x x bins)
+    position_extent: Optional[List[float]] = None  # [x_min, x_max, y_min, y_max] in meters
+
+    @property
+    def tag_count(self) -> int:
+        return len(self.epcs)
+
+def build_fleet_summary(tag_data: Dict[str, dict], aggregates: 'ReportAggregates') -> FleetSummary:
+    """Builds the fleet summary from the tag_reads statistics and the message aggregates"""
+    epcs = list(tag_data)
+    rows = list(tag_data.values())
+
+    def column(key, dtype=np.float64):
+        return np.fromiter((row[key] for row in rows), dtype=dtype, count=len(rows))
+
+    summary = FleetSummary(
+        epcs=np.array(epcs, dtype=object),
+        reads=column('reads', np.int64),
+        avg_rssi=column('avg_rssi'),
+        min_rssi=column('min_rssi'),
+        max_rssi=column('max_rssi'),
+        rate_per_minute=column('rate_per_minute'),
+        is_atr_reader=aggregates.is_atr_reader
+    )
+
+    if aggregates.epc_antenna_counts:
+        antenna_ids = sorted({antenna for counts in aggregates.epc_antenna_counts.values() for antenna in counts})
+        antenna_index = {antenna: i for i, antenna in enumerate(antenna_ids)}
+        epc_index = {epc: i for i, epc in enumerate(epcs)}
+        reads = np.zeros((len(epcs), len(antenna_ids)), dtype=np.int64)
+        rssi_sum = np.zeros(reads.shape)
+        rssi_count = np.zeros(reads.shape)
+        for epc, counts in aggregates.epc_antenna_counts.items():
+            row = epc_index.get(epc)
+            if row is None:
+                continue
+            for antenna, count in counts.items():
+                reads[row, antenna_index[antenna]] = count
+            for antenna, stats in aggregates.epc_antenna_rssi_stats.get(epc, {}).items():
+                rssi_sum[row, antenna_index[antenna]] = stats['sum']
+                rssi_count[row, antenna_index[antenna]] = stats['count']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            summary.antenna_avg_rssi = np.where(rssi_count > 0, rssi_sum / rssi_count, np.nan)
+        summary.antenna_ids = antenna_ids
+        summary.antenna_reads = reads
+
+    if aggregates.is_atr_reader and aggregates.epc_position_data:
+        xs = np.concatenate([np.asarray(p['x'], dtype=np.float64) for p in aggregates.epc_position_data.values()] or [np.empty(0)])
+        ys = np.concatenate([np.asarray(p['y'], dtype=np.float64) for p in aggregates.epc_position_data.values()] or [np.empty(0)])
+        if len(xs):
+            half = POSITION_GRID_METERS / 2
+            edges = np.arange(-half, half + POSITION_CELL_METERS / 2, POSITION_CELL_METERS)
+            histogram, _, _ = np.histogram2d(ys, xs, bins=[edges, edges])
+            summary.position_histogram = histogram
+            summary.position_extent = [-half, half, -half, half]
+    return summary
+
+def percentile_table(summary: FleetSummary) -> List[List[str]]:
+    """Returns the rows (label + formatted percentiles) of the population percentile table"""
+    rows = []
+    metrics = [
+        ('Reads per tag', summary.reads, '{:,.0f}'),
+        ('Read rate (reads/min)', summary.rate_per_minute, '{:.1f}'),
+        ('Average RSSI (dBm)', summary.avg_rssi, '{:.1f}'),
+        ('Min RSSI (dBm)', summary.min_rssi, '{:.1f}'),
+        ('Max RSSI (dBm)', summary.max_rssi, '{:.1f}')
+    ]
+    if summary.antenna_avg_rssi is not None:
+        for i, antenna in enumerate(summary.antenna_ids):
+            metrics.append((f'Antenna {antenna} avg RSSI (dBm)', summary.antenna_avg_rssi[:, i], '{:.1f}'))
+    for label, values, fmt in metrics:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            rows.append([label] + ['-'] * len(PERCENTILES) + ['0'])
+            continue
+        rows.append([label] + [fmt.format(v) for v in np.percentile(values, PERCENTILES)] + [f'{len(values):,}'])
+    return rows
+
+def select_detail_epcs(summary: FleetSummary, top_n: Optional[int] = DEFAULT_TOP_N,
+                       epc_filter: Optional[str] = None, sort_by: str = 'reads') -> List[str]:
+    """
+    Returns the EPCs that get detail pages: those matching epc_filter (glob, comma separated),
+    then the top_n by sort_by ('reads', 'rssi' or 'rate'), highest first. top_n=None keeps all matches.
+    """
+    candidates = np.arange(summary.tag_count)
+    if epc_filter:
+        patterns = [p.strip() for p in epc_filter.split(',') if p.strip()]
+        mask = np.fromiter((any(fnmatch.fnmatch(epc, p) for p in patterns) for epc in summary.epcs),
+                           dtype=bool, count=summary.tag_count)
+        candidates = candidates[mask]
+    values = getattr(summary, SORT_KEYS.get(sort_by, 'reads'))[candidates]
+    if top_n is not None and top_n < len(candidates):
+        # Partial selection keeps the cost linear in the population
+        top = np.argpartition(-values, top_n - 1)[:top_n] if top_n > 0 else np.empty(0, dtype=np.int64)
+        candidates, values = candidates[top], values[top]
+    order = np.argsort(-values, kind='stable')
+    return [summary.epcs[i] for i in candidates[order]]
+
+def plan_report(tag_data: Dict[str, dict], aggregates: 'ReportAggregates', summary_mode: Optional[bool] = None,
+                top_n: Optional[int] = DEFAULT_TOP_N, epc_filter: Optional[str] = None,
+                sort_by: str = 'reads') -> tuple:
+    """
+    Decides the report layout.
+
+    Args:
+        summary_mode: True/False forces the mode, None enables it above SUMMARY_AUTO_MIN_EPCS tags
+            or when an EPC filter is given
+
+    Returns:
+        tuple: (tag data of the EPCs with detail pages, FleetSummary or None in the classic layout)
+    """
+    if summary_mode is None:
+        summary_mode = len(tag_data) > SUMMARY_AUTO_MIN_EPCS or bool(epc_filter)
+    if not summary_mode:
+        return tag_data, None
+    summary = build_fleet_summary(tag_data, aggregates)
+    selected = select_detail_epcs(summary, top_n, epc_filter, sort_by)
+    return {epc: tag_data[epc] for epc in selected}, summary
+
+def build_epc_jobs(tag_data: dict, epc_rssi_data: dict, is_atr_reader: bool, epc_antenna_counts: dict,
+                   epc_antenna_rssi_stats: dict, epc_position_data: Optional[dict] = None) -> List[dict]:
+    """Precomputes the data of every EPC page set so that it can be rendered in any process"""
+    jobs = []
+    for epc, data in tag_data.items():
+        jobs.append({
+            'epc': epc,
+            'data': data,
+            'rssi_data': {epc: epc_rssi_data[epc]} if epc in epc_rssi_data else {},
+            'is_atr_reader': is_atr_reader,
+            'antenna_counts': {epc: epc_antenna_counts[epc]} if epc in epc_antenna_counts else {},
+            'antenna_rssi_stats': {epc: epc_antenna_rssi_stats[epc]} if epc in epc_antenna_rssi_stats else {},
+            'position_data': (epc_position_data or {}).get(epc) if is_atr_reader else None
+        })
+    return jobs
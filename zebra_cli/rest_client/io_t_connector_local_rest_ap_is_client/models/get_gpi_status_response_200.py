@@ -29,9 +29,9 @@ class GetGpiStatusResponse200:
             pin_3 (Union[Unset, GetGpiStatusResponse2003]): pin number and its state
      """
 
-    pin_1: GetGpiStatusResponse2001 = _attrs_field(alias="1")
-    pin_2: GetGpiStatusResponse2002 = _attrs_field(alias="2")
-    pin_3: Union[Unset, GetGpiStatusResponse2003] = _attrs_field(alias="3", default=UNSET)
+    pin_1: GetGpiStatusResponse2001
+    pin_2: GetGpiStatusResponse2002
+    pin_3: Union[Unset, GetGpiStatusResponse2003] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
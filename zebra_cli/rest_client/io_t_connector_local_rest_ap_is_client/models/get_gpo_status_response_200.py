@@ -31,16 +31,16 @@ T = TypeVar("T", bound="GetGpoStatusResponse200")
 class GetGpoStatusResponse200:
     """ 
         Attributes:
-            1 (GetGpoStatusResponse2001): pin number and its state
-            2 (GetGpoStatusResponse2002): pin number and its state
-            3 (Union[Unset, GetGpoStatusResponse2003]): pin number and its state
-            4 (Union[Unset, GetGpoStatusResponse2004]): pin number and its state
+            pin_1 (GetGpoStatusResponse2001): pin number and its state
+            pin_2 (GetGpoStatusResponse2002): pin number and its state
+            pin_3 (Union[Unset, GetGpoStatusResponse2003]): pin number and its state
+            pin_4 (Union[Unset, GetGpoStatusResponse2004]): pin number and its state
      """
 
-    1: GetGpoStatusResponse2001
-    2: GetGpoStatusResponse2002
-    3: Union[Unset, GetGpoStatusResponse2003] = UNSET
-    4: Union[Unset, GetGpoStatusResponse2004] = UNSET
+    pin_1: GetGpoStatusResponse2001
+    pin_2: GetGpoStatusResponse2002
+    pin_3: Union[Unset, GetGpoStatusResponse2003] = UNSET
+    pin_4: Union[Unset, GetGpoStatusResponse2004] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
 
@@ -48,31 +48,31 @@ class GetGpoStatusResponse200:
 
 
     def to_dict(self) -> dict[str, Any]:
-        1: str = self.1
+        pin_1: str = self.pin_1
 
-        2: str = self.2
+        pin_2: str = self.pin_2
 
-        3: Union[Unset, str] = UNSET
-        if not isinstance(self.3, Unset):
-            3 = self.3
+        pin_3: Union[Unset, str] = UNSET
+        if not isinstance(self.pin_3, Unset):
+            pin_3 = self.pin_3
 
 
-        4: Union[Unset, str] = UNSET
-        if not isinstance(self.4, Unset):
-            4 = self.4
+        pin_4: Union[Unset, str] = UNSET
+        if not isinstance(self.pin_4, Unset):
+            pin_4 = self.pin_4
 
 
 
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update({
-            "1": 1,
-            "2": 2,
+            "1": pin_1,
+            "2": pin_2,
         })
-        if 3 is not UNSET:
-            field_dict["3"] = 3
-        if 4 is not UNSET:
-            field_dict["4"] = 4
+        if pin_3 is not UNSET:
+            field_dict["3"] = pin_3
+        if pin_4 is not UNSET:
+            field_dict["4"] = pin_4
 
         return field_dict
 
@@ -81,41 +81,41 @@ class GetGpoStatusResponse200:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        1 = check_get_gpo_status_response_2001(d.pop("1"))
+        pin_1 = check_get_gpo_status_response_2001(d.pop("1"))
 
 
 
 
-        2 = check_get_gpo_status_response_2002(d.pop("2"))
+        pin_2 = check_get_gpo_status_response_2002(d.pop("2"))
 
 
 
 
-        _3 = d.pop("3", UNSET)
-        3: Union[Unset, GetGpoStatusResponse2003]
-        if isinstance(_3,  Unset):
-            3 = UNSET
+        _pin_3 = d.pop("3", UNSET)
+        pin_3: Union[Unset, GetGpoStatusResponse2003]
+        if isinstance(_pin_3,  Unset):
+            pin_3 = UNSET
         else:
-            3 = check_get_gpo_status_response_2003(_3)
+            pin_3 = check_get_gpo_status_response_2003(_pin_3)
 
 
 
 
-        _4 = d.pop("4", UNSET)
-        4: Union[Unset, GetGpoStatusResponse2004]
-        if isinstance(_4,  Unset):
-            4 = UNSET
+        _pin_4 = d.pop("4", UNSET)
+        pin_4: Union[Unset, GetGpoStatusResponse2004]
+        if isinstance(_pin_4,  Unset):
+            pin_4 = UNSET
         else:
-            4 = check_get_gpo_status_response_2004(_4)
+            pin_4 = check_get_gpo_status_response_2004(_pin_4)
 
 
 
 
         get_gpo_status_response_200 = cls(
-            1=1,
-            2=2,
-            3=3,
-            4=4,
+            pin_1=pin_1,
+            pin_2=pin_2,
+            pin_3=pin_3,
+            pin_4=pin_4,
         )
 
 
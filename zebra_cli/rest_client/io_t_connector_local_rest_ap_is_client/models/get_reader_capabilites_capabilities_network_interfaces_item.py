@@ -27,7 +27,7 @@ T = TypeVar("T", bound="GetReaderCapabilitesCapabilitiesNetworkInterfacesItem")
 class GetReaderCapabilitesCapabilitiesNetworkInterfacesItem:
     """ 
         Attributes:
-            802_1x (bool): Denotes if the reader supports IEEE 802.1x Standard
+            ieee_802_1x (bool): Denotes if the reader supports IEEE 802.1x Standard
             internal (bool): Denotes if the network interface is internal or external
             ip_assignment (list[GetReaderCapabilitesCapabilitiesNetworkInterfacesItemIpAssignmentItem]): types of IP
                 Assignments supported
@@ -36,7 +36,7 @@ class GetReaderCapabilitesCapabilitiesNetworkInterfacesItem:
             type_ (GetReaderCapabilitesCapabilitiesNetworkInterfacesItemType): Type of Network Interface
      """
 
-    802_1x: bool
+    ieee_802_1x: bool
     internal: bool
     ip_assignment: list[GetReaderCapabilitesCapabilitiesNetworkInterfacesItemIpAssignmentItem]
     ip_stack: list[GetReaderCapabilitesCapabilitiesNetworkInterfacesItemIpStackItem]
@@ -48,7 +48,7 @@ class GetReaderCapabilitesCapabilitiesNetworkInterfacesItem:
 
 
     def to_dict(self) -> dict[str, Any]:
-        802_1x = self.802_1x
+        ieee_802_1x = self.ieee_802_1x
 
         internal = self.internal
 
@@ -72,7 +72,7 @@ class GetReaderCapabilitesCapabilitiesNetworkInterfacesItem:
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update({
-            "802.1x": 802_1x,
+            "802.1x": ieee_802_1x,
             "internal": internal,
             "ipAssignment": ip_assignment,
             "ipStack": ip_stack,
@@ -86,7 +86,7 @@ class GetReaderCapabilitesCapabilitiesNetworkInterfacesItem:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        802_1x = d.pop("802.1x")
+        ieee_802_1x = d.pop("802.1x")
 
         internal = d.pop("internal")
 
@@ -116,7 +116,7 @@ class GetReaderCapabilitesCapabilitiesNetworkInterfacesItem:
 
 
         get_reader_capabilites_capabilities_network_interfaces_item = cls(
-            802_1x=802_1x,
+            ieee_802_1x=ieee_802_1x,
             internal=internal,
             ip_assignment=ip_assignment,
             ip_stack=ip_stack,
@@ -23,18 +23,18 @@ class GPIOLEDConfigurationGPIDebounce:
     """ GPI Debounce Configuration
 
         Attributes:
-            1 (Union[Unset, float]): GPI Debounce for pin 1 in milliseconds Default: 50.0.
-            2 (Union[Unset, float]): GPI Debounce for pin 2 in milliseconds Default: 50.0.
-            3 (Union[Unset, float]): GPI Debounce for pin 3 in milliseconds (only applicable to FX9600 readers) Default:
+            pin_1 (Union[Unset, float]): GPI Debounce for pin 1 in milliseconds Default: 50.0.
+            pin_2 (Union[Unset, float]): GPI Debounce for pin 2 in milliseconds Default: 50.0.
+            pin_3 (Union[Unset, float]): GPI Debounce for pin 3 in milliseconds (only applicable to FX9600 readers) Default:
                 50.0.
-            4 (Union[Unset, float]): GPI Debounce for pin 4 in milliseconds (only applicable to FX9600 readers) Default:
+            pin_4 (Union[Unset, float]): GPI Debounce for pin 4 in milliseconds (only applicable to FX9600 readers) Default:
                 50.0.
      """
 
-    1: Union[Unset, float] = 50.0
-    2: Union[Unset, float] = 50.0
-    3: Union[Unset, float] = 50.0
-    4: Union[Unset, float] = 50.0
+    pin_1: Union[Unset, float] = 50.0
+    pin_2: Union[Unset, float] = 50.0
+    pin_3: Union[Unset, float] = 50.0
+    pin_4: Union[Unset, float] = 50.0
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
 
@@ -42,27 +42,27 @@ class GPIOLEDConfigurationGPIDebounce:
 
 
     def to_dict(self) -> dict[str, Any]:
-        1 = self.1
+        pin_1 = self.pin_1
 
-        2 = self.2
+        pin_2 = self.pin_2
 
-        3 = self.3
+        pin_3 = self.pin_3
 
-        4 = self.4
+        pin_4 = self.pin_4
 
 
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update({
         })
-        if 1 is not UNSET:
-            field_dict["1"] = 1
-        if 2 is not UNSET:
-            field_dict["2"] = 2
-        if 3 is not UNSET:
-            field_dict["3"] = 3
-        if 4 is not UNSET:
-            field_dict["4"] = 4
+        if pin_1 is not UNSET:
+            field_dict["1"] = pin_1
+        if pin_2 is not UNSET:
+            field_dict["2"] = pin_2
+        if pin_3 is not UNSET:
+            field_dict["3"] = pin_3
+        if pin_4 is not UNSET:
+            field_dict["4"] = pin_4
 
         return field_dict
 
@@ -71,19 +71,19 @@ class GPIOLEDConfigurationGPIDebounce:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        1 = d.pop("1", UNSET)
+        pin_1 = d.pop("1", UNSET)
 
-        2 = d.pop("2", UNSET)
+        pin_2 = d.pop("2", UNSET)
 
-        3 = d.pop("3", UNSET)
+        pin_3 = d.pop("3", UNSET)
 
-        4 = d.pop("4", UNSET)
+        pin_4 = d.pop("4", UNSET)
 
         gpioled_configuration_gpi_debounce = cls(
-            1=1,
-            2=2,
-            3=3,
-            4=4,
+            pin_1=pin_1,
+            pin_2=pin_2,
+            pin_3=pin_3,
+            pin_4=pin_4,
         )
 
 
@@ -32,16 +32,16 @@ class GPIOLEDConfigurationGPODefaults:
     """ GPO default configurations
 
         Attributes:
-            1 (Union[Unset, GPIOLEDConfigurationGPODefaults1]): set default state for GPO pin 1
-            2 (Union[Unset, GPIOLEDConfigurationGPODefaults2]): set default state for GPO pin 2
-            3 (Union[Unset, GPIOLEDConfigurationGPODefaults3]): set default state for GPO pin 3
-            4 (Union[Unset, GPIOLEDConfigurationGPODefaults4]): set default state for GPO pin 4
+            pin_1 (Union[Unset, GPIOLEDConfigurationGPODefaults1]): set default state for GPO pin 1
+            pin_2 (Union[Unset, GPIOLEDConfigurationGPODefaults2]): set default state for GPO pin 2
+            pin_3 (Union[Unset, GPIOLEDConfigurationGPODefaults3]): set default state for GPO pin 3
+            pin_4 (Union[Unset, GPIOLEDConfigurationGPODefaults4]): set default state for GPO pin 4
      """
 
-    1: Union[Unset, GPIOLEDConfigurationGPODefaults1] = UNSET
-    2: Union[Unset, GPIOLEDConfigurationGPODefaults2] = UNSET
-    3: Union[Unset, GPIOLEDConfigurationGPODefaults3] = UNSET
-    4: Union[Unset, GPIOLEDConfigurationGPODefaults4] = UNSET
+    pin_1: Union[Unset, GPIOLEDConfigurationGPODefaults1] = UNSET
+    pin_2: Union[Unset, GPIOLEDConfigurationGPODefaults2] = UNSET
+    pin_3: Union[Unset, GPIOLEDConfigurationGPODefaults3] = UNSET
+    pin_4: Union[Unset, GPIOLEDConfigurationGPODefaults4] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
 
@@ -49,24 +49,24 @@ class GPIOLEDConfigurationGPODefaults:
 
 
     def to_dict(self) -> dict[str, Any]:
-        1: Union[Unset, str] = UNSET
-        if not isinstance(self.1, Unset):
-            1 = self.1
+        pin_1: Union[Unset, str] = UNSET
+        if not isinstance(self.pin_1, Unset):
+            pin_1 = self.pin_1
 
 
-        2: Union[Unset, str] = UNSET
-        if not isinstance(self.2, Unset):
-            2 = self.2
+        pin_2: Union[Unset, str] = UNSET
+        if not isinstance(self.pin_2, Unset):
+            pin_2 = self.pin_2
 
 
-        3: Union[Unset, str] = UNSET
-        if not isinstance(self.3, Unset):
-            3 = self.3
+        pin_3: Union[Unset, str] = UNSET
+        if not isinstance(self.pin_3, Unset):
+            pin_3 = self.pin_3
 
 
-        4: Union[Unset, str] = UNSET
-        if not isinstance(self.4, Unset):
-            4 = self.4
+        pin_4: Union[Unset, str] = UNSET
+        if not isinstance(self.pin_4, Unset):
+            pin_4 = self.pin_4
 
 
 
@@ -74,14 +74,14 @@ class GPIOLEDConfigurationGPODefaults:
         field_dict.update(self.additional_properties)
         field_dict.update({
         })
-        if 1 is not UNSET:
-            field_dict["1"] = 1
-        if 2 is not UNSET:
-            field_dict["2"] = 2
-        if 3 is not UNSET:
-            field_dict["3"] = 3
-        if 4 is not UNSET:
-            field_dict["4"] = 4
+        if pin_1 is not UNSET:
+            field_dict["1"] = pin_1
+        if pin_2 is not UNSET:
+            field_dict["2"] = pin_2
+        if pin_3 is not UNSET:
+            field_dict["3"] = pin_3
+        if pin_4 is not UNSET:
+            field_dict["4"] = pin_4
 
         return field_dict
 
@@ -90,51 +90,51 @@ class GPIOLEDConfigurationGPODefaults:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        _1 = d.pop("1", UNSET)
-        1: Union[Unset, GPIOLEDConfigurationGPODefaults1]
-        if isinstance(_1,  Unset):
-            1 = UNSET
+        _pin_1 = d.pop("1", UNSET)
+        pin_1: Union[Unset, GPIOLEDConfigurationGPODefaults1]
+        if isinstance(_pin_1,  Unset):
+            pin_1 = UNSET
         else:
-            1 = check_gpioled_configuration_gpo_defaults_1(_1)
+            pin_1 = check_gpioled_configuration_gpo_defaults_1(_pin_1)
 
 
 
 
-        _2 = d.pop("2", UNSET)
-        2: Union[Unset, GPIOLEDConfigurationGPODefaults2]
-        if isinstance(_2,  Unset):
-            2 = UNSET
+        _pin_2 = d.pop("2", UNSET)
+        pin_2: Union[Unset, GPIOLEDConfigurationGPODefaults2]
+        if isinstance(_pin_2,  Unset):
+            pin_2 = UNSET
         else:
-            2 = check_gpioled_configuration_gpo_defaults_2(_2)
+            pin_2 = check_gpioled_configuration_gpo_defaults_2(_pin_2)
 
 
 
 
-        _3 = d.pop("3", UNSET)
-        3: Union[Unset, GPIOLEDConfigurationGPODefaults3]
-        if isinstance(_3,  Unset):
-            3 = UNSET
+        _pin_3 = d.pop("3", UNSET)
+        pin_3: Union[Unset, GPIOLEDConfigurationGPODefaults3]
+        if isinstance(_pin_3,  Unset):
+            pin_3 = UNSET
         else:
-            3 = check_gpioled_configuration_gpo_defaults_3(_3)
+            pin_3 = check_gpioled_configuration_gpo_defaults_3(_pin_3)
 
 
 
 
-        _4 = d.pop("4", UNSET)
-        4: Union[Unset, GPIOLEDConfigurationGPODefaults4]
-        if isinstance(_4,  Unset):
-            4 = UNSET
+        _pin_4 = d.pop("4", UNSET)
+        pin_4: Union[Unset, GPIOLEDConfigurationGPODefaults4]
+        if isinstance(_pin_4,  Unset):
+            pin_4 = UNSET
         else:
-            4 = check_gpioled_configuration_gpo_defaults_4(_4)
+            pin_4 = check_gpioled_configuration_gpo_defaults_4(_pin_4)
 
 
 
 
         gpioled_configuration_gpo_defaults = cls(
-            1=1,
-            2=2,
-            3=3,
-            4=4,
+            pin_1=pin_1,
+            pin_2=pin_2,
+            pin_3=pin_3,
+            pin_4=pin_4,
         )
 
 
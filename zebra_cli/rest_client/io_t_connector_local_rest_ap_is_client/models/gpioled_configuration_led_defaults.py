@@ -30,14 +30,14 @@ class GPIOLEDConfigurationLEDDefaults:
     """ LED default configurations
 
         Attributes:
-            1 (Union[Unset, GPIOLEDConfigurationLEDDefaults1]): set default color for LED 2
-            2 (Union[Unset, GPIOLEDConfigurationLEDDefaults2]): set default color for LED 3
-            3 (Union[Unset, GPIOLEDConfigurationLEDDefaults3]): set default color for LED 4
+            led_1 (Union[Unset, GPIOLEDConfigurationLEDDefaults1]): set default color for LED 2
+            led_2 (Union[Unset, GPIOLEDConfigurationLEDDefaults2]): set default color for LED 3
+            led_3 (Union[Unset, GPIOLEDConfigurationLEDDefaults3]): set default color for LED 4
      """
 
-    1: Union[Unset, GPIOLEDConfigurationLEDDefaults1] = UNSET
-    2: Union[Unset, GPIOLEDConfigurationLEDDefaults2] = UNSET
-    3: Union[Unset, GPIOLEDConfigurationLEDDefaults3] = UNSET
+    led_1: Union[Unset, GPIOLEDConfigurationLEDDefaults1] = UNSET
+    led_2: Union[Unset, GPIOLEDConfigurationLEDDefaults2] = UNSET
+    led_3: Union[Unset, GPIOLEDConfigurationLEDDefaults3] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
 
@@ -45,19 +45,19 @@ class GPIOLEDConfigurationLEDDefaults:
 
 
     def to_dict(self) -> dict[str, Any]:
-        1: Union[Unset, str] = UNSET
-        if not isinstance(self.1, Unset):
-            1 = self.1
+        led_1: Union[Unset, str] = UNSET
+        if not isinstance(self.led_1, Unset):
+            led_1 = self.led_1
 
 
-        2: Union[Unset, str] = UNSET
-        if not isinstance(self.2, Unset):
-            2 = self.2
+        led_2: Union[Unset, str] = UNSET
+        if not isinstance(self.led_2, Unset):
+            led_2 = self.led_2
 
 
-        3: Union[Unset, str] = UNSET
-        if not isinstance(self.3, Unset):
-            3 = self.3
+        led_3: Union[Unset, str] = UNSET
+        if not isinstance(self.led_3, Unset):
+            led_3 = self.led_3
 
 
 
@@ -65,12 +65,12 @@ class GPIOLEDConfigurationLEDDefaults:
         field_dict.update(self.additional_properties)
         field_dict.update({
         })
-        if 1 is not UNSET:
-            field_dict["1"] = 1
-        if 2 is not UNSET:
-            field_dict["2"] = 2
-        if 3 is not UNSET:
-            field_dict["3"] = 3
+        if led_1 is not UNSET:
+            field_dict["1"] = led_1
+        if led_2 is not UNSET:
+            field_dict["2"] = led_2
+        if led_3 is not UNSET:
+            field_dict["3"] = led_3
 
         return field_dict
 
@@ -79,40 +79,40 @@ class GPIOLEDConfigurationLEDDefaults:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        _1 = d.pop("1", UNSET)
-        1: Union[Unset, GPIOLEDConfigurationLEDDefaults1]
-        if isinstance(_1,  Unset):
-            1 = UNSET
+        _led_1 = d.pop("1", UNSET)
+        led_1: Union[Unset, GPIOLEDConfigurationLEDDefaults1]
+        if isinstance(_led_1,  Unset):
+            led_1 = UNSET
         else:
-            1 = check_gpioled_configuration_led_defaults_1(_1)
+            led_1 = check_gpioled_configuration_led_defaults_1(_led_1)
 
 
 
 
-        _2 = d.pop("2", UNSET)
-        2: Union[Unset, GPIOLEDConfigurationLEDDefaults2]
-        if isinstance(_2,  Unset):
-            2 = UNSET
+        _led_2 = d.pop("2", UNSET)
+        led_2: Union[Unset, GPIOLEDConfigurationLEDDefaults2]
+        if isinstance(_led_2,  Unset):
+            led_2 = UNSET
         else:
-            2 = check_gpioled_configuration_led_defaults_2(_2)
+            led_2 = check_gpioled_configuration_led_defaults_2(_led_2)
 
 
 
 
-        _3 = d.pop("3", UNSET)
-        3: Union[Unset, GPIOLEDConfigurationLEDDefaults3]
-        if isinstance(_3,  Unset):
-            3 = UNSET
+        _led_3 = d.pop("3", UNSET)
+        led_3: Union[Unset, GPIOLEDConfigurationLEDDefaults3]
+        if isinstance(_led_3,  Unset):
+            led_3 = UNSET
         else:
-            3 = check_gpioled_configuration_led_defaults_3(_3)
+            led_3 = check_gpioled_configuration_led_defaults_3(_led_3)
 
 
 
 
         gpioled_configuration_led_defaults = cls(
-            1=1,
-            2=2,
-            3=3,
+            led_1=led_1,
+            led_2=led_2,
+            led_3=led_3,
         )
 
 
@@ -52,36 +52,36 @@ class ReaderStatsAntennas:
     """ Status of the antennas connection
 
         Attributes:
-            1 (ReaderStatsAntennas1): Antenna 1 connection state
-            2 (ReaderStatsAntennas2): Antenna 2 connection state
-            0 (Union[Unset, ReaderStatsAntennas0]): Antenna 0 connection state (only applicable to ATR7000)
-            3 (Union[Unset, ReaderStatsAntennas3]): Antenna 3 connection state
-            4 (Union[Unset, ReaderStatsAntennas4]): Antenna 4 connection state
-            5 (Union[Unset, ReaderStatsAntennas5]): Antenna 5 connection state
-            6 (Union[Unset, ReaderStatsAntennas6]): Antenna 6 connection state
-            7 (Union[Unset, ReaderStatsAntennas7]): Antenna 7 connection state
-            8 (Union[Unset, ReaderStatsAntennas8]): Antenna 8 connection state
-            9 (Union[Unset, ReaderStatsAntennas9]): Antenna 9 connection state (only applicable to ATR7000)
-            10 (Union[Unset, ReaderStatsAntennas10]): Antenna 10 connection state (only applicable to ATR7000)
-            11 (Union[Unset, ReaderStatsAntennas11]): Antenna 11 connection state (only applicable to ATR7000)
-            12 (Union[Unset, ReaderStatsAntennas12]): Antenna 12 connection state (only applicable to ATR7000)
-            13 (Union[Unset, ReaderStatsAntennas13]): Antenna 13 connection state (only applicable to ATR7000)
+            antenna_1 (ReaderStatsAntennas1): Antenna 1 connection state
+            antenna_2 (ReaderStatsAntennas2): Antenna 2 connection state
+            antenna_0 (Union[Unset, ReaderStatsAntennas0]): Antenna 0 connection state (only applicable to ATR7000)
+            antenna_3 (Union[Unset, ReaderStatsAntennas3]): Antenna 3 connection state
+            antenna_4 (Union[Unset, ReaderStatsAntennas4]): Antenna 4 connection state
+            antenna_5 (Union[Unset, ReaderStatsAntennas5]): Antenna 5 connection state
+            antenna_6 (Union[Unset, ReaderStatsAntennas6]): Antenna 6 connection state
+            antenna_7 (Union[Unset, ReaderStatsAntennas7]): Antenna 7 connection state
+            antenna_8 (Union[Unset, ReaderStatsAntennas8]): Antenna 8 connection state
+            antenna_9 (Union[Unset, ReaderStatsAntennas9]): Antenna 9 connection state (only applicable to ATR7000)
+            antenna_10 (Union[Unset, ReaderStatsAntennas10]): Antenna 10 connection state (only applicable to ATR7000)
+            antenna_11 (Union[Unset, ReaderStatsAntennas11]): Antenna 11 connection state (only applicable to ATR7000)
+            antenna_12 (Union[Unset, ReaderStatsAntennas12]): Antenna 12 connection state (only applicable to ATR7000)
+            antenna_13 (Union[Unset, ReaderStatsAntennas13]): Antenna 13 connection state (only applicable to ATR7000)
      """
 
-    1: ReaderStatsAntennas1
-    2: ReaderStatsAntennas2
-    0: Union[Unset, ReaderStatsAntennas0] = UNSET
-    3: Union[Unset, ReaderStatsAntennas3] = UNSET
-    4: Union[Unset, ReaderStatsAntennas4] = UNSET
-    5: Union[Unset, ReaderStatsAntennas5] = UNSET
-    6: Union[Unset, ReaderStatsAntennas6] = UNSET
-    7: Union[Unset, ReaderStatsAntennas7] = UNSET
-    8: Union[Unset, ReaderStatsAntennas8] = UNSET
-    9: Union[Unset, ReaderStatsAntennas9] = UNSET
-    10: Union[Unset, ReaderStatsAntennas10] = UNSET
-    11: Union[Unset, ReaderStatsAntennas11] = UNSET
-    12: Union[Unset, ReaderStatsAntennas12] = UNSET
-    13: Union[Unset, ReaderStatsAntennas13] = UNSET
+    antenna_1: ReaderStatsAntennas1
+    antenna_2: ReaderStatsAntennas2
+    antenna_0: Union[Unset, ReaderStatsAntennas0] = UNSET
+    antenna_3: Union[Unset, ReaderStatsAntennas3] = UNSET
+    antenna_4: Union[Unset, ReaderStatsAntennas4] = UNSET
+    antenna_5: Union[Unset, ReaderStatsAntennas5] = UNSET
+    antenna_6: Union[Unset, ReaderStatsAntennas6] = UNSET
+    antenna_7: Union[Unset, ReaderStatsAntennas7] = UNSET
+    antenna_8: Union[Unset, ReaderStatsAntennas8] = UNSET
+    antenna_9: Union[Unset, ReaderStatsAntennas9] = UNSET
+    antenna_10: Union[Unset, ReaderStatsAntennas10] = UNSET
+    antenna_11: Union[Unset, ReaderStatsAntennas11] = UNSET
+    antenna_12: Union[Unset, ReaderStatsAntennas12] = UNSET
+    antenna_13: Union[Unset, ReaderStatsAntennas13] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
 
@@ -89,101 +89,101 @@ class ReaderStatsAntennas:
 
 
     def to_dict(self) -> dict[str, Any]:
-        1: str = self.1
+        antenna_1: str = self.antenna_1
 
-        2: str = self.2
+        antenna_2: str = self.antenna_2
 
-        0: Union[Unset, str] = UNSET
-        if not isinstance(self.0, Unset):
-            0 = self.0
+        antenna_0: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_0, Unset):
+            antenna_0 = self.antenna_0
 
 
-        3: Union[Unset, str] = UNSET
-        if not isinstance(self.3, Unset):
-            3 = self.3
+        antenna_3: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_3, Unset):
+            antenna_3 = self.antenna_3
 
 
-        4: Union[Unset, str] = UNSET
-        if not isinstance(self.4, Unset):
-            4 = self.4
+        antenna_4: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_4, Unset):
+            antenna_4 = self.antenna_4
 
 
-        5: Union[Unset, str] = UNSET
-        if not isinstance(self.5, Unset):
-            5 = self.5
+        antenna_5: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_5, Unset):
+            antenna_5 = self.antenna_5
 
 
-        6: Union[Unset, str] = UNSET
-        if not isinstance(self.6, Unset):
-            6 = self.6
+        antenna_6: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_6, Unset):
+            antenna_6 = self.antenna_6
 
 
-        7: Union[Unset, str] = UNSET
-        if not isinstance(self.7, Unset):
-            7 = self.7
+        antenna_7: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_7, Unset):
+            antenna_7 = self.antenna_7
 
 
-        8: Union[Unset, str] = UNSET
-        if not isinstance(self.8, Unset):
-            8 = self.8
+        antenna_8: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_8, Unset):
+            antenna_8 = self.antenna_8
 
 
-        9: Union[Unset, str] = UNSET
-        if not isinstance(self.9, Unset):
-            9 = self.9
+        antenna_9: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_9, Unset):
+            antenna_9 = self.antenna_9
 
 
-        10: Union[Unset, str] = UNSET
-        if not isinstance(self.10, Unset):
-            10 = self.10
+        antenna_10: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_10, Unset):
+            antenna_10 = self.antenna_10
 
 
-        11: Union[Unset, str] = UNSET
-        if not isinstance(self.11, Unset):
-            11 = self.11
+        antenna_11: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_11, Unset):
+            antenna_11 = self.antenna_11
 
 
-        12: Union[Unset, str] = UNSET
-        if not isinstance(self.12, Unset):
-            12 = self.12
+        antenna_12: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_12, Unset):
+            antenna_12 = self.antenna_12
 
 
-        13: Union[Unset, str] = UNSET
-        if not isinstance(self.13, Unset):
-            13 = self.13
+        antenna_13: Union[Unset, str] = UNSET
+        if not isinstance(self.antenna_13, Unset):
+            antenna_13 = self.antenna_13
 
 
 
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update({
-            "1": 1,
-            "2": 2,
+            "1": antenna_1,
+            "2": antenna_2,
         })
-        if 0 is not UNSET:
-            field_dict["0"] = 0
-        if 3 is not UNSET:
-            field_dict["3"] = 3
-        if 4 is not UNSET:
-            field_dict["4"] = 4
-        if 5 is not UNSET:
-            field_dict["5"] = 5
-        if 6 is not UNSET:
-            field_dict["6"] = 6
-        if 7 is not UNSET:
-            field_dict["7"] = 7
-        if 8 is not UNSET:
-            field_dict["8"] = 8
-        if 9 is not UNSET:
-            field_dict["9"] = 9
-        if 10 is not UNSET:
-            field_dict["10"] = 10
-        if 11 is not UNSET:
-            field_dict["11"] = 11
-        if 12 is not UNSET:
-            field_dict["12"] = 12
-        if 13 is not UNSET:
-            field_dict["13"] = 13
+        if antenna_0 is not UNSET:
+            field_dict["0"] = antenna_0
+        if antenna_3 is not UNSET:
+            field_dict["3"] = antenna_3
+        if antenna_4 is not UNSET:
+            field_dict["4"] = antenna_4
+        if antenna_5 is not UNSET:
+            field_dict["5"] = antenna_5
+        if antenna_6 is not UNSET:
+            field_dict["6"] = antenna_6
+        if antenna_7 is not UNSET:
+            field_dict["7"] = antenna_7
+        if antenna_8 is not UNSET:
+            field_dict["8"] = antenna_8
+        if antenna_9 is not UNSET:
+            field_dict["9"] = antenna_9
+        if antenna_10 is not UNSET:
+            field_dict["10"] = antenna_10
+        if antenna_11 is not UNSET:
+            field_dict["11"] = antenna_11
+        if antenna_12 is not UNSET:
+            field_dict["12"] = antenna_12
+        if antenna_13 is not UNSET:
+            field_dict["13"] = antenna_13
 
         return field_dict
 
@@ -192,151 +192,151 @@ class ReaderStatsAntennas:
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
-        1 = check_reader_stats_antennas_1(d.pop("1"))
+        antenna_1 = check_reader_stats_antennas_1(d.pop("1"))
 
 
 
 
-        2 = check_reader_stats_antennas_2(d.pop("2"))
+        antenna_2 = check_reader_stats_antennas_2(d.pop("2"))
 
 
 
 
-        _0 = d.pop("0", UNSET)
-        0: Union[Unset, ReaderStatsAntennas0]
-        if isinstance(_0,  Unset):
-            0 = UNSET
+        _antenna_0 = d.pop("0", UNSET)
+        antenna_0: Union[Unset, ReaderStatsAntennas0]
+        if isinstance(_antenna_0,  Unset):
+            antenna_0 = UNSET
         else:
-            0 = check_reader_stats_antennas_0(_0)
+            antenna_0 = check_reader_stats_antennas_0(_antenna_0)
 
 
 
 
-        _3 = d.pop("3", UNSET)
-        3: Union[Unset, ReaderStatsAntennas3]
-        if isinstance(_3,  Unset):
-            3 = UNSET
+        _antenna_3 = d.pop("3", UNSET)
+        antenna_3: Union[Unset, ReaderStatsAntennas3]
+        if isinstance(_antenna_3,  Unset):
+            antenna_3 = UNSET
         else:
-            3 = check_reader_stats_antennas_3(_3)
+            antenna_3 = check_reader_stats_antennas_3(_antenna_3)
 
 
 
 
-        _4 = d.pop("4", UNSET)
-        4: Union[Unset, ReaderStatsAntennas4]
-        if isinstance(_4,  Unset):
-            4 = UNSET
+        _antenna_4 = d.pop("4", UNSET)
+        antenna_4: Union[Unset, ReaderStatsAntennas4]
+        if isinstance(_antenna_4,  Unset):
+            antenna_4 = UNSET
         else:
-            4 = check_reader_stats_antennas_4(_4)
+            antenna_4 = check_reader_stats_antennas_4(_antenna_4)
 
 
 
 
-        _5 = d.pop("5", UNSET)
-        5: Union[Unset, ReaderStatsAntennas5]
-        if isinstance(_5,  Unset):
-            5 = UNSET
+        _antenna_5 = d.pop("5", UNSET)
+        antenna_5: Union[Unset, ReaderStatsAntennas5]
+        if isinstance(_antenna_5,  Unset):
+            antenna_5 = UNSET
         else:
-            5 = check_reader_stats_antennas_5(_5)
+            antenna_5 = check_reader_stats_antennas_5(_antenna_5)
 
 
 
 
-        _6 = d.pop("6", UNSET)
-        6: Union[Unset, ReaderStatsAntennas6]
-        if isinstance(_6,  Unset):
-            6 = UNSET
+        _antenna_6 = d.pop("6", UNSET)
+        antenna_6: Union[Unset, ReaderStatsAntennas6]
+        if isinstance(_antenna_6,  Unset):
+            antenna_6 = UNSET
         else:
-            6 = check_reader_stats_antennas_6(_6)
+            antenna_6 = check_reader_stats_antennas_6(_antenna_6)
 
 
 
 
-        _7 = d.pop("7", UNSET)
-        7: Union[Unset, ReaderStatsAntennas7]
-        if isinstance(_7,  Unset):
-            7 = UNSET
+        _antenna_7 = d.pop("7", UNSET)
+        antenna_7: Union[Unset, ReaderStatsAntennas7]
+        if isinstance(_antenna_7,  Unset):
+            antenna_7 = UNSET
         else:
-            7 = check_reader_stats_antennas_7(_7)
+            antenna_7 = check_reader_stats_antennas_7(_antenna_7)
 
 
 
 
-        _8 = d.pop("8", UNSET)
-        8: Union[Unset, ReaderStatsAntennas8]
-        if isinstance(_8,  Unset):
-            8 = UNSET
+        _antenna_8 = d.pop("8", UNSET)
+        antenna_8: Union[Unset, ReaderStatsAntennas8]
+        if isinstance(_antenna_8,  Unset):
+            antenna_8 = UNSET
         else:
-            8 = check_reader_stats_antennas_8(_8)
+            antenna_8 = check_reader_stats_antennas_8(_antenna_8)
 
 
 
 
-        _9 = d.pop("9", UNSET)
-        9: Union[Unset, ReaderStatsAntennas9]
-        if isinstance(_9,  Unset):
-            9 = UNSET
+        _antenna_9 = d.pop("9", UNSET)
+        antenna_9: Union[Unset, ReaderStatsAntennas9]
+        if isinstance(_antenna_9,  Unset):
+            antenna_9 = UNSET
         else:
-            9 = check_reader_stats_antennas_9(_9)
+            antenna_9 = check_reader_stats_antennas_9(_antenna_9)
 
 
 
 
-        _10 = d.pop("10", UNSET)
-        10: Union[Unset, ReaderStatsAntennas10]
-        if isinstance(_10,  Unset):
-            10 = UNSET
+        _antenna_10 = d.pop("10", UNSET)
+        antenna_10: Union[Unset, ReaderStatsAntennas10]
+        if isinstance(_antenna_10,  Unset):
+            antenna_10 = UNSET
         else:
-            10 = check_reader_stats_antennas_10(_10)
+            antenna_10 = check_reader_stats_antennas_10(_antenna_10)
 
 
 
 
-        _11 = d.pop("11", UNSET)
-        11: Union[Unset, ReaderStatsAntennas11]
-        if isinstance(_11,  Unset):
-            11 = UNSET
+        _antenna_11 = d.pop("11", UNSET)
+        antenna_11: Union[Unset, ReaderStatsAntennas11]
+        if isinstance(_antenna_11,  Unset):
+            antenna_11 = UNSET
         else:
-            11 = check_reader_stats_antennas_11(_11)
+            antenna_11 = check_reader_stats_antennas_11(_antenna_11)
 
 
 
 
-        _12 = d.pop("12", UNSET)
-        12: Union[Unset, ReaderStatsAntennas12]
-        if isinstance(_12,  Unset):
-            12 = UNSET
+        _antenna_12 = d.pop("12", UNSET)
+        antenna_12: Union[Unset, ReaderStatsAntennas12]
+        if isinstance(_antenna_12,  Unset):
+            antenna_12 = UNSET
         else:
-            12 = check_reader_stats_antennas_12(_12)
+            antenna_12 = check_reader_stats_antennas_12(_antenna_12)
 
 
 
 
-        _13 = d.pop("13", UNSET)
-        13: Union[Unset, ReaderStatsAntennas13]
-        if isinstance(_13,  Unset):
-            13 = UNSET
+        _antenna_13 = d.pop("13", UNSET)
+        antenna_13: Union[Unset, ReaderStatsAntennas13]
+        if isinstance(_antenna_13,  Unset):
+            antenna_13 = UNSET
         else:
-            13 = check_reader_stats_antennas_13(_13)
+            antenna_13 = check_reader_stats_antennas_13(_antenna_13)
 
 
 
 
         reader_stats_antennas = cls(
-            1=1,
-            2=2,
-            0=0,
-            3=3,
-            4=4,
-            5=5,
-            6=6,
-            7=7,
-            8=8,
-            9=9,
-            10=10,
-            11=11,
-            12=12,
-            13=13,
+            antenna_1=antenna_1,
+            antenna_2=antenna_2,
+            antenna_0=antenna_0,
+            antenna_3=antenna_3,
+            antenna_4=antenna_4,
+            antenna_5=antenna_5,
+            antenna_6=antenna_6,
+            antenna_7=antenna_7,
+            antenna_8=antenna_8,
+            antenna_9=antenna_9,
+            antenna_10=antenna_10,
+            antenna_11=antenna_11,
+            antenna_12=antenna_12,
+            antenna_13=antenna_13,
         )
 
 
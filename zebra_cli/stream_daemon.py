@@ -0,0 +1,299 @@
+"""
+Headless streaming daemon: the tag events of a reader as NDJSON
+
+Logs in, starts the scan and writes one JSON object per line to stdout, a file or a Unix socket: one
+normalized object per tag event, or with a window one object per reader, EPC and time window. No GUI module
+(Tk, matplotlib) is imported. Lines are buffered and flushed every flush interval; SIGINT/SIGTERM stop the
+scan, write the last window and flush the output before exiting. Progress messages go to stderr.
+"""
+import sys
+import json
+import time
+import queue
+import signal
+import socket
+import threading
+import contextlib
+from typing import Dict, List, Optional, Tuple
+
+from zebra_cli.websocket_listener import GAP_MESSAGE_TYPE
+
+UNIX_SOCKET_PREFIX = 'unix:'
+DEFAULT_FLUSH_INTERVAL = 1.0
+WRITE_BUFFER_SIZE = 1024 * 1024
+DRAIN_BATCH = 5000  # Messages taken from the queue per loop iteration
+CONNECT_TIMEOUT = 15.0  # Seconds to wait for the WebSocket connection before starting the scan
+
+def _first(data: dict, keys: Tuple[str, ...]):
+    for key in keys:
+        if key in data:
+            return data[key]
+    return None
+
+def normalize_event(message, received_at: float) -> Optional[dict]:
+    """
+    Normalized tag event of a reader message ({"data": {"idHex", ...}} or a direct tag dict), None for
+    messages without EPC (heartbeats, alerts, undecodable text). RSSI is None when the reader sends none.
+    """
+    if not isinstance(message, dict):
+        return None
+    data = message.get('data') if isinstance(message.get('data'), dict) else message
+    epc = _first(data, ('idHex', 'epc', 'EPC'))
+    if not epc:
+        return None
+    rssi = _first(data, ('peakRssi', 'peakRSSI', 'RSSI', 'rssi'))
+    try:
+        rssi = float(rssi) if rssi not in (None, '', 'N/A') else None
+    except (ValueError, TypeError):
+        rssi = None
+    try:
+        reads = max(int(data.get('reads', 1)), 1)
+    except (ValueError, TypeError):
+        reads = 1
+    event = {
+        "ts": round(received_at, 3),
+        "reader_ts": message.get('timestamp'),
+        "reader_id": message.get('reader_id'),
+        "epc": epc,
+        "rssi": rssi,
+        "antenna": data.get('antenna'),
+        "reads": reads
+    }
+    for key in ('azimuth', 'elevation'):
+        if key in data:
+            event[key] = data[key]
+    return event
+
+class WindowAggregator:
+    """Per reader and EPC aggregates of tag events over fixed windows aligned to multiples of window_s"""
+
+    def __init__(self, window_s: float):
+        if window_s <= 0:
+            raise ValueError("window must be positive")
+        self.window_s = window_s
+        self.window_start = None
+        self.tags: Dict[Tuple[Optional[str], str], dict] = {}
+
+    def add(self, event: dict) -> List[dict]:
+        """Adds an event; returns the rows of the previous window if the event starts a new one"""
+        start = (event['ts'] // self.window_s) * self.window_s
+        rows = self.close_window() if self.window_start is not None and start > self.window_start else []
+        if self.window_start is None or start > self.window_start:
+            self.window_start = start
+        key = (event['reader_id'], event['epc'])
+        tag = self.tags.get(key)
+        if tag is None:
+            tag = self.tags[key] = {"reads": 0, "rssi_sum": 0.0, "rssi_count": 0, "rssi_min": None,
+                                    "rssi_max": None, "antennas": set(), "first_seen": event['ts']}
+        tag['reads'] += event['reads']
+        tag['last_seen'] = event['ts']
+        rssi = event['rssi']
+        if rssi is not None:
+            tag['rssi_sum'] += rssi
+            tag['rssi_count'] += 1
+            tag['rssi_min'] = rssi if tag['rssi_min'] is None else min(tag['rssi_min'], rssi)
+            tag['rssi_max'] = rssi if tag['rssi_max'] is None else max(tag['rssi_max'], rssi)
+        if event['antenna'] is not None:
+            tag['antennas'].add(event['antenna'])
+        return rows
+
+    def due(self, now: float) -> List[dict]:
+        """Rows of the current window if it has ended at `now`"""
+        if self.window_start is not None and now >= self.window_start + self.window_s:
+            return self.close_window()
+        return []
+
+    def close_window(self) -> List[dict]:
+        """Rows of the current window (one per reader and EPC), which is then emptied"""
+        if self.window_start is None:
+            return []
+        window_end = self.window_start + self.window_s
+        rows = []
+        for (reader_id, epc), tag in self.tags.items():
+            rows.append({
+                "window_start": round(self.window_start, 3),
+                "window_end": round(window_end, 3),
+                "reader_id": reader_id,
+                "epc": epc,
+                "reads": tag['reads'],
+                "rssi_avg": round(tag['rssi_sum'] / tag['rssi_count'], 2) if tag['rssi_count'] else None,
+                "rssi_min": tag['rssi_min'],
+                "rssi_max": tag['rssi_max'],
+                "antennas": sorted(tag['antennas'], key=str),
+                "first_seen": tag['first_seen'],
+                "last_seen": tag['last_seen']
+            })
+        self.tags = {}
+        self.window_start = None
+        return rows
+
+class NdjsonWriter:
+    """
+    Buffered NDJSON output: '-' (stdout), 'unix:/path' (connects to a listening Unix socket) or a file path
+    (appended). A closed reader of the output (broken pipe, socket closed) sets `broken` instead of raising.
+    """
+
+    def __init__(self, target: str = '-', flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 buffer_size: int = WRITE_BUFFER_SIZE):
+        self.target = target
+        self.flush_interval = flush_interval
+        self.lines = 0
+        self.broken = False
+        self._socket = None
+        if target == '-':
+            self._stream = open(sys.stdout.fileno(), 'wb', buffering=buffer_size, closefd=False)
+        elif target.startswith(UNIX_SOCKET_PREFIX):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(target[len(UNIX_SOCKET_PREFIX):])
+            self._stream = self._socket.makefile('wb', buffering=buffer_size)
+        else:
+            self._stream = open(target, 'ab', buffering=buffer_size)
+        self._last_flush = time.monotonic()
+
+    def write(self, obj: dict):
+        if self.broken:
+            return
+        try:
+            self._stream.write(json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n')
+            self.lines += 1
+        except (BrokenPipeError, ConnectionError):
+            self.broken = True
+
+    def maybe_flush(self):
+        """Flushes if the flush interval has elapsed since the last flush"""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if self.broken:
+            return
+        try:
+            self._stream.flush()
+        except (BrokenPipeError, ConnectionError):
+            self.broken = True
+
+    def close(self):
+        self.flush()
+        with contextlib.suppress(OSError):
+            self._stream.close()
+        if self._socket:
+            self._socket.close()
+
+def stream(data_queue: queue.Queue, writer: NdjsonWriter, stop_event: threading.Event,
+           window: Optional[float] = None) -> dict:
+    """
+    Writes the messages of data_queue to writer until stop_event is set or the output is closed, then drains
+    the queue and writes the last window. CONNECTION_GAP messages are passed through. Returns counters.
+    """
+    aggregator = WindowAggregator(window) if window else None
+    counts = {"messages": 0, "tag_events": 0, "gaps": 0}
+
+    def handle(messages: list, now: float):
+        counts["messages"] += len(messages)
+        for message in messages:
+            if isinstance(message, dict) and message.get('type') == GAP_MESSAGE_TYPE:
+                counts["gaps"] += 1
+                writer.write(message)
+                continue
+            event = normalize_event(message, now)
+            if event is None:
+                continue
+            counts["tag_events"] += 1
+            if aggregator:
+                for row in aggregator.add(event):
+                    writer.write(row)
+            else:
+                writer.write(event)
+
+    def drain(first=None) -> list:
+        messages = [] if first is None else [first]
+        try:
+            while len(messages) < DRAIN_BATCH:
+                messages.append(data_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return messages
+
+    while not stop_event.is_set() and not writer.broken:
+        try:
+            first = data_queue.get(timeout=0.2)
+        except queue.Empty:
+            first = None
+        now = time.time()
+        handle(drain(first) if first is not None else [], now)
+        if aggregator:
+            for row in aggregator.due(now):
+                writer.write(row)
+        writer.maybe_flush()
+
+    # Messages already received when stopping, then the last (partial) window
+    messages = drain()
+    while messages and not writer.broken:
+        handle(messages, time.time())
+        messages = drain()
+    if aggregator:
+        for row in aggregator.close_window():
+            writer.write(row)
+    writer.flush()
+    counts["lines"] = writer.lines
+    return counts
+
+def run_stream_daemon(ip: str, username: str, password: str, output: str = '-', window: Optional[float] = None,
+                      flush_interval: float = DEFAULT_FLUSH_INTERVAL, ws_engine: str = 'thread',
+                      fanout_address: Optional[str] = None, fanout_buffer: Optional[int] = None,
+                      debug: bool = False) -> int:
+    """Logs in, starts the scan and streams NDJSON until SIGINT/SIGTERM. Returns the process exit code."""
+    from zebra_cli.context import AppContext
+
+    try:
+        writer = NdjsonWriter(output, flush_interval=flush_interval)
+    except OSError as e:
+        print(f"❌ Cannot open output {output}: {e}", file=sys.stderr)
+        return 2
+
+    stop_event = threading.Event()
+    def request_stop(signum, frame):
+        stop_event.set()
+    previous_handlers = {sig: signal.signal(sig, request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+
+    # The CLI components print their progress: keep stdout for the NDJSON lines
+    with contextlib.redirect_stdout(sys.stderr):
+        app_context = AppContext(debug=debug, ws_engine=ws_engine, fanout_address=fanout_address,
+                                 fanout_buffer=fanout_buffer)
+        scanning = False
+        try:
+            if fanout_address and not app_context.fanout_server:
+                return 2
+            if not app_context.login_and_connect(ip, username, password):
+                return 1
+            data_queue = app_context.ensure_websocket_running(debug=debug)
+            deadline = time.monotonic() + CONNECT_TIMEOUT
+            while not app_context.is_websocket_running() and time.monotonic() < deadline and not stop_event.is_set():
+                time.sleep(0.1)
+            if not app_context.is_websocket_running():
+                print("❌ WebSocket not connected, not starting the scan")
+                return 1
+            if app_context.start_scan(record=False) is None:
+                print("❌ Scan not started")
+                return 1
+            scanning = True
+            print(f"📡 Streaming {'window aggregates' if window else 'tag events'} to "
+                  f"{'stdout' if output == '-' else output} - SIGINT/SIGTERM to stop")
+            counts = stream(data_queue, writer, stop_event, window=window)
+            if writer.broken:
+                print("🔌 Output closed by the reader")
+            print(f"✅ {counts['tag_events']} tag events, {counts['lines']} lines written, "
+                  f"{counts['gaps']} connection gaps")
+            return 0
+        finally:
+            if scanning:
+                with contextlib.suppress(Exception):
+                    app_context.stop_scan()
+            with contextlib.suppress(Exception):
+                app_context.stop_websocket()
+            if app_context.fanout_server:
+                app_context.fanout_server.stop()
+            writer.close()
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
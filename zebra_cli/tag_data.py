@@ -0,0 +1,54 @@
+"""
+Per-tag read statistics shared by the tag table, the CSV recording and the headless modes (no GUI imports)
+"""
+import time
+from typing import Optional
+
+class TagData:
+    """Class for storing RFID tag data"""
+
+    def __init__(self, epc: str, rssi: float, extra_data: Optional[dict] = None):
+        self.epc = epc
+        self.read_count = 1
+        self.rssi_values = [rssi]
+        self.first_seen = time.time()
+        self.last_seen = time.time()
+        self.extra_data = extra_data or {}  # For azimuth, elevation, etc.
+        
+    def add_reading(self, rssi: float, extra_data: Optional[dict] = None, reads: int = 1):
+        """Adds one or more readings for this tag"""
+        self.read_count += reads
+        # Add as many RSSI as there are reads (if >1, duplicate the last value)
+        if reads > 1:
+            self.rssi_values.extend([rssi] * reads)
+        else:
+            self.rssi_values.append(rssi)
+        self.last_seen = time.time()
+        # Update extra data if provided
+        if extra_data:
+            self.extra_data.update(extra_data)
+        # Keep only the last 100 readings to avoid excessive memory consumption
+        if len(self.rssi_values) > 100:
+            self.rssi_values = self.rssi_values[-100:]
+    
+    @property
+    def average_rssi(self) -> float:
+        """Calculates the average RSSI"""
+        if not self.rssi_values:
+            return 0.0
+        return sum(self.rssi_values) / len(self.rssi_values)
+    
+    @property
+    def time_since_first(self) -> float:
+        """Seconds elapsed since the first reading"""
+        return time.time() - self.first_seen
+    
+    @property
+    def time_since_last(self) -> float:
+        """Seconds elapsed since the last reading"""
+        return time.time() - self.last_seen
+    
+    @property
+    def has_location_data(self) -> bool:
+        """True if the tag has location data (azimuth/elevation)"""
+        return 'azimuth' in self.extra_data and 'elevation' in self.extra_data
@@ -11,56 +11,8 @@ from tkinter import ttk
 import threading
 
 # Local imports
-from typing import Dict, Optional
-
-class TagData:
-    """Class for storing RFID tag data"""
-
-    def __init__(self, epc: str, rssi: float, extra_data: Optional[dict] = None):
-        self.epc = epc
-        self.read_count = 1
-        self.rssi_values = [rssi]
-        self.first_seen = time.time()
-        self.last_seen = time.time()
-        self.extra_data = extra_data or {}  # For azimuth, elevation, etc.
-        
-    def add_reading(self, rssi: float, extra_data: Optional[dict] = None, reads: int = 1):
-        """Adds one or more readings for this tag"""
-        self.read_count += reads
-        # Add as many RSSI as there are reads (if >1, duplicate the last value)
-        if reads > 1:
-            self.rssi_values.extend([rssi] * reads)
-        else:
-            self.rssi_values.append(rssi)
-        self.last_seen = time.time()
-        # Update extra data if provided
-        if extra_data:
-            self.extra_data.update(extra_data)
-        # Keep only the last 100 readings to avoid excessive memory consumption
-        if len(self.rssi_values) > 100:
-            self.rssi_values = self.rssi_values[-100:]
-    
-    @property
-    def average_rssi(self) -> float:
-        """Calculates the average RSSI"""
-        if not self.rssi_values:
-            return 0.0
-        return sum(self.rssi_values) / len(self.rssi_values)
-    
-    @property
-    def time_since_first(self) -> float:
-        """Seconds elapsed since the first reading"""
-        return time.time() - self.first_seen
-    
-    @property
-    def time_since_last(self) -> float:
-        """Seconds elapsed since the last reading"""
-        return time.time() - self.last_seen
-    
-    @property
-    def has_location_data(self) -> bool:
-        """True if the tag has location data (azimuth/elevation)"""
-        return 'azimuth' in self.extra_data and 'elevation' in self.extra_data
+from typing import Callable, Dict, Optional
+from zebra_cli.tag_data import TagData
 
 class TagTableWindow:
     """Separate window for displaying the RFID tag table"""
@@ -74,8 +26,16 @@ class TagTableWindow:
             if self.debug:
                 print(f"[DEBUG][TagTableWindow] Error during queue cleanup: {e}")
 
-    def __init__(self, data_queue: queue.Queue, stop_event: threading.Event, debug: bool = False) -> None:
+    def __init__(self, data_queue: queue.Queue, stop_event: threading.Event, debug: bool = False,
+                 show_reader: bool = False, reader_stats: Optional[Callable[[], str]] = None) -> None:
+        """
+        Args:
+            show_reader: Adds a column with the reader that last read each tag (multi-reader sessions)
+            reader_stats: Called on every update; its text is shown below the general statistics
+        """
         self.data_queue = data_queue
+        self.show_reader = show_reader
+        self.reader_stats = reader_stats
         self.stop_event = stop_event
         self.tags: Dict[str, TagData] = {}
         self.root = None
@@ -128,6 +88,10 @@ class TagTableWindow:
         
         self.stats_labels['avg_rssi'] = ttk.Label(stats_row1, text="Avg RSSI: N/A", font=('Arial', 10, 'bold'))
         self.stats_labels['avg_rssi'].pack(side=tk.LEFT)
+
+        if self.reader_stats:
+            self.stats_labels['readers'] = ttk.Label(stats_frame, text="Readers: -", font=('Arial', 9))
+            self.stats_labels['readers'].pack(fill=tk.X, pady=(5, 0))
         
                 # Frame for the table with scrollbar
         table_frame = ttk.Frame(main_frame)
@@ -135,6 +99,8 @@ class TagTableWindow:
         
         # Create the Treeview (table)
         columns = ('EPC', 'Reads', 'Avg RSSI', 'Min RSSI', 'Max RSSI', 'First Seen', 'Last Seen', 'Rate/min', 'Type')
+        if self.show_reader:
+            columns += ('Reader',)
         self.tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=15)
         
         # Configure the columns
@@ -147,8 +113,10 @@ class TagTableWindow:
             'First Seen': {'width': 90, 'anchor': 'center'},
             'Last Seen': {'width': 90, 'anchor': 'center'},
             'Rate/min': {'width': 70, 'anchor': 'center'},
-            'Type': {'width': 80, 'anchor': 'center'}
+            'Type': {'width': 80, 'anchor': 'center'},
+            'Reader': {'width': 140, 'anchor': 'center'}
         }
+        column_configs = {col: column_configs[col] for col in columns}
         
         for col, config in column_configs.items():
             self.tree.heading(col, text=col)
@@ -214,6 +182,8 @@ class TagTableWindow:
                             extra_data['elevation'] = tag_data['elevation']
                         if 'antenna' in tag_data:
                             extra_data['antenna'] = tag_data['antenna']
+                        if 'reader_id' in data:
+                            extra_data['reader_id'] = data['reader_id']
                         if self.debug:
                             print(f"[DEBUG][TagTableWindow] Updating tag {epc} with RSSI {rssi} and extra {extra_data}")
                         if epc in self.tags:
@@ -232,7 +202,7 @@ class TagTableWindow:
                         except (ValueError, TypeError):
                             rssi = -50.0
                         extra_data = {}
-                        for key in ['azimuth', 'elevation', 'antenna']:
+                        for key in ['azimuth', 'elevation', 'antenna', 'reader_id']:
                             if key in data:
                                 extra_data[key] = data[key]
                         reads = 1
@@ -287,6 +257,8 @@ class TagTableWindow:
                 self.stats_labels['total_tags'].config(text=f"Unique Tags: {total_tags}")
                 self.stats_labels['total_reads'].config(text=f"Total Reads: {total_reads}")
                 self.stats_labels['avg_rssi'].config(text=f"Avg RSSI: {avg_rssi:.1f} dBm" if avg_rssi != 0 else "Avg RSSI: N/A")
+                if self.reader_stats:
+                    self.stats_labels['readers'].config(text=f"Readers: {self.reader_stats()}")
                 sorted_tags = sorted(self.tags.items(), key=lambda x: x[1].read_count, reverse=True)
                 for epc, tag_data in sorted_tags:
                     time_elapsed = tag_data.time_since_first
@@ -307,6 +279,8 @@ class TagTableWindow:
                         f"{rate_per_minute:.1f}/min",
                         tag_type
                     )
+                    if self.show_reader:
+                        values += (tag_data.extra_data.get('reader_id', ''),)
                     item_id = self.tree.insert('', tk.END, values=values)
                     if tag_data.time_since_last < 2:
                         self.tree.set(item_id, 'EPC', f"🟢 {epc}")
@@ -0,0 +1,142 @@
+"""
+Persistent per-reader JWT token store
+
+Logging in to a reader costs up to three REST login attempts plus a scrape of the web UI. Tokens are
+kept in ~/.zebra_cli/tokens.json per reader IP together with their `exp` claim and the login method
+that worked, so a reconnect reuses the token while it is valid and a new login tries the right
+endpoint first. Passwords are never written to disk: only a salted PBKDF2 hash, so a stored token is
+handed out only to the password it was obtained with.
+"""
+import os
+import json
+import time
+import base64
+import hashlib
+import hmac
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_TOKEN_FILE = Path.home() / ".zebra_cli" / "tokens.json"
+REFRESH_MARGIN = 120  # Seconds before expiry at which a token is no longer handed out and gets refreshed
+DEFAULT_TOKEN_LIFETIME = 1800  # Assumed lifetime of tokens without an `exp` claim
+PASSWORD_HASH_ITERATIONS = 100_000
+
+def hash_password(password: str, salt: bytes) -> str:
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, PASSWORD_HASH_ITERATIONS).hex()
+
+def decode_jwt_exp(token: str) -> Optional[float]:
+    """Returns the `exp` claim (epoch seconds) of a JWT without verifying it, or None"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+def token_expires_soon(token: str, margin: float = REFRESH_MARGIN) -> bool:
+    """True if the JWT expires within margin seconds (tokens without `exp` are assumed valid)"""
+    exp = decode_jwt_exp(token)
+    return exp is not None and exp - time.time() < margin
+
+class TokenStore:
+    """
+    Tokens keyed by reader IP: {"username", "token", "expires_at", "login_method", "password_salt",
+    "password_hash"}. A token is only returned for the username (and password, if given) it was issued to.
+    """
+
+    def __init__(self, token_file: Optional[str] = None, debug: bool = False):
+        self.token_file = Path(token_file) if token_file else DEFAULT_TOKEN_FILE
+        self.debug = debug
+        self._lock = threading.Lock()
+        self._entries = None  # Loaded from disk on first use
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.token_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        try:
+            self.token_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.token_file.parent, prefix='.tmp_tokens_')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(temp_path, self.token_file)
+        except OSError as e:
+            if self.debug:
+                print(f"[DEBUG][TokenStore] Could not save {self.token_file}: {e}")
+
+    def get(self, reader: str, username: Optional[str] = None, password: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the stored token of a reader if it is valid for at least REFRESH_MARGIN seconds and, when a
+        password is given, was obtained with that password
+        """
+        with self._lock:
+            entry = self._load().get(reader)
+        if not entry or not entry.get('token'):
+            return None
+        if username and entry.get('username') != username:
+            return None
+        if password is not None:
+            salt, password_hash = entry.get('password_salt'), entry.get('password_hash')
+            if not salt or not password_hash:
+                return None
+            if not hmac.compare_digest(hash_password(password, bytes.fromhex(salt)), password_hash):
+                return None
+        remaining = entry.get('expires_at', 0) - time.time()
+        if remaining < REFRESH_MARGIN:
+            return None
+        if self.debug:
+            print(f"[DEBUG][TokenStore] Reusing token of {reader} (expires in {remaining / 60:.0f} min)")
+        return entry['token']
+
+    def expires_at(self, reader: str) -> Optional[float]:
+        """Returns the expiry (epoch seconds) of the stored token of a reader"""
+        with self._lock:
+            entry = self._load().get(reader)
+        return entry.get('expires_at') if entry else None
+
+    def get_login_method(self, reader: str) -> Optional[str]:
+        """Returns the login method (REST endpoint or "web") that last worked for a reader"""
+        with self._lock:
+            entry = self._load().get(reader)
+        return entry.get('login_method') if entry else None
+
+    def put(self, reader: str, token: str, username: Optional[str] = None, login_method: Optional[str] = None,
+            password: Optional[str] = None) -> None:
+        """Stores a token of a reader; the expiry comes from its `exp` claim"""
+        if not reader or not token:
+            return
+        expires_at = decode_jwt_exp(token) or time.time() + DEFAULT_TOKEN_LIFETIME
+        salt = os.urandom(16)
+        password_hash = hash_password(password, salt) if password is not None else None
+        with self._lock:
+            entries = self._load()
+            previous = entries.get(reader, {})
+            entries[reader] = {
+                'username': username or previous.get('username'),
+                'token': token,
+                'expires_at': expires_at,
+                'login_method': login_method or previous.get('login_method'),
+                'password_salt': salt.hex() if password_hash else None,
+                'password_hash': password_hash
+            }
+            self._save()
+
+    def invalidate(self, reader: str) -> None:
+        """Drops the token of a reader (e.g. after a 401); the remembered login method is kept"""
+        with self._lock:
+            entry = self._load().get(reader)
+            if not entry or not entry.get('token'):
+                return
+            entry['token'] = None
+            entry['expires_at'] = 0
+            self._save()
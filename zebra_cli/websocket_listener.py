@@ -10,15 +10,362 @@ import traceback
 import socket
 import ssl
 import platform
+import random
 from typing import Optional
-from .tag_table_window import TagData
+from .tag_data import TagData
 
-class WebSocketListener(threading.Thread):
+# URIs are already ordered by the connection probe, so a failed one is followed almost immediately
+URI_RETRY_DELAY = 0.2
+# Reconnect backoff after a lost connection or a round of failed URIs (jittered, doubling up to the maximum)
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_STABLE_AFTER = 10.0  # A connection that lasted this long resets the backoff
+GAP_MESSAGE_TYPE = 'CONNECTION_GAP'
+# Dead-peer detection: a ping every PING_INTERVAL seconds, the connection is dropped (and reconnected)
+# if no pong arrives within PING_TIMEOUT seconds. A reader that lost power or network never closes.
+PING_INTERVAL = 20.0
+PING_TIMEOUT = 10.0
+
+def reconnect_delay(attempt: int, initial: float = RECONNECT_INITIAL_DELAY, maximum: float = RECONNECT_MAX_DELAY) -> float:
+    """Jittered exponential backoff: a random delay between half and all of min(maximum, initial * 2^attempt)"""
+    base = min(maximum, initial * (2 ** attempt))
+    return base / 2 + random.uniform(0, base / 2)
+
+def _gap_time(epoch: float) -> str:
+    return datetime.datetime.fromtimestamp(epoch).isoformat(timespec='milliseconds')
+
+class ConnectionGaps:
+    """
+    Disconnect gaps of a listener. A closed gap is a message of type CONNECTION_GAP
+    ({"type", "uri", "reason", "start", "end", "duration_s"}) that goes through the listener's queue and
+    recording like reader messages, so recordings and throughput reports can account for downtime.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.gaps = []  # Closed gaps
+        self.reconnects = 0
+        self._open = None  # (start epoch, uri, reason) while disconnected
+
+    def disconnected(self, uri: str, reason: str):
+        """Opens a gap (no-op if one is already open)"""
+        with self._lock:
+            if self._open is None:
+                self._open = (time.time(), uri, reason)
+
+    def connected(self) -> Optional[dict]:
+        """Closes the open gap on reconnection; returns it, or None if there was no gap"""
+        with self._lock:
+            if self._open is None:
+                return None
+            self.reconnects += 1
+            return self._close()
+
+    def close_open_gap(self) -> Optional[dict]:
+        """Closes the open gap when the listener stops while disconnected"""
+        with self._lock:
+            return self._close() if self._open is not None else None
+
+    def _close(self) -> dict:
+        start, uri, reason = self._open
+        end = time.time()
+        self._open = None
+        gap = {'type': GAP_MESSAGE_TYPE, 'uri': uri, 'reason': reason, 'start': _gap_time(start),
+               'end': _gap_time(end), 'duration_s': round(end - start, 3)}
+        self.gaps.append(gap)
+        return gap
+
+    def status(self) -> dict:
+        """Reconnects, closed gaps, total downtime (including the open gap) and start of the open gap"""
+        with self._lock:
+            downtime = sum(gap['duration_s'] for gap in self.gaps)
+            if self._open is not None:
+                downtime += time.time() - self._open[0]
+            return {
+                'reconnects': self.reconnects,
+                'connection_gaps': len(self.gaps),
+                'downtime_s': round(downtime, 1),
+                'disconnected_since': _gap_time(self._open[0]) if self._open is not None else None
+            }
+
+class CsvRecorder:
+    """
+    CSV recording of received messages (record/messages) and of the per-EPC tag statistics
+    (record/tag_reads, exported when the recording stops)
+    """
+
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+        self._init_recording()
+
+    def _init_recording(self):
+        self.ws_recorder_active = False  # WebSocket recorder active flag
+
+        # CSV Recording attributes
+        self._csv_messages_file = None
+        self._csv_messages_writer = None
+        self._recording_start_time = None
+        self._recording_tags = {}  # Dictionary to store TagData objects during recording
+        self._recording_timestamp = None  # Timestamp for CSV filename
+
+    def record_message(self, data):
+        """Records one received message (no-op while not recording)"""
+        if self.ws_recorder_active:
+            self._write_message_to_csv(data)
+            self._process_tag_data_for_recording(data)
+
+    def start_recording(self):
+        """Starts the WebSocket listener event recording and CSV file creation."""
+        if not self.ws_recorder_active:
+            self.ws_recorder_active = True
+            self._start_csv_recording()
+        elif self.debug:
+            print(f"[DEBUG][WebSocketListener] Recording already active")
+
+    def stop_recording(self):
+        """Stops the WebSocket listener event recording and closes CSV files."""
+        if self.ws_recorder_active:
+            self.ws_recorder_active = False
+            self._stop_csv_recording()
+        elif self.debug:
+            print(f"[DEBUG][WebSocketListener] Recording already stopped")
+
+    def _start_csv_recording(self):
+        """Initializes CSV recording - messages file immediately, tags collected in memory"""
+        try:
+            # Create timestamp for filenames
+            self._recording_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            
+            # Create directory structure if it doesn't exist
+            messages_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'messages')
+            os.makedirs(messages_dir, exist_ok=True)
+            
+            # Create messages filename with proper directory
+            messages_filename = os.path.join(messages_dir, f"messages_read_{self._recording_timestamp}.csv")
+            
+            # Open messages CSV file
+            self._csv_messages_file = open(messages_filename, 'w', newline='', encoding='utf-8')
+            
+            # Create messages CSV writer
+            self._csv_messages_writer = csv.writer(self._csv_messages_file)
+            
+            # Write messages header
+            self._csv_messages_writer.writerow(['Timestamp', 'Message_Type', 'Raw_JSON'])
+            
+            # Flush header to disk
+            self._csv_messages_file.flush()
+            
+            # Initialize tag data collection
+            self._recording_tags = {}
+            self._recording_start_time = time.time()
+            
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] CSV recording started: {messages_filename}")
+                print(f"[DEBUG][WebSocketListener] Tag data collection started in memory")
+            print(f"📝 CSV recording started: {messages_filename}")
+            
+            # Create tag reads directory for later use
+            tags_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'tag_reads')
+            os.makedirs(tags_dir, exist_ok=True)
+            
+            print(f"📊 Tag data collection started (will export to {os.path.join(tags_dir, f'tags_read_{self._recording_timestamp}.csv')} when stopped)")
+            
+        except Exception as e:
+            print(f"❌ Failed to start CSV recording: {e}")
+            self._stop_csv_recording()
+    
+    def _stop_csv_recording(self):
+        """Closes CSV files and exports collected tag data"""
+        try:
+            # Export collected tag data to CSV before cleanup
+            if self._recording_tags and self._recording_timestamp:
+                self._export_tags_to_csv()
+
+            # Close messages CSV
+            if self._csv_messages_writer:
+                self._csv_messages_writer = None
+                
+            if self._csv_messages_file:
+                self._csv_messages_file.close()
+                self._csv_messages_file = None
+                
+            if self._csv_messages_file or self._recording_tags:
+                if self.debug:
+                    print(f"[DEBUG][WebSocketListener] CSV recording stopped")
+                print("📝 CSV recording stopped")
+                
+            # Clear recording data
+            self._recording_tags = {}
+            self._recording_start_time = None
+            self._recording_timestamp = None
+            
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] Error stopping CSV recording: {e}")
+    
+    def _export_tags_to_csv(self):
+        """Exports collected tag data to CSV file"""
+        try:
+            if not self._recording_tags or not self._recording_timestamp:
+                return
+                
+            # Create tag reads directory and filename
+            tags_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'tag_reads')
+            os.makedirs(tags_dir, exist_ok=True)
+            tags_filename = os.path.join(tags_dir, f"tags_read_{self._recording_timestamp}.csv")
+            
+            with open(tags_filename, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                
+                # Header
+                writer.writerow(['EPC', 'Reads', 'Avg_RSSI', 'Min_RSSI', 'Max_RSSI', 
+                               'First_Seen', 'Last_Seen', 'Rate_Per_Minute'])
+                
+                # Data
+                for epc, tag_data in self._recording_tags.items():
+                    time_elapsed = tag_data.time_since_first
+                    rate_per_minute = (tag_data.read_count / time_elapsed * 60) if time_elapsed > 0 else 0
+                    rssi_min = min(tag_data.rssi_values) if tag_data.rssi_values else 0
+                    rssi_max = max(tag_data.rssi_values) if tag_data.rssi_values else 0
+                    
+                    writer.writerow([
+                        epc,
+                        tag_data.read_count,
+                        f"{tag_data.average_rssi:.1f}",
+                        f"{rssi_min:.1f}",
+                        f"{rssi_max:.1f}",
+                        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(tag_data.first_seen)),
+                        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(tag_data.last_seen)),
+                        f"{rate_per_minute:.1f}"
+                    ])
+            
+            total_tags = len(self._recording_tags)
+            total_reads = sum(tag.read_count for tag in self._recording_tags.values())
+            
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] Exported {total_tags} tags with {total_reads} total reads to {tags_filename}")
+            print(f"📊 Tag data exported: {tags_filename} ({total_tags} tags, {total_reads} reads)")
+            
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] Error exporting tags to CSV: {e}")
+            print(f"❌ Error exporting tag data: {e}")
+
+    def _write_message_to_csv(self, data):
+        """Writes a message to the messages CSV file"""
+        if not self._csv_messages_writer:
+            return
+            
+        try:
+            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+            message_type = data.get('type', 'UNKNOWN') if isinstance(data, dict) else 'RAW'
+            raw_json = json.dumps(data) if isinstance(data, dict) else str(data)
+            
+            self._csv_messages_writer.writerow([timestamp, message_type, raw_json])
+            self._csv_messages_file.flush()  # Ensure data is written immediately
+            
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] Error writing message to CSV: {e}")
+    
+    def _process_tag_data_for_recording(self, data):
+        """Processes tag data for in-memory collection"""
+        if self._recording_tags is None:  # Check if recording is not active
+            return
+        
+        try:
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] Processing tag data for recording: {data}")
+                
+            # Process data similar to TagTableWindow.process_data
+            if isinstance(data, dict) and 'data' in data:
+                tag_data = data['data']
+                if isinstance(tag_data, dict) and 'idHex' in tag_data:
+                    epc = tag_data['idHex']
+                    rssi = tag_data.get('RSSI', tag_data.get('rssi', tag_data.get('peakRssi', tag_data.get('peakRSSI', 0))))
+
+                    # Handle RSSI
+                    try:
+                        if rssi is None or rssi == 'N/A' or rssi == '':
+                            rssi = -50.0
+                        else:
+                            rssi = float(rssi)
+                    except (ValueError, TypeError):
+                        rssi = -50.0
+                    
+                    # Extract extra data
+                    extra_data = {}
+                    if 'azimuth' in tag_data:
+                        extra_data['azimuth'] = tag_data['azimuth']
+                    if 'elevation' in tag_data:
+                        extra_data['elevation'] = tag_data['elevation']
+                    if 'antenna' in tag_data:
+                        extra_data['antenna'] = tag_data['antenna']
+                    
+                    if self.debug:
+                        print(f"[DEBUG][WebSocketListener] Updating tag {epc} with RSSI {rssi} and extra {extra_data}")
+                    
+                    # Add or update tag data
+                    if epc in self._recording_tags:
+                        self._recording_tags[epc].add_reading(rssi, extra_data)
+                    else:
+                        self._recording_tags[epc] = TagData(epc, rssi, extra_data)
+                        
+            elif isinstance(data, dict):
+                # Handle direct tag data
+                epc = data.get('epc', data.get('EPC', data.get('idHex', '')))
+                if epc:
+                    rssi = data.get('RSSI', data.get('rssi', data.get('peakRSSI', data.get('peakRssi', 0))))
+                    
+                    # Handle RSSI
+                    try:
+                        if rssi is None or rssi == 'N/A' or rssi == '':
+                            rssi = -50.0
+                        else:
+                            rssi = float(rssi)
+                    except (ValueError, TypeError):
+                        rssi = -50.0
+                    
+                    # Extract extra data
+                    extra_data = {}
+                    for key in ['azimuth', 'elevation', 'antenna']:
+                        if key in data:
+                            extra_data[key] = data[key]
+                    
+                    # Handle multiple reads (from TagTableWindow)
+                    reads = 1
+                    if 'reads' in data:
+                        try:
+                            reads = int(data['reads'])
+                            if reads < 1:
+                                reads = 1
+                        except Exception:
+                            reads = 1
+                    
+                    if self.debug:
+                        print(f"[DEBUG][WebSocketListener] Updating tag {epc} with RSSI {rssi}, reads={reads}, extra={extra_data}")
+                    
+                    # Add or update tag data
+                    if epc in self._recording_tags:
+                        self._recording_tags[epc].add_reading(rssi, extra_data, reads=reads)
+                    else:
+                        tag = TagData(epc, rssi, extra_data)
+                        tag.read_count = reads
+                        if reads > 1:
+                            tag.rssi_values = [rssi] * reads
+                        self._recording_tags[epc] = tag
+                        
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG][WebSocketListener] Error processing tag data for recording: {e}")
+
+class WebSocketListener(CsvRecorder, threading.Thread):
     """
     Listens for WebSocket messages and processes them.
     """
-    def __init__(self, uri: str, data_queue: queue.Queue, stop_event: threading.Event, fallback_uris: Optional[list] = None, debug: bool = False):
-        super().__init__()
+    def __init__(self, uri: str, data_queue: queue.Queue, stop_event: threading.Event, fallback_uris: Optional[list] = None, debug: bool = False,
+                 reconnect: bool = True):
+        threading.Thread.__init__(self)
         self.uri = uri
         self.fallback_uris = fallback_uris or []
         self.all_uris = [uri] + self.fallback_uris
@@ -34,14 +381,11 @@ class WebSocketListener(threading.Thread):
         # Minimal counters for data tracking
         self._last_data_time = None  # Last received data time
         self._heartbeat_count = 0  # Heartbeat counter
-        self.ws_recorder_active = False  # WebSocket recorder active flag
-        
-        # CSV Recording attributes
-        self._csv_messages_file = None
-        self._csv_messages_writer = None
-        self._recording_start_time = None
-        self._recording_tags = {}  # Dictionary to store TagData objects during recording
-        self._recording_timestamp = None  # Timestamp for CSV filename
+        # Automatic reconnection: backoff, last good URI and disconnect gaps
+        self.reconnect = reconnect
+        self.gaps = ConnectionGaps()
+        self._good_uri_index = None
+        self._init_recording()
 
     def _split_json_messages(self, message):
         """
@@ -214,8 +558,12 @@ class WebSocketListener(threading.Thread):
         if self.debug:
             self._save_websocket_error_report(error, current_uri)
         
-        if error == "Connection to remote host was lost.":
-            print(f"💡 Connection lost error, trying to skip everything")
+        # Closed by the peer, or an open connection whose ping went unanswered: the run loop reconnects
+        lost = isinstance(error, websocket.WebSocketConnectionClosedException) or (
+            self._connection_open_time and isinstance(error, websocket.WebSocketTimeoutException))
+        if lost:
+            print(f"💡 Connection to the reader lost: {current_uri} ({error_str})"
+                  + (", reconnecting..." if self.reconnect else ""))
             return
 
         print(f"❌ Connection failed: {current_uri}")
@@ -488,8 +836,9 @@ class WebSocketListener(threading.Thread):
             print(f"🔌 WebSocket connection closed (intentional): {current_uri}")
             return  # Don't attempt to reconnect if stop event is set
         
-        # Stop reading data recording if active
-        self._stop_csv_recording()
+        if not self.reconnect:
+            # Stop reading data recording if active
+            self._stop_csv_recording()
 
         # Check if this was an immediate disconnection
         connection_duration = 0
@@ -532,9 +881,13 @@ class WebSocketListener(threading.Thread):
         else:
             print(f"   ℹ️  Close code {close_status_code} - see WebSocket RFC for details")
         
-        print("� Connection attempt completed - returning to menu")
-        # Always stop after any disconnection - no automatic reconnection
-        self.stop_event.set()
+        if self._connection_open_time:
+            self.gaps.disconnected(current_uri, f"closed ({code_str})")
+        if self.reconnect:
+            print("🔄 Connection lost - reconnecting (recording and queue continue)")
+        else:
+            print("🔌 Connection attempt completed - returning to menu")
+            self.stop_event.set()
 
     def on_open(self, ws):
         """Callback executed when the connection opens."""
@@ -548,6 +901,24 @@ class WebSocketListener(threading.Thread):
         # Mark as connected
         self._is_connected = True
 
+        gap = self.gaps.connected()
+        if gap:
+            print(f"🔁 Reconnected after {gap['duration_s']:.1f}s")
+            self._deliver_gap(gap)
+
+    def _deliver_gap(self, gap: dict):
+        """Records a closed gap and passes it downstream like a reader message"""
+        self.record_message(gap)
+        self.data_queue.put(gap)
+
+    def _uri_order(self) -> list:
+        """URI indexes of one connection round: the last good URI first, then the others in configured order"""
+        order = list(range(len(self.all_uris)))
+        if self._good_uri_index is not None:
+            order.remove(self._good_uri_index)
+            order.insert(0, self._good_uri_index)
+        return order
+
     def run(self):
         """Main thread for WebSocket management."""
         if self.debug:
@@ -560,89 +931,95 @@ class WebSocketListener(threading.Thread):
         for i, uri in enumerate(self.all_uris, 1):
             print(f"   {i}. {uri}")
             
-        # Try each URI once, no retry loops
-        for uri_index, current_uri in enumerate(self.all_uris):
-            if self.stop_event.is_set():
-                if self.debug:
-                    print(f"[DEBUG] WebSocketListener.run - Stop event set, breaking")
-                print("🛑 WebSocket listener stopping")
-                break
-                
-            try:
+        # Connection rounds: each URI once (last good URI first), then a jittered backoff before the next round
+        attempt = 0
+        while not self.stop_event.is_set():
+            connected = False
+            order = self._uri_order()
+            for position, uri_index in enumerate(order):
+                if self.stop_event.is_set():
+                    break
+                current_uri = self.all_uris[uri_index]
                 self.current_uri_index = uri_index
-                
-                if self.debug:
-                    print(f"[DEBUG] WebSocketListener.run - Attempting connection to: {current_uri}")
-                
-                print(f"\n🔗 WebSocket connection attempt ({uri_index + 1}/{len(self.all_uris)}): {current_uri}")
-                
-                # Configure SSL for wss:// connections (more stable configuration)
-                sslopt = None
-                if current_uri.startswith('wss://'):
-                    # Disable trace for SSL to avoid interference
-                    websocket.enableTrace(False)
-                    
-                    # Simplified and stable SSL configuration
-                    import ssl
-                    context = ssl.create_default_context()
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    
-                    # Simplified SSL configuration for stability
-                    sslopt = {
-                        "cert_reqs": ssl.CERT_NONE,
-                        "check_hostname": False
-                    }
-                    if self.debug:
-                        print("🔒 SSL verification disabled for wss://")
-                else:
-                    # Disable trace for non-SSL connections
-                    websocket.enableTrace(False)
-                
-                # Connect without authentication headers (Zebra WebSocket doesn't use them)
-                if self.debug:
-                    print(f"🔍 [DEBUG] Connecting without authentication headers")
-                
-                self.ws = websocket.WebSocketApp(
-                    current_uri,
-                    on_open=self.on_open,
-                    on_message=self.on_message,
-                    on_error=self.on_error,
-                    on_close=self.on_close
-                )
-                
-                # run_forever with appropriate SSL configuration
-                # This will block until connection closes
-                if sslopt is not None:
-                    if self.debug:
-                        print("[DEBUG] SSL options provided")
-                    self.ws.run_forever(sslopt=sslopt)
-                else:
-                    if self.debug:
-                        print("[DEBUG] No SSL options provided")
-                    self.ws.run_forever()
-                
-                # If we get here, the connection was closed
+                self._connection_open_time = None
+                print(f"\n🔗 WebSocket connection attempt ({position + 1}/{len(order)}): {current_uri}")
+                try:
+                    self._run_connection(current_uri)
+                except Exception as e:
+                    print(f"❌ Exception during connection to {current_uri}: {e}")
+
                 if self.stop_event.is_set():
                     break
-                
-                # Try next URI if available
-                if uri_index < len(self.all_uris) - 1:
-                    print(f"🔄 Trying next URI...")
-                    time.sleep(1)  # Brief pause between attempts
-                else:
-                    print(f"❌ All {len(self.all_uris)} WebSocket URIs attempted without success")
+                if self._connection_open_time:
+                    # Connected, then lost: reconnect to the same URI first
+                    connected = True
+                    self._good_uri_index = uri_index
+                    if time.time() - self._connection_open_time >= RECONNECT_STABLE_AFTER:
+                        attempt = 0
+                    self.gaps.disconnected(current_uri, "connection lost")
                     break
-                
-            except Exception as e:
-                print(f"❌ Exception during connection to {current_uri}: {e}")
-                if uri_index < len(self.all_uris) - 1:
+                if position < len(order) - 1:
                     print(f"🔄 Trying next URI...")
-                    time.sleep(1)  # Brief pause between attempts
-                else:
+                    self.stop_event.wait(URI_RETRY_DELAY)  # Brief pause between attempts
+
+            if self.stop_event.is_set():
+                print("🛑 WebSocket listener stopping")
+                break
+            if not self.reconnect:
+                if not connected:
                     print(f"❌ All {len(self.all_uris)} WebSocket URIs attempted without success")
-                    break                 
-        
+                break
+            delay = reconnect_delay(attempt)
+            attempt += 1
+            print(f"🔄 Reconnecting in {delay:.1f}s (attempt {attempt})...")
+            self.stop_event.wait(delay)
+
+    def _run_connection(self, current_uri: str):
+        """Runs one WebSocket connection until it closes."""
+        if self.debug:
+            print(f"[DEBUG] WebSocketListener.run - Attempting connection to: {current_uri}")
+
+        # Configure SSL for wss:// connections (more stable configuration)
+        sslopt = None
+        if current_uri.startswith('wss://'):
+            # Disable trace for SSL to avoid interference
+            websocket.enableTrace(False)
+
+            # Simplified SSL configuration for stability
+            sslopt = {
+                "cert_reqs": ssl.CERT_NONE,
+                "check_hostname": False
+            }
+            if self.debug:
+                print("🔒 SSL verification disabled for wss://")
+        else:
+            # Disable trace for non-SSL connections
+            websocket.enableTrace(False)
+
+        # Connect without authentication headers (Zebra WebSocket doesn't use them)
+        if self.debug:
+            print(f"🔍 [DEBUG] Connecting without authentication headers")
+
+        self.ws = websocket.WebSocketApp(
+            current_uri,
+            on_open=self.on_open,
+            on_message=self.on_message,
+            on_error=self.on_error,
+            on_close=self.on_close
+        )
+
+        # run_forever with appropriate SSL configuration
+        # This will block until connection closes
+        if sslopt is not None:
+            if self.debug:
+                print("[DEBUG] SSL options provided")
+            self.ws.run_forever(sslopt=sslopt, ping_interval=PING_INTERVAL, ping_timeout=PING_TIMEOUT)
+        else:
+            if self.debug:
+                print("[DEBUG] No SSL options provided")
+            self.ws.run_forever(ping_interval=PING_INTERVAL, ping_timeout=PING_TIMEOUT)
+        self._is_connected = False
+
     def is_connected(self):
         """Checks if the WebSocket connection is active."""
         return self._is_connected and self.ws is not None
@@ -651,6 +1028,11 @@ class WebSocketListener(threading.Thread):
         """Forcibly closes the listener and WebSocket connection."""
         try:
             print("🔌 Terminating WebSocket listener...")
+
+            # A listener stopped while disconnected still records its last gap
+            gap = self.gaps.close_open_gap()
+            if gap:
+                self.record_message(gap)
             
             # Stop CSV recording if active
             self._stop_csv_recording()
@@ -671,248 +1053,3 @@ class WebSocketListener(threading.Thread):
                     
         except Exception as e:
             print(f"⚠️  Error during listener closure: {e}")
-
-    def start_recording(self):
-        """Starts the WebSocket listener event recording and CSV file creation."""
-        if not self.ws_recorder_active:
-            self.ws_recorder_active = True
-            self._start_csv_recording()
-        elif self.debug:
-            print(f"[DEBUG][WebSocketListener] Recording already active")
-
-    def stop_recording(self):
-        """Stops the WebSocket listener event recording and closes CSV files."""
-        if self.ws_recorder_active:
-            self.ws_recorder_active = False
-            self._stop_csv_recording()
-        elif self.debug:
-            print(f"[DEBUG][WebSocketListener] Recording already stopped")
-
-    def _start_csv_recording(self):
-        """Initializes CSV recording - messages file immediately, tags collected in memory"""
-        try:
-            # Create timestamp for filenames
-            self._recording_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            # Create directory structure if it doesn't exist
-            messages_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'messages')
-            os.makedirs(messages_dir, exist_ok=True)
-            
-            # Create messages filename with proper directory
-            messages_filename = os.path.join(messages_dir, f"messages_read_{self._recording_timestamp}.csv")
-            
-            # Open messages CSV file
-            self._csv_messages_file = open(messages_filename, 'w', newline='', encoding='utf-8')
-            
-            # Create messages CSV writer
-            self._csv_messages_writer = csv.writer(self._csv_messages_file)
-            
-            # Write messages header
-            self._csv_messages_writer.writerow(['Timestamp', 'Message_Type', 'Raw_JSON'])
-            
-            # Flush header to disk
-            self._csv_messages_file.flush()
-            
-            # Initialize tag data collection
-            self._recording_tags = {}
-            self._recording_start_time = time.time()
-            
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] CSV recording started: {messages_filename}")
-                print(f"[DEBUG][WebSocketListener] Tag data collection started in memory")
-            print(f"📝 CSV recording started: {messages_filename}")
-            
-            # Create tag reads directory for later use
-            tags_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'tag_reads')
-            os.makedirs(tags_dir, exist_ok=True)
-            
-            print(f"📊 Tag data collection started (will export to {os.path.join(tags_dir, f'tags_read_{self._recording_timestamp}.csv')} when stopped)")
-            
-        except Exception as e:
-            print(f"❌ Failed to start CSV recording: {e}")
-            self._stop_csv_recording()
-    
-    def _stop_csv_recording(self):
-        """Closes CSV files and exports collected tag data"""
-        try:
-            # Export collected tag data to CSV before cleanup
-            if self._recording_tags and self._recording_timestamp:
-                self._export_tags_to_csv()
-
-            # Close messages CSV
-            if self._csv_messages_writer:
-                self._csv_messages_writer = None
-                
-            if self._csv_messages_file:
-                self._csv_messages_file.close()
-                self._csv_messages_file = None
-                
-            if self._csv_messages_file or self._recording_tags:
-                if self.debug:
-                    print(f"[DEBUG][WebSocketListener] CSV recording stopped")
-                print("📝 CSV recording stopped")
-                
-            # Clear recording data
-            self._recording_tags = {}
-            self._recording_start_time = None
-            self._recording_timestamp = None
-            
-        except Exception as e:
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] Error stopping CSV recording: {e}")
-    
-    def _export_tags_to_csv(self):
-        """Exports collected tag data to CSV file"""
-        try:
-            if not self._recording_tags or not self._recording_timestamp:
-                return
-                
-            # Create tag reads directory and filename
-            tags_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'record', 'tag_reads')
-            os.makedirs(tags_dir, exist_ok=True)
-            tags_filename = os.path.join(tags_dir, f"tags_read_{self._recording_timestamp}.csv")
-            
-            with open(tags_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Header
-                writer.writerow(['EPC', 'Reads', 'Avg_RSSI', 'Min_RSSI', 'Max_RSSI', 
-                               'First_Seen', 'Last_Seen', 'Rate_Per_Minute'])
-                
-                # Data
-                for epc, tag_data in self._recording_tags.items():
-                    time_elapsed = tag_data.time_since_first
-                    rate_per_minute = (tag_data.read_count / time_elapsed * 60) if time_elapsed > 0 else 0
-                    rssi_min = min(tag_data.rssi_values) if tag_data.rssi_values else 0
-                    rssi_max = max(tag_data.rssi_values) if tag_data.rssi_values else 0
-                    
-                    writer.writerow([
-                        epc,
-                        tag_data.read_count,
-                        f"{tag_data.average_rssi:.1f}",
-                        f"{rssi_min:.1f}",
-                        f"{rssi_max:.1f}",
-                        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(tag_data.first_seen)),
-                        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(tag_data.last_seen)),
-                        f"{rate_per_minute:.1f}"
-                    ])
-            
-            total_tags = len(self._recording_tags)
-            total_reads = sum(tag.read_count for tag in self._recording_tags.values())
-            
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] Exported {total_tags} tags with {total_reads} total reads to {tags_filename}")
-            print(f"📊 Tag data exported: {tags_filename} ({total_tags} tags, {total_reads} reads)")
-            
-        except Exception as e:
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] Error exporting tags to CSV: {e}")
-            print(f"❌ Error exporting tag data: {e}")
-
-    def _write_message_to_csv(self, data):
-        """Writes a message to the messages CSV file"""
-        if not self._csv_messages_writer:
-            return
-            
-        try:
-            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-            message_type = data.get('type', 'UNKNOWN') if isinstance(data, dict) else 'RAW'
-            raw_json = json.dumps(data) if isinstance(data, dict) else str(data)
-            
-            self._csv_messages_writer.writerow([timestamp, message_type, raw_json])
-            self._csv_messages_file.flush()  # Ensure data is written immediately
-            
-        except Exception as e:
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] Error writing message to CSV: {e}")
-    
-    def _process_tag_data_for_recording(self, data):
-        """Processes tag data for in-memory collection"""
-        if self._recording_tags is None:  # Check if recording is not active
-            return
-        
-        try:
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] Processing tag data for recording: {data}")
-                
-            # Process data similar to TagTableWindow.process_data
-            if isinstance(data, dict) and 'data' in data:
-                tag_data = data['data']
-                if isinstance(tag_data, dict) and 'idHex' in tag_data:
-                    epc = tag_data['idHex']
-                    rssi = tag_data.get('RSSI', tag_data.get('rssi', tag_data.get('peakRssi', tag_data.get('peakRSSI', 0))))
-
-                    # Handle RSSI
-                    try:
-                        if rssi is None or rssi == 'N/A' or rssi == '':
-                            rssi = -50.0
-                        else:
-                            rssi = float(rssi)
-                    except (ValueError, TypeError):
-                        rssi = -50.0
-                    
-                    # Extract extra data
-                    extra_data = {}
-                    if 'azimuth' in tag_data:
-                        extra_data['azimuth'] = tag_data['azimuth']
-                    if 'elevation' in tag_data:
-                        extra_data['elevation'] = tag_data['elevation']
-                    if 'antenna' in tag_data:
-                        extra_data['antenna'] = tag_data['antenna']
-                    
-                    if self.debug:
-                        print(f"[DEBUG][WebSocketListener] Updating tag {epc} with RSSI {rssi} and extra {extra_data}")
-                    
-                    # Add or update tag data
-                    if epc in self._recording_tags:
-                        self._recording_tags[epc].add_reading(rssi, extra_data)
-                    else:
-                        self._recording_tags[epc] = TagData(epc, rssi, extra_data)
-                        
-            elif isinstance(data, dict):
-                # Handle direct tag data
-                epc = data.get('epc', data.get('EPC', data.get('idHex', '')))
-                if epc:
-                    rssi = data.get('RSSI', data.get('rssi', data.get('peakRSSI', data.get('peakRssi', 0))))
-                    
-                    # Handle RSSI
-                    try:
-                        if rssi is None or rssi == 'N/A' or rssi == '':
-                            rssi = -50.0
-                        else:
-                            rssi = float(rssi)
-                    except (ValueError, TypeError):
-                        rssi = -50.0
-                    
-                    # Extract extra data
-                    extra_data = {}
-                    for key in ['azimuth', 'elevation', 'antenna']:
-                        if key in data:
-                            extra_data[key] = data[key]
-                    
-                    # Handle multiple reads (from TagTableWindow)
-                    reads = 1
-                    if 'reads' in data:
-                        try:
-                            reads = int(data['reads'])
-                            if reads < 1:
-                                reads = 1
-                        except Exception:
-                            reads = 1
-                    
-                    if self.debug:
-                        print(f"[DEBUG][WebSocketListener] Updating tag {epc} with RSSI {rssi}, reads={reads}, extra={extra_data}")
-                    
-                    # Add or update tag data
-                    if epc in self._recording_tags:
-                        self._recording_tags[epc].add_reading(rssi, extra_data, reads=reads)
-                    else:
-                        tag = TagData(epc, rssi, extra_data)
-                        tag.read_count = reads
-                        if reads > 1:
-                            tag.rssi_values = [rssi] * reads
-                        self._recording_tags[epc] = tag
-                        
-        except Exception as e:
-            if self.debug:
-                print(f"[DEBUG][WebSocketListener] Error processing tag data for recording: {e}")
\ No newline at end of file
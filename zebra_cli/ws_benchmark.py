@@ -0,0 +1,360 @@
+"""
+Ingestion benchmark: threaded WebSocket listener vs asyncio engine vs MQTT subscriber
+
+Starts a local stand-in reader server (Zebra-like tag events over WebSocket, one asyncio loop in its own
+thread), connects N listeners of each engine to it and measures how fast all messages reach the consumer
+queue, with the CPU time and the number of threads used. The `mqtt` transport instead starts a stand-in
+MQTT broker, subscribes one MqttListener to the data topics of the N readers and publishes the same
+events on them (requires paho-mqtt).
+
+Run with: python -m zebra_cli.ws_benchmark --readers 16 --messages 5000
+"""
+import io
+import sys
+import json
+import time
+import queue
+import asyncio
+import argparse
+import threading
+import struct
+import contextlib
+from typing import Dict, List, Optional
+
+from zebra_cli.async_ws_engine import (
+    WS_ENGINES, OPCODE_CLOSE, OPCODE_TEXT, encode_frame, listener_class, websocket_accept
+)
+
+TRANSPORTS = WS_ENGINES + ('mqtt',)
+WRITE_BATCH = 200  # Frames written per drain by the stand-in server
+DEFAULT_RUN_TIMEOUT = 120.0
+
+def tag_event(index: int) -> dict:
+    """A tag event shaped like the IoT Connector data events"""
+    return {
+        "type": "SIMPLE",
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S.000+0000', time.gmtime()),
+        "data": {"idHex": f"E280{index:020X}", "antenna": index % 4 + 1, "peakRssi": -40 - index % 30,
+                 "channel": 865.7, "reads": 1, "format": "epc"}
+    }
+
+class StandInReaderServer:
+    """
+    Local WebSocket server that sends `messages` tag events to every client, then closes. With close=False
+    it goes silent instead, like a reader that lost power: no close frame, no pong, the socket stays open.
+    """
+
+    def __init__(self, messages: int, host: str = '127.0.0.1', close: bool = True):
+        self.messages = messages
+        self.host = host
+        self.close = close
+        self.port = None
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._frames = b''.join(encode_frame(OPCODE_TEXT, json.dumps(tag_event(i)).encode(), mask=False)
+                                for i in range(messages))
+
+    def start(self) -> str:
+        """Starts the server thread; returns the ws:// URI"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, 0))
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            # Connections of clients that never closed
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="StandInReaderServer", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return f"ws://{self.host}:{self.port}/ws"
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    async def _handle(self, reader, writer):
+        try:
+            request = (await reader.readuntil(b"\r\n\r\n")).decode('latin-1')
+            key = next((line.split(':', 1)[1].strip() for line in request.split("\r\n")
+                        if line.lower().startswith('sec-websocket-key:')), '')
+            writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                          f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n\r\n").encode())
+            frame_size = len(self._frames) // max(1, self.messages)
+            step = WRITE_BATCH * max(1, frame_size)
+            for offset in range(0, len(self._frames), step):
+                writer.write(self._frames[offset:offset + step])
+                await writer.drain()
+            if not self.close:
+                await asyncio.Event().wait()  # Until the server stops
+            writer.write(encode_frame(OPCODE_CLOSE, b'\x03\xe8', mask=False))
+            await writer.drain()
+            # Wait for the client's close frame / disconnect
+            await asyncio.wait_for(reader.read(), timeout=10)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # Cancelled: server stopped while the client kept the connection open
+        finally:
+            writer.close()
+
+def _mqtt_remaining_length(length: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte, length = length % 128, length // 128
+        encoded.append(byte | (0x80 if length else 0))
+        if not length:
+            return bytes(encoded)
+
+def mqtt_publish_packet(topic: str, payload: bytes) -> bytes:
+    """QoS 0 PUBLISH packet"""
+    topic_bytes = topic.encode()
+    body = struct.pack('!H', len(topic_bytes)) + topic_bytes + payload
+    return b'\x30' + _mqtt_remaining_length(len(body)) + body
+
+def mqtt_topic_matches(pattern: str, topic: str) -> bool:
+    """MQTT topic filter match with the + and # wildcards"""
+    pattern_levels, topic_levels = pattern.split('/'), topic.split('/')
+    for index, level in enumerate(pattern_levels):
+        if level == '#':
+            return True
+        if index >= len(topic_levels) or (level != '+' and level != topic_levels[index]):
+            return False
+    return len(pattern_levels) == len(topic_levels)
+
+class StandInMqttBroker:
+    """
+    Minimal local MQTT 3.1.1 broker (QoS 0 delivery, + and # wildcards) for tests and benchmarks:
+    routes PUBLISH packets of its clients to the matching subscribers. publish_events() injects
+    stand-in reader events directly.
+    """
+
+    def __init__(self, host: str = '127.0.0.1'):
+        self.host = host
+        self.port = None
+        self._loop = None
+        self._thread = None
+        self._subscriptions: Dict[asyncio.StreamWriter, List[str]] = {}
+
+    def start(self) -> str:
+        """Starts the broker thread; returns the mqtt:// URI"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, 0))
+            self.port = server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            server.close()
+            self._loop.run_until_complete(server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="StandInMqttBroker", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return f"mqtt://{self.host}:{self.port}"
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    def subscriber_count(self) -> int:
+        return sum(1 for topics in self._subscriptions.values() if topics)
+
+    def publish_events(self, reader_names: List[str], messages: int, timeout: float = 60.0):
+        """Publishes `messages` tag events on tevents/<reader> for every reader (blocks until written)"""
+        asyncio.run_coroutine_threadsafe(self._publish_events(reader_names, messages), self._loop).result(timeout)
+
+    async def _publish_events(self, reader_names: List[str], messages: int):
+        for start in range(0, messages, WRITE_BATCH):
+            for name in reader_names:
+                packets = b''.join(mqtt_publish_packet(f"tevents/{name}", json.dumps(tag_event(i)).encode())
+                                   for i in range(start, min(messages, start + WRITE_BATCH)))
+                await self._route(f"tevents/{name}", packets)
+
+    async def _route(self, topic: str, packets: bytes):
+        for writer, patterns in list(self._subscriptions.items()):
+            if any(mqtt_topic_matches(pattern, topic) for pattern in patterns):
+                writer.write(packets)
+                await writer.drain()
+
+    async def _handle(self, reader, writer):
+        self._subscriptions[writer] = []
+        try:
+            while True:
+                header = await reader.readexactly(1)
+                length, multiplier = 0, 1
+                while True:
+                    byte = (await reader.readexactly(1))[0]
+                    length += (byte & 0x7F) * multiplier
+                    multiplier *= 128
+                    if not byte & 0x80:
+                        break
+                body = await reader.readexactly(length)
+                packet_type = header[0] >> 4
+                if packet_type == 1:  # CONNECT
+                    writer.write(b'\x20\x02\x00\x00')
+                elif packet_type == 3:  # PUBLISH
+                    qos = (header[0] >> 1) & 0x03
+                    topic_length = struct.unpack_from('!H', body)[0]
+                    topic = body[2:2 + topic_length].decode()
+                    offset = 2 + topic_length + (2 if qos else 0)
+                    if qos == 1:
+                        writer.write(b'\x40\x02' + body[2 + topic_length:offset])
+                    await self._route(topic, mqtt_publish_packet(topic, body[offset:]))
+                elif packet_type == 8:  # SUBSCRIBE
+                    packet_id, offset, granted = body[:2], 2, bytearray()
+                    while offset < len(body):
+                        topic_length = struct.unpack_from('!H', body, offset)[0]
+                        self._subscriptions[writer].append(body[offset + 2:offset + 2 + topic_length].decode())
+                        offset += 2 + topic_length + 1
+                        granted.append(0)
+                    writer.write(b'\x90' + _mqtt_remaining_length(2 + len(granted)) + packet_id + bytes(granted))
+                elif packet_type == 10:  # UNSUBSCRIBE
+                    writer.write(b'\xb0\x02' + body[:2])
+                elif packet_type == 12:  # PINGREQ
+                    writer.write(b'\xd0\x00')
+                elif packet_type == 14:  # DISCONNECT
+                    break
+                await writer.drain()
+        except (OSError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._subscriptions.pop(writer, None)
+            writer.close()
+
+def _process_cpu_seconds() -> float:
+    return time.process_time()
+
+def _consume(data_queue: queue.Queue, expected: int, deadline: float) -> tuple:
+    """Takes tag events from the queue until `expected` arrived or the deadline; returns (received, peak threads)"""
+    received = 0
+    peak_threads = threading.active_count()
+    while received < expected and time.perf_counter() < deadline:
+        try:
+            data = data_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        if isinstance(data, dict) and 'data' in data:
+            received += 1
+        if received % 100 == 0:
+            peak_threads = max(peak_threads, threading.active_count())
+    return received, peak_threads
+
+def _result(engine: str, readers: int, expected: int, received: int, seconds: float, cpu_seconds: float,
+            peak_threads: int) -> dict:
+    return {
+        'engine': engine,
+        'readers': readers,
+        'messages': expected,
+        'received': received,
+        'seconds': round(seconds, 3),
+        'messages_per_s': round(received / seconds, 1) if seconds else 0.0,
+        'cpu_seconds': round(cpu_seconds, 3),
+        'peak_threads': peak_threads
+    }
+
+def run_engine(engine: str, uri: str, readers: int, messages: int,
+               timeout: float = DEFAULT_RUN_TIMEOUT) -> dict:
+    """Connects `readers` listeners of one engine and consumes messages until all have arrived"""
+    data_queue = queue.Queue()
+    factory = listener_class(engine)
+    expected = readers * messages
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cpu_start = _process_cpu_seconds()
+        start = time.perf_counter()
+        listeners = [factory(uri, data_queue, threading.Event(), reconnect=False) for _ in range(readers)]
+        for listener in listeners:
+            listener.start()
+        received, peak_threads = _consume(data_queue, expected, start + timeout)
+        seconds = time.perf_counter() - start
+        cpu_seconds = _process_cpu_seconds() - cpu_start
+        for listener in listeners:
+            listener.close()
+
+    return _result(engine, readers, expected, received, seconds, cpu_seconds, peak_threads)
+
+def run_mqtt(readers: int, messages: int, timeout: float = DEFAULT_RUN_TIMEOUT) -> dict:
+    """Subscribes one MqttListener to `readers` readers of a stand-in broker and consumes their events"""
+    from zebra_cli.mqtt_ingest import MqttListener
+
+    broker = StandInMqttBroker()
+    uri = broker.start()
+    data_queue = queue.Queue()
+    names = [f"reader-{i + 1}" for i in range(readers)]
+    expected = readers * messages
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            cpu_start = _process_cpu_seconds()
+            start = time.perf_counter()
+            listener = MqttListener(uri, data_queue, threading.Event(), reader_names=names, reconnect=False)
+            listener.start()
+            listener.wait_subscribed(timeout=10)
+            publisher = threading.Thread(target=broker.publish_events, args=(names, messages, timeout), daemon=True)
+            publisher.start()
+            received, peak_threads = _consume(data_queue, expected, start + timeout)
+            seconds = time.perf_counter() - start
+            cpu_seconds = _process_cpu_seconds() - cpu_start
+            listener.close()
+            publisher.join(timeout=5)
+    finally:
+        broker.stop()
+    # The broker runs in this process: its publishing CPU is included
+    return _result('mqtt', readers, expected, received, seconds, cpu_seconds, peak_threads)
+
+def run_benchmark(readers: int = 8, messages: int = 2000, engines: Optional[List[str]] = None,
+                  timeout: float = DEFAULT_RUN_TIMEOUT) -> List[dict]:
+    """Runs every engine against a fresh stand-in server (or broker for 'mqtt'); one result per engine"""
+    results = []
+    for engine in engines or WS_ENGINES:
+        if engine == 'mqtt':
+            results.append(run_mqtt(readers, messages, timeout))
+            continue
+        server = StandInReaderServer(messages)
+        uri = server.start()
+        try:
+            results.append(run_engine(engine, uri, readers, messages, timeout))
+        finally:
+            server.stop()
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the WebSocket listeners and the MQTT subscriber")
+    parser.add_argument('--readers', type=int, default=16, help="Simulated readers (default: 16)")
+    parser.add_argument('--messages', type=int, default=5000, help="Tag events per reader (default: 5000)")
+    parser.add_argument('--engines', nargs='+', choices=TRANSPORTS, default=list(WS_ENGINES),
+                        help="Ingestion paths to compare (default: thread async; mqtt requires paho-mqtt)")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.readers, args.messages, args.engines)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"📊 {args.readers} readers x {args.messages} tag events")
+        for r in results:
+            icon = "✅" if r['received'] == r['messages'] else "⚠️ "
+            print(f"{icon} {r['engine']:<6} {r['messages_per_s']:>10.0f} msg/s  {r['seconds']:>7.2f} s  "
+                  f"CPU {r['cpu_seconds']:>6.2f} s  threads {r['peak_threads']}  ({r['received']}/{r['messages']})")
+    return 0 if all(r['received'] == r['messages'] for r in results) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())